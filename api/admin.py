@@ -1,13 +1,13 @@
 from django.contrib import admin
 from django.contrib.auth.admin import UserAdmin
-from .models import User, Item, Bid, Question
+from .models import User, Item, Bid, Question, OutboundEmail
 
 admin.site.register(User, UserAdmin)
 
 
 @admin.register(Item)
 class ItemAdmin(admin.ModelAdmin):
-    list_display = ['title', 'owner', 'current_price', 'end_date', 'is_active']
+    list_display = ['title', 'owner', 'current_price', 'bid_count', 'end_date', 'is_active']
     list_filter = ['is_active', 'end_date']
     search_fields = ['title', 'description']
     date_hierarchy = 'created_at'
@@ -25,3 +25,11 @@ class QuestionAdmin(admin.ModelAdmin):
     list_display = ['item', 'asker', 'question_text', 'asked_at', 'answered_at']
     list_filter = ['asked_at', 'answered_at']
     date_hierarchy = 'asked_at'
+
+
+@admin.register(OutboundEmail)
+class OutboundEmailAdmin(admin.ModelAdmin):
+    list_display = ['subject', 'to_email', 'status', 'attempts', 'next_attempt_at', 'sent_at']
+    list_filter = ['status']
+    search_fields = ['to_email', 'subject']
+    date_hierarchy = 'created_at'
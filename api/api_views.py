@@ -1,25 +1,56 @@
-from django.http import JsonResponse, HttpRequest
-from django.views.decorators.http import require_http_methods
+import asyncio
+import os
+from datetime import datetime
+from bisect import bisect_left
+from django.core.handlers.asgi import ASGIRequest
+from django.http import JsonResponse, HttpRequest, StreamingHttpResponse
+from django.views.decorators.http import condition, require_http_methods
 from django.contrib.auth import login, logout, authenticate
 from django.contrib.auth.decorators import login_required
 from django.views.decorators.csrf import ensure_csrf_cookie
-from django.db.models import Q
+from django.db import transaction
+from django.db.models import F
 from django.utils import timezone
-from decimal import Decimal
-from django.http.multipartparser import MultiPartParser
+from decimal import Decimal, InvalidOperation
 import json
+from project import database
 from .forms import CustomUserCreationForm
 from .serializers import (
+    bid_queryset,
+    item_queryset,
+    parse_item_fields,
+    question_queryset,
     serialize_user,
     serialize_item,
     serialize_bid,
     serialize_question,
 )
-from .utils import json_response
+from .utils import json_response, stream_json_response
+from .dashboard import build_dashboard
+from .bidding import CENT, ENDED, MAX_AMOUNT, NOT_FOUND, OWN_ITEM, place_bid
+from .events import (
+    ITEMS_CHANNEL,
+    get_broadcaster,
+    item_channel,
+    publish_bid,
+    publish_closed,
+)
+from .pagination import (
+    InvalidCursor,
+    KeysetPaginator,
+    decode_cursor,
+    encode_cursor,
+    parse_limit,
+)
+from .replicas import read_from_replica
+from .uploads import UploadRejected, bounded_uploads, parse_upload
+from .search import get_search_backend
 from .models import User, Item, Bid, Question
+from . import images, price_cache, user_activity, user_cache
 
 
 @require_http_methods(["POST"])
+@bounded_uploads
 def api_signup(request: HttpRequest) -> JsonResponse:
     """
     User registration endpoint.
@@ -36,10 +67,17 @@ def api_signup(request: HttpRequest) -> JsonResponse:
         Success: {success: true, data: {user: UserDict}}
         Error: {success: false, errors: {field: [errors]}}
     """
-    form = CustomUserCreationForm(request.POST, request.FILES)
+    try:
+        data, files = parse_upload(request)
+    except UploadRejected as e:
+        return json_response(errors={e.field: [e.message]}, status=e.status)
+
+    form = CustomUserCreationForm(data, files)
 
     if form.is_valid():
         user = form.save()
+        if user.profile_image:
+            images.refresh_profile_variants(user)
         login(request, user)
         return json_response(data={"user": serialize_user(user)}, status=201)
     else:
@@ -100,11 +138,16 @@ def api_logout(request: HttpRequest) -> JsonResponse:
 
 @ensure_csrf_cookie
 @require_http_methods(["GET"])
+@read_from_replica
 def api_get_user(request: HttpRequest) -> JsonResponse:
     """
     Get current authenticated user.
     Also sets the CSRF cookie for subsequent requests.
 
+    Query Parameters:
+        compact: "1" to return only the sizes of bid_item_ids and
+            questioned_item_ids; page through the ids with api_user_item_ids
+
     Returns:
         Success: {success: true, data: {user: UserDict}}
         Error: {success: false, error: str}
@@ -112,7 +155,88 @@ def api_get_user(request: HttpRequest) -> JsonResponse:
     if not request.user.is_authenticated:
         return json_response(error="Not authenticated", status=401)
 
-    return json_response(data={"user": serialize_user(request.user)})
+    compact = request.GET.get("compact") in ("1", "true")
+    return json_response(data={"user": serialize_user(request.user, compact=compact)})
+
+
+@require_http_methods(["GET"])
+@login_required
+def api_user_item_ids(request: HttpRequest) -> JsonResponse:
+    """
+    Page through the ids of the items the current user has bid on or asked
+    about, newest items first.
+
+    Query Parameters:
+        kind: "bid" or "question"
+        cursor: Opaque token from a previous response's next_cursor
+        limit: Page size (default 24, max 100)
+
+    Returns:
+        Success: {success: true, data: {item_ids: list[int], next_cursor: str | None, limit: int}}
+        Error: {success: false, error: str}
+    """
+    kind = request.GET.get("kind", "")
+    if kind not in user_activity.KINDS:
+        return json_response(error='kind must be "bid" or "question"', status=400)
+
+    try:
+        limit = parse_limit(request.GET.get("limit"))
+        end = None
+        cursor = request.GET.get("cursor")
+        if cursor:
+            values, direction = decode_cursor(cursor)
+            if direction != "next" or len(values) != 1 or not isinstance(values[0], int):
+                raise InvalidCursor("Invalid cursor")
+            end = values[0]
+    except InvalidCursor as e:
+        return json_response(error=str(e), status=400)
+
+    # The cached ids are sorted ascending; walk them backwards from the cursor
+    ids = user_activity.item_ids(request.user.id, kind)
+    stop = len(ids) if end is None else bisect_left(ids, end)
+    page = ids[max(stop - limit, 0):stop][::-1]
+    next_cursor = encode_cursor([page[-1]], "next") if stop > limit else None
+
+    return json_response(
+        data={"item_ids": page, "next_cursor": next_cursor, "limit": limit}
+    )
+
+
+@require_http_methods(["GET"])
+@login_required
+def api_dashboard(request: HttpRequest) -> JsonResponse:
+    """
+    Everything the dashboard shows in one response: the user's listings,
+    the items they bid on (with their highest bid and whether they lead),
+    their won items, the items they asked about and the unanswered
+    questions on their listings, plus totals. See api.dashboard.
+
+    Returns:
+        Success: {success: true, data: DashboardDict}
+    """
+    return json_response(data=build_dashboard(request.user))
+
+
+@require_http_methods(["GET"])
+@login_required
+def api_db_pool_stats(request: HttpRequest) -> JsonResponse:
+    """
+    Connection pool counters of the worker process that serves the request
+    (staff only). Each worker has its own pool, so poll repeatedly to see
+    them all; ``pid`` tells them apart.
+
+    Returns:
+        Success: {success: true, data: {pid: int, pooled: bool, pool: dict | None}}
+            See project.database.pool_stats for the counters
+        Error: {success: false, error: str}
+    """
+    if not request.user.is_staff:
+        return json_response(error="Staff only", status=403)
+
+    stats = database.pool_stats()
+    return json_response(
+        data={"pid": os.getpid(), "pooled": stats is not None, "pool": stats}
+    )
 
 
 @ensure_csrf_cookie
@@ -130,6 +254,7 @@ def api_csrf(request: HttpRequest) -> JsonResponse:
 
 @require_http_methods(["PUT"])
 @login_required
+@bounded_uploads
 def api_update_profile(request: HttpRequest) -> JsonResponse:
     """
     Update user profile endpoint using PUT.
@@ -149,9 +274,11 @@ def api_update_profile(request: HttpRequest) -> JsonResponse:
 
     # Handle multipart/form-data manually for PUT requests
     if request.content_type and "multipart/form-data" in request.content_type:
-        # Use Django's MultiPartParser to extract data and files from the raw request
-        parser = MultiPartParser(request.META, request, request.upload_handlers)
-        put_data, files = parser.parse()
+        # Django doesn't parse PUT bodies; files stream through the bounded handler
+        try:
+            put_data, files = parse_upload(request)
+        except UploadRejected as e:
+            return json_response(errors={e.field: [e.message]}, status=e.status)
 
         email = put_data.get("email", "").strip()
         date_of_birth = put_data.get("date_of_birth", "").strip()
@@ -199,38 +326,143 @@ def api_update_profile(request: HttpRequest) -> JsonResponse:
 
     try:
         user.save()
+        if profile_image:
+            images.refresh_profile_variants(user)
+        # Saving dropped the cached user; store the new one for the next request
+        user_cache.remember(user)
         return json_response(data={"user": serialize_user(user)})
     except Exception as e:
         return json_response(error=f"Failed to update profile: {str(e)}", status=500)
 
 
+def _items_version(request: HttpRequest) -> datetime | None:
+    """
+    Version of everything the item list can show, from two index seeks:
+    the latest change to any item, and the latest end date that has passed
+    on an auction not yet closed (its is_ended flips without a write).
+    Memoised on the request; None for anything but GET.
+    """
+    if request.method != "GET":
+        return None
+    if not hasattr(request, "_items_version"):
+        latest_change = (
+            Item.objects.order_by("-updated_at")
+            .values_list("updated_at", flat=True)
+            .first()
+        )
+        latest_end = (
+            Item.objects.filter(
+                is_active=True, winner__isnull=True, end_date__lte=timezone.now()
+            )
+            .order_by("-end_date")
+            .values_list("end_date", flat=True)
+            .first()
+        )
+        versions = [v for v in (latest_change, latest_end) if v is not None]
+        request._items_version = max(versions, default=None)
+    return request._items_version
+
+
+def _items_etag(request: HttpRequest) -> str | None:
+    version = _items_version(request)
+    return f"items-{version.timestamp():.6f}" if version else None
+
+
+def _item_version(request: HttpRequest, item_id: int) -> datetime | None:
+    """
+    Version of one item's detail response (and of its bid and question
+    pages): its last write, or its end date once passed. Memoised on the
+    request; None for a missing item and for anything but GET.
+    """
+    if request.method != "GET":
+        return None
+    if not hasattr(request, "_item_version"):
+        row = (
+            Item.objects.filter(id=item_id, is_active=True)
+            .values_list("updated_at", "end_date")
+            .first()
+        )
+        version = None
+        if row is not None:
+            updated_at, end_date = row
+            version = max(updated_at, end_date) if end_date <= timezone.now() else updated_at
+        request._item_version = version
+    return request._item_version
+
+
+def _item_etag(request: HttpRequest, item_id: int) -> str | None:
+    version = _item_version(request, item_id)
+    return f"item-{item_id}-{version.timestamp():.6f}" if version else None
+
+
 @ensure_csrf_cookie
 @require_http_methods(["GET", "POST"])
 @login_required
-def api_items(request: HttpRequest) -> JsonResponse:
+@read_from_replica
+@condition(etag_func=_items_etag, last_modified_func=_items_version)
+@bounded_uploads
+def api_items(request: HttpRequest) -> JsonResponse | StreamingHttpResponse:
     """
-    GET: List all active items with optional search
+    GET: List active items, newest first, or by relevance when searching.
+         Paginated by cursor: pass ``limit`` and the ``next_cursor`` /
+         ``prev_cursor`` of a previous response as ``cursor``.
+         ``fields`` (comma-separated ItemDict keys) limits each item to
+         those keys; unrequested columns and joins are skipped.
     POST: Create new item
+
+    GETs are conditional: If-None-Match / If-Modified-Since are answered with
+    304 after a cheap version lookup, without building the page.
     """
     if request.method == "GET":
         search_query: str = request.GET.get("search", "").strip()
         items = Item.objects.filter(is_active=True)
 
+        keys = (("created_at", True), ("id", True))
+
         if search_query:
-            items = items.filter(
-                Q(title__icontains=search_query)
-                | Q(description__icontains=search_query)
-            )
+            # Ranked full-text search; best matches first
+            items = get_search_backend().search(items, search_query)
+            keys = (("search_rank", True), ("id", True))
+
+        try:
+            fields = parse_item_fields(request.GET.get("fields"))
+        except ValueError as e:
+            return json_response(errors={"fields": [str(e)]}, status=400)
 
-        items = items.order_by("-created_at")
-        return json_response(data={"items": [serialize_item(item) for item in items]})
+        # Pagination keys are read from every row, so load them too
+        columns = tuple(name for name, _ in keys if name != "search_rank")
+        try:
+            limit = parse_limit(request.GET.get("limit"))
+            page = KeysetPaginator(
+                item_queryset(items, fields, also=columns), keys
+            ).stream(request.GET.get("cursor"), limit)
+        except InvalidCursor as e:
+            return json_response(error=str(e), status=400)
+
+        # Items are serialized and sent as they are read
+        return stream_json_response(
+            "items",
+            page,
+            lambda item: serialize_item(item, fields),
+            trailer=lambda: {
+                "next_cursor": page.next_cursor,
+                "prev_cursor": page.prev_cursor,
+                "limit": page.limit,
+            },
+            asynchronous=isinstance(request, ASGIRequest),
+        )
 
     else:  # POST - Create new item
-        title: str = request.POST.get("title", "").strip()
-        description: str = request.POST.get("description", "").strip()
-        starting_price_str: str = request.POST.get("starting_price", "").strip()
-        end_date_str: str = request.POST.get("end_date", "").strip()
-        picture = request.FILES.get("picture")
+        try:
+            data, files = parse_upload(request)
+        except UploadRejected as e:
+            return json_response(errors={e.field: [e.message]}, status=e.status)
+
+        title: str = data.get("title", "").strip()
+        description: str = data.get("description", "").strip()
+        starting_price_str: str = data.get("starting_price", "").strip()
+        end_date_str: str = data.get("end_date", "").strip()
+        picture = files.get("picture")
 
         # Validation
         errors: dict[str, list[str]] = {}
@@ -282,32 +514,182 @@ def api_items(request: HttpRequest) -> JsonResponse:
             picture=picture,
             end_date=end_date,
         )
+        images.refresh_item_variants(item)
 
         return json_response(data={"item": serialize_item(item)}, status=201)
 
 
+# Most ids one batch request may ask for
+BATCH_MAX_IDS = 100
+
+
 @require_http_methods(["GET"])
 @login_required
-def api_item_detail(request: HttpRequest, item_id: int) -> JsonResponse:
-    """Get single item with bids and questions"""
-    try:
-        item = Item.objects.get(id=item_id, is_active=True)
-        bids = item.bids.all()[:20]  # Latest 20 bids
-        questions = item.questions.all().order_by("-asked_at")
+def api_items_batch(request: HttpRequest) -> JsonResponse:
+    """
+    Get many items by id in one query, e.g. those in the current user's
+    bid_item_ids / questioned_item_ids. Visibility is the same as
+    api_item_detail: inactive items are reported as missing.
 
+    Query Parameters:
+        ids: Comma-separated item ids (at most BATCH_MAX_IDS)
+        fields: Comma-separated ItemDict keys to return for each item
+
+    Returns:
+        Success: {success: true, data: {items: list[ItemDict], missing: list[int]}}
+            Items are in the order the ids were given, without duplicates
+        Error: {success: false, error: str} or {success: false, errors: {...}}
+    """
+    raw_ids = [part.strip() for part in request.GET.get("ids", "").split(",")]
+    try:
+        ids = list(dict.fromkeys(int(part) for part in raw_ids if part))
+    except ValueError:
+        return json_response(errors={"ids": ["ids must be integers"]}, status=400)
+    if not ids:
+        return json_response(errors={"ids": ["ids is required"]}, status=400)
+    if len(ids) > BATCH_MAX_IDS:
         return json_response(
-            data={
-                "item": serialize_item(item),
-                "bids": [serialize_bid(bid) for bid in bids],
-                "questions": [serialize_question(q) for q in questions],
-            }
+            errors={"ids": [f"At most {BATCH_MAX_IDS} ids per request"]}, status=400
         )
+
+    try:
+        fields = parse_item_fields(request.GET.get("fields"))
+    except ValueError as e:
+        return json_response(errors={"fields": [str(e)]}, status=400)
+
+    found = item_queryset(Item.objects.filter(is_active=True), fields).in_bulk(ids)
+    return json_response(
+        data={
+            "items": [serialize_item(found[i], fields) for i in ids if i in found],
+            "missing": [i for i in ids if i not in found],
+        }
+    )
+
+
+@require_http_methods(["GET"])
+@login_required
+@read_from_replica
+@condition(etag_func=_item_etag, last_modified_func=_item_version)
+def api_item_detail(request: HttpRequest, item_id: int) -> JsonResponse:
+    """
+    Get single item with bids and questions.
+    Conditional: answers If-None-Match / If-Modified-Since with 304 after
+    reading only the item's version.
+
+    Query Parameters:
+        fields: Comma-separated ItemDict keys to return for the item
+    """
+    try:
+        fields = parse_item_fields(request.GET.get("fields"))
+    except ValueError as e:
+        return json_response(errors={"fields": [str(e)]}, status=400)
+
+    try:
+        # The price cache needs the bidding state whatever was requested
+        item = item_queryset(
+            Item.objects.all(), fields, also=("current_price", "end_date", "owner")
+        ).get(id=item_id, is_active=True)
     except Item.DoesNotExist:
         return json_response(error="Item not found", status=404)
+    price_cache.remember_item(item)
+
+    # First pages only; the rest come from api_item_bids / api_item_questions
+    bids = _bids_paginator(item.id).paginate(None, DETAIL_PAGE_SIZE)
+    questions = _questions_paginator(item.id).paginate(None, DETAIL_PAGE_SIZE)
+
+    return json_response(
+        data={
+            "item": serialize_item(item, fields),
+            "bids": [serialize_bid(bid) for bid in bids.results],
+            "bids_next_cursor": bids.next_cursor,
+            "questions": [serialize_question(q) for q in questions.results],
+            "questions_next_cursor": questions.next_cursor,
+        }
+    )
+
+
+# Bids and questions on the first page of an item's detail
+DETAIL_PAGE_SIZE = 20
+
+
+def _bids_paginator(item_id: int) -> KeysetPaginator[Bid]:
+    """Bids on an item, newest first (served by bid_item_created_idx)."""
+    return KeysetPaginator(bid_queryset(Bid.objects.filter(item_id=item_id)))
+
+
+def _questions_paginator(item_id: int) -> KeysetPaginator[Question]:
+    """Questions on an item, newest first (served by question_item_asked_idx)."""
+    return KeysetPaginator(
+        question_queryset(Question.objects.filter(item_id=item_id)),
+        keys=(("asked_at", True), ("id", True)),
+    )
+
+
+def _item_page_response(
+    request: HttpRequest, paginator: KeysetPaginator, key: str, serialize
+) -> JsonResponse:
+    """Serve one cursor page of an item's bids or questions."""
+    try:
+        limit = parse_limit(request.GET.get("limit"), default=DETAIL_PAGE_SIZE)
+        page = paginator.paginate(request.GET.get("cursor"), limit)
+    except InvalidCursor as e:
+        return json_response(error=str(e), status=400)
+    return json_response(
+        data={
+            key: [serialize(row) for row in page.results],
+            "next_cursor": page.next_cursor,
+            "prev_cursor": page.prev_cursor,
+            "limit": page.limit,
+        }
+    )
+
+
+@require_http_methods(["GET"])
+@login_required
+@read_from_replica
+@condition(etag_func=_item_etag, last_modified_func=_item_version)
+def api_item_bids(request: HttpRequest, item_id: int) -> JsonResponse:
+    """
+    Page through an item's bids, newest first.
+
+    Query Parameters:
+        cursor: next_cursor / prev_cursor of a previous page (or
+            bids_next_cursor from the item detail)
+        limit: Page size (default 20, max 100)
+
+    Returns:
+        Success: {success: true, data: {bids: list[BidDict], next_cursor, prev_cursor, limit}}
+        Error: {success: false, error: str}
+    """
+    # The version lookup made for the conditional GET also checks existence
+    if _item_version(request, item_id) is None:
+        return json_response(error="Item not found", status=404)
+    return _item_page_response(request, _bids_paginator(item_id), "bids", serialize_bid)
+
+
+@require_http_methods(["GET", "POST"])
+@login_required
+@read_from_replica
+@condition(etag_func=_item_etag, last_modified_func=_item_version)
+def api_item_questions(request: HttpRequest, item_id: int) -> JsonResponse:
+    """
+    GET: Page through an item's questions, newest first. Takes ``cursor``
+         (or questions_next_cursor from the item detail) and ``limit``.
+    POST: Ask a question about the item (see api_ask_question)
+    """
+    if request.method == "POST":
+        return api_ask_question(request, item_id)
+    # The version lookup made for the conditional GET also checks existence
+    if _item_version(request, item_id) is None:
+        return json_response(error="Item not found", status=404)
+    return _item_page_response(
+        request, _questions_paginator(item_id), "questions", serialize_question
+    )
 
 
 @require_http_methods(["PUT"])
 @login_required
+@bounded_uploads
 def api_update_item(request: HttpRequest, item_id: int) -> JsonResponse:
     """
     Update an item (only owner can update).
@@ -326,8 +708,10 @@ def api_update_item(request: HttpRequest, item_id: int) -> JsonResponse:
 
     # Handle multipart/form-data for PUT requests
     if request.content_type and "multipart/form-data" in request.content_type:
-        parser = MultiPartParser(request.META, request, request.upload_handlers)
-        put_data, files = parser.parse()
+        try:
+            put_data, files = parse_upload(request)
+        except UploadRejected as e:
+            return json_response(errors={e.field: [e.message]}, status=e.status)
 
         title = put_data.get("title", "").strip()
         description = put_data.get("description", "").strip()
@@ -372,12 +756,18 @@ def api_update_item(request: HttpRequest, item_id: int) -> JsonResponse:
     item.title = title
     item.description = description
     item.end_date = end_date
+    update_fields = ["title", "description", "end_date", "updated_at"]
 
     if picture:
         item.picture = picture
+        update_fields.append("picture")
 
     try:
-        item.save()
+        # Only write edited columns so concurrent bids on current_price survive
+        item.save(update_fields=update_fields)
+        if picture:
+            images.refresh_item_variants(item)
+        price_cache.item_changed(item)
         return json_response(data={"item": serialize_item(item)})
     except Exception as e:
         return json_response(error=f"Failed to update item: {str(e)}", status=500)
@@ -401,7 +791,9 @@ def api_delete_item(request: HttpRequest, item_id: int) -> JsonResponse:
 
     # Soft delete - preserve bid history
     item.is_active = False
-    item.save()
+    item.save(update_fields=["is_active", "updated_at"])
+    price_cache.forget(item.id)
+    publish_closed(item.id)
 
     return json_response(data={}, status=200)
 
@@ -422,41 +814,51 @@ def api_place_bid(request: HttpRequest, item_id: int) -> JsonResponse:
 
     try:
         amount = Decimal(amount_str)
-    except (ValueError, TypeError):
+    except (ValueError, TypeError, InvalidOperation):
         return json_response(error="Invalid bid amount format", status=400)
 
-    try:
-        item = Item.objects.get(id=item_id, is_active=True)
-    except Item.DoesNotExist:
-        return json_response(error="Item not found", status=404)
+    if not amount.is_finite():
+        return json_response(error="Invalid bid amount format", status=400)
 
-    # Validation
-    if item.owner == request.user:
-        return json_response(error="Cannot bid on your own item", status=400)
+    # Checked before quantizing, which fails on amounts beyond its precision
+    if not 0 < amount <= MAX_AMOUNT:
+        return json_response(
+            error=f"Bid amount must be between $0.01 and ${MAX_AMOUNT}", status=400
+        )
+    # Prices are stored with two decimal places: 20.001 would win the
+    # comparison against 20.00 but be saved as 20.00
+    if amount != amount.quantize(CENT):
+        return json_response(
+            error="Bid amount can have at most 2 decimal places", status=400
+        )
+    amount = amount.quantize(CENT)
 
-    if item.is_ended:
-        return json_response(error="Auction has ended", status=400)
+    result = place_bid(item_id, request.user, amount)
 
-    if amount <= item.current_price:
+    if not result.accepted:
+        if result.reason == NOT_FOUND:
+            return json_response(error="Item not found", status=404)
+        if result.reason == OWN_ITEM:
+            return json_response(error="Cannot bid on your own item", status=400)
+        if result.reason == ENDED:
+            return json_response(error="Auction has ended", status=400)
         return json_response(
-            error=f"Bid must be higher than current price ${item.current_price}",
+            error=f"Bid must be higher than current price ${result.current_price}",
             status=400,
         )
 
-    # Create bid and update item
-    bid = Bid.objects.create(
-        item=item,
-        bidder=request.user,
-        amount=amount,
-    )
+    item = item_queryset(Item.objects.all()).get(id=item_id)
+    bid = result.bid
+    bid.item = item
 
-    item.current_price = amount
-    item.save()
+    item_data = serialize_item(item)
+    bid_data = serialize_bid(bid)
+    publish_bid(item_data, bid_data)
 
     return json_response(
         data={
-            "item": serialize_item(item),
-            "bid": serialize_bid(bid),
+            "item": item_data,
+            "bid": bid_data,
         }
     )
 
@@ -479,11 +881,17 @@ def api_ask_question(request: HttpRequest, item_id: int) -> JsonResponse:
     except Item.DoesNotExist:
         return json_response(error="Item not found", status=404)
 
-    question = Question.objects.create(
-        item=item,
-        asker=request.user,
-        question_text=question_text,
-    )
+    with transaction.atomic():
+        question = Question.objects.create(
+            item=item,
+            asker=request.user,
+            question_text=question_text,
+        )
+        Item.objects.filter(id=item.id).update(
+            unanswered_question_count=F("unanswered_question_count") + 1,
+            updated_at=question.asked_at,
+        )
+    user_activity.interacted(request.user.id, item.id, user_activity.QUESTIONS)
 
     return json_response(data={"question": serialize_question(question)}, status=201)
 
@@ -502,16 +910,110 @@ def api_answer_question(request: HttpRequest, question_id: int) -> JsonResponse:
         return json_response(error="Answer text is required", status=400)
 
     try:
-        question = Question.objects.get(id=question_id)
+        question = question_queryset(Question.objects.all()).get(id=question_id)
     except Question.DoesNotExist:
         return json_response(error="Question not found", status=404)
 
     # Only item owner can answer
-    if question.item.owner != request.user:
+    if question.item.owner_id != request.user.id:
         return json_response(error="Only item owner can answer", status=403)
 
     question.answer_text = answer_text
     question.answered_at = timezone.now()
-    question.save()
+
+    with transaction.atomic():
+        # Only the first answer moves the question out of the unanswered count
+        first_answer = Question.objects.filter(id=question.id, answer_text="").update(
+            answer_text=question.answer_text, answered_at=question.answered_at
+        )
+        item_changes = {"updated_at": question.answered_at}
+        if first_answer:
+            item_changes["unanswered_question_count"] = (
+                F("unanswered_question_count") - 1
+            )
+        else:
+            question.save(update_fields=["answer_text", "answered_at"])
+        Item.objects.filter(id=question.item_id).update(**item_changes)
 
     return json_response(data={"question": serialize_question(question)})
+
+
+# Seconds between keep-alive comments on idle event streams
+STREAM_KEEPALIVE_SECONDS = 15
+
+
+async def _event_stream(channel: str):
+    """Yield Server-Sent Events published to ``channel`` until the client leaves."""
+    broadcaster = get_broadcaster()
+    subscription = broadcaster.subscribe(channel)
+    try:
+        yield ": connected\n\n"
+        while True:
+            try:
+                message = await asyncio.wait_for(
+                    subscription.get(), STREAM_KEEPALIVE_SECONDS
+                )
+            except asyncio.TimeoutError:
+                yield ": keepalive\n\n"
+                continue
+            if message is None:
+                break
+            yield message
+    finally:
+        broadcaster.unsubscribe(subscription)
+
+
+def _streams_unavailable(request: HttpRequest) -> JsonResponse | None:
+    """
+    A 501 response unless the request came through ASGI.
+
+    Under WSGI the handler would read the endless stream to completion
+    before sending anything, holding a worker forever.
+    """
+    if isinstance(request, ASGIRequest):
+        return None
+    return json_response(error="Event streams require an ASGI server", status=501)
+
+
+def _event_stream_response(channel: str) -> StreamingHttpResponse:
+    response = StreamingHttpResponse(
+        _event_stream(channel), content_type="text/event-stream"
+    )
+    response["Cache-Control"] = "no-cache"
+    response["X-Accel-Buffering"] = "no"
+    return response
+
+
+@require_http_methods(["GET"])
+@login_required
+async def api_items_stream(request: HttpRequest) -> JsonResponse | StreamingHttpResponse:
+    """
+    Server-Sent Events for all items: "bid" and "closed".
+    Must be served over ASGI (project.asgi); answers 501 otherwise.
+    """
+    unavailable = _streams_unavailable(request)
+    if unavailable is not None:
+        return unavailable
+    return _event_stream_response(ITEMS_CHANNEL)
+
+
+@require_http_methods(["GET"])
+@login_required
+async def api_item_stream(
+    request: HttpRequest, item_id: int
+) -> JsonResponse | StreamingHttpResponse:
+    """
+    Server-Sent Events for one item.
+
+    Events:
+        bid: {item: ItemDict, bid: BidDict}
+        closed: {item_id: int, winner_id: int | None, winner_username: str | None}
+
+    Must be served over ASGI (project.asgi); answers 501 otherwise.
+    """
+    unavailable = _streams_unavailable(request)
+    if unavailable is not None:
+        return unavailable
+    if not await Item.objects.filter(id=item_id, is_active=True).aexists():
+        return json_response(error="Item not found", status=404)
+    return _event_stream_response(item_channel(item_id))
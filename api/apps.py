@@ -1,6 +1,18 @@
 from django.apps import AppConfig
+from django.core import checks
+from django.db.models.signals import post_delete, post_migrate, post_save
 
 
 class ApiConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'api'
+
+    def ready(self) -> None:
+        from .models import User
+        from .search import ensure_search_triggers
+        from .user_cache import check_shared_cache, user_changed
+
+        post_migrate.connect(ensure_search_triggers, sender=self)
+        post_save.connect(user_changed, sender=User)
+        post_delete.connect(user_changed, sender=User)
+        checks.register(check_shared_cache)
@@ -0,0 +1,81 @@
+from dataclasses import dataclass, field
+from datetime import datetime
+
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from . import price_cache
+from .events import publish_closed
+from .models import Item, OutboundEmail
+from .outbox import winner_email
+
+
+@dataclass
+class ClosedAuctions:
+    """Outcome of closing one batch of auctions."""
+
+    won: list[Item] = field(default_factory=list)
+    unsold_ids: list[int] = field(default_factory=list)
+
+
+def close_ended(ids: list[int], now: datetime) -> ClosedAuctions:
+    """
+    Close the auctions among ``ids`` that are still open and ended by ``now``.
+
+    A fixed number of set-based statements runs however many ids are passed.
+    Ids that are already closed, or whose end date has moved past ``now``,
+    are left alone, so callers may pass candidates from a stale schedule.
+
+    Args:
+        ids: Candidate item ids
+        now: Cut-off for end_date
+
+    Returns:
+        ClosedAuctions with the won items (owner and winner loaded) and the
+        ids closed without bids
+    """
+    still_open = Q(id__in=ids, is_active=True, end_date__lte=now, winner__isnull=True)
+
+    with transaction.atomic():
+        # The leading bidder is maintained on the item by each bid, so
+        # every winner in the batch is assigned by a single UPDATE. Rows are
+        # locked first so a concurrent closer waits and then skips them
+        # instead of notifying the same winner twice
+        won_ids = list(
+            Item.objects.select_for_update()
+            .filter(still_open, leading_bidder__isnull=False)
+            .values_list('id', flat=True)
+        )
+        won = []
+        if won_ids:
+            Item.objects.filter(id__in=won_ids).update(
+                winner=F('leading_bidder'), updated_at=timezone.now()
+            )
+
+            # Winner emails are queued in the same transaction, so a winner
+            # is notified exactly when their win is committed; send_outbox
+            # delivers them
+            won = list(
+                Item.objects.filter(id__in=won_ids).select_related('owner', 'winner')
+            )
+            OutboundEmail.objects.bulk_create([winner_email(item) for item in won])
+
+        # No bids, just mark as ended
+        unsold_ids = list(
+            Item.objects.select_for_update()
+            .filter(still_open, leading_bidder__isnull=True)
+            .values_list('id', flat=True)
+        )
+        Item.objects.filter(id__in=unsold_ids).update(
+            is_active=False, updated_at=timezone.now()
+        )
+
+    for item_id in unsold_ids:
+        price_cache.forget(item_id)
+        publish_closed(item_id)
+
+    for item in won:
+        publish_closed(item.id, item.winner_id, item.winner.username)
+
+    return ClosedAuctions(won=won, unsold_ids=unsold_ids)
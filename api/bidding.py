@@ -0,0 +1,110 @@
+from dataclasses import dataclass
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from . import price_cache, user_activity
+from .models import Bid, Item, User
+
+# Precision and largest value of the price and amount columns
+CENT = Decimal("0.01")
+MAX_AMOUNT = Decimal("99999999.99")
+
+# BidResult.reason values
+NOT_FOUND = "not_found"
+OWN_ITEM = "own_item"
+ENDED = "ended"
+OUTBID = "outbid"
+
+
+@dataclass
+class BidResult:
+    """Outcome of a bid attempt."""
+
+    accepted: bool
+    reason: str | None = None
+    bid: Bid | None = None
+    current_price: Decimal | None = None
+
+
+def place_bid(item_id: int, bidder: User, amount: Decimal) -> BidResult:
+    """
+    Place a bid with one conditional UPDATE and an INSERT in a short transaction.
+
+    The price only moves if, at write time, the item is active, not ended,
+    not owned by the bidder and priced below ``amount``. The database
+    evaluates that condition against the latest committed row, so concurrent
+    bids cannot overwrite a higher price and no read-modify-write lock is held.
+    The same UPDATE maintains the item's bid aggregates; an accepted bid is
+    always the new leading bid.
+    Bids the price cache already shows to be too low or too late are
+    rejected before touching the database.
+
+    Args:
+        item_id: Item being bid on
+        bidder: User placing the bid
+        amount: Bid amount, in whole cents and at most MAX_AMOUNT
+
+    Returns:
+        BidResult; when not accepted, ``reason`` is one of NOT_FOUND,
+        OWN_ITEM, ENDED or OUTBID
+    """
+    now = timezone.now()
+
+    # Fast path: reject clearly low or late bids from the price cache
+    cached_price, cached_end_date, cached_owner_id = price_cache.get_state(item_id)
+    if cached_owner_id == bidder.id:
+        return BidResult(accepted=False, reason=OWN_ITEM)
+    if cached_end_date is not None and cached_end_date <= now:
+        return BidResult(accepted=False, reason=ENDED)
+    if cached_price is not None and amount <= cached_price:
+        return BidResult(accepted=False, reason=OUTBID, current_price=cached_price)
+
+    with transaction.atomic():
+        updated = (
+            Item.objects.filter(
+                id=item_id,
+                is_active=True,
+                end_date__gt=now,
+                current_price__lt=amount,
+            )
+            .exclude(owner=bidder)
+            .update(
+                current_price=amount,
+                bid_count=F("bid_count") + 1,
+                leading_bid=amount,
+                leading_bidder=bidder,
+                last_bid_at=now,
+                updated_at=now,
+            )
+        )
+        if updated:
+            bid = Bid.objects.create(
+                item_id=item_id, bidder=bidder, amount=amount, created_at=now
+            )
+            transaction.on_commit(lambda: price_cache.price_changed(item_id, amount))
+            transaction.on_commit(
+                lambda: user_activity.interacted(bidder.id, item_id, user_activity.BIDS)
+            )
+            return BidResult(accepted=True, bid=bid, current_price=amount)
+
+    # The update matched nothing: read the row once to explain why
+    state = (
+        Item.objects.filter(id=item_id, is_active=True)
+        .values("owner_id", "end_date", "current_price")
+        .first()
+    )
+    if state is None:
+        return BidResult(accepted=False, reason=NOT_FOUND)
+    price_cache.remember(
+        item_id, state["current_price"], state["end_date"], state["owner_id"]
+    )
+    if state["owner_id"] == bidder.id:
+        return BidResult(accepted=False, reason=OWN_ITEM)
+    if state["end_date"] <= now:
+        return BidResult(accepted=False, reason=ENDED)
+    return BidResult(
+        accepted=False, reason=OUTBID, current_price=state["current_price"]
+    )
@@ -0,0 +1,125 @@
+from decimal import Decimal
+from typing import TypedDict
+
+from django.db.models import Count, Max, Q, Sum
+from django.utils import timezone
+
+from .models import Bid, Item, Question, User
+from .serializers import (
+    BidItemDict,
+    ItemDict,
+    QuestionDict,
+    item_queryset,
+    question_queryset,
+    serialize_item,
+    serialize_question,
+)
+
+# Most entries returned per dashboard list; the totals count everything
+DASHBOARD_LIMIT = 50
+
+
+class DashboardTotals(TypedDict):
+    """Counts over all of the user's activity, not just the returned lists"""
+
+    listings: int
+    active_listings: int
+    unanswered_questions: int
+    won_items: int
+    bid_items: int
+    winning_items: int
+    ended_bid_items: int
+    bid_value: str
+
+
+class DashboardDict(TypedDict):
+    """Type definition for the dashboard response"""
+
+    my_items: list[ItemDict]
+    bid_items: list[BidItemDict]
+    won_items: list[ItemDict]
+    asked_items: list[ItemDict]
+    unanswered_questions: list[QuestionDict]
+    totals: DashboardTotals
+    limit: int
+
+
+def _price(value: Decimal | None) -> str:
+    """Format an aggregated price like the serializers (SQLite drops the scale)."""
+    return str((value or Decimal(0)).quantize(Decimal("0.01")))
+
+
+def build_dashboard(user: User, limit: int = DASHBOARD_LIMIT) -> DashboardDict:
+    """
+    Gather everything the dashboard shows for ``user``.
+
+    Seven queries run whatever the user's activity: two aggregates for the
+    totals and one per list. Lists are newest first and hold at most
+    ``limit`` entries. Only active items are included, as in the item list.
+
+    Args:
+        user: The signed-in user
+        limit: Most entries per list
+
+    Returns:
+        DashboardDict
+    """
+    now = timezone.now()
+    active = Item.objects.filter(is_active=True)
+    bid_on = active.filter(id__in=Bid.objects.filter(bidder=user).values("item"))
+
+    # Listing and win counts in one pass over the user's items;
+    # unanswered_question_count is kept up to date on each item
+    item_totals = active.filter(Q(owner=user) | Q(winner=user)).aggregate(
+        listings=Count("id", filter=Q(owner=user)),
+        active_listings=Count("id", filter=Q(owner=user, end_date__gt=now)),
+        unanswered_questions=Sum("unanswered_question_count", filter=Q(owner=user)),
+        won_items=Count("id", filter=Q(winner=user)),
+    )
+    bid_totals = bid_on.aggregate(
+        bid_items=Count("id"),
+        winning_items=Count("id", filter=Q(leading_bidder=user)),
+        ended_bid_items=Count("id", filter=Q(end_date__lte=now)),
+        bid_value=Sum("current_price"),
+    )
+
+    my_items = item_queryset(active.filter(owner=user)).order_by("-created_at", "-id")
+    # Filtering and aggregating over the same join only sees the user's bids
+    bid_items = (
+        item_queryset(active.filter(bids__bidder=user))
+        .annotate(my_highest_bid=Max("bids__amount"), my_last_bid_at=Max("bids__created_at"))
+        .order_by("-my_last_bid_at", "-id")
+    )
+    won_items = item_queryset(active.filter(winner=user)).order_by("-end_date", "-id")
+    asked_items = item_queryset(
+        active.filter(id__in=Question.objects.filter(asker=user).values("item"))
+    ).order_by("-created_at", "-id")
+    unanswered = question_queryset(
+        Question.objects.filter(item__owner=user, item__is_active=True, answer_text="")
+    ).order_by("-asked_at", "-id")
+
+    return {
+        "my_items": [serialize_item(item) for item in my_items[:limit]],
+        "bid_items": [
+            {
+                "item": serialize_item(item),
+                "my_highest_bid": _price(item.my_highest_bid),
+                "is_winning": item.leading_bidder_id == user.id,
+            }
+            for item in bid_items[:limit]
+        ],
+        "won_items": [serialize_item(item) for item in won_items[:limit]],
+        "asked_items": [serialize_item(item) for item in asked_items[:limit]],
+        "unanswered_questions": [serialize_question(q) for q in unanswered[:limit]],
+        "totals": {
+            "listings": item_totals["listings"],
+            "active_listings": item_totals["active_listings"],
+            "unanswered_questions": item_totals["unanswered_questions"] or 0,
+            "won_items": item_totals["won_items"],
+            "bid_items": bid_totals["bid_items"],
+            "winning_items": bid_totals["winning_items"],
+            "ended_bid_items": bid_totals["ended_bid_items"],
+            "bid_value": _price(bid_totals["bid_value"]),
+        },
+        "limit": limit,
+    }
@@ -0,0 +1,186 @@
+import asyncio
+import json
+import logging
+import threading
+import time
+from collections import defaultdict
+from functools import lru_cache
+from typing import Any
+
+from django.conf import settings
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import DatabaseError, connections
+from django.utils.module_loading import import_string
+
+# Channel every item event is also published to, for list pages
+ITEMS_CHANNEL = "items"
+
+# Events buffered per subscriber before it is considered too slow and dropped
+SUBSCRIBER_QUEUE_SIZE = 100
+
+logger = logging.getLogger(__name__)
+
+
+def item_channel(item_id: int) -> str:
+    return f"item:{item_id}"
+
+
+class Subscription:
+    """A subscriber's queue of encoded messages, bound to its event loop."""
+
+    def __init__(self, channel: str) -> None:
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue[str | None] = asyncio.Queue(SUBSCRIBER_QUEUE_SIZE)
+
+    def deliver(self, message: str | None) -> None:
+        """Queue a message; must run on ``self.loop``."""
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            # Too slow to keep up: end the stream, the client will reconnect
+            self.queue.get_nowait()
+            self.queue.put_nowait(None)
+
+    async def get(self) -> str | None:
+        """Next message, or None when the subscription has been closed."""
+        return await self.queue.get()
+
+
+class LocalBroadcaster:
+    """
+    In-process fan-out of events to streaming subscribers.
+
+    Each event is encoded once and handed to every subscriber's event loop.
+    Publishing never blocks on subscribers, and it is safe to call from sync
+    views running in worker threads. Only subscribers in the same process are
+    reached: events published by close_auctions or run_auction_scheduler, or
+    by another web worker, need PostgresBroadcaster.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._subscribers: dict[str, set[Subscription]] = defaultdict(set)
+
+    def subscribe(self, channel: str) -> Subscription:
+        subscription = Subscription(channel)
+        with self._lock:
+            self._subscribers[channel].add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscribers.get(subscription.channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscribers[subscription.channel]
+
+    def publish(self, channel: str, message: str) -> None:
+        with self._lock:
+            subscribers = list(self._subscribers.get(channel, ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription.deliver, message)
+            except RuntimeError:
+                # Event loop already closed
+                self.unsubscribe(subscription)
+
+
+class PostgresBroadcaster(LocalBroadcaster):
+    """
+    Fan-out across processes through PostgreSQL LISTEN/NOTIFY.
+
+    ``publish`` sends a NOTIFY on the default database connection, so it
+    works from any process (web workers, close_auctions and
+    run_auction_scheduler), and an event published inside a transaction is
+    only sent when it commits. A process with streaming subscribers keeps
+    one extra connection LISTENing in a background thread and hands each
+    notification to its local subscribers.
+    """
+
+    NOTIFY_CHANNEL = "auction_events"
+    # PostgreSQL rejects NOTIFY payloads of 8000 bytes or more
+    MAX_PAYLOAD_BYTES = 7999
+    # Seconds to wait before reconnecting a dropped listener
+    RECONNECT_SECONDS = 1
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._listener: threading.Thread | None = None
+
+    def subscribe(self, channel: str) -> Subscription:
+        with self._lock:
+            if self._listener is None:
+                self._listener = threading.Thread(
+                    target=self._listen, name="event-listener", daemon=True
+                )
+                self._listener.start()
+        return super().subscribe(channel)
+
+    def publish(self, channel: str, message: str) -> None:
+        payload = f"{channel}\n{message}"
+        if len(payload.encode()) > self.MAX_PAYLOAD_BYTES:
+            logger.warning("Event on %s too large to publish", channel)
+            return
+        try:
+            with connections["default"].cursor() as cursor:
+                cursor.execute("SELECT pg_notify(%s, %s)", [self.NOTIFY_CHANNEL, payload])
+        except DatabaseError:
+            # Events are best effort; never fail the write that raised them
+            logger.exception("Could not publish event on %s", channel)
+
+    def _listen(self) -> None:
+        import psycopg
+
+        params = connections["default"].get_connection_params()
+        while True:
+            try:
+                with psycopg.connect(**params, autocommit=True) as conn:
+                    conn.execute(f"LISTEN {self.NOTIFY_CHANNEL}")
+                    for notify in conn.notifies():
+                        channel, _, message = notify.payload.partition("\n")
+                        super().publish(channel, message)
+            except psycopg.Error:
+                logger.exception("Event listener lost its connection; reconnecting")
+                time.sleep(self.RECONNECT_SECONDS)
+
+
+@lru_cache(maxsize=None)
+def get_broadcaster() -> LocalBroadcaster:
+    """Return the process-wide broadcaster configured by ``settings.EVENT_BROADCASTER``."""
+    return import_string(settings.EVENT_BROADCASTER)()
+
+
+def encode_event(event: str, data: dict[str, Any]) -> str:
+    """Format one Server-Sent Events message."""
+    payload = json.dumps(data, cls=DjangoJSONEncoder, separators=(",", ":"))
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+def publish_item_event(item_id: int, event: str, data: dict[str, Any]) -> None:
+    """Publish an event to the item's own stream and to the list stream."""
+    message = encode_event(event, data)
+    broadcaster = get_broadcaster()
+    broadcaster.publish(item_channel(item_id), message)
+    broadcaster.publish(ITEMS_CHANNEL, message)
+
+
+def publish_bid(item: dict[str, Any], bid: dict[str, Any]) -> None:
+    """A bid was accepted; ``item`` carries the new price and bid count."""
+    publish_item_event(item["id"], "bid", {"item": item, "bid": bid})
+
+
+def publish_closed(
+    item_id: int, winner_id: int | None = None, winner_username: str | None = None
+) -> None:
+    """An auction closed or was withdrawn by its owner."""
+    publish_item_event(
+        item_id,
+        "closed",
+        {
+            "item_id": item_id,
+            "winner_id": winner_id,
+            "winner_username": winner_username,
+        },
+    )
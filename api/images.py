@@ -0,0 +1,140 @@
+"""
+Resized renditions of uploaded item pictures and profile images.
+
+Each upload gets a set of variants, written next to the original under a
+``variants/`` directory of the same storage:
+
+- ``<name>``: the size as JPEG (PNG sources with transparency stay PNG)
+- ``<name>_webp``: the same size as WebP
+
+Variant paths are recorded on the model (``Item.picture_variants``,
+``User.profile_image_variants``), so serializers only expose variants that
+exist. The ``generate_image_variants`` command backfills older uploads.
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.db.models.fields.files import FieldFile
+from PIL import Image, ImageOps, UnidentifiedImageError
+
+from .models import Item, User
+
+logger = logging.getLogger(__name__)
+
+JPEG_QUALITY = 85
+WEBP_QUALITY = 80
+
+
+@dataclass(frozen=True)
+class VariantSpec:
+    """One rendition: bounding box, and whether to crop to fill it exactly."""
+
+    width: int
+    height: int
+    crop: bool = False
+
+
+# Item cards are 4:3; the detail page shows the picture at most 1200px wide
+ITEM_VARIANTS = {
+    "thumb": VariantSpec(400, 300, crop=True),
+    "detail": VariantSpec(1200, 900),
+}
+PROFILE_VARIANTS = {
+    "thumb": VariantSpec(96, 96, crop=True),
+    "detail": VariantSpec(400, 400, crop=True),
+}
+
+
+def _render(image: Image.Image, spec: VariantSpec) -> Image.Image:
+    """Resize without ever enlarging the source."""
+    if spec.crop and image.width >= spec.width and image.height >= spec.height:
+        return ImageOps.fit(image, (spec.width, spec.height), Image.Resampling.LANCZOS)
+    resized = image.copy()
+    resized.thumbnail((spec.width, spec.height), Image.Resampling.LANCZOS)
+    return resized
+
+
+def _encode(image: Image.Image, image_format: str) -> bytes:
+    buffer = BytesIO()
+    if image_format == "JPEG":
+        image.convert("RGB").save(
+            buffer, "JPEG", quality=JPEG_QUALITY, optimize=True, progressive=True
+        )
+    elif image_format == "WEBP":
+        image.save(buffer, "WEBP", quality=WEBP_QUALITY, method=4)
+    else:
+        image.save(buffer, image_format, optimize=True)
+    return buffer.getvalue()
+
+
+def generate_variants(
+    field_file: FieldFile, specs: dict[str, VariantSpec]
+) -> dict[str, str]:
+    """
+    Write the variants of a stored image.
+
+    Args:
+        field_file: Saved ImageField file (e.g. ``item.picture``)
+        specs: Variant name to size, e.g. ITEM_VARIANTS
+
+    Returns:
+        Variant name (and ``<name>_webp``) to storage path; empty if the
+        file is missing or is not an image Pillow can read
+    """
+    if not field_file:
+        return {}
+    try:
+        with field_file.open("rb") as source:
+            image = Image.open(source)
+            image.load()
+    except (OSError, UnidentifiedImageError, Image.DecompressionBombError) as e:
+        logger.warning("Cannot make variants of %s: %s", field_file.name, e)
+        return {}
+
+    # Apply the camera's rotation before resizing
+    image = ImageOps.exif_transpose(image)
+    has_alpha = image.mode in ("RGBA", "LA") or "transparency" in image.info
+    if image.mode not in ("RGB", "RGBA"):
+        image = image.convert("RGBA" if has_alpha else "RGB")
+    fallback_format, extension = ("PNG", "png") if has_alpha else ("JPEG", "jpg")
+
+    storage = field_file.storage
+    directory, filename = os.path.split(field_file.name)
+    stem = os.path.splitext(filename)[0]
+
+    variants = {}
+    for name, spec in specs.items():
+        rendered = _render(image, spec)
+        for key, image_format, ext in (
+            (name, fallback_format, extension),
+            (f"{name}_webp", "WEBP", "webp"),
+        ):
+            path = os.path.join(directory, "variants", f"{stem}.{name}.{ext}")
+            # Replace a stale rendition rather than getting a suffixed name
+            if storage.exists(path):
+                storage.delete(path)
+            variants[key] = storage.save(
+                path, ContentFile(_encode(rendered, image_format))
+            )
+    return variants
+
+
+def variant_urls(field_file: FieldFile, variants: dict[str, str]) -> dict[str, str]:
+    """Public URLs of recorded variants, keyed by variant name."""
+    return {name: field_file.storage.url(path) for name, path in variants.items()}
+
+
+def refresh_item_variants(item: Item) -> None:
+    """Regenerate and save the variants of an item's picture."""
+    item.picture_variants = generate_variants(item.picture, ITEM_VARIANTS)
+    item.save(update_fields=["picture_variants", "updated_at"])
+
+
+def refresh_profile_variants(user: User) -> None:
+    """Regenerate and save the variants of a user's profile image."""
+    user.profile_image_variants = generate_variants(user.profile_image, PROFILE_VARIANTS)
+    user.save(update_fields=["profile_image_variants"])
@@ -0,0 +1,312 @@
+"""
+Load-test harness for the auction API, driven by ``manage.py load_test``.
+
+Simulated users run in a thread pool. Each has its own ``django.test.Client``,
+so requests go through the real middleware and URL conf against the
+configured database, without a network server in between. Each user signs
+in and then, until the run ends, picks weighted actions:
+
+- ``items``: first page of the item list
+- ``search``: item list filtered by a word from a random title
+- ``detail``: one random active item
+- ``bid``: a bid just above the last price seen on one of a few hot items,
+  so users compete for them; an outbid user re-reads the price
+  (``detail``) before trying again
+
+Every request records its latency (including a streamed body), status and
+number of queries. The results give per-endpoint percentiles, throughput,
+error rate (5xx and exceptions) and rejection rate (4xx, mostly outbid
+bids).
+"""
+
+import math
+import random
+import threading
+import time
+from collections import Counter, defaultdict
+from contextlib import ExitStack
+from dataclasses import asdict, dataclass, field
+from decimal import Decimal
+from typing import Any
+
+from django.db import close_old_connections, connections
+from django.http import HttpResponse
+from django.test import Client
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from .models import Item, User
+
+# Relative weights of the actions a simulated user picks from
+ACTION_WEIGHTS = {"items": 4, "search": 2, "detail": 3, "bid": 3}
+# Active items sampled for detail views and search words
+SAMPLE_ITEMS = 500
+
+
+@dataclass
+class Sample:
+    """One request as measured by a simulated user."""
+
+    endpoint: str
+    latency_ms: float
+    status: int
+    queries: int
+
+
+@dataclass
+class LoadTestConfig:
+    """Parameters of a run."""
+
+    users: int = 10
+    duration: float = 30.0
+    hot_items: int = 3
+    think_time: float = 0.0
+    password: str = "testpass123"
+    username_prefix: str = "testuser"
+    seed: int | None = None
+
+
+@dataclass
+class EndpointStats:
+    """Summary of the samples for one endpoint (or all of them)."""
+
+    requests: int
+    requests_per_second: float
+    p50_ms: float
+    p95_ms: float
+    p99_ms: float
+    mean_ms: float
+    max_ms: float
+    error_rate: float
+    reject_rate: float
+    queries_per_request: float
+    statuses: dict[str, int] = field(default_factory=dict)
+
+
+def _percentile(ordered: list[float], percent: float) -> float:
+    """Nearest-rank percentile of an ascending list."""
+    if not ordered:
+        return 0.0
+    rank = math.ceil(percent / 100 * len(ordered))
+    return ordered[min(max(rank, 1), len(ordered)) - 1]
+
+
+def summarize(samples: list[Sample], elapsed: float) -> EndpointStats:
+    """Aggregate samples taken over ``elapsed`` seconds."""
+    latencies = sorted(sample.latency_ms for sample in samples)
+    count = len(samples)
+    errors = sum(1 for sample in samples if sample.status >= 500 or sample.status == 0)
+    rejected = sum(1 for sample in samples if 400 <= sample.status < 500)
+    return EndpointStats(
+        requests=count,
+        requests_per_second=round(count / elapsed, 2) if elapsed else 0.0,
+        p50_ms=round(_percentile(latencies, 50), 2),
+        p95_ms=round(_percentile(latencies, 95), 2),
+        p99_ms=round(_percentile(latencies, 99), 2),
+        mean_ms=round(sum(latencies) / count, 2) if count else 0.0,
+        max_ms=round(latencies[-1], 2) if latencies else 0.0,
+        error_rate=round(errors / count, 4) if count else 0.0,
+        reject_rate=round(rejected / count, 4) if count else 0.0,
+        queries_per_request=(
+            round(sum(sample.queries for sample in samples) / count, 2) if count else 0.0
+        ),
+        statuses=dict(sorted(Counter(str(sample.status) for sample in samples).items())),
+    )
+
+
+class SimulatedUser:
+    """One user's session: signs in, then browses, searches and bids."""
+
+    def __init__(
+        self,
+        user: User,
+        config: LoadTestConfig,
+        item_ids: list[int],
+        search_words: list[str],
+        hot_item_ids: list[int],
+        rng: random.Random,
+    ) -> None:
+        self.user = user
+        self.config = config
+        self.item_ids = item_ids
+        self.search_words = search_words
+        self.hot_item_ids = hot_item_ids
+        self.rng = rng
+        # A view that raises is recorded as a 500 instead of stopping the user
+        self.client = Client(raise_request_exception=False)
+        self.samples: list[Sample] = []
+        # Last price this user saw for each hot item
+        self.prices: dict[int, Decimal] = {}
+
+    def request(
+        self, endpoint: str, method: str, path: str, data: Any = None
+    ) -> HttpResponse | None:
+        """Send one request and record it; None if it raised."""
+        with ExitStack() as stack:
+            # Reads may go to a replica; count the queries on every database
+            captured = [
+                stack.enter_context(CaptureQueriesContext(connections[alias]))
+                for alias in connections
+            ]
+            started = time.perf_counter()
+            try:
+                if method == "post":
+                    response = self.client.post(path, data, content_type="application/json")
+                else:
+                    response = self.client.get(path, data)
+                if response.streaming:
+                    # Time the whole body, which is read while it streams
+                    b"".join(response.streaming_content)
+                status = response.status_code
+            except Exception:
+                response, status = None, 0
+            latency = (time.perf_counter() - started) * 1000
+        queries = sum(len(capture) for capture in captured)
+        self.samples.append(Sample(endpoint, latency, status, queries))
+        return response
+
+    def login(self) -> bool:
+        response = self.request(
+            "login",
+            "post",
+            "/api/auth/login/",
+            {"username": self.user.username, "password": self.config.password},
+        )
+        return response is not None and response.status_code == 200
+
+    def browse(self) -> None:
+        self.request("items", "get", "/api/items/")
+
+    def search(self) -> None:
+        self.request("search", "get", "/api/items/", {"search": self.rng.choice(self.search_words)})
+
+    def detail(self) -> None:
+        self.request("detail", "get", f"/api/items/{self.rng.choice(self.item_ids)}/")
+
+    def refresh_price(self, item_id: int) -> None:
+        response = self.request(
+            "detail", "get", f"/api/items/{item_id}/", {"fields": "current_price"}
+        )
+        if response is not None and response.status_code == 200:
+            self.prices[item_id] = Decimal(response.json()["data"]["item"]["current_price"])
+
+    def bid(self) -> None:
+        item_id = self.rng.choice(self.hot_item_ids)
+        if item_id not in self.prices:
+            self.refresh_price(item_id)
+        amount = self.prices.get(item_id, Decimal(0)) + Decimal(self.rng.randint(1, 5))
+        response = self.request(
+            "bid", "post", f"/api/items/{item_id}/bid/", {"amount": str(amount)}
+        )
+        if response is not None and response.status_code == 200:
+            self.prices[item_id] = Decimal(response.json()["data"]["item"]["current_price"])
+        else:
+            # Outbid (or the item changed); see the new price next time
+            self.prices.pop(item_id, None)
+
+    def run(self, deadline: float, start: threading.Barrier) -> None:
+        actions = {
+            "items": self.browse,
+            "search": self.search,
+            "detail": self.detail,
+            "bid": self.bid,
+        }
+        names = list(ACTION_WEIGHTS)
+        weights = list(ACTION_WEIGHTS.values())
+        if not self.hot_item_ids:
+            weights[names.index("bid")] = 0
+        try:
+            start.wait()
+            if not self.login():
+                return
+            while time.perf_counter() < deadline:
+                actions[self.rng.choices(names, weights)[0]]()
+                if self.config.think_time:
+                    time.sleep(self.config.think_time)
+        finally:
+            # Each thread has its own connections
+            connections.close_all()
+
+
+def run_load_test(config: LoadTestConfig) -> dict[str, Any]:
+    """
+    Run the scenario and summarize it.
+
+    Users are the existing accounts whose username starts with
+    ``config.username_prefix`` and whose password is ``config.password``
+    (as made by create_test_data). Hot items are the active, unended items
+    with the most bids.
+
+    Returns:
+        JSON-serializable results: config, elapsed seconds, overall and
+        per-endpoint EndpointStats
+
+    Raises:
+        ValueError: If there are not enough users or no active items
+    """
+    rng = random.Random(config.seed)
+    users = list(
+        User.objects.filter(username__startswith=config.username_prefix).order_by("id")[
+            : config.users
+        ]
+    )
+    if len(users) < config.users:
+        raise ValueError(
+            f"Need {config.users} users named {config.username_prefix}*, found {len(users)}"
+        )
+
+    active = Item.objects.filter(is_active=True, end_date__gt=timezone.now())
+    sample = list(active.order_by("-created_at").values_list("id", "title")[:SAMPLE_ITEMS])
+    if not sample:
+        raise ValueError("No active items to browse")
+    item_ids = [item_id for item_id, _ in sample]
+    search_words = sorted({word for _, title in sample for word in title.split() if len(word) > 3})
+    hot_items = list(active.order_by("-bid_count", "end_date").values("id", "owner_id")[:config.hot_items])
+    close_old_connections()
+
+    simulated = []
+    for user in users:
+        # Users cannot bid on their own items
+        hot_item_ids = [item["id"] for item in hot_items if item["owner_id"] != user.id]
+        simulated.append(
+            SimulatedUser(
+                user,
+                config,
+                item_ids,
+                search_words or ["item"],
+                hot_item_ids,
+                random.Random(rng.random()),
+            )
+        )
+
+    start = threading.Barrier(len(simulated) + 1)
+    started_at = timezone.now()
+    began = time.perf_counter()
+    deadline = began + config.duration
+    threads = [
+        threading.Thread(target=user.run, args=(deadline, start), daemon=True)
+        for user in simulated
+    ]
+    for thread in threads:
+        thread.start()
+    start.wait()
+    for thread in threads:
+        thread.join()
+    elapsed = time.perf_counter() - began
+
+    samples = [sample for user in simulated for sample in user.samples]
+    by_endpoint: dict[str, list[Sample]] = defaultdict(list)
+    for sample in samples:
+        by_endpoint[sample.endpoint].append(sample)
+
+    return {
+        "started_at": started_at.isoformat(),
+        "config": asdict(config) | {"password": "***"},
+        "elapsed_seconds": round(elapsed, 3),
+        "total": asdict(summarize(samples, elapsed)),
+        "endpoints": {
+            name: asdict(summarize(by_endpoint[name], elapsed))
+            for name in ["login", *ACTION_WEIGHTS]
+            if name in by_endpoint
+        },
+    }
@@ -0,0 +1,92 @@
+import time
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from api.models import User
+
+# (label, SESSION_ENGINE, AUTHENTICATION_BACKENDS)
+MODES = [
+    (
+        'uncached',
+        'django.contrib.sessions.backends.db',
+        ['django.contrib.auth.backends.ModelBackend'],
+    ),
+    (
+        'cached',
+        'django.contrib.sessions.backends.cached_db',
+        ['api.user_cache.CachedModelBackend'],
+    ),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare queries and time per signed-in request with the stock session '
+        'and auth backends and with the cached ones'
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            '--requests',
+            type=int,
+            default=200,
+            help='Requests per mode (default: 200)',
+        )
+        parser.add_argument(
+            '--path',
+            default='/api/auth/me/?compact=1',
+            help='login_required GET endpoint to request (default: /api/auth/me/?compact=1)',
+        )
+        parser.add_argument(
+            '--username',
+            help='User to sign in as (default: the first user)',
+        )
+
+    def handle(self, *args, **options) -> None:
+        requests: int = options['requests']
+        path: str = options['path']
+        if requests <= 0:
+            raise CommandError('--requests must be positive')
+
+        users = User.objects.order_by('id')
+        if options['username']:
+            users = users.filter(username=options['username'])
+        user = users.first()
+        if user is None:
+            raise CommandError('No such user; run create_test_data first')
+
+        results = {}
+        for label, engine, backends in MODES:
+            with override_settings(
+                SESSION_ENGINE=engine,
+                AUTHENTICATION_BACKENDS=backends,
+                ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver'],
+            ):
+                client = Client()
+                client.force_login(user)
+                # Warm up: fills the caches and any per-process state
+                response = client.get(path)
+                if response.status_code != 200:
+                    raise CommandError(f'GET {path} answered {response.status_code}')
+
+                with CaptureQueriesContext(connection) as queries:
+                    started = time.perf_counter()
+                    for _ in range(requests):
+                        client.get(path)
+                    elapsed = time.perf_counter() - started
+                client.logout()
+
+            per_request = len(queries.captured_queries) / requests
+            results[label] = per_request
+            self.stdout.write(
+                f'{label:>9}: {per_request:.2f} queries/request, '
+                f'{elapsed / requests * 1000:.2f} ms/request'
+            )
+
+        removed = results['uncached'] - results['cached']
+        self.stdout.write(
+            self.style.SUCCESS(f'Queries removed per request: {removed:.2f}')
+        )
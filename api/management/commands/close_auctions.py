@@ -1,89 +1,94 @@
-from django.core.management.base import BaseCommand
+import time
+from itertools import islice
+from django.core.management.base import BaseCommand, CommandError
 from django.utils import timezone
-from django.core.mail import send_mail
-from django.conf import settings
-from api.models import Item, Bid
-from typing import List
+from api.auctions import close_ended
+from api.models import Item
+from api.outbox import deliver_pending
 
 
 class Command(BaseCommand):
-    help = 'Close ended auctions and notify winners'
+    help = 'Close ended auctions, then send the queued winner notifications'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Auctions closed per batch (default: 500)',
+        )
+        parser.add_argument(
+            '--no-send',
+            action='store_true',
+            help='Only queue winner emails, for a separate send_outbox job',
+        )
 
     def handle(self, *args, **options) -> None:
         """
         Find all active items where end_date has passed,
-        determine winner, send email, mark as inactive.
+        determine winner, queue the winner email, mark as inactive.
+        Then deliver the outbox, unless --no-send.
+
+        Ended auction ids are streamed from the database and closed in
+        batches, each with a fixed number of set-based statements, so memory
+        and transaction size stay bounded however many auctions have ended.
         """
+        batch_size: int = options['batch_size']
+        self.verbosity: int = options['verbosity']
+        if batch_size <= 0:
+            raise CommandError('--batch-size must be positive')
+
         now = timezone.now()
-        ended_items: List[Item] = Item.objects.filter(
-            is_active=True,
-            end_date__lte=now,
-            winner__isnull=True
+        ended_ids = (
+            Item.objects.filter(is_active=True, end_date__lte=now, winner__isnull=True)
+            .values_list('id', flat=True)
+            .iterator(chunk_size=batch_size)
         )
 
-        self.stdout.write(f"Found {ended_items.count()} ended auctions")
-
-        for item in ended_items:
-            # Get highest bid
-            highest_bid: Bid | None = item.bids.order_by('-amount').first()
-
-            if highest_bid:
-                # Set winner
-                item.winner = highest_bid.bidder
-                item.save()
-
-                # Send email
-                self._send_winner_email(item, highest_bid)
-
-                self.stdout.write(
-                    self.style.SUCCESS(
-                        f'Closed "{item.title}" - Winner: {highest_bid.bidder.username}'
-                    )
-                )
-            else:
-                # No bids, just mark as ended
-                item.is_active = False
-                item.save()
-                self.stdout.write(
-                    self.style.WARNING(f'Closed "{item.title}" - No bids')
-                )
-
-    def _send_winner_email(self, item: Item, winning_bid: Bid) -> None:
-        """Send email to auction winner"""
-        subject = f'You won the auction for {item.title}!'
-
-        message = f"""
-Congratulations {winning_bid.bidder.username}!
-
-You have won the auction for "{item.title}" with a winning bid of ${winning_bid.amount}.
-
-Item Details:
-- Title: {item.title}
-- Description: {item.description}
-- Your Winning Bid: ${winning_bid.amount}
-- Seller: {item.owner.username}
-- Seller Email: {item.owner.email}
-
-Please proceed to purchase the item by contacting the seller.
+        total_won = total_unsold = 0
+        batch_number = 0
+        while batch := list(islice(ended_ids, batch_size)):
+            batch_number += 1
+            started = time.perf_counter()
+            won, unsold = self._close_batch(batch, now)
+            total_won += won
+            total_unsold += unsold
+            self.stdout.write(
+                f'Batch {batch_number}: {len(batch)} auctions '
+                f'({won} won, {unsold} without bids) '
+                f'in {time.perf_counter() - started:.3f}s'
+            )
 
-Thank you for using our auction platform!
+        self.stdout.write(
+            self.style.SUCCESS(
+                f'Closed {total_won + total_unsold} auctions: '
+                f'{total_won} won, {total_unsold} without bids'
+            )
+        )
 
-Best regards,
-Auction Team
-"""
+        if not options['no_send']:
+            self._send_outbox()
 
+    def _send_outbox(self) -> None:
+        """Deliver queued emails; failures stay queued for the next run."""
         try:
-            send_mail(
-                subject=subject,
-                message=message,
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=[winning_bid.bidder.email],
-                fail_silently=False,
-            )
-            self.stdout.write(
-                self.style.SUCCESS(f'Email sent to {winning_bid.bidder.email}')
-            )
+            stats = deliver_pending()
         except Exception as e:
             self.stdout.write(
-                self.style.ERROR(f'Failed to send email: {str(e)}')
+                self.style.WARNING(f'Could not send emails, they stay queued: {e}')
             )
+            return
+        self.stdout.write(
+            f'Sent {stats.sent} emails, {stats.retrying} to retry, {stats.failed} failed'
+        )
+
+    def _close_batch(self, ids: list[int], now) -> tuple[int, int]:
+        """Close one batch of ended auctions; returns (won, unsold) counts."""
+        closed = close_ended(ids, now)
+        if self.verbosity >= 2:
+            for item in closed.won:
+                self.stdout.write(
+                    f'Closed "{item.title}" - Winner: {item.winner.username}, '
+                    f'email queued for {item.winner.email}'
+                )
+        return len(closed.won), len(closed.unsold_ids)
@@ -1,107 +1,317 @@
-from django.core.management.base import BaseCommand
-from django.contrib.auth import get_user_model
-from api.models import Item, Bid, Question
-from datetime import timedelta
-from django.utils import timezone
+import hashlib
+import io
+import random
+import time
+from datetime import datetime, timedelta
 from decimal import Decimal
+
+from django.contrib.auth import get_user_model
+from django.contrib.auth.hashers import make_password
 from django.core.files.base import ContentFile
-import io
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.utils import timezone
 from PIL import Image
 
+from api.images import ITEM_VARIANTS, generate_variants
+from api.models import Bid, Item, Question
+
 User = get_user_model()
 
+PASSWORD = 'testpass123'
+# Distinct pictures shared by all generated items
+IMAGE_POOL_SIZE = 12
+# One item in HOT_ITEM_RATIO gets HOT_BID_FACTOR times the usual bids
+HOT_ITEM_RATIO = 1000
+HOT_BID_FACTOR = 100
+# Tail of the per-item bid count distribution (lower is more skewed)
+BID_SKEW = 1.5
+
+ADJECTIVES = [
+    'Vintage', 'Antique', 'Modern', 'Rare', 'Classic', 'Handmade', 'Signed',
+    'Restored', 'Limited', 'Professional', 'Compact', 'Leather', 'Wooden',
+    'Electric', 'Retro', 'Original', 'Collectible', 'Portable', 'Deluxe', 'Mint',
+]
+NOUNS = [
+    'Bicycle', 'Laptop', 'Watch', 'Handbag', 'Camera', 'Records', 'Painting',
+    'Jacket', 'Guitar', 'Lamp', 'Chair', 'Desk', 'Typewriter', 'Telescope',
+    'Headphones', 'Drone', 'Sculpture', 'Rug', 'Clock', 'Console',
+]
+QUESTIONS = [
+    'What is the condition of this item?',
+    'Can you ship internationally?',
+    'Are there any scratches or defects?',
+    'Is the original packaging included?',
+    'How old is it?',
+]
+ANSWERS = [
+    'The item is in excellent condition with no defects.',
+    'Yes, shipping is available worldwide.',
+    'Only minor signs of use, see the photo.',
+]
+
 
 class Command(BaseCommand):
-    help = 'Create test data for auction app'
+    help = (
+        'Create synthetic users, auctions, bids and questions. Scales to '
+        'millions of rows: rows are bulk-inserted in chunks and items share a '
+        'small pool of deduplicated pictures'
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            '--users', type=int, default=5, help='Users testuser1..N (default: 5)'
+        )
+        parser.add_argument(
+            '--items', type=int, default=10, help='Items to create (default: 10)'
+        )
+        parser.add_argument(
+            '--bids-per-item',
+            type=float,
+            default=1.0,
+            help='Average bids per item; a few hot items get far more (default: 1)',
+        )
+        parser.add_argument(
+            '--questions',
+            type=float,
+            default=0.5,
+            help='Average questions per item, half of them answered (default: 0.5)',
+        )
+        parser.add_argument(
+            '--ended',
+            type=float,
+            default=0.3,
+            help='Share of items already past their end date and not yet closed (default: 0.3)',
+        )
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=5000,
+            help='Items inserted per transaction (default: 5000)',
+        )
+        parser.add_argument(
+            '--seed', type=int, help='Random seed, for a repeatable data set'
+        )
 
     def handle(self, *args, **options) -> None:
-        self.stdout.write("Creating test users...")
-
-        # Create 5 test users
-        users = []
-        for i in range(1, 6):
-            username = f'testuser{i}'
-            email = f'testuser{i}@example.com'
-
-            # Check if user exists
-            if User.objects.filter(username=username).exists():
-                user = User.objects.get(username=username)
-                self.stdout.write(f"User {username} already exists")
-            else:
-                user = User.objects.create_user(
-                    username=username,
-                    email=email,
-                    password='testpass123',
-                    date_of_birth='1990-01-01',
-                )
-                self.stdout.write(self.style.SUCCESS(f"Created user: {username}"))
-
-            users.append(user)
-
-        self.stdout.write("Creating test auction items...")
-
-        # Item data
-        items_data = [
-            ("Vintage Bicycle", "Classic red bicycle in excellent condition", "150.00"),
-            ("Gaming Laptop", "High-performance laptop with RTX graphics", "800.00"),
-            ("Antique Watch", "Rare pocket watch from the 1950s", "300.00"),
-            ("Designer Handbag", "Authentic leather handbag", "250.00"),
-            ("Camera Equipment", "Professional DSLR camera with lenses", "600.00"),
-            ("Vintage Vinyl Records", "Collection of 50+ classic albums", "120.00"),
-            ("Smart Home Hub", "Latest model with voice control", "80.00"),
-            ("Art Painting", "Original oil painting by local artist", "400.00"),
-            ("Leather Jacket", "Genuine leather motorcycle jacket", "180.00"),
-            ("Kitchen Appliances", "Food processor and blender set", "90.00"),
-        ]
-
-        for i, (title, description, price) in enumerate(items_data):
-            # Create simple colored image
-            img = Image.new('RGB', (400, 300), color=(100 + i*10, 150, 200 - i*5))
-            img_io = io.BytesIO()
-            img.save(img_io, format='JPEG')
-            img_file = ContentFile(img_io.getvalue(), name=f'item{i+1}.jpg')
-
-            # Vary end dates
-            days_ahead = (i % 5) + 1  # 1-5 days
-            end_date = timezone.now() + timedelta(days=days_ahead)
-
-            item = Item.objects.create(
-                owner=users[i % 5],
-                title=title,
-                description=description,
-                starting_price=Decimal(price),
-                current_price=Decimal(price),
-                picture=img_file,
-                end_date=end_date,
+        n_users: int = options['users']
+        n_items: int = options['items']
+        chunk_size: int = options['chunk_size']
+        if n_users < 2 or n_items < 0 or chunk_size <= 0:
+            raise CommandError('Need at least 2 users, and a positive --chunk-size')
+        if not 0 <= options['ended'] <= 1:
+            raise CommandError('--ended must be between 0 and 1')
+
+        self.rng = random.Random(options['seed'])
+        self.bids_per_item: float = options['bids_per_item']
+        self.questions_per_item: float = options['questions']
+        self.ended_share: float = options['ended']
+        self.now = timezone.now()
+        started = time.perf_counter()
+
+        self.stdout.write(f'Creating {n_users} test users...')
+        self.user_ids = self.create_users(n_users)
+
+        self.stdout.write('Preparing shared pictures...')
+        self.pictures = self.create_pictures()
+
+        self.stdout.write(f'Creating {n_items} items with bids and questions...')
+        hot_items = max(n_items // HOT_ITEM_RATIO, 1)
+        self.hot_every = max(n_items // hot_items, 1)
+        totals = {'items': 0, 'bids': 0, 'questions': 0}
+        for offset in range(0, n_items, chunk_size):
+            created = self.create_chunk(offset, min(chunk_size, n_items - offset))
+            for key, count in created.items():
+                totals[key] += count
+            self.stdout.write(
+                f"  {totals['items']}/{n_items} items, {totals['bids']} bids, "
+                f"{totals['questions']} questions"
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"\nTest data created in {time.perf_counter() - started:.1f}s: "
+                f"{totals['items']} items, {totals['bids']} bids, "
+                f"{totals['questions']} questions"
             )
+        )
+        self.stdout.write('\nTest user credentials:')
+        self.stdout.write(f'Username: testuser1-{n_users}')
+        self.stdout.write(f'Password: {PASSWORD}')
+        self.stdout.write('Ended auctions are left open; run close_auctions to close them')
 
-            # Add some bids
-            if i % 2 == 0:  # Add bids to half the items
-                bid_amount = Decimal(price) + Decimal('10.00')
-                Bid.objects.create(
-                    item=item,
-                    bidder=users[(i + 1) % 5],
-                    amount=bid_amount,
+    def create_users(self, count: int) -> list[int]:
+        """Create testuser1..count (existing ones are kept) and return their ids."""
+        # Hashing is deliberately slow, so every user shares one hash
+        password = make_password(PASSWORD)
+        usernames = [f'testuser{i}' for i in range(1, count + 1)]
+        for offset in range(0, count, 10000):
+            User.objects.bulk_create(
+                [
+                    User(
+                        username=username,
+                        email=f'{username}@example.com',
+                        password=password,
+                        date_of_birth='1990-01-01',
+                    )
+                    for username in usernames[offset:offset + 10000]
+                ],
+                ignore_conflicts=True,
+            )
+        # Ordered, so --seed picks the same users on every database
+        return list(
+            User.objects.filter(username__in=usernames)
+            .order_by('id')
+            .values_list('id', flat=True)
+        )
+
+    def create_pictures(self) -> list[tuple[str, dict[str, str]]]:
+        """
+        Store IMAGE_POOL_SIZE pictures and their variants, named by content
+        hash so repeated runs reuse the same files.
+        """
+        pictures = []
+        for i in range(IMAGE_POOL_SIZE):
+            image = Image.new('RGB', (400, 300), color=(100 + i * 10, 150, 200 - i * 5))
+            buffer = io.BytesIO()
+            image.save(buffer, format='JPEG')
+            content = buffer.getvalue()
+            path = f'item_pics/test/{hashlib.sha256(content).hexdigest()[:16]}.jpg'
+            if not default_storage.exists(path):
+                path = default_storage.save(path, ContentFile(content))
+            picture = Item(picture=path).picture
+            pictures.append((path, generate_variants(picture, ITEM_VARIANTS)))
+        return pictures
+
+    def price(self, low: int, high: int) -> Decimal:
+        return Decimal(self.rng.randint(low * 100, high * 100)) / 100
+
+    def other_user(self, owner_id: int) -> int:
+        while True:
+            user_id = self.rng.choice(self.user_ids)
+            if user_id != owner_id:
+                return user_id
+
+    def bid_count(self, hot: bool) -> int:
+        """Heavy-tailed number of bids averaging bids_per_item."""
+        most = int(self.bids_per_item * HOT_BID_FACTOR)
+        if hot:
+            return most
+        # paretovariate(a) - 1 has mean 1 / (a - 1)
+        draw = (self.rng.paretovariate(BID_SKEW) - 1) * (BID_SKEW - 1)
+        return min(int(self.bids_per_item * draw + self.rng.random()), most)
+
+    def make_bids(self, item: Item, count: int) -> list[Bid]:
+        """Rising bids spread between the item's creation and its end (or now)."""
+        last = min(item.end_date, self.now)
+        times = sorted(
+            item.created_at + (last - item.created_at) * self.rng.random()
+            for _ in range(count)
+        )
+        bids = []
+        amount = item.starting_price
+        for created_at in times:
+            # Steps relative to the starting price, so hot items' prices stay
+            # within the field's digits
+            amount += max(
+                (item.starting_price * Decimal(self.rng.uniform(0.01, 0.05))).quantize(
+                    Decimal('0.01')
+                ),
+                Decimal('0.01'),
+            )
+            bids.append(
+                Bid(
+                    bidder_id=self.other_user(item.owner_id),
+                    amount=amount,
+                    created_at=created_at,
                 )
-                item.current_price = bid_amount
-                item.save()
-
-            # Add some questions
-            if i % 3 == 0:  # Add questions to 1/3 of items
-                q = Question.objects.create(
-                    item=item,
-                    asker=users[(i + 2) % 5],
-                    question_text="What is the condition of this item?",
+            )
+        if bids:
+            item.current_price = item.leading_bid = bids[-1].amount
+            item.leading_bidder_id = bids[-1].bidder_id
+            item.last_bid_at = bids[-1].created_at
+            item.bid_count = len(bids)
+        return bids
+
+    def make_questions(self, item: Item) -> list[Question]:
+        count = 0
+        if self.questions_per_item:
+            count = int(self.rng.expovariate(1 / self.questions_per_item) + self.rng.random())
+        questions = []
+        for _ in range(count):
+            answered = self.rng.random() < 0.5
+            questions.append(
+                Question(
+                    asker_id=self.other_user(item.owner_id),
+                    question_text=self.rng.choice(QUESTIONS),
+                    answer_text=self.rng.choice(ANSWERS) if answered else '',
+                    answered_at=self.now if answered else None,
                 )
-                # Answer some questions
-                if i % 6 == 0:
-                    q.answer_text = "The item is in excellent condition with no defects."
-                    q.answered_at = timezone.now()
-                    q.save()
-
-            self.stdout.write(self.style.SUCCESS(f"Created item: {title}"))
-
-        self.stdout.write(self.style.SUCCESS("\nTest data created successfully!"))
-        self.stdout.write("\nTest user credentials:")
-        self.stdout.write("Username: testuser1-5")
-        self.stdout.write("Password: testpass123")
+            )
+        item.unanswered_question_count = sum(1 for q in questions if not q.answer_text)
+        return questions
+
+    def end_date(self, ended: bool) -> datetime:
+        if ended:
+            return self.now - timedelta(minutes=self.rng.uniform(1, 60 * 24 * 7))
+        return self.now + timedelta(minutes=self.rng.uniform(10, 60 * 24 * 14))
+
+    def create_chunk(self, offset: int, count: int) -> dict[str, int]:
+        items, bids, questions = [], [], []
+        for index in range(offset, offset + count):
+            # Hot items stay open so they keep attracting bids
+            hot = index % self.hot_every == 0
+            ended = not hot and self.rng.random() < self.ended_share
+            picture, variants = self.rng.choice(self.pictures)
+            starting_price = self.price(5, 1000)
+            item = Item(
+                owner_id=self.rng.choice(self.user_ids),
+                title=f'{self.rng.choice(ADJECTIVES)} {self.rng.choice(NOUNS)} #{index + 1}',
+                description=(
+                    f'{self.rng.choice(ADJECTIVES)} {self.rng.choice(NOUNS).lower()} '
+                    f'in {self.rng.choice(["good", "great", "fair", "excellent"])} condition'
+                ),
+                starting_price=starting_price,
+                current_price=starting_price,
+                picture=picture,
+                picture_variants=variants,
+                end_date=self.end_date(ended),
+            )
+            # Listed 1-14 days before it ended (or before now, if still open)
+            item.created_at = min(item.end_date, self.now) - timedelta(
+                days=self.rng.uniform(1, 14)
+            )
+            bids.append(self.make_bids(item, self.bid_count(hot)))
+            questions.append(self.make_questions(item))
+            items.append(item)
+
+        created_at = [item.created_at for item in items]
+        with transaction.atomic():
+            if connection.features.can_return_rows_from_bulk_insert:
+                Item.objects.bulk_create(items)
+            else:
+                # MySQL doesn't report the ids of bulk-inserted rows, and the
+                # bids and questions below need them
+                for item in items:
+                    item.save(force_insert=True)
+            # Inserting stamped created_at with now (auto_now_add)
+            for item, value in zip(items, created_at):
+                item.created_at = value
+            Item.objects.bulk_update(items, ['created_at'], batch_size=1000)
+            for item, item_bids, item_questions in zip(items, bids, questions):
+                for row in (*item_bids, *item_questions):
+                    row.item_id = item.id
+            Bid.objects.bulk_create(
+                [bid for item_bids in bids for bid in item_bids], batch_size=10000
+            )
+            Question.objects.bulk_create(
+                [q for item_questions in questions for q in item_questions],
+                batch_size=10000,
+            )
+
+        return {
+            'items': len(items),
+            'bids': sum(len(item_bids) for item_bids in bids),
+            'questions': sum(len(item_questions) for item_questions in questions),
+        }
@@ -0,0 +1,59 @@
+from django.core.management.base import BaseCommand, CommandError
+from api.images import refresh_item_variants, refresh_profile_variants
+from api.models import Item, User
+
+
+class Command(BaseCommand):
+    help = 'Backfill resized variants of item pictures and profile images'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=200,
+            help='Rows loaded per batch (default: 200)',
+        )
+        parser.add_argument(
+            '--force',
+            action='store_true',
+            help='Regenerate variants that already exist (e.g. after changing sizes)',
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Walk items and users in primary-key order and generate the variants
+        of every upload that has none yet (or all of them with --force).
+        """
+        chunk_size: int = options['chunk_size']
+        force: bool = options['force']
+        if chunk_size <= 0:
+            raise CommandError('--chunk-size must be positive')
+
+        items = Item.objects.exclude(picture='')
+        users = User.objects.exclude(profile_image='').exclude(profile_image__isnull=True)
+        if not force:
+            items = items.filter(picture_variants={})
+            users = users.filter(profile_image_variants={})
+
+        done, failed = self._backfill(items, refresh_item_variants, 'picture_variants', chunk_size)
+        self.stdout.write(f'Item pictures: {done} processed, {failed} unreadable')
+        done, failed = self._backfill(users, refresh_profile_variants, 'profile_image_variants', chunk_size)
+        self.stdout.write(f'Profile images: {done} processed, {failed} unreadable')
+
+        self.stdout.write(self.style.SUCCESS('Image variants are up to date'))
+
+    def _backfill(self, queryset, refresh, field: str, chunk_size: int) -> tuple[int, int]:
+        """Refresh each row of ``queryset`` one chunk at a time."""
+        done = failed = 0
+        last_id = 0
+        while True:
+            chunk = list(queryset.filter(id__gt=last_id).order_by('id')[:chunk_size])
+            if not chunk:
+                return done, failed
+            last_id = chunk[-1].id
+            for obj in chunk:
+                refresh(obj)
+                done += 1
+                if not getattr(obj, field):
+                    failed += 1
+                    self.stdout.write(self.style.WARNING(f'Could not read image of {type(obj).__name__} {obj.id}'))
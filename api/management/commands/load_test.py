@@ -0,0 +1,115 @@
+import json
+import logging
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.test import override_settings
+from api.loadtest import LoadTestConfig, run_load_test
+
+
+class Command(BaseCommand):
+    help = (
+        'Simulate concurrent users (login, browsing, search, item detail and '
+        'contested bidding) through the test client against the configured '
+        'database, and report latency, throughput, errors and queries per endpoint'
+    )
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            '--users',
+            type=int,
+            default=10,
+            help='Concurrent simulated users, one thread each (default: 10)',
+        )
+        parser.add_argument(
+            '--duration',
+            type=float,
+            default=30.0,
+            help='Seconds to run (default: 30)',
+        )
+        parser.add_argument(
+            '--hot-items',
+            type=int,
+            default=3,
+            help='Items every user bids on (default: 3)',
+        )
+        parser.add_argument(
+            '--think-time',
+            type=float,
+            default=0.0,
+            help='Seconds each user pauses between requests (default: 0)',
+        )
+        parser.add_argument(
+            '--username-prefix',
+            default='testuser',
+            help='Users to sign in as, e.g. those of create_test_data (default: testuser)',
+        )
+        parser.add_argument(
+            '--password',
+            default='testpass123',
+            help='Password of those users (default: testpass123)',
+        )
+        parser.add_argument(
+            '--seed',
+            type=int,
+            help='Random seed, for repeatable action sequences',
+        )
+        parser.add_argument(
+            '--output',
+            default='load_test_results.json',
+            help='Where to write the JSON results (default: load_test_results.json)',
+        )
+
+    def handle(self, *args, **options) -> None:
+        config = LoadTestConfig(
+            users=options['users'],
+            duration=options['duration'],
+            hot_items=options['hot_items'],
+            think_time=options['think_time'],
+            password=options['password'],
+            username_prefix=options['username_prefix'],
+            seed=options['seed'],
+        )
+        if config.users <= 0 or config.duration <= 0 or config.hot_items < 0:
+            raise CommandError('--users and --duration must be positive, --hot-items not negative')
+
+        self.stdout.write(
+            f'Running {config.users} users for {config.duration:g}s...'
+        )
+        # Outbid bids are expected; don't log each 4xx response
+        request_logger = logging.getLogger('django.request')
+        level = request_logger.level
+        request_logger.setLevel(logging.ERROR)
+        # The test client sends Host: testserver
+        try:
+            with override_settings(ALLOWED_HOSTS=[*settings.ALLOWED_HOSTS, 'testserver']):
+                results = run_load_test(config)
+        except ValueError as e:
+            raise CommandError(f'{e}; run create_test_data first') from e
+        finally:
+            request_logger.setLevel(level)
+
+        header = (
+            f"{'endpoint':<8} {'reqs':>7} {'req/s':>8} {'p50 ms':>8} {'p95 ms':>8} "
+            f"{'p99 ms':>8} {'errors':>7} {'4xx':>7} {'queries':>8}"
+        )
+        self.stdout.write(header)
+        rows = [*results['endpoints'].items(), ('total', results['total'])]
+        for name, stats in rows:
+            self.stdout.write(
+                f"{name:<8} {stats['requests']:>7} {stats['requests_per_second']:>8.1f} "
+                f"{stats['p50_ms']:>8.1f} {stats['p95_ms']:>8.1f} {stats['p99_ms']:>8.1f} "
+                f"{stats['error_rate']:>7.1%} {stats['reject_rate']:>7.1%} "
+                f"{stats['queries_per_request']:>8.1f}"
+            )
+
+        with open(options['output'], 'w') as output:
+            json.dump(results, output, indent=2)
+        self.stdout.write(self.style.SUCCESS(f"Results written to {options['output']}"))
+
+        if results['total']['error_rate']:
+            self.stdout.write(
+                self.style.WARNING(
+                    f"{results['total']['error_rate']:.1%} of requests failed (5xx or exception)"
+                )
+            )
@@ -0,0 +1,155 @@
+import signal
+import threading
+import time
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections, connections
+from django.utils import timezone
+from api.auctions import close_ended
+from api.outbox import deliver_pending
+from api.scheduler import AuctionSchedule
+
+
+class Command(BaseCommand):
+    help = 'Run a daemon that closes each auction as soon as its end date passes'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            '--poll-interval',
+            type=float,
+            default=1.0,
+            help='Longest sleep between checks for new or edited items, in seconds (default: 1)',
+        )
+        parser.add_argument(
+            '--reload-interval',
+            type=float,
+            default=300.0,
+            help='Seconds between full reloads of the schedule from the database (default: 300)',
+        )
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=500,
+            help='Auctions closed per batch when many end at once (default: 500)',
+        )
+        parser.add_argument(
+            '--send-interval',
+            type=float,
+            default=60.0,
+            help='Longest wait between outbox deliveries, for retries, in seconds (default: 60)',
+        )
+        parser.add_argument(
+            '--no-send',
+            action='store_true',
+            help='Only queue winner emails, for a separate send_outbox job',
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Keep every open auction's deadline in an in-memory priority queue and
+        close auctions as they come due, instead of scanning the active set on
+        a timer. See api.scheduler for how the schedule is kept in sync.
+
+        Winner emails are delivered from the outbox by a background thread,
+        woken after each close, so a slow mail server never delays closing.
+        """
+        poll_interval: float = options['poll_interval']
+        reload_interval: float = options['reload_interval']
+        batch_size: int = options['batch_size']
+        send_interval: float = options['send_interval']
+        self.verbosity: int = options['verbosity']
+        if min(poll_interval, reload_interval, batch_size, send_interval) <= 0:
+            raise CommandError(
+                '--poll-interval, --reload-interval, --batch-size and '
+                '--send-interval must be positive'
+            )
+
+        self._running = True
+        self._emails_queued = threading.Event()
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+        sender = None
+        if not options['no_send']:
+            # Daemon, so a crash of the main loop still ends the process;
+            # on a clean stop it finishes its current delivery first
+            sender = threading.Thread(
+                target=self._send_outbox,
+                args=(send_interval,),
+                name='outbox-sender',
+                daemon=True,
+            )
+            sender.start()
+
+        schedule = AuctionSchedule()
+        schedule.reload()
+        reloaded_at = time.monotonic()
+        self.stdout.write(f'Scheduled {len(schedule)} open auctions')
+
+        while self._running:
+            # Long-running process: drop connections the database has closed
+            close_old_connections()
+
+            if time.monotonic() - reloaded_at >= reload_interval:
+                schedule.reload()
+                reloaded_at = time.monotonic()
+                if self.verbosity >= 2:
+                    self.stdout.write(f'Reloaded {len(schedule)} open auctions')
+            else:
+                schedule.poll()
+
+            now = timezone.now()
+            due = schedule.pop_due(now)
+            for start in range(0, len(due), batch_size):
+                self._close(schedule, due[start:start + batch_size], now)
+
+            next_deadline = schedule.next_deadline()
+            wait = poll_interval
+            if next_deadline is not None:
+                wait = min(wait, (next_deadline - timezone.now()).total_seconds())
+            if wait > 0:
+                time.sleep(wait)
+
+        if sender is not None:
+            self._emails_queued.set()
+            sender.join()
+        self.stdout.write(self.style.SUCCESS('Scheduler stopped'))
+
+    def _close(self, schedule: AuctionSchedule, ids: list[int], now) -> None:
+        """Close one batch of due auctions and put back any whose end date moved."""
+        closed = close_ended(ids, now)
+        closed_ids = {item.id for item in closed.won}.union(closed.unsold_ids)
+        schedule.reschedule([item_id for item_id in ids if item_id not in closed_ids])
+
+        for item in closed.won:
+            lag = (timezone.now() - item.end_date).total_seconds()
+            self.stdout.write(
+                f'Closed "{item.title}" - Winner: {item.winner.username} ({lag:.2f}s after end)'
+            )
+        if closed.unsold_ids:
+            self.stdout.write(f'Closed {len(closed.unsold_ids)} auctions without bids')
+        if closed.won:
+            self._emails_queued.set()
+
+    def _send_outbox(self, interval: float) -> None:
+        """Sender thread: drain the outbox when woken, and every ``interval`` for retries."""
+        try:
+            while self._running:
+                self._emails_queued.wait(interval)
+                self._emails_queued.clear()
+                close_old_connections()
+                try:
+                    stats = deliver_pending()
+                except Exception as e:
+                    self.stderr.write(f'Could not send emails, they stay queued: {e}')
+                    continue
+                if stats.sent or stats.retrying or stats.failed:
+                    self.stdout.write(
+                        f'Sent {stats.sent} emails, {stats.retrying} to retry, '
+                        f'{stats.failed} failed'
+                    )
+        finally:
+            # This thread has its own database connections
+            connections.close_all()
+
+    def _stop(self, signum, frame) -> None:
+        self._running = False
+        self._emails_queued.set()
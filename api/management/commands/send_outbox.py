@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+from api.outbox import MAX_ATTEMPTS, deliver_pending
+
+
+class Command(BaseCommand):
+    help = 'Deliver pending outbox emails over a single mail connection'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            '--batch-size',
+            type=int,
+            default=100,
+            help='Messages claimed per transaction (default: 100)',
+        )
+        parser.add_argument(
+            '--max-attempts',
+            type=int,
+            default=MAX_ATTEMPTS,
+            help=f'Attempts before a message is marked failed (default: {MAX_ATTEMPTS})',
+        )
+
+    def handle(self, *args, **options) -> None:
+        batch_size: int = options['batch_size']
+        max_attempts: int = options['max_attempts']
+        if batch_size <= 0 or max_attempts <= 0:
+            raise CommandError('--batch-size and --max-attempts must be positive')
+
+        stats = deliver_pending(batch_size=batch_size, max_attempts=max_attempts)
+
+        self.stdout.write(self.style.SUCCESS(f'Sent {stats.sent} emails'))
+        if stats.retrying:
+            self.stdout.write(
+                self.style.WARNING(f'{stats.retrying} emails will be retried')
+            )
+        if stats.failed:
+            self.stdout.write(
+                self.style.ERROR(f'{stats.failed} emails failed permanently')
+            )
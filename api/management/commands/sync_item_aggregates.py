@@ -0,0 +1,153 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+from django.db.models import Count, F, Max, Window
+from django.db.models.functions import RowNumber
+from django.utils import timezone
+from api.models import Item, Bid, Question
+
+AGGREGATE_FIELDS = [
+    'bid_count',
+    'leading_bid',
+    'leading_bidder_id',
+    'last_bid_at',
+    'unanswered_question_count',
+]
+
+
+class Command(BaseCommand):
+    help = 'Backfill or verify the bid and question aggregates stored on items'
+
+    def add_arguments(self, parser) -> None:
+        parser.add_argument(
+            '--chunk-size',
+            type=int,
+            default=1000,
+            help='Items recomputed per batch (default: 1000)',
+        )
+        parser.add_argument(
+            '--check',
+            action='store_true',
+            help='Only report items whose stored aggregates are wrong; exit non-zero if any are',
+        )
+
+    def handle(self, *args, **options) -> None:
+        """
+        Walk items in primary-key order, recompute their aggregates from the
+        bids and questions tables one chunk at a time and fix any mismatch.
+        """
+        chunk_size: int = options['chunk_size']
+        check_only: bool = options['check']
+        if chunk_size <= 0:
+            raise CommandError('--chunk-size must be positive')
+
+        checked = 0
+        mismatched = 0
+        last_id = 0
+
+        while True:
+            if check_only:
+                items, stale = self._sync_chunk(last_id, chunk_size, write=False)
+            else:
+                # Locked from the read to the write, so a bid placed meanwhile
+                # waits instead of being overwritten with older aggregates
+                with transaction.atomic():
+                    items, stale = self._sync_chunk(last_id, chunk_size, write=True)
+            if not items:
+                break
+            last_id = items[-1].id
+
+            checked += len(items)
+            mismatched += len(stale)
+            self.stdout.write(
+                f'Checked {checked} items, {mismatched} with stale aggregates'
+            )
+
+        if check_only and mismatched:
+            raise CommandError(f'{mismatched} items have stale aggregates')
+
+        verb = 'Found' if check_only else 'Fixed'
+        self.stdout.write(
+            self.style.SUCCESS(f'{verb} {mismatched} of {checked} items')
+        )
+
+    def _sync_chunk(
+        self, last_id: int, chunk_size: int, write: bool
+    ) -> tuple[list[Item], list[Item]]:
+        """
+        Recompute the next chunk of items after ``last_id``; with ``write``
+        (inside a transaction) lock them and save the stale ones.
+
+        Returns:
+            (items in the chunk, items whose stored aggregates were wrong)
+        """
+        items = Item.objects.filter(id__gt=last_id).order_by('id')
+        if write:
+            items = items.select_for_update()
+        items = list(items.only('id', *AGGREGATE_FIELDS)[:chunk_size])
+
+        expected = self._compute(items)
+        stale = []
+        for item in items:
+            values = expected[item.id]
+            if any(getattr(item, field) != values[field] for field in AGGREGATE_FIELDS):
+                for field in AGGREGATE_FIELDS:
+                    setattr(item, field, values[field])
+                stale.append(item)
+
+        if stale and write:
+            now = timezone.now()
+            for item in stale:
+                item.updated_at = now
+            Item.objects.bulk_update(stale, [*AGGREGATE_FIELDS, 'updated_at'])
+        return items, stale
+
+    def _compute(self, items: list[Item]) -> dict[int, dict]:
+        """Recompute aggregates for a chunk of items with three grouped queries."""
+        ids = [item.id for item in items]
+        expected = {
+            item_id: {
+                'bid_count': 0,
+                'leading_bid': None,
+                'leading_bidder_id': None,
+                'last_bid_at': None,
+                'unanswered_question_count': 0,
+            }
+            for item_id in ids
+        }
+
+        bid_totals = (
+            Bid.objects.filter(item_id__in=ids)
+            .order_by()
+            .values('item_id')
+            .annotate(total=Count('id'), last=Max('created_at'))
+        )
+        for row in bid_totals:
+            expected[row['item_id']]['bid_count'] = row['total']
+            expected[row['item_id']]['last_bid_at'] = row['last']
+
+        leading_bids = (
+            Bid.objects.filter(item_id__in=ids)
+            .annotate(
+                rank=Window(
+                    RowNumber(),
+                    partition_by=F('item_id'),
+                    order_by=[F('amount').desc(), F('created_at').asc()],
+                )
+            )
+            .filter(rank=1)
+            .values('item_id', 'amount', 'bidder_id')
+        )
+        for row in leading_bids:
+            expected[row['item_id']]['leading_bid'] = row['amount']
+            expected[row['item_id']]['leading_bidder_id'] = row['bidder_id']
+
+        unanswered = (
+            Question.objects.filter(item_id__in=ids, answer_text='')
+            .order_by()
+            .values('item_id')
+            .annotate(total=Count('id'))
+        )
+        for row in unanswered:
+            expected[row['item_id']]['unanswered_question_count'] = row['total']
+
+        return expected
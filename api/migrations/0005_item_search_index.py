@@ -0,0 +1,77 @@
+from django.db import migrations
+
+
+SQLITE_INSTALL = [
+    "CREATE VIRTUAL TABLE api_item_fts USING fts5(title, description)",
+    """
+    CREATE TRIGGER api_item_fts_insert AFTER INSERT ON api_item
+    WHEN new.is_active
+    BEGIN
+        INSERT INTO api_item_fts (rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER api_item_fts_update AFTER UPDATE OF title, description, is_active ON api_item
+    BEGIN
+        DELETE FROM api_item_fts WHERE rowid = old.id;
+        INSERT INTO api_item_fts (rowid, title, description)
+        SELECT new.id, new.title, new.description WHERE new.is_active;
+    END
+    """,
+    """
+    CREATE TRIGGER api_item_fts_delete AFTER DELETE ON api_item
+    BEGIN
+        DELETE FROM api_item_fts WHERE rowid = old.id;
+    END
+    """,
+    """
+    INSERT INTO api_item_fts (rowid, title, description)
+    SELECT id, title, description FROM api_item WHERE is_active
+    """,
+]
+
+SQLITE_UNINSTALL = [
+    "DROP TRIGGER IF EXISTS api_item_fts_insert",
+    "DROP TRIGGER IF EXISTS api_item_fts_update",
+    "DROP TRIGGER IF EXISTS api_item_fts_delete",
+    "DROP TABLE IF EXISTS api_item_fts",
+]
+
+# Must match PostgresSearchBackend.document_sql
+POSTGRES_INSTALL = [
+    """
+    CREATE INDEX api_item_search_gin ON api_item USING GIN ((
+        setweight(to_tsvector('english', coalesce("api_item"."title", '')), 'A') ||
+        setweight(to_tsvector('english', coalesce("api_item"."description", '')), 'B')
+    )) WHERE is_active
+    """,
+]
+
+POSTGRES_UNINSTALL = [
+    "DROP INDEX IF EXISTS api_item_search_gin",
+]
+
+
+def _run(schema_editor, statements):
+    for sql in statements.get(schema_editor.connection.vendor, []):
+        schema_editor.execute(sql)
+
+
+def create_search_index(apps, schema_editor):
+    _run(schema_editor, {"sqlite": SQLITE_INSTALL, "postgresql": POSTGRES_INSTALL})
+
+
+def drop_search_index(apps, schema_editor):
+    _run(schema_editor, {"sqlite": SQLITE_UNINSTALL, "postgresql": POSTGRES_UNINSTALL})
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("api", "0004_user_currency_preference"),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_index, drop_search_index),
+    ]
@@ -0,0 +1,75 @@
+# Generated by Django 5.2.6 on 2026-10-18 06:00
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, IntegerField, Max, OuterRef, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_item_aggregates(apps, schema_editor):
+    Item = apps.get_model('api', 'Item')
+    Bid = apps.get_model('api', 'Bid')
+    Question = apps.get_model('api', 'Question')
+
+    bids = Bid.objects.filter(item=OuterRef('pk')).order_by()
+    top_bid = bids.order_by('-amount', 'created_at')
+    unanswered = Question.objects.filter(item=OuterRef('pk'), answer_text='').order_by()
+
+    Item.objects.update(
+        bid_count=Coalesce(
+            Subquery(bids.values('item').annotate(n=Count('*')).values('n'),
+                     output_field=IntegerField()),
+            0,
+        ),
+        last_bid_at=Subquery(bids.values('item').annotate(m=Max('created_at')).values('m')),
+        leading_bid=Subquery(top_bid.values('amount')[:1]),
+        leading_bidder=Subquery(top_bid.values('bidder')[:1]),
+        unanswered_question_count=Coalesce(
+            Subquery(unanswered.values('item').annotate(n=Count('*')).values('n'),
+                     output_field=IntegerField()),
+            0,
+        ),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('api', '0005_item_search_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='item',
+            name='bid_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='item',
+            name='last_bid_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='item',
+            name='leading_bid',
+            field=models.DecimalField(blank=True, decimal_places=2, max_digits=10, null=True),
+        ),
+        migrations.AddField(
+            model_name='item',
+            name='leading_bidder',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='leading_items', to=settings.AUTH_USER_MODEL),
+        ),
+        migrations.AddField(
+            model_name='item',
+            name='unanswered_question_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AlterField(
+            model_name='bid',
+            name='created_at',
+            field=models.DateTimeField(default=django.utils.timezone.now, editable=False),
+        ),
+        migrations.RunPython(backfill_item_aggregates, migrations.RunPython.noop),
+    ]
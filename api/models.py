@@ -1,4 +1,5 @@
 from django.db import models
+from django.db.models import Q
 from django.contrib.auth.models import AbstractUser
 from django.core.validators import FileExtensionValidator
 from django.utils import timezone
@@ -25,6 +26,8 @@ class User(AbstractUser):
         blank=True,
         validators=[FileExtensionValidator(["jpg", "jpeg", "png"])],
     )
+    # Resized renditions of profile_image (see api.images)
+    profile_image_variants = models.JSONField(default=dict, blank=True)
     currency_preference: str = models.CharField(
         max_length=3,
         choices=CURRENCY_CHOICES,
@@ -57,6 +60,8 @@ class Item(models.Model):
         upload_to="item_pics/",
         validators=[FileExtensionValidator(["jpg", "jpeg", "png"])],
     )
+    # Resized renditions of picture (see api.images)
+    picture_variants = models.JSONField(default=dict, blank=True)
     end_date = models.DateTimeField()
     created_at = models.DateTimeField(auto_now_add=True)
     is_active: bool = models.BooleanField(default=True)
@@ -64,6 +69,47 @@ class Item(models.Model):
         User, on_delete=models.SET_NULL, null=True, blank=True, related_name="won_items"
     )
 
+    # Auction aggregates, maintained in the same transaction as each Bid and
+    # Question write (see api.bidding and the question views). Run the
+    # sync_item_aggregates command to backfill or verify them.
+    bid_count = models.PositiveIntegerField(default=0)
+    leading_bid = models.DecimalField(
+        max_digits=10, decimal_places=2, null=True, blank=True
+    )
+    leading_bidder = models.ForeignKey(
+        User,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name="leading_items",
+    )
+    last_bid_at = models.DateTimeField(null=True, blank=True)
+    unanswered_question_count = models.PositiveIntegerField(default=0)
+
+    # Version for conditional GETs. save() bumps it; every queryset update()
+    # that changes what the item list or detail shows must set it too.
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            # Item list: active items, newest first, keyset-paginated
+            models.Index(
+                fields=["-created_at", "-id"],
+                condition=Q(is_active=True),
+                name="item_active_created_idx",
+            ),
+            # close_auctions: active auctions without a winner past their
+            # end date. winner leads so the planner prefers this over the
+            # winner FK index for "winner_id IS NULL".
+            models.Index(
+                fields=["winner", "end_date"],
+                condition=Q(is_active=True),
+                name="item_active_winner_end_idx",
+            ),
+            # Item list version: latest change to any item
+            models.Index(fields=["updated_at"], name="item_updated_idx"),
+        ]
+
     def __str__(self) -> str:
         return f"{self.title} by {self.owner.username}"
 
@@ -72,11 +118,6 @@ class Item(models.Model):
         """Return True if auction has ended (current time >= end_date)."""
         return timezone.now() >= self.end_date
 
-    @property
-    def bid_count(self) -> int:
-        """Return total number of bids placed on this item."""
-        return self.bids.count()
-
 
 class Bid(models.Model):
     """Bid on an auction item"""
@@ -84,10 +125,19 @@ class Bid(models.Model):
     item = models.ForeignKey(Item, on_delete=models.CASCADE, related_name="bids")
     bidder = models.ForeignKey(User, on_delete=models.CASCADE, related_name="bids")
     amount = models.DecimalField(max_digits=10, decimal_places=2)
-    created_at = models.DateTimeField(auto_now_add=True)
+    # Set explicitly by api.bidding so it matches Item.last_bid_at
+    created_at = models.DateTimeField(default=timezone.now, editable=False)
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Latest bids on an item
+            models.Index(
+                fields=["item", "-created_at", "-id"], name="bid_item_created_idx"
+            ),
+            # Highest bids on an item
+            models.Index(fields=["item", "-amount"], name="bid_item_amount_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"${self.amount} on {self.item.title} by {self.bidder.username}"
@@ -105,6 +155,14 @@ class Question(models.Model):
     asked_at = models.DateTimeField(auto_now_add=True)
     answered_at = models.DateTimeField(null=True, blank=True)
 
+    class Meta:
+        indexes = [
+            # Latest questions on an item
+            models.Index(
+                fields=["item", "-asked_at", "-id"], name="question_item_asked_idx"
+            ),
+        ]
+
     @property
     def is_answered(self) -> bool:
         """Return True if the question has been answered."""
@@ -112,3 +170,49 @@ class Question(models.Model):
 
     def __str__(self) -> str:
         return f"Q on {self.item.title} by {self.asker.username}"
+
+
+class OutboundEmail(models.Model):
+    """
+    Transactional email outbox.
+
+    Rows are written in the same transaction as the change they announce and
+    delivered later by the send_outbox command (see api.outbox).
+    """
+
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
+    STATUS_CHOICES = [
+        (PENDING, "Pending"),
+        (SENT, "Sent"),
+        (FAILED, "Failed"),
+    ]
+
+    item = models.ForeignKey(
+        Item, on_delete=models.SET_NULL, null=True, blank=True, related_name="emails"
+    )
+    to_email: str = models.EmailField()
+    subject: str = models.CharField(max_length=255)
+    body: str = models.TextField()
+    status: str = models.CharField(
+        max_length=10, choices=STATUS_CHOICES, default=PENDING
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error: str = models.TextField(blank=True, default="")
+    created_at = models.DateTimeField(auto_now_add=True)
+    sent_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            # Sender: pending messages that are due
+            models.Index(
+                fields=["next_attempt_at", "id"],
+                condition=Q(status="pending"),
+                name="email_pending_due_idx",
+            ),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.subject} to {self.to_email} ({self.status})"
@@ -0,0 +1,159 @@
+from dataclasses import dataclass
+from datetime import timedelta
+
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+
+from .models import Item, OutboundEmail
+
+# Delivery attempts before a message is marked failed
+MAX_ATTEMPTS = 5
+# Retry delay doubles after each failed attempt, up to the cap
+RETRY_BASE_SECONDS = 60
+RETRY_MAX_SECONDS = 60 * 60
+# Seconds a claimed message stays reserved for its sender
+CLAIM_LEASE_SECONDS = 5 * 60
+
+
+@dataclass
+class DeliveryStats:
+    """Counts from one outbox drain."""
+
+    sent: int = 0
+    retrying: int = 0
+    failed: int = 0
+
+
+def winner_email(item: Item) -> OutboundEmail:
+    """Build (unsaved) the notification for an auction's winner."""
+    winner = item.winner
+    body = f"""
+Congratulations {winner.username}!
+
+You have won the auction for "{item.title}" with a winning bid of ${item.leading_bid}.
+
+Item Details:
+- Title: {item.title}
+- Description: {item.description}
+- Your Winning Bid: ${item.leading_bid}
+- Seller: {item.owner.username}
+- Seller Email: {item.owner.email}
+
+Please proceed to purchase the item by contacting the seller.
+
+Thank you for using our auction platform!
+
+Best regards,
+Auction Team
+"""
+    return OutboundEmail(
+        item=item,
+        to_email=winner.email,
+        subject=f"You won the auction for {item.title}!",
+        body=body,
+    )
+
+
+def retry_delay(attempts: int) -> timedelta:
+    """Backoff before the next attempt, given the attempts made so far."""
+    return timedelta(
+        seconds=min(RETRY_BASE_SECONDS * 2 ** (attempts - 1), RETRY_MAX_SECONDS)
+    )
+
+
+def claim_batch(batch_size: int, lease: timedelta) -> list[OutboundEmail]:
+    """
+    Lease up to ``batch_size`` due messages to this sender.
+
+    The rows are locked only while their next_attempt_at is pushed past the
+    lease, so the transaction is short and no other sender picks them up
+    until then. Messages of a sender that died become due again when the
+    lease runs out.
+    """
+    with transaction.atomic():
+        batch = list(
+            OutboundEmail.objects.select_for_update(skip_locked=True)
+            .filter(status=OutboundEmail.PENDING, next_attempt_at__lte=timezone.now())
+            .order_by("next_attempt_at", "id")[:batch_size]
+        )
+        OutboundEmail.objects.filter(id__in=[email.id for email in batch]).update(
+            next_attempt_at=timezone.now() + lease
+        )
+    return batch
+
+
+def deliver_pending(
+    batch_size: int = 100,
+    max_attempts: int = MAX_ATTEMPTS,
+    connection=None,
+) -> DeliveryStats:
+    """
+    Send due outbox messages in batches over one reused mail connection.
+
+    Each batch is claimed with SELECT ... FOR UPDATE SKIP LOCKED (where the
+    database supports it) in a short transaction that leases the rows, so
+    several senders can drain the outbox at once. Messages are sent outside
+    any transaction and each outcome is saved as soon as it is known, so a
+    slow mail server holds no database locks and a sent message is never
+    rolled back to pending. A failed message is retried with exponential
+    backoff and marked failed after ``max_attempts``.
+
+    Args:
+        batch_size: Messages claimed per transaction
+        max_attempts: Attempts before a message is given up on
+        connection: Email backend instance; defaults to get_connection()
+
+    Returns:
+        DeliveryStats for the messages attempted
+    """
+    connection = connection or get_connection()
+    lease = timedelta(seconds=CLAIM_LEASE_SECONDS)
+    stats = DeliveryStats()
+    connection.open()
+    try:
+        while True:
+            batch = claim_batch(batch_size, lease)
+            for email in batch:
+                _deliver(email, connection, max_attempts, stats)
+            if len(batch) < batch_size:
+                return stats
+    finally:
+        connection.close()
+
+
+def _deliver(
+    email: OutboundEmail, connection, max_attempts: int, stats: DeliveryStats
+) -> None:
+    """Attempt one message and save its outcome."""
+    message = EmailMessage(
+        subject=email.subject,
+        body=email.body,
+        from_email=settings.DEFAULT_FROM_EMAIL,
+        to=[email.to_email],
+        connection=connection,
+    )
+    email.attempts += 1
+    try:
+        connection.send_messages([message])
+    except Exception as e:
+        email.last_error = str(e)
+        if email.attempts >= max_attempts:
+            email.status = OutboundEmail.FAILED
+            stats.failed += 1
+        else:
+            email.next_attempt_at = timezone.now() + retry_delay(email.attempts)
+            stats.retrying += 1
+        email.save(update_fields=["status", "attempts", "next_attempt_at", "last_error"])
+        # The connection may be unusable after an error; start a fresh one.
+        # If that fails, the rest of the batch is retried after its lease.
+        connection.close()
+        connection.open()
+        return
+
+    email.status = OutboundEmail.SENT
+    email.sent_at = timezone.now()
+    email.last_error = ""
+    email.save(update_fields=["status", "attempts", "last_error", "sent_at"])
+    stats.sent += 1
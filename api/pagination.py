@@ -0,0 +1,304 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Generic, Iterator, Sequence, TypeVar
+
+from django.core.exceptions import FieldDoesNotExist, ValidationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Model, Q, QuerySet
+
+T = TypeVar("T", bound=Model)
+
+DEFAULT_PAGE_SIZE = 24
+MAX_PAGE_SIZE = 100
+
+
+class InvalidCursor(ValueError):
+    """Raised when a client supplies a cursor or limit we cannot use."""
+
+
+class _CursorEncoder(DjangoJSONEncoder):
+    """DjangoJSONEncoder truncates datetimes to milliseconds; keys need all digits."""
+
+    def default(self, o: Any) -> Any:
+        if isinstance(o, datetime):
+            return o.isoformat()
+        return super().default(o)
+
+
+@dataclass
+class Page(Generic[T]):
+    """One page of keyset-paginated results."""
+
+    results: list[T]
+    next_cursor: str | None
+    prev_cursor: str | None
+    limit: int
+
+
+def parse_limit(
+    raw: str | None,
+    default: int = DEFAULT_PAGE_SIZE,
+    maximum: int = MAX_PAGE_SIZE,
+) -> int:
+    """
+    Parse the ``limit`` query parameter.
+
+    Args:
+        raw: Raw query string value (may be None or empty)
+        default: Value used when no limit was supplied
+        maximum: Largest page size a client may request
+
+    Returns:
+        Page size clamped to ``maximum``
+
+    Raises:
+        InvalidCursor: If the value is not a positive integer
+    """
+    if raw is None or raw.strip() == "":
+        return default
+    try:
+        limit = int(raw)
+    except ValueError:
+        raise InvalidCursor("Limit must be a positive integer")
+    if limit <= 0:
+        raise InvalidCursor("Limit must be a positive integer")
+    return min(limit, maximum)
+
+
+def encode_cursor(values: Sequence[Any], direction: str) -> str:
+    """Encode key values and a direction ("next"/"prev") into an opaque token."""
+    payload = json.dumps(
+        {"v": list(values), "d": direction},
+        cls=_CursorEncoder,
+        separators=(",", ":"),
+    )
+    return base64.urlsafe_b64encode(payload.encode()).decode().rstrip("=")
+
+
+def decode_cursor(token: str) -> tuple[list[Any], str]:
+    """
+    Decode a token produced by :func:`encode_cursor`.
+
+    Raises:
+        InvalidCursor: If the token is malformed
+    """
+    try:
+        padded = token + "=" * (-len(token) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode()))
+        values, direction = payload["v"], payload["d"]
+    except (binascii.Error, ValueError, TypeError, KeyError, UnicodeDecodeError):
+        raise InvalidCursor("Invalid cursor")
+    if direction not in ("next", "prev") or not isinstance(values, list):
+        raise InvalidCursor("Invalid cursor")
+    return values, direction
+
+
+class KeysetPaginator(Generic[T]):
+    """
+    Cursor (keyset) paginator over a queryset.
+
+    Rows are ordered by ``keys``, a sequence of ``(field, descending)`` pairs
+    whose combination must be unique (end it with the primary key). Each page
+    is fetched with a ``WHERE (k1, k2, ...) < (v1, v2, ...)`` predicate
+    instead of an OFFSET, so the cost of a page does not grow with its depth.
+    """
+
+    def __init__(
+        self,
+        queryset: QuerySet[T],
+        keys: Sequence[tuple[str, bool]] = (("created_at", True), ("id", True)),
+    ) -> None:
+        self.queryset = queryset
+        self.keys = list(keys)
+
+    def _to_python(self, name: str, value: Any) -> Any:
+        try:
+            field = self.queryset.model._meta.get_field(name)
+        except FieldDoesNotExist:
+            # Annotations (e.g. a search rank) are plain numbers
+            if not isinstance(value, (int, float)):
+                raise InvalidCursor("Invalid cursor")
+            return value
+        try:
+            return field.to_python(value)
+        except ValidationError:
+            raise InvalidCursor("Invalid cursor")
+
+    def _key_values(self, obj: T) -> list[Any]:
+        return [getattr(obj, name) for name, _ in self.keys]
+
+    def _after(self, values: list[Any], reverse: bool) -> Q:
+        """Build the predicate selecting rows strictly after ``values``."""
+        condition = Q()
+        equal = Q()
+        for (name, descending), value in zip(self.keys, values):
+            lookup = "lt" if descending != reverse else "gt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+        # Redundant bound on the leading key, so the planner can seek an
+        # index to the cursor position instead of filtering from the start
+        name, descending = self.keys[0]
+        bound = "lte" if descending != reverse else "gte"
+        return Q(**{f"{name}__{bound}": values[0]}) & condition
+
+    def _ordering(self, reverse: bool) -> list[str]:
+        return [
+            f"-{name}" if descending != reverse else name
+            for name, descending in self.keys
+        ]
+
+    def _decode(self, cursor: str | None) -> tuple[list[Any] | None, str]:
+        """Return the cursor's key values (None for the first page) and direction."""
+        if not cursor:
+            return None, "next"
+        raw_values, direction = decode_cursor(cursor)
+        if len(raw_values) != len(self.keys):
+            raise InvalidCursor("Invalid cursor")
+        values = [
+            self._to_python(name, value)
+            for (name, _), value in zip(self.keys, raw_values)
+        ]
+        return values, direction
+
+    def paginate(self, cursor: str | None, limit: int) -> Page[T]:
+        """
+        Return the page addressed by ``cursor`` (or the first page).
+
+        Raises:
+            InvalidCursor: If the cursor cannot be decoded
+        """
+        queryset = self.queryset
+        values, direction = self._decode(cursor)
+        reverse = direction == "prev"
+        if values is not None:
+            queryset = queryset.filter(self._after(values, reverse))
+
+        rows = list(queryset.order_by(*self._ordering(reverse))[: limit + 1])
+        has_more = len(rows) > limit
+        rows = rows[:limit]
+
+        if reverse:
+            rows.reverse()
+            has_next, has_prev = True, has_more
+        else:
+            has_next, has_prev = has_more, bool(cursor)
+
+        next_cursor = (
+            encode_cursor(self._key_values(rows[-1]), "next")
+            if rows and has_next
+            else None
+        )
+        prev_cursor = (
+            encode_cursor(self._key_values(rows[0]), "prev")
+            if rows and has_prev
+            else None
+        )
+        return Page(rows, next_cursor, prev_cursor, limit)
+
+    def stream(
+        self, cursor: str | None, limit: int, chunk_size: int = 100
+    ) -> "PageStream[T]":
+        """
+        Like :meth:`paginate`, but the rows are fetched lazily with
+        ``.iterator(chunk_size)`` as the returned page is iterated, so only
+        one chunk of model instances is in memory at a time.
+
+        A "prev" page is first located with a query over the key columns
+        alone, then streamed in forward order like any other page.
+
+        Raises:
+            InvalidCursor: If the cursor cannot be decoded
+        """
+        values, direction = self._decode(cursor)
+        ordering = self._ordering(reverse=False)
+
+        if direction == "next":
+            queryset = self.queryset
+            if values is not None:
+                queryset = queryset.filter(self._after(values, reverse=False))
+            rows = queryset.order_by(*ordering)[: limit + 1]
+            return PageStream(self, rows, limit, chunk_size, has_prev=bool(cursor))
+
+        # Walk back from the cursor over the keys only. The row just before
+        # the page, if any, becomes the page's lower bound.
+        before_cursor = self.queryset.filter(self._after(values, reverse=True))
+        names = [name for name, _ in self.keys]
+        preceding = list(
+            before_cursor.order_by(*self._ordering(reverse=True)).values_list(*names)[
+                : limit + 1
+            ]
+        )
+        has_prev = len(preceding) > limit
+        queryset = before_cursor
+        if has_prev:
+            queryset = queryset.filter(self._after(list(preceding[-1]), reverse=False))
+        rows = queryset.order_by(*ordering)[:limit]
+        return PageStream(
+            self, rows, limit, chunk_size, has_prev=has_prev, has_next=True
+        )
+
+
+class PageStream(Generic[T]):
+    """
+    A keyset page whose rows are fetched while it is iterated.
+
+    ``next_cursor`` and ``prev_cursor`` depend on the first and last rows,
+    so they are only available once the page has been iterated.
+    """
+
+    def __init__(
+        self,
+        paginator: KeysetPaginator[T],
+        rows: QuerySet[T],
+        limit: int,
+        chunk_size: int,
+        has_prev: bool,
+        has_next: bool | None = None,
+    ) -> None:
+        self._paginator = paginator
+        self._rows = rows
+        self.limit = limit
+        self._chunk_size = chunk_size
+        self._has_prev = has_prev
+        # None: decided by whether a row beyond the limit turns up
+        self._has_next = has_next
+        self._first: list[Any] | None = None
+        self._last: list[Any] | None = None
+        self._consumed = False
+
+    def __iter__(self) -> Iterator[T]:
+        count = 0
+        for row in self._rows.iterator(chunk_size=self._chunk_size):
+            if count == self.limit:
+                # The lookahead row only tells us there is a next page
+                self._has_next = True
+                break
+            if count == 0:
+                self._first = self._paginator._key_values(row)
+            self._last = self._paginator._key_values(row)
+            count += 1
+            yield row
+        if self._has_next is None:
+            self._has_next = False
+        self._consumed = True
+
+    def _check_consumed(self) -> None:
+        if not self._consumed:
+            raise RuntimeError("Iterate the page before reading its cursors")
+
+    @property
+    def next_cursor(self) -> str | None:
+        self._check_consumed()
+        if self._last is None or not self._has_next:
+            return None
+        return encode_cursor(self._last, "next")
+
+    @property
+    def prev_cursor(self) -> str | None:
+        self._check_consumed()
+        if self._first is None or not self._has_prev:
+            return None
+        return encode_cursor(self._first, "prev")
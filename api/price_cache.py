@@ -0,0 +1,89 @@
+"""
+Write-through cache of the bidding state of active items.
+
+Each item has two entries in Django's default cache:
+
+- ``item:<id>:price``: current price, written by accepted bids
+- ``item:<id>:meta``: ``(end_date, owner_id)``, written by item edits
+
+Keeping them apart means a bid never overwrites an edit's end date and vice
+versa. The bid path uses them only to *reject* bids early. Acceptance is
+always decided by the conditional UPDATE in :mod:`api.bidding`. A stale
+entry is safe as long as it is never stricter than the database. Prices only
+rise, so an old cached price is always lower. Reads use ``cache.add`` so they
+cannot overwrite a newer edit. Edits and deletes write through synchronously.
+
+With more than one worker process the cache must be shared (e.g. Redis or
+Memcached), otherwise edits in one process are not seen by the others.
+"""
+
+from datetime import datetime
+from decimal import ROUND_DOWN, Decimal
+
+from django.core.cache import cache
+from django.db import DEFAULT_DB_ALIAS
+
+from .models import Item
+
+PRICE_CACHE_TIMEOUT = 60 * 60
+
+
+def _price_key(item_id: int) -> str:
+    return f"item:{item_id}:price"
+
+
+def _meta_key(item_id: int) -> str:
+    return f"item:{item_id}:meta"
+
+
+def get_state(
+    item_id: int,
+) -> tuple[Decimal | None, datetime | None, int | None]:
+    """
+    Return ``(current_price, end_date, owner_id)`` from the cache.
+    Missing parts are None. Costs one cache round trip.
+    """
+    price_key, meta_key = _price_key(item_id), _meta_key(item_id)
+    cached = cache.get_many([price_key, meta_key])
+    end_date, owner_id = cached.get(meta_key, (None, None))
+    return cached.get(price_key), end_date, owner_id
+
+
+def remember(
+    item_id: int, current_price: Decimal, end_date: datetime, owner_id: int
+) -> None:
+    """Cache state read from the database, without replacing newer entries."""
+    cache.add(_price_key(item_id), current_price, PRICE_CACHE_TIMEOUT)
+    cache.add(_meta_key(item_id), (end_date, owner_id), PRICE_CACHE_TIMEOUT)
+
+
+def remember_item(item: Item) -> None:
+    """
+    Cache the bidding state of a loaded active item.
+
+    Items read from a replica are skipped: a lagging replica may still hold
+    an end date the owner has since extended, which would be stricter than
+    the database.
+    """
+    if item._state.db != DEFAULT_DB_ALIAS:
+        return
+    remember(item.id, item.current_price, item.end_date, item.owner_id)
+
+
+def price_changed(item_id: int, current_price: Decimal) -> None:
+    """Write through the price set by an accepted bid."""
+    # Match the column's two decimal places, rounding towards the safe side
+    price = current_price.quantize(Decimal("0.01"), rounding=ROUND_DOWN)
+    cache.set(_price_key(item_id), price, PRICE_CACHE_TIMEOUT)
+
+
+def item_changed(item: Item) -> None:
+    """Write through an edited item's end date and owner."""
+    cache.set(
+        _meta_key(item.id), (item.end_date, item.owner_id), PRICE_CACHE_TIMEOUT
+    )
+
+
+def forget(item_id: int) -> None:
+    """Drop an item that is no longer open for bidding."""
+    cache.delete_many([_price_key(item_id), _meta_key(item_id)])
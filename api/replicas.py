@@ -0,0 +1,123 @@
+"""
+Read-replica routing with read-your-writes stickiness.
+
+When ``settings.READ_REPLICA`` names a database alias, views decorated with
+``read_from_replica`` run their GET queries against it; everything else,
+and every write, uses ``default``. The choice is held in a context
+variable that ``ReplicaRouter`` reads, so querysets need no ``.using()``.
+
+A replica lags the primary. So that users never see their own bid or edit
+missing, ``ReadYourWritesMiddleware`` marks a user after any successful
+unsafe request (POST/PUT/PATCH/DELETE) and their reads stay on the primary
+for ``READ_YOUR_WRITES_SECONDS``:
+
+- ``user:<id>:primary``: present while the user's reads must be fresh
+
+Like the other per-user cache entries, several worker processes need a
+shared cache for the mark to follow a user between them.
+"""
+
+from contextvars import ContextVar
+from functools import wraps
+from typing import Callable, Iterable, Iterator
+
+from django.conf import settings
+from django.core.cache import cache
+from django.http import HttpRequest, HttpResponse
+from django.utils.deprecation import MiddlewareMixin
+
+# Alias the current request reads from, when a view opted in
+_read_alias: ContextVar[str | None] = ContextVar("read_alias", default=None)
+
+SAFE_METHODS = ("GET", "HEAD", "OPTIONS")
+
+
+def _key(user_id: int) -> str:
+    return f"user:{user_id}:primary"
+
+
+def stick_to_primary(user_id: int) -> None:
+    """Send the user's reads to the primary for READ_YOUR_WRITES_SECONDS."""
+    cache.set(_key(user_id), True, settings.READ_YOUR_WRITES_SECONDS)
+
+
+def is_sticky(user_id: int) -> bool:
+    """Whether the user wrote recently enough that a replica may be stale."""
+    return cache.get(_key(user_id)) is not None
+
+
+def _stream_from(alias: str, chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """Keep a streaming body's lazy queries on ``alias`` while it is sent."""
+    iterator = iter(chunks)
+    while True:
+        token = _read_alias.set(alias)
+        try:
+            chunk = next(iterator)
+        except StopIteration:
+            return
+        finally:
+            _read_alias.reset(token)
+        yield chunk
+
+
+def read_from_replica(view: Callable) -> Callable:
+    """
+    Decorate a read-only view so its GET queries may go to the replica.
+
+    Place it below login_required: the session and user are resolved on the
+    primary first, and users who just wrote read from the primary.
+    """
+
+    @wraps(view)
+    def wrapper(request: HttpRequest, *args, **kwargs) -> HttpResponse:
+        alias = settings.READ_REPLICA
+        if (
+            alias is None
+            or request.method not in ("GET", "HEAD")
+            # Also loads request.user before reads are redirected
+            or (request.user.is_authenticated and is_sticky(request.user.id))
+        ):
+            return view(request, *args, **kwargs)
+
+        token = _read_alias.set(alias)
+        try:
+            response = view(request, *args, **kwargs)
+        finally:
+            _read_alias.reset(token)
+        if response.streaming:
+            response.streaming_content = _stream_from(alias, response.streaming_content)
+        return response
+
+    return wrapper
+
+
+class ReplicaRouter:
+    """Route reads to the replica chosen by read_from_replica, if any."""
+
+    def db_for_read(self, model, **hints) -> str | None:
+        return _read_alias.get()
+
+    def db_for_write(self, model, **hints) -> str | None:
+        # Without this, saving an instance read from the replica would
+        # write to the replica (Django falls back to the instance's database)
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints) -> bool | None:
+        # The replica holds the same rows as the primary
+        return True
+
+
+class ReadYourWritesMiddleware(MiddlewareMixin):
+    """Keep a user's reads on the primary for a while after they write."""
+
+    def process_response(
+        self, request: HttpRequest, response: HttpResponse
+    ) -> HttpResponse:
+        if (
+            settings.READ_REPLICA is not None
+            and request.method not in SAFE_METHODS
+            and response.status_code < 400
+            and request.user.is_authenticated
+        ):
+            stick_to_primary(request.user.id)
+        return response
@@ -0,0 +1,107 @@
+"""
+In-memory schedule of auction deadlines for ``run_auction_scheduler``.
+
+The daemon keeps a min-heap of ``(end_date, item_id)`` for every open auction
+and closes each one as its deadline passes. The database stays the source of
+truth, and the heap is only ever a hint:
+
+- ``reload()`` rebuilds the heap from the open auctions. It runs at start-up,
+  so a restarted daemon recovers its schedule and immediately closes whatever
+  ended while it was down. It also runs periodically as a safety net.
+- ``poll()`` picks up items created or edited since the last poll, seeking
+  on ``item_updated_idx``. Every write to an item bumps ``updated_at``, so a
+  new or moved deadline is seen within one poll in any process.
+- ``close_ended`` rechecks each auction's end date before closing it. An
+  auction whose deadline moved later is put back with its new end date.
+"""
+
+import heapq
+from datetime import datetime, timedelta
+
+from .models import Item
+
+# Seconds each poll reaches back before the last change seen. updated_at is
+# set before its transaction commits, so a row can become visible after
+# later ones; re-reading the window catches it (rescheduling is idempotent).
+POLL_OVERLAP_SECONDS = 10
+
+
+class AuctionSchedule:
+    """Min-heap of open auction deadlines with lazy deletion."""
+
+    def __init__(self) -> None:
+        self._heap: list[tuple[datetime, int]] = []
+        # Current deadline per item; heap entries that disagree are stale
+        self._deadlines: dict[int, datetime] = {}
+        # Latest updated_at seen; polls read changes from there on
+        self._last_seen: datetime | None = None
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def reload(self) -> None:
+        """Rebuild the schedule from the open auctions in the database."""
+        # Read the change position first so edits made during the load are
+        # picked up by the next poll rather than lost
+        self._last_seen = (
+            Item.objects.order_by("-updated_at").values_list("updated_at", flat=True).first()
+        )
+        self._deadlines = {}
+        rows = Item.objects.filter(is_active=True, winner__isnull=True).values_list(
+            "id", "end_date"
+        )
+        for item_id, end_date in rows.iterator(chunk_size=2000):
+            self._deadlines[item_id] = end_date
+        self._heap = [(end_date, item_id) for item_id, end_date in self._deadlines.items()]
+        heapq.heapify(self._heap)
+
+    def schedule(self, item_id: int, end_date: datetime) -> None:
+        """Add an auction or move its deadline."""
+        if self._deadlines.get(item_id) == end_date:
+            return
+        self._deadlines[item_id] = end_date
+        heapq.heappush(self._heap, (end_date, item_id))
+
+    def poll(self) -> None:
+        """Pick up items created, edited, closed or withdrawn since the last poll."""
+        changed = Item.objects.order_by("updated_at")
+        if self._last_seen is not None:
+            changed = changed.filter(
+                updated_at__gte=self._last_seen - timedelta(seconds=POLL_OVERLAP_SECONDS)
+            )
+        rows = changed.values_list("id", "end_date", "is_active", "winner_id", "updated_at")
+        for item_id, end_date, is_active, winner_id, updated_at in rows.iterator(
+            chunk_size=2000
+        ):
+            self._last_seen = updated_at
+            if is_active and winner_id is None:
+                self.schedule(item_id, end_date)
+            else:
+                # Leaves its heap entry stale
+                self._deadlines.pop(item_id, None)
+
+    def pop_due(self, now: datetime) -> list[int]:
+        """Remove and return the ids of auctions whose deadline is ``now`` or earlier."""
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            end_date, item_id = heapq.heappop(self._heap)
+            if self._deadlines.get(item_id) == end_date:
+                del self._deadlines[item_id]
+                due.append(item_id)
+        return due
+
+    def next_deadline(self) -> datetime | None:
+        """Earliest scheduled deadline, or None if nothing is open."""
+        while self._heap and self._deadlines.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def reschedule(self, item_ids: list[int]) -> None:
+        """Put back those of ``item_ids`` that are still open, with their current deadlines."""
+        if not item_ids:
+            return
+        rows = Item.objects.filter(
+            id__in=item_ids, is_active=True, winner__isnull=True
+        ).values_list("id", "end_date")
+        for item_id, end_date in rows:
+            self.schedule(item_id, end_date)
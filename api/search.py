@@ -0,0 +1,157 @@
+import re
+from functools import lru_cache
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+from django.db.models import BooleanField, FloatField, Q, QuerySet, Value
+from django.db.models.expressions import RawSQL
+from django.utils.module_loading import import_string
+
+from .models import Item
+
+# Longest query we turn into index terms; the rest is ignored
+MAX_SEARCH_TERMS = 16
+
+
+def search_terms(query: str) -> list[str]:
+    """Split a free-text query into lowercase word tokens safe for any backend."""
+    return re.findall(r"\w+", query.lower())[:MAX_SEARCH_TERMS]
+
+
+class SearchBackend:
+    """
+    Ranked item search.
+
+    ``search`` filters an Item queryset to the matching rows and annotates
+    each with ``search_rank`` (higher is better), so callers can order and
+    keyset-paginate on ``(search_rank, id)`` whatever backend is active.
+    """
+
+    def search(self, queryset: QuerySet[Item], query: str) -> QuerySet[Item]:
+        raise NotImplementedError
+
+    def no_results(self, queryset: QuerySet[Item]) -> QuerySet[Item]:
+        """Empty result that still carries ``search_rank`` for ordering."""
+        return queryset.annotate(
+            search_rank=Value(0.0, output_field=FloatField())
+        ).none()
+
+
+class BasicSearchBackend(SearchBackend):
+    """Unindexed substring match, used on databases without a full-text index."""
+
+    def search(self, queryset: QuerySet[Item], query: str) -> QuerySet[Item]:
+        return queryset.filter(
+            Q(title__icontains=query) | Q(description__icontains=query)
+        ).annotate(search_rank=Value(0.0, output_field=FloatField()))
+
+
+# Keep api_item_fts in sync with api_item (see migration 0005). SQLite drops
+# a table's triggers whenever a migration rebuilds it, so these are
+# re-created after every migrate by ensure_search_triggers.
+SQLITE_TRIGGERS = [
+    """
+    CREATE TRIGGER IF NOT EXISTS api_item_fts_insert AFTER INSERT ON api_item
+    WHEN new.is_active
+    BEGIN
+        INSERT INTO api_item_fts (rowid, title, description)
+        VALUES (new.id, new.title, new.description);
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS api_item_fts_update
+    AFTER UPDATE OF title, description, is_active ON api_item
+    BEGIN
+        DELETE FROM api_item_fts WHERE rowid = old.id;
+        INSERT INTO api_item_fts (rowid, title, description)
+        SELECT new.id, new.title, new.description WHERE new.is_active;
+    END
+    """,
+    """
+    CREATE TRIGGER IF NOT EXISTS api_item_fts_delete AFTER DELETE ON api_item
+    BEGIN
+        DELETE FROM api_item_fts WHERE rowid = old.id;
+    END
+    """,
+]
+
+
+def ensure_search_triggers(using: str = DEFAULT_DB_ALIAS, **kwargs) -> None:
+    """post_migrate handler: restore the FTS5 sync triggers if a rebuild dropped them."""
+    connection = connections[using]
+    if connection.vendor != "sqlite":
+        return
+    if "api_item_fts" not in connection.introspection.table_names():
+        return
+    with connection.cursor() as cursor:
+        for sql in SQLITE_TRIGGERS:
+            cursor.execute(sql)
+
+
+class SQLiteSearchBackend(SearchBackend):
+    """
+    FTS5 search over the ``api_item_fts`` table (migration 0005).
+
+    The table holds one row per active item, keyed by item id, and is kept in
+    sync by triggers on ``api_item``, so creates, edits and soft deletes made
+    anywhere through the ORM are reflected without application code.
+    """
+
+    # Title matches weigh ten times as much as description matches
+    rank_sql = (
+        'SELECT -bm25(api_item_fts, 10.0, 1.0) FROM api_item_fts '
+        'WHERE api_item_fts MATCH %s AND api_item_fts.rowid = "api_item"."id"'
+    )
+    match_sql = "SELECT rowid FROM api_item_fts WHERE api_item_fts MATCH %s"
+
+    def search(self, queryset: QuerySet[Item], query: str) -> QuerySet[Item]:
+        terms = search_terms(query)
+        if not terms:
+            return self.no_results(queryset)
+        # Every term must match; each is a quoted prefix query
+        expression = " ".join(f'"{term}"*' for term in terms)
+        return queryset.filter(
+            id__in=RawSQL(self.match_sql, [expression])
+        ).annotate(
+            search_rank=RawSQL(self.rank_sql, [expression], output_field=FloatField())
+        )
+
+
+class PostgresSearchBackend(SearchBackend):
+    """
+    tsvector search backed by the ``api_item_search_gin`` expression index.
+
+    The document expression below must stay identical to the one indexed in
+    migration 0005 for the planner to use the GIN index. PostgreSQL maintains
+    the index itself, and it is partial on ``is_active``.
+    """
+
+    document_sql = (
+        "setweight(to_tsvector('english', coalesce(\"api_item\".\"title\", '')), 'A') || "
+        "setweight(to_tsvector('english', coalesce(\"api_item\".\"description\", '')), 'B')"
+    )
+
+    def search(self, queryset: QuerySet[Item], query: str) -> QuerySet[Item]:
+        terms = search_terms(query)
+        if not terms:
+            return self.no_results(queryset)
+        tsquery = " & ".join(f"{term}:*" for term in terms)
+        matches = RawSQL(
+            f"({self.document_sql}) @@ to_tsquery('english', %s)",
+            [tsquery],
+            output_field=BooleanField(),
+        )
+        # Cast so cursors round-trip the exact rank value
+        rank = RawSQL(
+            f"CAST(ts_rank({self.document_sql}, to_tsquery('english', %s)) "
+            "AS double precision)",
+            [tsquery],
+            output_field=FloatField(),
+        )
+        return queryset.filter(matches).annotate(search_rank=rank)
+
+
+@lru_cache(maxsize=None)
+def get_search_backend() -> SearchBackend:
+    """Return the backend configured by ``settings.SEARCH_BACKEND``."""
+    return import_string(settings.SEARCH_BACKEND)()
@@ -1,5 +1,15 @@
-from typing import TypedDict
+from typing import Any, Callable, NotRequired, TypedDict, cast
+from django.db.models import QuerySet
 from .models import User, Item, Bid, Question
+from . import user_activity
+from .images import variant_urls
+
+
+# Relations each serializer reads; querysets are prepared with these up front
+# so that serializing N rows costs a fixed number of queries instead of ~3N.
+ITEM_RELATED = ("owner", "winner")
+BID_RELATED = ("item", "bidder")
+QUESTION_RELATED = ("item", "asker")
 
 
 class UserDict(TypedDict):
@@ -10,9 +20,13 @@ class UserDict(TypedDict):
     email: str
     date_of_birth: str | None
     profile_image: str | None
+    profile_image_variants: dict[str, str]
     currency_preference: str
-    bid_item_ids: list[int]
-    questioned_item_ids: list[int]
+    bid_item_count: int
+    questioned_item_count: int
+    # Omitted in the compact form; page through them with api_user_item_ids
+    bid_item_ids: NotRequired[list[int]]
+    questioned_item_ids: NotRequired[list[int]]
 
 
 class ItemDict(TypedDict):
@@ -26,15 +40,28 @@ class ItemDict(TypedDict):
     starting_price: str
     current_price: str
     picture: str | None
+    picture_variants: dict[str, str]
     end_date: str
     created_at: str
     is_active: bool
     is_ended: bool
     bid_count: int
+    leading_bid: str | None
+    leading_bidder_id: int | None
+    last_bid_at: str | None
+    unanswered_question_count: int
     winner_id: int | None
     winner_username: str | None
 
 
+class BidItemDict(TypedDict):
+    """An item the user bid on, with their standing on it"""
+
+    item: ItemDict
+    my_highest_bid: str
+    is_winning: bool
+
+
 class BidDict(TypedDict):
     """Type definition for serialized Bid"""
 
@@ -62,55 +89,162 @@ class QuestionDict(TypedDict):
     is_answered: bool
 
 
-def serialize_user(user: User) -> UserDict:
+ITEM_FIELDS: tuple[str, ...] = tuple(ItemDict.__annotations__)
+
+# Model fields each ItemDict field reads, where not just the field itself.
+# item_queryset turns a fieldset into .only() and the joins it needs.
+ITEM_FIELD_SOURCES: dict[str, tuple[str, ...]] = {
+    "owner_id": ("owner",),
+    "owner_username": ("owner", "owner__username"),
+    "picture_variants": ("picture", "picture_variants"),
+    "is_ended": ("end_date",),
+    "leading_bidder_id": ("leading_bidder",),
+    "winner_id": ("winner",),
+    "winner_username": ("winner", "winner__username"),
+}
+
+
+def parse_item_fields(raw: str | None) -> tuple[str, ...] | None:
+    """
+    Parse a ``fields`` query parameter into a sparse ItemDict fieldset.
+
+    Args:
+        raw: Comma-separated ItemDict keys (None or empty for all fields)
+
+    Returns:
+        The requested fields plus ``id``, in ItemDict order, or None for all
+
+    Raises:
+        ValueError: If a field is not an ItemDict key
+    """
+    if raw is None or raw.strip() == "":
+        return None
+    requested = {name.strip() for name in raw.split(",") if name.strip()}
+    unknown = requested.difference(ITEM_FIELDS)
+    if unknown:
+        raise ValueError(f"Unknown fields: {', '.join(sorted(unknown))}")
+    requested.add("id")
+    return tuple(name for name in ITEM_FIELDS if name in requested)
+
+
+def item_queryset(
+    queryset: QuerySet[Item],
+    fields: tuple[str, ...] | None = None,
+    also: tuple[str, ...] = (),
+) -> QuerySet[Item]:
+    """
+    Prepare an Item queryset for serialize_item.
+    Bid aggregates are stored on Item, so nothing else is needed.
+
+    Args:
+        queryset: Items to prepare
+        fields: Sparse fieldset from parse_item_fields; None joins owner and
+            winner and loads every column
+        also: Model fields the caller reads besides ``fields`` (e.g.
+            pagination keys), loaded so they are not fetched row by row
+
+    Returns:
+        Queryset joining only the relations the fields need
+    """
+    if fields is None:
+        return queryset.select_related(*ITEM_RELATED)
+    columns = {"id", *also}
+    for name in fields:
+        columns.update(ITEM_FIELD_SOURCES.get(name, (name,)))
+    related = [name for name in ITEM_RELATED if f"{name}__username" in columns]
+    if related:
+        # select_related() without arguments would join every relation
+        queryset = queryset.select_related(*related)
+    return queryset.only(*columns)
+
+
+def bid_queryset(queryset: QuerySet[Bid]) -> QuerySet[Bid]:
+    """Prepare a Bid queryset for serialize_bid (joins item and bidder)."""
+    return queryset.select_related(*BID_RELATED)
+
+
+def question_queryset(queryset: QuerySet[Question]) -> QuerySet[Question]:
+    """Prepare a Question queryset for serialize_question (joins item and asker)."""
+    return queryset.select_related(*QUESTION_RELATED)
+
+
+def serialize_user(user: User, compact: bool = False) -> UserDict:
     """
     Convert User model instance to typed dictionary for JSON serialization.
+    The interaction sets come from the per-user cache in api.user_activity.
 
     Args:
         user: User model instance
+        compact: Only include the sizes of the interaction sets, not the ids
 
     Returns:
         Dictionary containing user data with proper types
     """
-    return {
+    activity = user_activity.all_item_ids(user.id)
+    data: UserDict = {
         "id": user.id,
         "username": user.username,
         "email": user.email,
         "date_of_birth": str(user.date_of_birth) if user.date_of_birth else None,
         "profile_image": user.profile_image.url if user.profile_image else None,
+        "profile_image_variants": variant_urls(
+            user.profile_image, user.profile_image_variants
+        ),
         "currency_preference": user.currency_preference,
-        "bid_item_ids": user.bid_item_ids,
-        "questioned_item_ids": user.questioned_item_ids,
+        "bid_item_count": len(activity[user_activity.BIDS]),
+        "questioned_item_count": len(activity[user_activity.QUESTIONS]),
     }
+    if not compact:
+        data["bid_item_ids"] = activity[user_activity.BIDS]
+        data["questioned_item_ids"] = activity[user_activity.QUESTIONS]
+    return data
 
 
-def serialize_item(item: Item) -> ItemDict:
+# One getter per ItemDict field, so unrequested fields cost nothing
+_ITEM_GETTERS: dict[str, Callable[[Item], Any]] = {
+    "id": lambda item: item.id,
+    "owner_id": lambda item: item.owner_id,
+    "owner_username": lambda item: item.owner.username,
+    "title": lambda item: item.title,
+    "description": lambda item: item.description,
+    "starting_price": lambda item: str(item.starting_price),
+    "current_price": lambda item: str(item.current_price),
+    "picture": lambda item: item.picture.url if item.picture else None,
+    "picture_variants": lambda item: variant_urls(item.picture, item.picture_variants),
+    "end_date": lambda item: item.end_date.isoformat(),
+    "created_at": lambda item: item.created_at.isoformat(),
+    "is_active": lambda item: item.is_active,
+    "is_ended": lambda item: item.is_ended,
+    "bid_count": lambda item: item.bid_count,
+    "leading_bid": lambda item: (
+        str(item.leading_bid) if item.leading_bid is not None else None
+    ),
+    "leading_bidder_id": lambda item: item.leading_bidder_id,
+    "last_bid_at": lambda item: (
+        item.last_bid_at.isoformat() if item.last_bid_at else None
+    ),
+    "unanswered_question_count": lambda item: item.unanswered_question_count,
+    "winner_id": lambda item: item.winner_id,
+    "winner_username": lambda item: item.winner.username if item.winner_id else None,
+}
+
+
+def serialize_item(item: Item, fields: tuple[str, ...] | None = None) -> ItemDict:
     """
     Convert Item model instance to typed dictionary.
+    Use item_queryset() (with the same fields) when serializing many items.
 
     Args:
         item: Item model instance
+        fields: Sparse fieldset from parse_item_fields; None for all fields
 
     Returns:
         Dictionary containing item data with proper types
     """
-    return {
-        "id": item.id,
-        "owner_id": item.owner.id,
-        "owner_username": item.owner.username,
-        "title": item.title,
-        "description": item.description,
-        "starting_price": str(item.starting_price),
-        "current_price": str(item.current_price),
-        "picture": item.picture.url if item.picture else None,
-        "end_date": item.end_date.isoformat(),
-        "created_at": item.created_at.isoformat(),
-        "is_active": item.is_active,
-        "is_ended": item.is_ended,
-        "bid_count": item.bid_count,
-        "winner_id": item.winner.id if item.winner else None,
-        "winner_username": item.winner.username if item.winner else None,
-    }
+    return cast(
+        ItemDict,
+        {name: _ITEM_GETTERS[name](item) for name in fields or ITEM_FIELDS},
+    )
 
 
 def serialize_bid(bid: Bid) -> BidDict:
@@ -125,9 +259,9 @@ def serialize_bid(bid: Bid) -> BidDict:
     """
     return {
         "id": bid.id,
-        "item_id": bid.item.id,
+        "item_id": bid.item_id,
         "item_title": bid.item.title,
-        "bidder_id": bid.bidder.id,
+        "bidder_id": bid.bidder_id,
         "bidder_username": bid.bidder.username,
         "amount": str(bid.amount),
         "created_at": bid.created_at.isoformat(),
@@ -146,9 +280,9 @@ def serialize_question(question: Question) -> QuestionDict:
     """
     return {
         "id": question.id,
-        "item_id": question.item.id,
+        "item_id": question.item_id,
         "item_title": question.item.title,
-        "asker_id": question.asker.id,
+        "asker_id": question.asker_id,
         "asker_username": question.asker.username,
         "question_text": question.question_text,
         "answer_text": question.answer_text,
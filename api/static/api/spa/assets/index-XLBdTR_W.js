@@ -22,7 +22,7 @@
   * vue-router v4.5.1
   * (c) 2025 Eduardo San Martin Morote
   * @license MIT
-  */const qn=typeof document<"u";function Xp(e){return typeof e=="object"||"displayName"in e||"props"in e||"__vccOpts"in e}function my(e){return e.__esModule||e[Symbol.toStringTag]==="Module"||e.default&&Xp(e.default)}const wt=Object.assign;function Ba(e,t){const s={};for(const n in t){const i=t[n];s[n]=Ke(i)?i.map(e):e(i)}return s}const Ki=()=>{},Ke=Array.isArray,Qp=/#/g,_y=/&/g,by=/\//g,vy=/=/g,yy=/\?/g,Jp=/\+/g,xy=/%5B/g,wy=/%5D/g,Zp=/%5E/g,Ey=/%60/g,tg=/%7B/g,Sy=/%7C/g,eg=/%7D/g,Cy=/%20/g;function vc(e){return encodeURI(""+e).replace(Sy,"|").replace(xy,"[").replace(wy,"]")}function Ay(e){return vc(e).replace(tg,"{").replace(eg,"}").replace(Zp,"^")}function Pl(e){return vc(e).replace(Jp,"%2B").replace(Cy,"+").replace(Qp,"%23").replace(_y,"%26").replace(Ey,"`").replace(tg,"{").replace(eg,"}").replace(Zp,"^")}function Ty(e){return Pl(e).replace(vy,"%3D")}function Oy(e){return vc(e).replace(Qp,"%23").replace(yy,"%3F")}function ky(e){return e==null?"":Oy(e).replace(by,"%2F")}function co(e){try{return decodeURIComponent(""+e)}catch{}return""+e}const Dy=/\/$/,My=e=>e.replace(Dy,"");function Va(e,t,s="/"){let n,i={},o="",r="";const a=t.indexOf("#");let l=t.indexOf("?");return a<l&&a>=0&&(l=-1),l>-1&&(n=t.slice(0,l),o=t.slice(l+1,a>-1?a:t.length),i=e(o)),a>-1&&(n=n||t.slice(0,a),r=t.slice(a,t.length)),n=Ry(n??t,s),{fullPath:n+(o&&"?")+o+r,path:n,query:i,hash:co(r)}}function Py(e,t){const s=t.query?e(t.query):"";return t.path+(s&&"?")+s+(t.hash||"")}function qu(e,t){return!t||!e.toLowerCase().startsWith(t.toLowerCase())?e:e.slice(t.length)||"/"}function Iy(e,t,s){const n=t.matched.length-1,i=s.matched.length-1;return n>-1&&n===i&&ri(t.matched[n],s.matched[i])&&sg(t.params,s.params)&&e(t.query)===e(s.query)&&t.hash===s.hash}function ri(e,t){return(e.aliasOf||e)===(t.aliasOf||t)}function sg(e,t){if(Object.keys(e).length!==Object.keys(t).length)return!1;for(const s in e)if(!Ly(e[s],t[s]))return!1;return!0}function Ly(e,t){return Ke(e)?Gu(e,t):Ke(t)?Gu(t,e):e===t}function Gu(e,t){return Ke(t)?e.length===t.length&&e.every((s,n)=>s===t[n]):e.length===1&&e[0]===t}function Ry(e,t){if(e.startsWith("/"))return e;if(!e)return t;const s=t.split("/"),n=e.split("/"),i=n[n.length-1];(i===".."||i===".")&&n.push("");let o=s.length-1,r,a;for(r=0;r<n.length;r++)if(a=n[r],a!==".")if(a==="..")o>1&&o--;else break;return s.slice(0,o).join("/")+"/"+n.slice(r).join("/")}const $s={path:"/",name:void 0,params:{},query:{},hash:"",fullPath:"/",matched:[],meta:{},redirectedFrom:void 0};var uo;(function(e){e.pop="pop",e.push="push"})(uo||(uo={}));var Yi;(function(e){e.back="back",e.forward="forward",e.unknown=""})(Yi||(Yi={}));function $y(e){if(!e)if(qn){const t=document.querySelector("base");e=t&&t.getAttribute("href")||"/",e=e.replace(/^\w+:\/\/[^\/]+/,"")}else e="/";return e[0]!=="/"&&e[0]!=="#"&&(e="/"+e),My(e)}const Ny=/^[^#]+#/;function Fy(e,t){return e.replace(Ny,"#")+t}function By(e,t){const s=document.documentElement.getBoundingClientRect(),n=e.getBoundingClientRect();return{behavior:t.behavior,left:n.left-s.left-(t.left||0),top:n.top-s.top-(t.top||0)}}const la=()=>({left:window.scrollX,top:window.scrollY});function Vy(e){let t;if("el"in e){const s=e.el,n=typeof s=="string"&&s.startsWith("#"),i=typeof s=="string"?n?document.getElementById(s.slice(1)):document.querySelector(s):s;if(!i)return;t=By(i,e)}else t=e;"scrollBehavior"in document.documentElement.style?window.scrollTo(t):window.scrollTo(t.left!=null?t.left:window.scrollX,t.top!=null?t.top:window.scrollY)}function Xu(e,t){return(history.state?history.state.position-t:-1)+e}const Il=new Map;function Hy(e,t){Il.set(e,t)}function jy(e){const t=Il.get(e);return Il.delete(e),t}let Wy=()=>location.protocol+"//"+location.host;function ng(e,t){const{pathname:s,search:n,hash:i}=t,o=e.indexOf("#");if(o>-1){let a=i.includes(e.slice(o))?e.slice(o).length:1,l=i.slice(a);return l[0]!=="/"&&(l="/"+l),qu(l,"")}return qu(s,e)+n+i}function zy(e,t,s,n){let i=[],o=[],r=null;const a=({state:f})=>{const h=ng(e,location),m=s.value,p=t.value;let _=0;if(f){if(s.value=h,t.value=f,r&&r===m){r=null;return}_=p?f.position-p.position:0}else n(h);i.forEach(b=>{b(s.value,m,{delta:_,type:uo.pop,direction:_?_>0?Yi.forward:Yi.back:Yi.unknown})})};function l(){r=s.value}function c(f){i.push(f);const h=()=>{const m=i.indexOf(f);m>-1&&i.splice(m,1)};return o.push(h),h}function u(){const{history:f}=window;f.state&&f.replaceState(wt({},f.state,{scroll:la()}),"")}function d(){for(const f of o)f();o=[],window.removeEventListener("popstate",a),window.removeEventListener("beforeunload",u)}return window.addEventListener("popstate",a),window.addEventListener("beforeunload",u,{passive:!0}),{pauseListeners:l,listen:c,destroy:d}}function Qu(e,t,s,n=!1,i=!1){return{back:e,current:t,forward:s,replaced:n,position:window.history.length,scroll:i?la():null}}function Uy(e){const{history:t,location:s}=window,n={value:ng(e,s)},i={value:t.state};i.value||o(n.value,{back:null,current:n.value,forward:null,position:t.length-1,replaced:!0,scroll:null},!0);function o(l,c,u){const d=e.indexOf("#"),f=d>-1?(s.host&&document.querySelector("base")?e:e.slice(d))+l:Wy()+e+l;try{t[u?"replaceState":"pushState"](c,"",f),i.value=c}catch(h){console.error(h),s[u?"replace":"assign"](f)}}function r(l,c){const u=wt({},t.state,Qu(i.value.back,l,i.value.forward,!0),c,{position:i.value.position});o(l,u,!0),n.value=l}function a(l,c){const u=wt({},i.value,t.state,{forward:l,scroll:la()});o(u.current,u,!0);const d=wt({},Qu(n.value,l,null),{position:u.position+1},c);o(l,d,!1),n.value=l}return{location:n,state:i,push:a,replace:r}}function Ky(e){e=$y(e);const t=Uy(e),s=zy(e,t.state,t.location,t.replace);function n(o,r=!0){r||s.pauseListeners(),history.go(o)}const i=wt({location:"",base:e,go:n,createHref:Fy.bind(null,e)},t,s);return Object.defineProperty(i,"location",{enumerable:!0,get:()=>t.location.value}),Object.defineProperty(i,"state",{enumerable:!0,get:()=>t.state.value}),i}function Yy(e){return typeof e=="string"||e&&typeof e=="object"}function ig(e){return typeof e=="string"||typeof e=="symbol"}const og=Symbol("");var Ju;(function(e){e[e.aborted=4]="aborted",e[e.cancelled=8]="cancelled",e[e.duplicated=16]="duplicated"})(Ju||(Ju={}));function ai(e,t){return wt(new Error,{type:e,[og]:!0},t)}function ps(e,t){return e instanceof Error&&og in e&&(t==null||!!(e.type&t))}const Zu="[^/]+?",qy={sensitive:!1,strict:!1,start:!0,end:!0},Gy=/[.+*?^${}()[\]/\\]/g;function Xy(e,t){const s=wt({},qy,t),n=[];let i=s.start?"^":"";const o=[];for(const c of e){const u=c.length?[]:[90];s.strict&&!c.length&&(i+="/");for(let d=0;d<c.length;d++){const f=c[d];let h=40+(s.sensitive?.25:0);if(f.type===0)d||(i+="/"),i+=f.value.replace(Gy,"\\$&"),h+=40;else if(f.type===1){const{value:m,repeatable:p,optional:_,regexp:b}=f;o.push({name:m,repeatable:p,optional:_});const y=b||Zu;if(y!==Zu){h+=10;try{new RegExp(`(${y})`)}catch(E){throw new Error(`Invalid custom RegExp for param "${m}" (${y}): `+E.message)}}let v=p?`((?:${y})(?:/(?:${y}))*)`:`(${y})`;d||(v=_&&c.length<2?`(?:/${v})`:"/"+v),_&&(v+="?"),i+=v,h+=20,_&&(h+=-8),p&&(h+=-20),y===".*"&&(h+=-50)}u.push(h)}n.push(u)}if(s.strict&&s.end){const c=n.length-1;n[c][n[c].length-1]+=.7000000000000001}s.strict||(i+="/?"),s.end?i+="$":s.strict&&!i.endsWith("/")&&(i+="(?:/|$)");const r=new RegExp(i,s.sensitive?"":"i");function a(c){const u=c.match(r),d={};if(!u)return null;for(let f=1;f<u.length;f++){const h=u[f]||"",m=o[f-1];d[m.name]=h&&m.repeatable?h.split("/"):h}return d}function l(c){let u="",d=!1;for(const f of e){(!d||!u.endsWith("/"))&&(u+="/"),d=!1;for(const h of f)if(h.type===0)u+=h.value;else if(h.type===1){const{value:m,repeatable:p,optional:_}=h,b=m in c?c[m]:"";if(Ke(b)&&!p)throw new Error(`Provided param "${m}" is an array but it is not repeatable (* or + modifiers)`);const y=Ke(b)?b.join("/"):b;if(!y)if(_)f.length<2&&(u.endsWith("/")?u=u.slice(0,-1):d=!0);else throw new Error(`Missing required param "${m}"`);u+=y}}return u||"/"}return{re:r,score:n,keys:o,parse:a,stringify:l}}function Qy(e,t){let s=0;for(;s<e.length&&s<t.length;){const n=t[s]-e[s];if(n)return n;s++}return e.length<t.length?e.length===1&&e[0]===80?-1:1:e.length>t.length?t.length===1&&t[0]===80?1:-1:0}function rg(e,t){let s=0;const n=e.score,i=t.score;for(;s<n.length&&s<i.length;){const o=Qy(n[s],i[s]);if(o)return o;s++}if(Math.abs(i.length-n.length)===1){if(td(n))return 1;if(td(i))return-1}return i.length-n.length}function td(e){const t=e[e.length-1];return e.length>0&&t[t.length-1]<0}const Jy={type:0,value:""},Zy=/[a-zA-Z0-9_]/;function t0(e){if(!e)return[[]];if(e==="/")return[[Jy]];if(!e.startsWith("/"))throw new Error(`Invalid path "${e}"`);function t(h){throw new Error(`ERR (${s})/"${c}": ${h}`)}let s=0,n=s;const i=[];let o;function r(){o&&i.push(o),o=[]}let a=0,l,c="",u="";function d(){c&&(s===0?o.push({type:0,value:c}):s===1||s===2||s===3?(o.length>1&&(l==="*"||l==="+")&&t(`A repeatable param (${c}) must be alone in its segment. eg: '/:ids+.`),o.push({type:1,value:c,regexp:u,repeatable:l==="*"||l==="+",optional:l==="*"||l==="?"})):t("Invalid state to consume buffer"),c="")}function f(){c+=l}for(;a<e.length;){if(l=e[a++],l==="\\"&&s!==2){n=s,s=4;continue}switch(s){case 0:l==="/"?(c&&d(),r()):l===":"?(d(),s=1):f();break;case 4:f(),s=n;break;case 1:l==="("?s=2:Zy.test(l)?f():(d(),s=0,l!=="*"&&l!=="?"&&l!=="+"&&a--);break;case 2:l===")"?u[u.length-1]=="\\"?u=u.slice(0,-1)+l:s=3:u+=l;break;case 3:d(),s=0,l!=="*"&&l!=="?"&&l!=="+"&&a--,u="";break;default:t("Unknown state");break}}return s===2&&t(`Unfinished custom RegExp for param "${c}"`),d(),r(),i}function e0(e,t,s){const n=Xy(t0(e.path),s),i=wt(n,{record:e,parent:t,children:[],alias:[]});return t&&!i.record.aliasOf==!t.record.aliasOf&&t.children.push(i),i}function s0(e,t){const s=[],n=new Map;t=id({strict:!1,end:!0,sensitive:!1},t);function i(d){return n.get(d)}function o(d,f,h){const m=!h,p=sd(d);p.aliasOf=h&&h.record;const _=id(t,d),b=[p];if("alias"in d){const E=typeof d.alias=="string"?[d.alias]:d.alias;for(const S of E)b.push(sd(wt({},p,{components:h?h.record.components:p.components,path:S,aliasOf:h?h.record:p})))}let y,v;for(const E of b){const{path:S}=E;if(f&&S[0]!=="/"){const O=f.record.path,C=O[O.length-1]==="/"?"":"/";E.path=f.record.path+(S&&C+S)}if(y=e0(E,f,_),h?h.alias.push(y):(v=v||y,v!==y&&v.alias.push(y),m&&d.name&&!nd(y)&&r(d.name)),ag(y)&&l(y),p.children){const O=p.children;for(let C=0;C<O.length;C++)o(O[C],y,h&&h.children[C])}h=h||y}return v?()=>{r(v)}:Ki}function r(d){if(ig(d)){const f=n.get(d);f&&(n.delete(d),s.splice(s.indexOf(f),1),f.children.forEach(r),f.alias.forEach(r))}else{const f=s.indexOf(d);f>-1&&(s.splice(f,1),d.record.name&&n.delete(d.record.name),d.children.forEach(r),d.alias.forEach(r))}}function a(){return s}function l(d){const f=o0(d,s);s.splice(f,0,d),d.record.name&&!nd(d)&&n.set(d.record.name,d)}function c(d,f){let h,m={},p,_;if("name"in d&&d.name){if(h=n.get(d.name),!h)throw ai(1,{location:d});_=h.record.name,m=wt(ed(f.params,h.keys.filter(v=>!v.optional).concat(h.parent?h.parent.keys.filter(v=>v.optional):[]).map(v=>v.name)),d.params&&ed(d.params,h.keys.map(v=>v.name))),p=h.stringify(m)}else if(d.path!=null)p=d.path,h=s.find(v=>v.re.test(p)),h&&(m=h.parse(p),_=h.record.name);else{if(h=f.name?n.get(f.name):s.find(v=>v.re.test(f.path)),!h)throw ai(1,{location:d,currentLocation:f});_=h.record.name,m=wt({},f.params,d.params),p=h.stringify(m)}const b=[];let y=h;for(;y;)b.unshift(y.record),y=y.parent;return{name:_,path:p,params:m,matched:b,meta:i0(b)}}e.forEach(d=>o(d));function u(){s.length=0,n.clear()}return{addRoute:o,resolve:c,removeRoute:r,clearRoutes:u,getRoutes:a,getRecordMatcher:i}}function ed(e,t){const s={};for(const n of t)n in e&&(s[n]=e[n]);return s}function sd(e){const t={path:e.path,redirect:e.redirect,name:e.name,meta:e.meta||{},aliasOf:e.aliasOf,beforeEnter:e.beforeEnter,props:n0(e),children:e.children||[],instances:{},leaveGuards:new Set,updateGuards:new Set,enterCallbacks:{},components:"components"in e?e.components||null:e.component&&{default:e.component}};return Object.defineProperty(t,"mods",{value:{}}),t}function n0(e){const t={},s=e.props||!1;if("component"in e)t.default=s;else for(const n in e.components)t[n]=typeof s=="object"?s[n]:s;return t}function nd(e){for(;e;){if(e.record.aliasOf)return!0;e=e.parent}return!1}function i0(e){return e.reduce((t,s)=>wt(t,s.meta),{})}function id(e,t){const s={};for(const n in e)s[n]=n in t?t[n]:e[n];return s}function o0(e,t){let s=0,n=t.length;for(;s!==n;){const o=s+n>>1;rg(e,t[o])<0?n=o:s=o+1}const i=r0(e);return i&&(n=t.lastIndexOf(i,n-1)),n}function r0(e){let t=e;for(;t=t.parent;)if(ag(t)&&rg(e,t)===0)return t}function ag({record:e}){return!!(e.name||e.components&&Object.keys(e.components).length||e.redirect)}function a0(e){const t={};if(e===""||e==="?")return t;const n=(e[0]==="?"?e.slice(1):e).split("&");for(let i=0;i<n.length;++i){const o=n[i].replace(Jp," "),r=o.indexOf("="),a=co(r<0?o:o.slice(0,r)),l=r<0?null:co(o.slice(r+1));if(a in t){let c=t[a];Ke(c)||(c=t[a]=[c]),c.push(l)}else t[a]=l}return t}function od(e){let t="";for(let s in e){const n=e[s];if(s=Ty(s),n==null){n!==void 0&&(t+=(t.length?"&":"")+s);continue}(Ke(n)?n.map(o=>o&&Pl(o)):[n&&Pl(n)]).forEach(o=>{o!==void 0&&(t+=(t.length?"&":"")+s,o!=null&&(t+="="+o))})}return t}function l0(e){const t={};for(const s in e){const n=e[s];n!==void 0&&(t[s]=Ke(n)?n.map(i=>i==null?null:""+i):n==null?n:""+n)}return t}const c0=Symbol(""),rd=Symbol(""),ca=Symbol(""),yc=Symbol(""),Ll=Symbol("");function Ai(){let e=[];function t(n){return e.push(n),()=>{const i=e.indexOf(n);i>-1&&e.splice(i,1)}}function s(){e=[]}return{add:t,list:()=>e.slice(),reset:s}}function Ws(e,t,s,n,i,o=r=>r()){const r=n&&(n.enterCallbacks[i]=n.enterCallbacks[i]||[]);return()=>new Promise((a,l)=>{const c=f=>{f===!1?l(ai(4,{from:s,to:t})):f instanceof Error?l(f):Yy(f)?l(ai(2,{from:t,to:f})):(r&&n.enterCallbacks[i]===r&&typeof f=="function"&&r.push(f),a())},u=o(()=>e.call(n&&n.instances[i],t,s,c));let d=Promise.resolve(u);e.length<3&&(d=d.then(c)),d.catch(f=>l(f))})}function Ha(e,t,s,n,i=o=>o()){const o=[];for(const r of e)for(const a in r.components){let l=r.components[a];if(!(t!=="beforeRouteEnter"&&!r.instances[a]))if(Xp(l)){const u=(l.__vccOpts||l)[t];u&&o.push(Ws(u,s,n,r,a,i))}else{let c=l();o.push(()=>c.then(u=>{if(!u)throw new Error(`Couldn't resolve component "${a}" at "${r.path}"`);const d=my(u)?u.default:u;r.mods[a]=u,r.components[a]=d;const h=(d.__vccOpts||d)[t];return h&&Ws(h,s,n,r,a,i)()}))}}return o}function ad(e){const t=Ce(ca),s=Ce(yc),n=gt(()=>{const l=N(e.to);return t.resolve(l)}),i=gt(()=>{const{matched:l}=n.value,{length:c}=l,u=l[c-1],d=s.matched;if(!u||!d.length)return-1;const f=d.findIndex(ri.bind(null,u));if(f>-1)return f;const h=ld(l[c-2]);return c>1&&ld(u)===h&&d[d.length-1].path!==h?d.findIndex(ri.bind(null,l[c-2])):f}),o=gt(()=>i.value>-1&&p0(s.params,n.value.params)),r=gt(()=>i.value>-1&&i.value===s.matched.length-1&&sg(s.params,n.value.params));function a(l={}){if(h0(l)){const c=t[N(e.replace)?"replace":"push"](N(e.to)).catch(Ki);return e.viewTransition&&typeof document<"u"&&"startViewTransition"in document&&document.startViewTransition(()=>c),c}return Promise.resolve()}return{route:n,href:gt(()=>n.value.href),isActive:o,isExactActive:r,navigate:a}}function u0(e){return e.length===1?e[0]:e}const d0=zt({name:"RouterLink",compatConfig:{MODE:3},props:{to:{type:[String,Object],required:!0},replace:Boolean,activeClass:String,exactActiveClass:String,custom:Boolean,ariaCurrentValue:{type:String,default:"page"},viewTransition:Boolean},useLink:ad,setup(e,{slots:t}){const s=Co(ad(e)),{options:n}=Ce(ca),i=gt(()=>({[cd(e.activeClass,n.linkActiveClass,"router-link-active")]:s.isActive,[cd(e.exactActiveClass,n.linkExactActiveClass,"router-link-exact-active")]:s.isExactActive}));return()=>{const o=t.default&&u0(t.default(s));return e.custom?o:$p("a",{"aria-current":s.isExactActive?e.ariaCurrentValue:null,href:s.href,onClick:s.navigate,class:i.value},o)}}}),f0=d0;function h0(e){if(!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)&&!e.defaultPrevented&&!(e.button!==void 0&&e.button!==0)){if(e.currentTarget&&e.currentTarget.getAttribute){const t=e.currentTarget.getAttribute("target");if(/\b_blank\b/i.test(t))return}return e.preventDefault&&e.preventDefault(),!0}}function p0(e,t){for(const s in t){const n=t[s],i=e[s];if(typeof n=="string"){if(n!==i)return!1}else if(!Ke(i)||i.length!==n.length||n.some((o,r)=>o!==i[r]))return!1}return!0}function ld(e){return e?e.aliasOf?e.aliasOf.path:e.path:""}const cd=(e,t,s)=>e??t??s,g0=zt({name:"RouterView",inheritAttrs:!1,props:{name:{type:String,default:"default"},route:Object},compatConfig:{MODE:3},setup(e,{attrs:t,slots:s}){const n=Ce(Ll),i=gt(()=>e.route||n.value),o=Ce(rd,0),r=gt(()=>{let c=N(o);const{matched:u}=i.value;let d;for(;(d=u[c])&&!d.components;)c++;return c}),a=gt(()=>i.value.matched[r.value]);fr(rd,gt(()=>r.value+1)),fr(c0,a),fr(Ll,i);const l=ft();return Tn(()=>[l.value,a.value,e.name],([c,u,d],[f,h,m])=>{u&&(u.instances[d]=c,h&&h!==u&&c&&c===f&&(u.leaveGuards.size||(u.leaveGuards=h.leaveGuards),u.updateGuards.size||(u.updateGuards=h.updateGuards))),c&&u&&(!h||!ri(u,h)||!f)&&(u.enterCallbacks[d]||[]).forEach(p=>p(c))},{flush:"post"}),()=>{const c=i.value,u=e.name,d=a.value,f=d&&d.components[u];if(!f)return ud(s.default,{Component:f,route:c});const h=d.props[u],m=h?h===!0?c.params:typeof h=="function"?h(c):h:null,_=$p(f,wt({},m,t,{onVnodeUnmounted:b=>{b.component.isUnmounted&&(d.instances[u]=null)},ref:l}));return ud(s.default,{Component:_,route:c})||_}}});function ud(e,t){if(!e)return null;const s=e(t);return s.length===1?s[0]:s}const m0=g0;function _0(e){const t=s0(e.routes,e),s=e.parseQuery||a0,n=e.stringifyQuery||od,i=e.history,o=Ai(),r=Ai(),a=Ai(),l=lb($s);let c=$s;qn&&e.scrollBehavior&&"scrollRestoration"in history&&(history.scrollRestoration="manual");const u=Ba.bind(null,D=>""+D),d=Ba.bind(null,ky),f=Ba.bind(null,co);function h(D,q){let z,J;return ig(D)?(z=t.getRecordMatcher(D),J=q):J=D,t.addRoute(J,z)}function m(D){const q=t.getRecordMatcher(D);q&&t.removeRoute(q)}function p(){return t.getRoutes().map(D=>D.record)}function _(D){return!!t.getRecordMatcher(D)}function b(D,q){if(q=wt({},q||l.value),typeof D=="string"){const T=Va(s,D,q.path),I=t.resolve({path:T.path},q),R=i.createHref(T.fullPath);return wt(T,I,{params:f(I.params),hash:co(T.hash),redirectedFrom:void 0,href:R})}let z;if(D.path!=null)z=wt({},D,{path:Va(s,D.path,q.path).path});else{const T=wt({},D.params);for(const I in T)T[I]==null&&delete T[I];z=wt({},D,{params:d(T)}),q.params=d(q.params)}const J=t.resolve(z,q),xt=D.hash||"";J.params=u(f(J.params));const x=Py(n,wt({},D,{hash:Ay(xt),path:J.path})),w=i.createHref(x);return wt({fullPath:x,hash:xt,query:n===od?l0(D.query):D.query||{}},J,{redirectedFrom:void 0,href:w})}function y(D){return typeof D=="string"?Va(s,D,l.value.path):wt({},D)}function v(D,q){if(c!==D)return ai(8,{from:q,to:D})}function E(D){return C(D)}function S(D){return E(wt(y(D),{replace:!0}))}function O(D){const q=D.matched[D.matched.length-1];if(q&&q.redirect){const{redirect:z}=q;let J=typeof z=="function"?z(D):z;return typeof J=="string"&&(J=J.includes("?")||J.includes("#")?J=y(J):{path:J},J.params={}),wt({query:D.query,hash:D.hash,params:J.path!=null?{}:D.params},J)}}function C(D,q){const z=c=b(D),J=l.value,xt=D.state,x=D.force,w=D.replace===!0,T=O(z);if(T)return C(wt(y(T),{state:typeof T=="object"?wt({},xt,T.state):xt,force:x,replace:w}),q||z);const I=z;I.redirectedFrom=q;let R;return!x&&Iy(n,J,z)&&(R=ai(16,{to:I,from:J}),Yt(J,J,!0,!1)),(R?Promise.resolve(R):$(I,J)).catch(M=>ps(M)?ps(M,2)?M:Ut(M):ot(M,I,J)).then(M=>{if(M){if(ps(M,2))return C(wt({replace:w},y(M.to),{state:typeof M.to=="object"?wt({},xt,M.to.state):xt,force:x}),q||I)}else M=P(I,J,!0,w,xt);return H(I,J,M),M})}function k(D,q){const z=v(D,q);return z?Promise.reject(z):Promise.resolve()}function A(D){const q=Vt.values().next().value;return q&&typeof q.runWithContext=="function"?q.runWithContext(D):D()}function $(D,q){let z;const[J,xt,x]=b0(D,q);z=Ha(J.reverse(),"beforeRouteLeave",D,q);for(const T of J)T.leaveGuards.forEach(I=>{z.push(Ws(I,D,q))});const w=k.bind(null,D,q);return z.push(w),Dt(z).then(()=>{z=[];for(const T of o.list())z.push(Ws(T,D,q));return z.push(w),Dt(z)}).then(()=>{z=Ha(xt,"beforeRouteUpdate",D,q);for(const T of xt)T.updateGuards.forEach(I=>{z.push(Ws(I,D,q))});return z.push(w),Dt(z)}).then(()=>{z=[];for(const T of x)if(T.beforeEnter)if(Ke(T.beforeEnter))for(const I of T.beforeEnter)z.push(Ws(I,D,q));else z.push(Ws(T.beforeEnter,D,q));return z.push(w),Dt(z)}).then(()=>(D.matched.forEach(T=>T.enterCallbacks={}),z=Ha(x,"beforeRouteEnter",D,q,A),z.push(w),Dt(z))).then(()=>{z=[];for(const T of r.list())z.push(Ws(T,D,q));return z.push(w),Dt(z)}).catch(T=>ps(T,8)?T:Promise.reject(T))}function H(D,q,z){a.list().forEach(J=>A(()=>J(D,q,z)))}function P(D,q,z,J,xt){const x=v(D,q);if(x)return x;const w=q===$s,T=qn?history.state:{};z&&(J||w?i.replace(D.fullPath,wt({scroll:w&&T&&T.scroll},xt)):i.push(D.fullPath,xt)),l.value=D,Yt(D,q,z,w),Ut()}let X;function ct(){X||(X=i.listen((D,q,z)=>{if(!qt.listening)return;const J=b(D),xt=O(J);if(xt){C(wt(xt,{replace:!0,force:!0}),J).catch(Ki);return}c=J;const x=l.value;qn&&Hy(Xu(x.fullPath,z.delta),la()),$(J,x).catch(w=>ps(w,12)?w:ps(w,2)?(C(wt(y(w.to),{force:!0}),J).then(T=>{ps(T,20)&&!z.delta&&z.type===uo.pop&&i.go(-1,!1)}).catch(Ki),Promise.reject()):(z.delta&&i.go(-z.delta,!1),ot(w,J,x))).then(w=>{w=w||P(J,x,!1),w&&(z.delta&&!ps(w,8)?i.go(-z.delta,!1):z.type===uo.pop&&ps(w,20)&&i.go(-1,!1)),H(J,x,w)}).catch(Ki)}))}let nt=Ai(),Q=Ai(),K;function ot(D,q,z){Ut(D);const J=Q.list();return J.length?J.forEach(xt=>xt(D,q,z)):console.error(D),Promise.reject(D)}function mt(){return K&&l.value!==$s?Promise.resolve():new Promise((D,q)=>{nt.add([D,q])})}function Ut(D){return K||(K=!D,ct(),nt.list().forEach(([q,z])=>D?z(D):q()),nt.reset()),D}function Yt(D,q,z,J){const{scrollBehavior:xt}=e;if(!qn||!xt)return Promise.resolve();const x=!z&&jy(Xu(D.fullPath,0))||(J||!z)&&history.state&&history.state.scroll||null;return To().then(()=>xt(D,q,x)).then(w=>w&&Vy(w)).catch(w=>ot(w,D,q))}const At=D=>i.go(D);let Jt;const Vt=new Set,qt={currentRoute:l,listening:!0,addRoute:h,removeRoute:m,clearRoutes:t.clearRoutes,hasRoute:_,getRoutes:p,resolve:b,options:e,push:E,replace:S,go:At,back:()=>At(-1),forward:()=>At(1),beforeEach:o.add,beforeResolve:r.add,afterEach:a.add,onError:Q.add,isReady:mt,install(D){const q=this;D.component("RouterLink",f0),D.component("RouterView",m0),D.config.globalProperties.$router=q,Object.defineProperty(D.config.globalProperties,"$route",{enumerable:!0,get:()=>N(l)}),qn&&!Jt&&l.value===$s&&(Jt=!0,E(i.location).catch(xt=>{}));const z={};for(const xt in $s)Object.defineProperty(z,xt,{get:()=>l.value[xt],enumerable:!0});D.provide(ca,q),D.provide(yc,Gh(z)),D.provide(Ll,l);const J=D.unmount;Vt.add(D),D.unmount=function(){Vt.delete(D),Vt.size<1&&(c=$s,X&&X(),X=null,l.value=$s,Jt=!1,K=!1),J()}}};function Dt(D){return D.reduce((q,z)=>q.then(()=>A(z)),Promise.resolve())}return qt}function b0(e,t){const s=[],n=[],i=[],o=Math.max(t.matched.length,e.matched.length);for(let r=0;r<o;r++){const a=t.matched[r];a&&(e.matched.find(c=>ri(c,a))?n.push(a):s.push(a));const l=e.matched[r];l&&(t.matched.find(c=>ri(c,l))||i.push(l))}return[s,n,i]}function on(){return Ce(ca)}function lg(e){return Ce(yc)}const fo={USD:{code:"USD",name:"US Dollar",symbol:"$"},EUR:{code:"EUR",name:"Euro",symbol:"€"},GBP:{code:"GBP",name:"British Pound",symbol:"£"},JPY:{code:"JPY",name:"Japanese Yen",symbol:"¥"},AUD:{code:"AUD",name:"Australian Dollar",symbol:"A$"}},cg={USD:1,EUR:.92,GBP:.79,JPY:149.5,AUD:1.53};function Lr(e,t){const s=cg[t];return e*s}function v0(e,t){const s=cg[t];return e/s}function qi(e,t){const s=typeof e=="string"?parseFloat(e):e;if(isNaN(s))return`${fo[t].symbol}0.00`;const n=Lr(s,t),i=fo[t].symbol;return t==="JPY"?`${i}${Math.round(n).toLocaleString()}`:`${i}${n.toFixed(2)}`}function xc(e){return fo[e].symbol}function ug(){return Object.values(fo)}const y0={class:"navbar navbar-expand-lg navbar-dark bg-dark"},x0={class:"container"},w0={class:"collapse navbar-collapse",id:"navbarNav"},E0={class:"navbar-nav ms-auto align-items-lg-center"},S0={class:"nav-item"},C0={class:"nav-item"},A0={class:"nav-item"},T0={class:"nav-item dropdown"},O0={class:"nav-link dropdown-toggle",href:"#",role:"button","data-bs-toggle":"dropdown","aria-expanded":"false"},k0={class:"dropdown-menu dropdown-menu-end"},D0=["onClick"],M0={class:"nav-item"},P0={class:"nav-link text-light"},I0=zt({__name:"AppNavbar",setup(e){const t=on(),s=Ae(),n=ug(),i=gt(()=>{const a=s.user?.currency_preference||"USD";return xc(a)}),o=async a=>{await s.setCurrency(a)},r=async()=>{await s.logout(),t.push("/login")};return(a,l)=>{const c=be("router-link");return L(),B("nav",y0,[g("div",x0,[dt(c,{to:"/",class:"navbar-brand"},{default:Ht(()=>[...l[0]||(l[0]=[g("img",{src:gy,alt:"Soldit Logo",class:"navbar-logo"},null,-1)])]),_:1}),l[6]||(l[6]=g("button",{class:"navbar-toggler",type:"button","data-bs-toggle":"collapse","data-bs-target":"#navbarNav","aria-controls":"navbarNav","aria-expanded":"false","aria-label":"Toggle navigation"},[g("span",{class:"navbar-toggler-icon"})],-1)),g("div",w0,[g("ul",E0,[g("li",S0,[dt(c,{to:"/",class:"nav-link","active-class":"active"},{default:Ht(()=>[...l[1]||(l[1]=[rt(" Home ",-1)])]),_:1})]),g("li",C0,[dt(c,{to:"/items",class:"nav-link","active-class":"active"},{default:Ht(()=>[...l[2]||(l[2]=[rt(" Auctions ",-1)])]),_:1})]),g("li",A0,[dt(c,{to:"/profile",class:"nav-link","active-class":"active"},{default:Ht(()=>[...l[3]||(l[3]=[rt(" Profile ",-1)])]),_:1})]),g("li",T0,[g("a",O0,[l[4]||(l[4]=g("i",{class:"bi bi-currency-exchange me-1"},null,-1)),rt(" "+U(i.value),1)]),g("ul",k0,[(L(!0),B(It,null,We(N(n),u=>(L(),B("li",{key:u.code},[g("a",{class:Kt(["dropdown-item",{active:N(s).user?.currency_preference===u.code}]),href:"#",onClick:os(d=>o(u.code),["prevent"])},U(u.symbol)+" "+U(u.name),11,D0)]))),128))])]),g("li",M0,[g("span",P0,[l[5]||(l[5]=g("i",{class:"bi bi-person-circle"},null,-1)),rt(" "+U(N(s).user?.username),1)])]),g("li",{class:"nav-item"},[g("button",{onClick:r,class:"btn btn-outline-light btn-sm ms-lg-2"}," Logout ")])])])])])}}}),Ye=(e,t)=>{const s=e.__vccOpts||e;for(const[n,i]of t)s[n]=i;return s},L0=Ye(I0,[["__scopeId","data-v-38353bfe"]]),R0=zt({__name:"App",setup(e){const t=Ae();return fs(()=>{t.user||t.fetchCurrentUser()}),(s,n)=>{const i=be("RouterView");return L(),B("div",null,[N(t).isAuthenticated?(L(),Pe(L0,{key:0})):bt("",!0),dt(i)])}}}),Ns={async getItems(e){const t=e?`/api/items/?search=${encodeURIComponent(e)}`:"/api/items/";return ce.get(t)},async getItemDetail(e){return ce.get(`/api/items/${e}/`)},async createItem(e){const t=new FormData;return t.append("title",e.title),t.append("description",e.description),t.append("starting_price",e.starting_price),t.append("picture",e.picture),t.append("end_date",e.end_date),ce.postFormData("/api/items/",t)},async placeBid(e,t){return ce.post(`/api/items/${e}/bid/`,t)},async askQuestion(e,t){return ce.post(`/api/items/${e}/questions/`,t)},async answerQuestion(e,t){return ce.post(`/api/questions/${e}/answer/`,t)},async updateItem(e,t){const s=new FormData;return s.append("title",t.title),s.append("description",t.description),s.append("end_date",t.end_date),t.picture&&s.append("picture",t.picture),ce.putFormData(`/api/items/${e}/edit/`,s)},async deleteItem(e){return ce.delete(`/api/items/${e}/delete/`)}},Do=Gp("items",{state:()=>({items:[],currentItem:null,currentItemBids:[],currentItemQuestions:[],loading:!1,error:null}),getters:{activeItems:e=>e.items.filter(t=>!t.is_ended),endedItems:e=>e.items.filter(t=>t.is_ended)},actions:{async fetchItems(e){this.loading=!0,this.error=null;try{const t=await Ns.getItems(e);t.success&&t.data?this.items=t.data.items:this.error=t.error||"Failed to load items"}catch{this.error="Network error"}finally{this.loading=!1}},async fetchItemDetail(e){this.loading=!0,this.error=null;try{const t=await Ns.getItemDetail(e);return t.success&&t.data?(this.currentItem=t.data.item,this.currentItemBids=t.data.bids,this.currentItemQuestions=t.data.questions,!0):(this.error=t.error||"Failed to load item",!1)}catch{return this.error="Network error",!1}finally{this.loading=!1}},async createItem(e){this.loading=!0,this.error=null;try{const t=await Ns.createItem(e);return t.success&&t.data?(this.items.unshift(t.data.item),!0):(this.error=t.error||"Failed to create item",!1)}catch{return this.error="Network error",!1}finally{this.loading=!1}},async placeBid(e,t){this.loading=!0,this.error=null;try{const s=await Ns.placeBid(e,{amount:t});if(s.success&&s.data){this.currentItem=s.data.item,this.currentItemBids.unshift(s.data.bid);const n=this.items.findIndex(o=>o.id===e);n!==-1&&(this.items[n]=s.data.item);const i=Ae();return i.user&&!i.user.bid_item_ids.includes(e)&&i.user.bid_item_ids.push(e),!0}else return this.error=s.error||"Failed to place bid",!1}catch{return this.error="Network error",!1}finally{this.loading=!1}},async askQuestion(e,t){this.loading=!0,this.error=null;try{const s=await Ns.askQuestion(e,{question_text:t});if(s.success&&s.data){this.currentItemQuestions.push(s.data.question);const n=Ae();return n.user&&!n.user.questioned_item_ids.includes(e)&&n.user.questioned_item_ids.push(e),!0}else return this.error=s.error||"Failed to ask question",!1}catch{return this.error="Network error",!1}finally{this.loading=!1}},async answerQuestion(e,t){this.loading=!0,this.error=null;try{const s=await Ns.answerQuestion(e,{answer_text:t});if(s.success&&s.data){const n=this.currentItemQuestions.findIndex(i=>i.id===e);return n!==-1&&(this.currentItemQuestions[n]=s.data.question),!0}else return this.error=s.error||"Failed to answer question",!1}catch{return this.error="Network error",!1}finally{this.loading=!1}},async updateItem(e,t){this.loading=!0,this.error=null;try{const s=await Ns.updateItem(e,t);if(s.success&&s.data){this.currentItem=s.data.item;const n=this.items.findIndex(i=>i.id===e);return n!==-1&&(this.items[n]=s.data.item),!0}else return this.error=s.error||"Failed to update item",!1}catch{return this.error="Network error",!1}finally{this.loading=!1}},async deleteItem(e){this.loading=!0,this.error=null;try{const t=await Ns.deleteItem(e);return t.success?(this.items=this.items.filter(s=>s.id!==e),this.currentItem?.id===e&&this.clearCurrentItem(),!0):(this.error=t.error||"Failed to delete item",!1)}catch{return this.error="Network error",!1}finally{this.loading=!1}},clearCurrentItem(){this.currentItem=null,this.currentItemBids=[],this.currentItemQuestions=[]}}});function $0(e){const t=ft(""),s=ft("normal");let n;const i=()=>{const o=new Date(e).getTime(),r=new Date().getTime(),a=o-r;if(a<=0){t.value="Ended",s.value="critical",clearInterval(n);return}const l=Math.floor(a/(1e3*60*60*24)),c=Math.floor(a%(1e3*60*60*24)/(1e3*60*60)),u=Math.floor(a%(1e3*60*60)/(1e3*60));a<36e5?(s.value="critical",t.value=`${u}m remaining`):a<864e5?(s.value="warning",t.value=`${c}h ${u}m`):(s.value="normal",t.value=`${l}d ${c}h`)};return fs(()=>{i(),n=setInterval(i,1e3)}),Oo(()=>{clearInterval(n)}),{timeRemaining:t,urgency:s}}const N0={class:"position-relative"},F0=["src"],B0={class:"position-absolute top-0 end-0 m-2"},V0={key:1,class:"badge bg-danger shadow-sm"},H0={class:"card-body d-flex flex-column"},j0={class:"card-title text-truncate"},W0={class:"card-text text-muted small flex-grow-1 text-truncate-2"},z0={class:"mt-2"},U0={class:"d-flex justify-content-between align-items-center mb-2"},K0={class:"fw-bold text-primary"},Y0={class:"text-end"},q0={class:"badge rounded-pill bg-light text-dark border"},G0={class:"pt-2 border-top"},X0={class:"text-muted d-block"},Q0=zt({__name:"ItemCard",props:{item:{}},emits:["click"],setup(e){const t=e,s=Ae(),{timeRemaining:n,urgency:i}=$0(t.item.end_date),o=r=>new Date(r).toLocaleString();return(r,a)=>(L(),B("div",{class:"card h-100 shadow-sm",onClick:a[0]||(a[0]=l=>r.$emit("click"))},[g("div",N0,[g("img",{src:r.item.picture||"",class:"card-img-top item-image",alt:"Item image"},null,8,F0),g("div",B0,[!r.item.is_ended&&r.item.is_active?(L(),B("div",{key:0,class:Kt(["countdown-badge",`countdown-${N(i)}`])},[a[1]||(a[1]=g("i",{class:"bi bi-clock me-1"},null,-1)),rt(U(N(n)),1)],2)):(L(),B("span",V0,[...a[2]||(a[2]=[g("i",{class:"bi bi-lock-fill me-1"},null,-1),rt(" Closed ",-1)])]))])]),g("div",H0,[g("h5",j0,U(r.item.title),1),g("p",W0,U(r.item.description),1),g("div",z0,[g("div",U0,[g("div",null,[a[3]||(a[3]=g("small",{class:"text-muted d-block"},"Current Bid",-1)),g("span",K0,U(N(qi)(r.item.current_price,N(s).user?.currency_preference||"USD")),1)]),g("div",Y0,[a[4]||(a[4]=g("small",{class:"text-muted d-block"},"Bids",-1)),g("span",q0,U(r.item.bid_count),1)])]),g("div",G0,[g("small",X0,[a[5]||(a[5]=g("i",{class:"bi bi-calendar3 me-1"},null,-1)),rt(" "+U(r.item.is_ended?"Ended on:":"Ends on:"),1)]),g("span",{class:Kt(["small",r.item.is_ended?"text-muted":"text-danger fw-medium"])},U(o(r.item.end_date)),3)])])])]))}}),mr=Ye(Q0,[["__scopeId","data-v-31461ca9"]]),J0={class:"container mt-4"},Z0={class:"welcome-section mb-4"},tx={class:"text-muted"},ex={class:"quick-actions mb-4"},sx={class:"card"},nx={class:"card-body"},ix={class:"d-flex flex-wrap gap-2"},ox={class:"row g-4 mb-4"},rx={class:"col-lg-3 col-md-6"},ax={class:"card stat-card border-0 h-100"},lx={class:"card-body"},cx={class:"d-flex justify-content-between align-items-center mb-2"},ux={class:"mb-0 fw-bold"},dx={class:"mt-3 pt-2 border-top"},fx={class:"text-success"},hx={class:"col-lg-3 col-md-6"},px={class:"card stat-card border-0 h-100"},gx={class:"card-body"},mx={class:"d-flex justify-content-between align-items-center mb-2"},_x={class:"mb-0 fw-bold"},bx={class:"mt-3 pt-2 border-top"},vx={class:"text-muted"},yx={class:"col-lg-3 col-md-6"},xx={class:"card stat-card border-0 h-100"},wx={class:"card-body"},Ex={class:"d-flex justify-content-between align-items-center mb-2"},Sx={class:"mb-0 fw-bold"},Cx={class:"col-lg-3 col-md-6"},Ax={class:"card stat-card border-0 h-100"},Tx={class:"card-body"},Ox={class:"d-flex justify-content-between align-items-center mb-2"},kx={class:"mb-0 fw-bold"},Dx={class:"mt-3 pt-2 border-top"},Mx={class:"text-muted"},Px={class:"activity-section"},Ix={class:"d-flex justify-content-between align-items-center mb-3"},Lx={key:0,class:"text-center py-4"},Rx={key:1},$x={key:0,class:"mb-4"},Nx={class:"text-muted mb-3"},Fx={class:"row g-3"},Bx={key:1,class:"mb-4"},Vx={class:"text-muted mb-3"},Hx={class:"row g-3"},jx={key:2,class:"mb-4"},Wx={class:"text-muted mb-3"},zx={class:"row g-3"},Ux={key:3,class:"card"},Kx={class:"card-body text-center py-5"},Yx=zt({__name:"DashboardPage",setup(e){const t=Ae(),s=Do(),n=on(),i=gt(()=>s.items.filter(f=>f.owner_id===t.user?.id)),o=gt(()=>{const f=t.user?.bid_item_ids||[];return s.items.filter(h=>f.includes(h.id))}),r=gt(()=>{const f=t.user?.questioned_item_ids||[];return s.items.filter(h=>f.includes(h.id))}),a=gt(()=>i.value.filter(f=>!f.is_ended).length),l=gt(()=>{const f=o.value.reduce((h,m)=>h+parseFloat(m.current_price),0);return qi(f,t.user?.currency_preference||"USD")}),c=gt(()=>s.items.filter(f=>f.winner_id===t.user?.id).length),u=gt(()=>{const f=o.value.filter(h=>h.is_ended).length;return f===0?0:Math.round(c.value/f*100)}),d=f=>{n.push(`/items/${f}`)};return fs(()=>{s.fetchItems()}),(f,h)=>{const m=be("router-link");return L(),B("div",J0,[g("div",Z0,[h[0]||(h[0]=g("h1",null,"Welcome to SoldIt",-1)),g("p",tx," Hello, "+U(N(t).user?.username)+"! Start bidding on items or list your own. ",1)]),g("div",ex,[g("div",sx,[g("div",nx,[h[4]||(h[4]=g("h5",{class:"card-title"},"Quick Actions",-1)),g("div",ix,[dt(m,{to:"/items/create",class:"btn btn-primary"},{default:Ht(()=>[...h[1]||(h[1]=[g("i",{class:"bi bi-plus-circle me-1"},null,-1),rt(" Create Listing ",-1)])]),_:1}),dt(m,{to:"/items",class:"btn btn-outline-primary"},{default:Ht(()=>[...h[2]||(h[2]=[g("i",{class:"bi bi-search me-1"},null,-1),rt(" Browse Auctions ",-1)])]),_:1}),dt(m,{to:"/profile",class:"btn btn-outline-secondary"},{default:Ht(()=>[...h[3]||(h[3]=[g("i",{class:"bi bi-person me-1"},null,-1),rt(" View Profile ",-1)])]),_:1})])])])]),g("div",ox,[g("div",rx,[g("div",ax,[g("div",lx,[g("div",cx,[g("div",null,[g("h3",ux,U(i.value.length),1),h[5]||(h[5]=g("small",{class:"text-muted"},"My Listings",-1))]),h[6]||(h[6]=g("div",{class:"stat-icon bg-primary"},[g("i",{class:"bi bi-box-seam"})],-1))]),g("div",dx,[g("small",fx,[h[7]||(h[7]=g("i",{class:"bi bi-arrow-up-circle me-1"},null,-1)),rt(" "+U(a.value)+" active ",1)])])])])]),g("div",hx,[g("div",px,[g("div",gx,[g("div",mx,[g("div",null,[g("h3",_x,U(l.value),1),h[8]||(h[8]=g("small",{class:"text-muted"},"Bid Value",-1))]),h[9]||(h[9]=g("div",{class:"stat-icon bg-success"},[g("i",{class:"bi bi-cash-stack"})],-1))]),g("div",bx,[g("small",vx,[h[10]||(h[10]=g("i",{class:"bi bi-tag me-1"},null,-1)),rt(" "+U(o.value.length)+" items ",1)])])])])]),g("div",yx,[g("div",xx,[g("div",wx,[g("div",Ex,[g("div",null,[g("h3",Sx,U(r.value.length),1),h[11]||(h[11]=g("small",{class:"text-muted"},"Questions",-1))]),h[12]||(h[12]=g("div",{class:"stat-icon bg-info"},[g("i",{class:"bi bi-chat-dots"})],-1))]),h[13]||(h[13]=g("div",{class:"mt-3 pt-2 border-top"},[g("small",{class:"text-muted"},[g("i",{class:"bi bi-check-circle me-1"}),rt(" Engaging with sellers ")])],-1))])])]),g("div",Cx,[g("div",Ax,[g("div",Tx,[g("div",Ox,[g("div",null,[g("h3",kx,U(u.value)+"%",1),h[14]||(h[14]=g("small",{class:"text-muted"},"Win Rate",-1))]),h[15]||(h[15]=g("div",{class:"stat-icon bg-warning"},[g("i",{class:"bi bi-trophy"})],-1))]),g("div",Dx,[g("small",Mx,[h[16]||(h[16]=g("i",{class:"bi bi-award me-1"},null,-1)),rt(" "+U(c.value)+" won ",1)])])])])])]),g("div",Px,[g("div",Ix,[h[18]||(h[18]=g("h3",{class:"mb-0"},"My Activity",-1)),dt(m,{to:"/items",class:"btn btn-sm btn-outline-primary"},{default:Ht(()=>[...h[17]||(h[17]=[rt(" Browse All Auctions ",-1)])]),_:1})]),N(s).loading?(L(),B("div",Lx,[...h[19]||(h[19]=[g("div",{class:"spinner-border",role:"status"},[g("span",{class:"visually-hidden"},"Loading...")],-1)])])):(L(),B("div",Rx,[i.value.length>0?(L(),B("div",$x,[g("h5",Nx,"My Listings ("+U(i.value.length)+")",1),g("div",Fx,[(L(!0),B(It,null,We(i.value,p=>(L(),B("div",{key:p.id,class:"col-md-4"},[dt(mr,{item:p,onClick:_=>d(p.id)},null,8,["item","onClick"])]))),128))])])):bt("",!0),o.value.length>0?(L(),B("div",Bx,[g("h5",Vx,"Items I'm Bidding On ("+U(o.value.length)+")",1),g("div",Hx,[(L(!0),B(It,null,We(o.value,p=>(L(),B("div",{key:p.id,class:"col-md-4"},[dt(mr,{item:p,onClick:_=>d(p.id)},null,8,["item","onClick"])]))),128))])])):bt("",!0),r.value.length>0?(L(),B("div",jx,[g("h5",Wx,"Items I've Asked About ("+U(r.value.length)+")",1),g("div",zx,[(L(!0),B(It,null,We(r.value,p=>(L(),B("div",{key:p.id,class:"col-md-4"},[dt(mr,{item:p,onClick:_=>d(p.id)},null,8,["item","onClick"])]))),128))])])):bt("",!0),i.value.length===0&&o.value.length===0&&r.value.length===0?(L(),B("div",Ux,[g("div",Kx,[h[21]||(h[21]=g("i",{class:"bi bi-inbox",style:{"font-size":"3rem",color:"#ccc"}},null,-1)),h[22]||(h[22]=g("h5",{class:"mt-3"},"No Activity Yet",-1)),h[23]||(h[23]=g("p",{class:"text-muted mb-3"}," You haven't created any listings, placed any bids, or asked any questions yet. ",-1)),dt(m,{to:"/items",class:"btn btn-primary"},{default:Ht(()=>[...h[20]||(h[20]=[rt(" Browse Auctions ",-1)])]),_:1})])])):bt("",!0)]))])])}}}),qx=Ye(Yx,[["__scopeId","data-v-1a6991b0"]]),Gx={class:"auth-container"},Xx={class:"auth-card"},Qx={key:0,class:"alert alert-danger",role:"alert"},Jx={class:"mb-3"},Zx={class:"mb-3"},t1=["disabled"],e1={class:"text-center mt-3 mb-0"},s1=zt({__name:"LoginPage",setup(e){const t=on(),s=Ae(),n=ft({username:"",password:""}),i=ft(null),o=async()=>{i.value=null,await s.login(n.value)?t.push("/"):i.value=s.error||"Login failed. Please check your credentials."};return(r,a)=>{const l=be("router-link");return L(),B("div",Gx,[g("div",Xx,[a[6]||(a[6]=g("h2",{class:"text-center mb-4"},"Login",-1)),i.value?(L(),B("div",Qx,U(i.value),1)):bt("",!0),g("form",{onSubmit:os(o,["prevent"])},[g("div",Jx,[a[2]||(a[2]=g("label",{for:"username",class:"form-label"},"Username",-1)),Ot(g("input",{id:"username","onUpdate:modelValue":a[0]||(a[0]=c=>n.value.username=c),type:"text",class:"form-control",placeholder:"Enter your username",required:""},null,512),[[Nt,n.value.username]])]),g("div",Zx,[a[3]||(a[3]=g("label",{for:"password",class:"form-label"},"Password",-1)),Ot(g("input",{id:"password","onUpdate:modelValue":a[1]||(a[1]=c=>n.value.password=c),type:"password",class:"form-control",placeholder:"Enter your password",required:""},null,512),[[Nt,n.value.password]])]),g("button",{type:"submit",class:"btn btn-primary w-100",disabled:N(s).loading},U(N(s).loading?"Logging in...":"Login"),9,t1)],32),g("p",e1,[a[5]||(a[5]=rt(" Don't have an account? ",-1)),dt(l,{to:"/signup",class:"text-decoration-none"},{default:Ht(()=>[...a[4]||(a[4]=[rt("Sign up",-1)])]),_:1})])])])}}}),n1=Ye(s1,[["__scopeId","data-v-dceb6c71"]]),i1={class:"auth-container"},o1={class:"auth-card"},r1={key:0,class:"alert alert-danger",role:"alert"},a1={class:"mb-3 text-center"},l1=["src"],c1={key:0,class:"text-danger small mt-1"},u1={class:"mb-3"},d1={key:0,class:"invalid-feedback"},f1={class:"mb-3"},h1={key:0,class:"invalid-feedback"},p1={class:"mb-3"},g1={key:0,class:"invalid-feedback"},m1={class:"mb-3"},_1={key:0,class:"invalid-feedback"},b1={class:"mb-3"},v1={key:0,class:"invalid-feedback"},y1=["disabled"],x1={class:"text-center mt-3 mb-0"},w1="https://upload.wikimedia.org/wikipedia/commons/7/7c/Profile_avatar_placeholder_large.png",E1=zt({__name:"SignupPage",setup(e){const t=on(),s=Ae(),n=ft({username:"",email:"",password1:"",password2:"",date_of_birth:void 0}),i=ft(null),o=ft(null),r=gt(()=>i.value?URL.createObjectURL(i.value):w1),a=c=>{const u=c.target;u.files&&u.files[0]&&(i.value=u.files[0])},l=async()=>{const c={...n.value,profile_image:i.value||void 0};await s.signup(c)&&t.push("/")};return(c,u)=>{const d=be("router-link");return L(),B("div",i1,[g("div",o1,[u[17]||(u[17]=g("h2",{class:"text-center mb-4"},"Sign Up",-1)),N(s).error?(L(),B("div",r1,U(N(s).error),1)):bt("",!0),g("form",{onSubmit:os(l,["prevent"])},[g("div",a1,[g("div",{class:"profile-preview-container",onClick:u[0]||(u[0]=f=>o.value?.click())},[g("img",{src:r.value,class:"profile-preview",alt:"Profile preview"},null,8,l1),u[6]||(u[6]=g("div",{class:"upload-overlay"},"CLICK TO UPLOAD",-1))]),g("input",{ref_key:"fileInput",ref:o,type:"file",accept:"image/jpeg,image/jpg,image/png",onChange:a,style:{display:"none"}},null,544),u[7]||(u[7]=g("small",{class:"text-muted d-block mt-1"},"Optional: Upload profile image",-1)),u[8]||(u[8]=g("small",{class:"text-muted d-block"},"(JPG, JPEG, or PNG)",-1)),N(s).errors?.profile_image?(L(),B("div",c1,U(N(s).errors.profile_image[0]),1)):bt("",!0)]),g("div",u1,[u[9]||(u[9]=g("label",{for:"username",class:"form-label"},"Username",-1)),Ot(g("input",{id:"username","onUpdate:modelValue":u[1]||(u[1]=f=>n.value.username=f),type:"text",class:Kt(["form-control",{"is-invalid":N(s).errors?.username}]),placeholder:"Choose a username",required:""},null,2),[[Nt,n.value.username]]),N(s).errors?.username?(L(),B("div",d1,U(N(s).errors.username[0]),1)):bt("",!0)]),g("div",f1,[u[10]||(u[10]=g("label",{for:"email",class:"form-label"},"Email",-1)),Ot(g("input",{id:"email","onUpdate:modelValue":u[2]||(u[2]=f=>n.value.email=f),type:"email",class:Kt(["form-control",{"is-invalid":N(s).errors?.email}]),placeholder:"name@example.com",required:""},null,2),[[Nt,n.value.email]]),N(s).errors?.email?(L(),B("div",h1,U(N(s).errors.email[0]),1)):bt("",!0)]),g("div",p1,[u[11]||(u[11]=g("label",{for:"dob",class:"form-label"},"Date of Birth (Optional)",-1)),Ot(g("input",{id:"dob","onUpdate:modelValue":u[3]||(u[3]=f=>n.value.date_of_birth=f),type:"date",class:Kt(["form-control",{"is-invalid":N(s).errors?.date_of_birth}])},null,2),[[Nt,n.value.date_of_birth]]),N(s).errors?.date_of_birth?(L(),B("div",g1,U(N(s).errors.date_of_birth[0]),1)):bt("",!0)]),g("div",m1,[u[12]||(u[12]=g("label",{for:"password1",class:"form-label"},"Password",-1)),Ot(g("input",{id:"password1","onUpdate:modelValue":u[4]||(u[4]=f=>n.value.password1=f),type:"password",class:Kt(["form-control",{"is-invalid":N(s).errors?.password1}]),placeholder:"Enter password",required:""},null,2),[[Nt,n.value.password1]]),N(s).errors?.password1?(L(),B("div",_1,U(N(s).errors.password1[0]),1)):bt("",!0),u[13]||(u[13]=g("small",{class:"text-muted"}," Password must be at least 8 characters and not entirely numeric. ",-1))]),g("div",b1,[u[14]||(u[14]=g("label",{for:"password2",class:"form-label"},"Confirm Password",-1)),Ot(g("input",{id:"password2","onUpdate:modelValue":u[5]||(u[5]=f=>n.value.password2=f),type:"password",class:Kt(["form-control",{"is-invalid":N(s).errors?.password2}]),placeholder:"Confirm password",required:""},null,2),[[Nt,n.value.password2]]),N(s).errors?.password2?(L(),B("div",v1,U(N(s).errors.password2[0]),1)):bt("",!0)]),g("button",{type:"submit",class:"btn btn-primary w-100",disabled:N(s).loading},U(N(s).loading?"Creating account...":"Sign Up"),9,y1)],32),g("p",x1,[u[16]||(u[16]=rt(" Already have an account? ",-1)),dt(d,{to:"/login",class:"text-decoration-none"},{default:Ht(()=>[...u[15]||(u[15]=[rt("Login",-1)])]),_:1})])])])}}}),S1=Ye(E1,[["__scopeId","data-v-d7e19a82"]]),C1={class:"container mt-4"},A1={class:"row justify-content-center"},T1={class:"col-md-8"},O1={class:"card shadow-sm"},k1={class:"card-body"},D1={class:"d-flex justify-content-between align-items-center mb-4"},M1={key:0,class:"alert alert-success",role:"alert"},P1={key:1},I1={class:"text-center mb-4"},L1=["src"],R1={class:"profile-info"},$1={class:"mb-3"},N1={class:"fs-5"},F1={class:"mb-3"},B1={class:"fs-5"},V1={class:"mb-3"},H1={class:"fs-5"},j1={class:"mb-3"},W1={class:"fs-5"},z1={key:2},U1={key:0,class:"alert alert-danger",role:"alert"},K1={class:"text-center mb-4"},Y1=["src"],q1={class:"mb-3"},G1={key:0,class:"invalid-feedback"},X1={class:"mb-3"},Q1={key:0,class:"invalid-feedback"},J1={class:"mb-3"},Z1=["value"],tw={class:"mb-3"},ew=["value"],sw={class:"d-flex gap-2"},nw=["disabled"],iw=["disabled"],dd="https://upload.wikimedia.org/wikipedia/commons/7/7c/Profile_avatar_placeholder_large.png",ow=zt({__name:"ProfilePage",setup(e){const t=Ae(),s=ft(!1),n=ug(),i=ft(null),o=ft({email:t.user?.email||"",date_of_birth:t.user?.date_of_birth||void 0,currency_preference:t.user?.currency_preference||"USD"}),r=m=>{const p=fo[m];return`${p.symbol} ${p.name}`},a=ft(null),l=ft(null),c=gt(()=>a.value?URL.createObjectURL(a.value):t.user?.profile_image||dd),u=()=>{s.value=!0,l.value=null,t.error=null,t.errors=null,o.value={email:t.user?.email||"",date_of_birth:t.user?.date_of_birth||void 0,currency_preference:t.user?.currency_preference||"USD"},a.value=null},d=m=>{const p=m.target;p.files&&p.files[0]&&(a.value=p.files[0])},f=async()=>{l.value=null;const m={email:o.value.email,date_of_birth:o.value.date_of_birth,currency_preference:o.value.currency_preference};a.value&&(m.profile_image=a.value),await t.updateProfile(m)&&(s.value=!1,a.value=null,l.value="Profile updated successfully!",setTimeout(()=>{l.value=null},3e3))},h=()=>{s.value=!1,a.value=null,l.value=null,t.error=null,t.errors=null};return(m,p)=>(L(),B("div",C1,[g("div",A1,[g("div",T1,[g("div",O1,[g("div",k1,[g("div",D1,[p[5]||(p[5]=g("h2",{class:"mb-0"},"My Profile",-1)),s.value?bt("",!0):(L(),B("button",{key:0,onClick:u,class:"btn btn-primary"},[...p[4]||(p[4]=[g("i",{class:"bi bi-pencil me-1"},null,-1),rt(" Edit Profile ",-1)])]))]),l.value?(L(),B("div",M1,U(l.value),1)):bt("",!0),!s.value&&N(t).user?(L(),B("div",P1,[g("div",I1,[g("img",{src:N(t).user.profile_image||dd,class:"profile-image-large",alt:"Profile"},null,8,L1)]),g("div",R1,[g("div",$1,[p[6]||(p[6]=g("label",{class:"form-label fw-bold text-muted"},"Username",-1)),g("p",N1,U(N(t).user.username),1)]),g("div",F1,[p[7]||(p[7]=g("label",{class:"form-label fw-bold text-muted"},"Email",-1)),g("p",B1,U(N(t).user.email),1)]),g("div",V1,[p[8]||(p[8]=g("label",{class:"form-label fw-bold text-muted"},"Date of Birth",-1)),g("p",H1,U(N(t).user.date_of_birth||"Not provided"),1)]),g("div",j1,[p[9]||(p[9]=g("label",{class:"form-label fw-bold text-muted"},"Currency",-1)),g("p",W1,U(r(N(t).user.currency_preference)),1)])])])):(L(),B("div",z1,[N(t).error?(L(),B("div",U1,U(N(t).error),1)):bt("",!0),g("form",{onSubmit:os(f,["prevent"])},[g("div",K1,[g("div",{class:"profile-upload-container",onClick:p[0]||(p[0]=_=>i.value?.click())},[g("img",{src:c.value,class:"profile-image-large",alt:"Profile"},null,8,Y1),p[10]||(p[10]=g("div",{class:"upload-overlay"},[g("i",{class:"bi bi-camera"}),g("br"),rt(" CHANGE ")],-1))]),g("input",{ref_key:"fileInput",ref:i,type:"file",accept:"image/jpeg,image/jpg,image/png",onChange:d,style:{display:"none"}},null,544),p[11]||(p[11]=g("br",null,null,-1)),p[12]||(p[12]=g("small",{class:"text-muted"},"Click to change profile image",-1))]),g("div",q1,[p[13]||(p[13]=g("label",{for:"email",class:"form-label"},"Email",-1)),Ot(g("input",{id:"email","onUpdate:modelValue":p[1]||(p[1]=_=>o.value.email=_),type:"email",class:Kt(["form-control",{"is-invalid":N(t).errors?.email}]),required:""},null,2),[[Nt,o.value.email]]),N(t).errors?.email?(L(),B("div",G1,U(N(t).errors.email.join(", ")),1)):bt("",!0)]),g("div",X1,[p[14]||(p[14]=g("label",{for:"dob",class:"form-label"},"Date of Birth",-1)),Ot(g("input",{id:"dob","onUpdate:modelValue":p[2]||(p[2]=_=>o.value.date_of_birth=_),type:"date",class:Kt(["form-control",{"is-invalid":N(t).errors?.date_of_birth}])},null,2),[[Nt,o.value.date_of_birth]]),N(t).errors?.date_of_birth?(L(),B("div",Q1,U(N(t).errors.date_of_birth.join(", ")),1)):bt("",!0)]),g("div",J1,[p[15]||(p[15]=g("label",{for:"currency",class:"form-label"},"Display Currency",-1)),Ot(g("select",{id:"currency","onUpdate:modelValue":p[3]||(p[3]=_=>o.value.currency_preference=_),class:"form-select"},[(L(!0),B(It,null,We(N(n),_=>(L(),B("option",{key:_.code,value:_.code},U(_.symbol)+" - "+U(_.name),9,Z1))),128))],512),[[jp,o.value.currency_preference]]),p[16]||(p[16]=g("small",{class:"text-muted"},"Prices will be displayed in this currency",-1))]),g("div",tw,[p[17]||(p[17]=g("label",{class:"form-label"},"Username",-1)),g("input",{type:"text",class:"form-control",value:N(t).user?.username,disabled:""},null,8,ew),p[18]||(p[18]=g("small",{class:"text-muted"},"Username cannot be changed",-1))]),g("div",sw,[g("button",{type:"submit",class:"btn btn-primary",disabled:N(t).loading},[p[19]||(p[19]=g("i",{class:"bi bi-check-circle me-1"},null,-1)),rt(" "+U(N(t).loading?"Saving...":"Save Changes"),1)],8,nw),g("button",{type:"button",onClick:h,class:"btn btn-secondary",disabled:N(t).loading},[...p[20]||(p[20]=[g("i",{class:"bi bi-x-circle me-1"},null,-1),rt(" Cancel ",-1)])],8,iw)])],32)]))])])])])]))}}),rw=Ye(ow,[["__scopeId","data-v-39343ee6"]]),aw={},lw={class:"card h-100"};function cw(e,t){return L(),B("div",lw,[...t[0]||(t[0]=[Ip('<div class="skeleton" style="height:200px;" data-v-d4445bd6></div><div class="card-body" data-v-d4445bd6><div class="skeleton mb-2" style="height:24px;width:70%;" data-v-d4445bd6></div><div class="skeleton mb-2" style="height:16px;width:100%;" data-v-d4445bd6></div><div class="skeleton mb-2" style="height:16px;width:80%;" data-v-d4445bd6></div><div class="mt-3" data-v-d4445bd6><div class="d-flex justify-content-between mb-2" data-v-d4445bd6><div class="skeleton" style="height:20px;width:80px;" data-v-d4445bd6></div><div class="skeleton" style="height:20px;width:50px;" data-v-d4445bd6></div></div><div class="skeleton" style="height:16px;width:120px;" data-v-d4445bd6></div></div></div>',2)])])}const uw=Ye(aw,[["render",cw],["__scopeId","data-v-d4445bd6"]]),dw={class:"container-fluid mt-4"},fw={class:"row"},hw={class:"col-lg-3 col-md-4 mb-4"},pw={class:"card filter-card sticky-top"},gw={class:"card-header d-flex justify-content-between align-items-center"},mw={class:"card-body"},_w={class:"mb-4"},bw={class:"mb-4"},vw={class:"row g-2"},yw={class:"col-6"},xw={class:"col-6"},ww={key:0,class:"text-muted"},Ew={class:"mb-4"},Sw={class:"form-check"},Cw={class:"form-check"},Aw={class:"form-check"},Tw={key:0,class:"alert alert-info py-2 mb-0"},Ow={class:"col-lg-9 col-md-8"},kw={class:"d-flex justify-content-between align-items-center mb-3"},Dw={class:"text-muted"},Mw={class:"search-section mb-4"},Pw={class:"input-group input-group-lg"},Iw={key:0,class:"row g-4"},Lw={key:1,class:"alert alert-danger"},Rw={key:2,class:"text-center py-5"},$w={key:3,class:"row g-4"},Nw=zt({__name:"ItemsListPage",setup(e){const t=Do(),s=on(),n=ft(""),i=ft("newest"),o=ft(null),r=ft(null),a=ft(!0),l=ft(!1),c=ft(!1),u=gt(()=>{let y=[...t.items];switch(y=y.filter(v=>{const E=parseFloat(v.current_price);if(o.value!==null&&E<o.value||r.value!==null&&E>r.value||!a.value&&!v.is_ended)return!1;if(l.value){const S=(new Date(v.end_date).getTime()-Date.now())/36e5;if(S>=24||S<0)return!1}return!(c.value&&v.bid_count>0)}),i.value){case"newest":y.sort((v,E)=>new Date(E.created_at).getTime()-new Date(v.created_at).getTime());break;case"ending-soon":y.sort((v,E)=>new Date(v.end_date).getTime()-new Date(E.end_date).getTime());break;case"price-low":y.sort((v,E)=>parseFloat(v.current_price)-parseFloat(E.current_price));break;case"price-high":y.sort((v,E)=>parseFloat(E.current_price)-parseFloat(v.current_price));break;case"most-bids":y.sort((v,E)=>E.bid_count-v.bid_count);break}return y}),d=gt(()=>o.value!==null||r.value!==null||!a.value||l.value||c.value||i.value!=="newest"),f=gt(()=>{let y=0;return(o.value!==null||r.value!==null)&&y++,a.value||y++,l.value&&y++,c.value&&y++,i.value!=="newest"&&y++,y}),h=()=>{o.value=null,r.value=null,a.value=!0,l.value=!1,c.value=!1,i.value="newest",n.value="",t.fetchItems()},m=()=>{n.value="",t.fetchItems()};let p;const _=()=>{clearTimeout(p),p=setTimeout(()=>{t.fetchItems(n.value)},300)},b=y=>{s.push(`/items/${y}`)};return fs(()=>{t.fetchItems()}),(y,v)=>{const E=be("router-link");return L(),B("div",dw,[g("div",fw,[g("div",hw,[g("div",pw,[g("div",gw,[v[7]||(v[7]=g("h5",{class:"mb-0"},[g("i",{class:"bi bi-funnel me-2"}),rt("Filters")],-1)),d.value?(L(),B("button",{key:0,class:"btn btn-sm btn-link text-decoration-none",onClick:h}," Reset ")):bt("",!0)]),g("div",mw,[g("div",_w,[v[9]||(v[9]=g("label",{class:"form-label fw-bold"},[g("i",{class:"bi bi-sort-down me-2"}),rt("Sort By ")],-1)),Ot(g("select",{"onUpdate:modelValue":v[0]||(v[0]=S=>i.value=S),class:"form-select form-select-sm"},[...v[8]||(v[8]=[Ip('<option value="newest" data-v-1d2f013b>Newest First</option><option value="ending-soon" data-v-1d2f013b>Ending Soon</option><option value="price-low" data-v-1d2f013b>Price: Low to High</option><option value="price-high" data-v-1d2f013b>Price: High to Low</option><option value="most-bids" data-v-1d2f013b>Most Bids</option>',5)])],512),[[jp,i.value]])]),g("div",bw,[v[10]||(v[10]=g("label",{class:"form-label fw-bold"},[g("i",{class:"bi bi-currency-dollar me-2"}),rt("Price Range ")],-1)),g("div",vw,[g("div",yw,[Ot(g("input",{"onUpdate:modelValue":v[1]||(v[1]=S=>o.value=S),type:"number",class:"form-control form-control-sm",placeholder:"Min",min:"0",step:"1"},null,512),[[Nt,o.value,void 0,{number:!0}]])]),g("div",xw,[Ot(g("input",{"onUpdate:modelValue":v[2]||(v[2]=S=>r.value=S),type:"number",class:"form-control form-control-sm",placeholder:"Max",min:"0",step:"1"},null,512),[[Nt,r.value,void 0,{number:!0}]])])]),o.value||r.value?(L(),B("small",ww,U(o.value||"0")+" - "+U(r.value||"∞"),1)):bt("",!0)]),g("div",Ew,[v[14]||(v[14]=g("label",{class:"form-label fw-bold"},[g("i",{class:"bi bi-clock-history me-2"}),rt("Status ")],-1)),g("div",Sw,[Ot(g("input",{"onUpdate:modelValue":v[3]||(v[3]=S=>a.value=S),class:"form-check-input",type:"checkbox",id:"showActive"},null,512),[[Na,a.value]]),v[11]||(v[11]=g("label",{class:"form-check-label",for:"showActive"}," Active Auctions ",-1))]),g("div",Cw,[Ot(g("input",{"onUpdate:modelValue":v[4]||(v[4]=S=>l.value=S),class:"form-check-input",type:"checkbox",id:"showEndingSoon"},null,512),[[Na,l.value]]),v[12]||(v[12]=g("label",{class:"form-check-label",for:"showEndingSoon"}," Ending Soon (<24h) ",-1))]),g("div",Aw,[Ot(g("input",{"onUpdate:modelValue":v[5]||(v[5]=S=>c.value=S),class:"form-check-input",type:"checkbox",id:"showNoBids"},null,512),[[Na,c.value]]),v[13]||(v[13]=g("label",{class:"form-check-label",for:"showNoBids"}," No Bids Yet ",-1))])]),d.value?(L(),B("div",Tw,[g("small",null,[v[15]||(v[15]=g("i",{class:"bi bi-info-circle me-1"},null,-1)),g("strong",null,U(f.value),1),v[16]||(v[16]=rt(" filter(s) active ",-1))])])):bt("",!0)])])]),g("div",Ow,[g("div",kw,[g("div",null,[v[18]||(v[18]=g("h2",{class:"mb-1"},"Auction Items",-1)),g("small",Dw,[v[17]||(v[17]=g("i",{class:"bi bi-grid-3x3-gap me-1"},null,-1)),rt(" "+U(u.value.length)+" item(s) found ",1)])]),dt(E,{to:"/items/create",class:"btn btn-primary"},{default:Ht(()=>[...v[19]||(v[19]=[g("i",{class:"bi bi-plus-circle me-2"},null,-1),rt("Create Listing ",-1)])]),_:1})]),g("div",Mw,[g("div",Pw,[v[21]||(v[21]=g("span",{class:"input-group-text bg-white"},[g("i",{class:"bi bi-search"})],-1)),Ot(g("input",{"onUpdate:modelValue":v[6]||(v[6]=S=>n.value=S),onInput:_,type:"text",class:"form-control",placeholder:"Search items by title or description..."},null,544),[[Nt,n.value]]),n.value?(L(),B("button",{key:0,class:"btn btn-outline-secondary",type:"button",onClick:m},[...v[20]||(v[20]=[g("i",{class:"bi bi-x-lg"},null,-1)])])):bt("",!0)])]),N(t).loading?(L(),B("div",Iw,[(L(),B(It,null,We(6,S=>g("div",{key:S,class:"col-lg-4 col-md-6"},[dt(uw)])),64))])):N(t).error?(L(),B("div",Lw,[v[22]||(v[22]=g("i",{class:"bi bi-exclamation-triangle me-2"},null,-1)),rt(U(N(t).error),1)])):u.value.length===0?(L(),B("div",Rw,[v[23]||(v[23]=g("i",{class:"bi bi-inbox fs-1 text-muted d-block mb-3"},null,-1)),v[24]||(v[24]=g("h4",{class:"text-muted"},"No items match your filters",-1)),v[25]||(v[25]=g("p",{class:"text-muted"},"Try adjusting your search or filters.",-1)),g("button",{class:"btn btn-outline-primary",onClick:h}," Clear All Filters ")])):(L(),B("div",$w,[(L(!0),B(It,null,We(u.value,S=>(L(),B("div",{key:S.id,class:"col-lg-4 col-md-6"},[dt(mr,{item:S,onClick:O=>b(S.id)},null,8,["item","onClick"])]))),128))]))])])])}}}),Fw=Ye(Nw,[["__scopeId","data-v-1d2f013b"]]);var Bw=Object.defineProperty,fd=Object.getOwnPropertySymbols,Vw=Object.prototype.hasOwnProperty,Hw=Object.prototype.propertyIsEnumerable,hd=(e,t,s)=>t in e?Bw(e,t,{enumerable:!0,configurable:!0,writable:!0,value:s}):e[t]=s,dg=(e,t)=>{for(var s in t||(t={}))Vw.call(t,s)&&hd(e,s,t[s]);if(fd)for(var s of fd(t))Hw.call(t,s)&&hd(e,s,t[s]);return e},ua=e=>typeof e=="function",da=e=>typeof e=="string",fg=e=>da(e)&&e.trim().length>0,jw=e=>typeof e=="number",wn=e=>typeof e>"u",ho=e=>typeof e=="object"&&e!==null,Ww=e=>rs(e,"tag")&&fg(e.tag),hg=e=>window.TouchEvent&&e instanceof TouchEvent,pg=e=>rs(e,"component")&&gg(e.component),zw=e=>ua(e)||ho(e),gg=e=>!wn(e)&&(da(e)||zw(e)||pg(e)),pd=e=>ho(e)&&["height","width","right","left","top","bottom"].every(t=>jw(e[t])),rs=(e,t)=>(ho(e)||ua(e))&&t in e,Uw=(e=>()=>e++)(0);function ja(e){return hg(e)?e.targetTouches[0].clientX:e.clientX}function gd(e){return hg(e)?e.targetTouches[0].clientY:e.clientY}var Kw=e=>{wn(e.remove)?e.parentNode&&e.parentNode.removeChild(e):e.remove()},Mo=e=>pg(e)?Mo(e.component):Ww(e)?zt({render(){return e}}):typeof e=="string"?e:_t(N(e)),Yw=e=>{if(typeof e=="string")return e;const t=rs(e,"props")&&ho(e.props)?e.props:{},s=rs(e,"listeners")&&ho(e.listeners)?e.listeners:{};return{component:Mo(e),props:t,listeners:s}},qw=()=>typeof window<"u",wc=class{constructor(){this.allHandlers={}}getHandlers(e){return this.allHandlers[e]||[]}on(e,t){const s=this.getHandlers(e);s.push(t),this.allHandlers[e]=s}off(e,t){const s=this.getHandlers(e);s.splice(s.indexOf(t)>>>0,1)}emit(e,t){this.getHandlers(e).forEach(n=>n(t))}},Gw=e=>["on","off","emit"].every(t=>rs(e,t)&&ua(e[t])),we;(function(e){e.SUCCESS="success",e.ERROR="error",e.WARNING="warning",e.INFO="info",e.DEFAULT="default"})(we||(we={}));var Rr;(function(e){e.TOP_LEFT="top-left",e.TOP_CENTER="top-center",e.TOP_RIGHT="top-right",e.BOTTOM_LEFT="bottom-left",e.BOTTOM_CENTER="bottom-center",e.BOTTOM_RIGHT="bottom-right"})(Rr||(Rr={}));var Ee;(function(e){e.ADD="add",e.DISMISS="dismiss",e.UPDATE="update",e.CLEAR="clear",e.UPDATE_DEFAULTS="update_defaults"})(Ee||(Ee={}));var Ve="Vue-Toastification",Be={type:{type:String,default:we.DEFAULT},classNames:{type:[String,Array],default:()=>[]},trueBoolean:{type:Boolean,default:!0}},mg={type:Be.type,customIcon:{type:[String,Boolean,Object,Function],default:!0}},_r={component:{type:[String,Object,Function,Boolean],default:"button"},classNames:Be.classNames,showOnHover:{type:Boolean,default:!1},ariaLabel:{type:String,default:"close"}},Rl={timeout:{type:[Number,Boolean],default:5e3},hideProgressBar:{type:Boolean,default:!1},isRunning:{type:Boolean,default:!1}},_g={transition:{type:[Object,String],default:`${Ve}__bounce`}},Xw={position:{type:String,default:Rr.TOP_RIGHT},draggable:Be.trueBoolean,draggablePercent:{type:Number,default:.6},pauseOnFocusLoss:Be.trueBoolean,pauseOnHover:Be.trueBoolean,closeOnClick:Be.trueBoolean,timeout:Rl.timeout,hideProgressBar:Rl.hideProgressBar,toastClassName:Be.classNames,bodyClassName:Be.classNames,icon:mg.customIcon,closeButton:_r.component,closeButtonClassName:_r.classNames,showCloseButtonOnHover:_r.showOnHover,accessibility:{type:Object,default:()=>({toastRole:"alert",closeButtonLabel:"close"})},rtl:{type:Boolean,default:!1},eventBus:{type:Object,required:!1,default:()=>new wc}},Qw={id:{type:[String,Number],required:!0,default:0},type:Be.type,content:{type:[String,Object,Function],required:!0,default:""},onClick:{type:Function,default:void 0},onClose:{type:Function,default:void 0}},Jw={container:{type:[Object,Function],default:()=>document.body},newestOnTop:Be.trueBoolean,maxToasts:{type:Number,default:20},transition:_g.transition,toastDefaults:Object,filterBeforeCreate:{type:Function,default:e=>e},filterToasts:{type:Function,default:e=>e},containerClassName:Be.classNames,onMounted:Function,shareAppContext:[Boolean,Object]},As={CORE_TOAST:Xw,TOAST:Qw,CONTAINER:Jw,PROGRESS_BAR:Rl,ICON:mg,TRANSITION:_g,CLOSE_BUTTON:_r},bg=zt({name:"VtProgressBar",props:As.PROGRESS_BAR,data(){return{hasClass:!0}},computed:{style(){return{animationDuration:`${this.timeout}ms`,animationPlayState:this.isRunning?"running":"paused",opacity:this.hideProgressBar?0:1}},cpClass(){return this.hasClass?`${Ve}__progress-bar`:""}},watch:{timeout(){this.hasClass=!1,this.$nextTick(()=>this.hasClass=!0)}},mounted(){this.$el.addEventListener("animationend",this.animationEnded)},beforeUnmount(){this.$el.removeEventListener("animationend",this.animationEnded)},methods:{animationEnded(){this.$emit("close-toast")}}});function Zw(e,t){return L(),B("div",{style:Eo(e.style),class:Kt(e.cpClass)},null,6)}bg.render=Zw;var tE=bg,vg=zt({name:"VtCloseButton",props:As.CLOSE_BUTTON,computed:{buttonComponent(){return this.component!==!1?Mo(this.component):"button"},classes(){const e=[`${Ve}__close-button`];return this.showOnHover&&e.push("show-on-hover"),e.concat(this.classNames)}}}),eE=rt(" × ");function sE(e,t){return L(),Pe(gc(e.buttonComponent),ia({"aria-label":e.ariaLabel,class:e.classes},e.$attrs),{default:Ht(()=>[eE]),_:1},16,["aria-label","class"])}vg.render=sE;var nE=vg,yg={},iE={"aria-hidden":"true",focusable:"false","data-prefix":"fas","data-icon":"check-circle",class:"svg-inline--fa fa-check-circle fa-w-16",role:"img",xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 512 512"},oE=g("path",{fill:"currentColor",d:"M504 256c0 136.967-111.033 248-248 248S8 392.967 8 256 119.033 8 256 8s248 111.033 248 248zM227.314 387.314l184-184c6.248-6.248 6.248-16.379 0-22.627l-22.627-22.627c-6.248-6.249-16.379-6.249-22.628 0L216 308.118l-70.059-70.059c-6.248-6.248-16.379-6.248-22.628 0l-22.627 22.627c-6.248 6.248-6.248 16.379 0 22.627l104 104c6.249 6.249 16.379 6.249 22.628.001z"},null,-1),rE=[oE];function aE(e,t){return L(),B("svg",iE,rE)}yg.render=aE;var lE=yg,xg={},cE={"aria-hidden":"true",focusable:"false","data-prefix":"fas","data-icon":"info-circle",class:"svg-inline--fa fa-info-circle fa-w-16",role:"img",xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 512 512"},uE=g("path",{fill:"currentColor",d:"M256 8C119.043 8 8 119.083 8 256c0 136.997 111.043 248 248 248s248-111.003 248-248C504 119.083 392.957 8 256 8zm0 110c23.196 0 42 18.804 42 42s-18.804 42-42 42-42-18.804-42-42 18.804-42 42-42zm56 254c0 6.627-5.373 12-12 12h-88c-6.627 0-12-5.373-12-12v-24c0-6.627 5.373-12 12-12h12v-64h-12c-6.627 0-12-5.373-12-12v-24c0-6.627 5.373-12 12-12h64c6.627 0 12 5.373 12 12v100h12c6.627 0 12 5.373 12 12v24z"},null,-1),dE=[uE];function fE(e,t){return L(),B("svg",cE,dE)}xg.render=fE;var md=xg,wg={},hE={"aria-hidden":"true",focusable:"false","data-prefix":"fas","data-icon":"exclamation-circle",class:"svg-inline--fa fa-exclamation-circle fa-w-16",role:"img",xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 512 512"},pE=g("path",{fill:"currentColor",d:"M504 256c0 136.997-111.043 248-248 248S8 392.997 8 256C8 119.083 119.043 8 256 8s248 111.083 248 248zm-248 50c-25.405 0-46 20.595-46 46s20.595 46 46 46 46-20.595 46-46-20.595-46-46-46zm-43.673-165.346l7.418 136c.347 6.364 5.609 11.346 11.982 11.346h48.546c6.373 0 11.635-4.982 11.982-11.346l7.418-136c.375-6.874-5.098-12.654-11.982-12.654h-63.383c-6.884 0-12.356 5.78-11.981 12.654z"},null,-1),gE=[pE];function mE(e,t){return L(),B("svg",hE,gE)}wg.render=mE;var _E=wg,Eg={},bE={"aria-hidden":"true",focusable:"false","data-prefix":"fas","data-icon":"exclamation-triangle",class:"svg-inline--fa fa-exclamation-triangle fa-w-18",role:"img",xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 576 512"},vE=g("path",{fill:"currentColor",d:"M569.517 440.013C587.975 472.007 564.806 512 527.94 512H48.054c-36.937 0-59.999-40.055-41.577-71.987L246.423 23.985c18.467-32.009 64.72-31.951 83.154 0l239.94 416.028zM288 354c-25.405 0-46 20.595-46 46s20.595 46 46 46 46-20.595 46-46-20.595-46-46-46zm-43.673-165.346l7.418 136c.347 6.364 5.609 11.346 11.982 11.346h48.546c6.373 0 11.635-4.982 11.982-11.346l7.418-136c.375-6.874-5.098-12.654-11.982-12.654h-63.383c-6.884 0-12.356 5.78-11.981 12.654z"},null,-1),yE=[vE];function xE(e,t){return L(),B("svg",bE,yE)}Eg.render=xE;var wE=Eg,Sg=zt({name:"VtIcon",props:As.ICON,computed:{customIconChildren(){return rs(this.customIcon,"iconChildren")?this.trimValue(this.customIcon.iconChildren):""},customIconClass(){return da(this.customIcon)?this.trimValue(this.customIcon):rs(this.customIcon,"iconClass")?this.trimValue(this.customIcon.iconClass):""},customIconTag(){return rs(this.customIcon,"iconTag")?this.trimValue(this.customIcon.iconTag,"i"):"i"},hasCustomIcon(){return this.customIconClass.length>0},component(){return this.hasCustomIcon?this.customIconTag:gg(this.customIcon)?Mo(this.customIcon):this.iconTypeComponent},iconTypeComponent(){return{[we.DEFAULT]:md,[we.INFO]:md,[we.SUCCESS]:lE,[we.ERROR]:wE,[we.WARNING]:_E}[this.type]},iconClasses(){const e=[`${Ve}__icon`];return this.hasCustomIcon?e.concat(this.customIconClass):e}},methods:{trimValue(e,t=""){return fg(e)?e.trim():t}}});function EE(e,t){return L(),Pe(gc(e.component),{class:Kt(e.iconClasses)},{default:Ht(()=>[rt(U(e.customIconChildren),1)]),_:1},8,["class"])}Sg.render=EE;var SE=Sg,Cg=zt({name:"VtToast",components:{ProgressBar:tE,CloseButton:nE,Icon:SE},inheritAttrs:!1,props:Object.assign({},As.CORE_TOAST,As.TOAST),data(){return{isRunning:!0,disableTransitions:!1,beingDragged:!1,dragStart:0,dragPos:{x:0,y:0},dragRect:{}}},computed:{classes(){const e=[`${Ve}__toast`,`${Ve}__toast--${this.type}`,`${this.position}`].concat(this.toastClassName);return this.disableTransitions&&e.push("disable-transition"),this.rtl&&e.push(`${Ve}__toast--rtl`),e},bodyClasses(){return[`${Ve}__toast-${da(this.content)?"body":"component-body"}`].concat(this.bodyClassName)},draggableStyle(){return this.dragStart===this.dragPos.x?{}:this.beingDragged?{transform:`translateX(${this.dragDelta}px)`,opacity:1-Math.abs(this.dragDelta/this.removalDistance)}:{transition:"transform 0.2s, opacity 0.2s",transform:"translateX(0)",opacity:1}},dragDelta(){return this.beingDragged?this.dragPos.x-this.dragStart:0},removalDistance(){return pd(this.dragRect)?(this.dragRect.right-this.dragRect.left)*this.draggablePercent:0}},mounted(){this.draggable&&this.draggableSetup(),this.pauseOnFocusLoss&&this.focusSetup()},beforeUnmount(){this.draggable&&this.draggableCleanup(),this.pauseOnFocusLoss&&this.focusCleanup()},methods:{hasProp:rs,getVueComponentFromObj:Mo,closeToast(){this.eventBus.emit(Ee.DISMISS,this.id)},clickHandler(){this.onClick&&this.onClick(this.closeToast),this.closeOnClick&&(!this.beingDragged||this.dragStart===this.dragPos.x)&&this.closeToast()},timeoutHandler(){this.closeToast()},hoverPause(){this.pauseOnHover&&(this.isRunning=!1)},hoverPlay(){this.pauseOnHover&&(this.isRunning=!0)},focusPause(){this.isRunning=!1},focusPlay(){this.isRunning=!0},focusSetup(){addEventListener("blur",this.focusPause),addEventListener("focus",this.focusPlay)},focusCleanup(){removeEventListener("blur",this.focusPause),removeEventListener("focus",this.focusPlay)},draggableSetup(){const e=this.$el;e.addEventListener("touchstart",this.onDragStart,{passive:!0}),e.addEventListener("mousedown",this.onDragStart),addEventListener("touchmove",this.onDragMove,{passive:!1}),addEventListener("mousemove",this.onDragMove),addEventListener("touchend",this.onDragEnd),addEventListener("mouseup",this.onDragEnd)},draggableCleanup(){const e=this.$el;e.removeEventListener("touchstart",this.onDragStart),e.removeEventListener("mousedown",this.onDragStart),removeEventListener("touchmove",this.onDragMove),removeEventListener("mousemove",this.onDragMove),removeEventListener("touchend",this.onDragEnd),removeEventListener("mouseup",this.onDragEnd)},onDragStart(e){this.beingDragged=!0,this.dragPos={x:ja(e),y:gd(e)},this.dragStart=ja(e),this.dragRect=this.$el.getBoundingClientRect()},onDragMove(e){this.beingDragged&&(e.preventDefault(),this.isRunning&&(this.isRunning=!1),this.dragPos={x:ja(e),y:gd(e)})},onDragEnd(){this.beingDragged&&(Math.abs(this.dragDelta)>=this.removalDistance?(this.disableTransitions=!0,this.$nextTick(()=>this.closeToast())):setTimeout(()=>{this.beingDragged=!1,pd(this.dragRect)&&this.pauseOnHover&&this.dragRect.bottom>=this.dragPos.y&&this.dragPos.y>=this.dragRect.top&&this.dragRect.left<=this.dragPos.x&&this.dragPos.x<=this.dragRect.right?this.isRunning=!1:this.isRunning=!0}))}}}),CE=["role"];function AE(e,t){const s=be("Icon"),n=be("CloseButton"),i=be("ProgressBar");return L(),B("div",{class:Kt(e.classes),style:Eo(e.draggableStyle),onClick:t[0]||(t[0]=(...o)=>e.clickHandler&&e.clickHandler(...o)),onMouseenter:t[1]||(t[1]=(...o)=>e.hoverPause&&e.hoverPause(...o)),onMouseleave:t[2]||(t[2]=(...o)=>e.hoverPlay&&e.hoverPlay(...o))},[e.icon?(L(),Pe(s,{key:0,"custom-icon":e.icon,type:e.type},null,8,["custom-icon","type"])):bt("v-if",!0),g("div",{role:e.accessibility.toastRole||"alert",class:Kt(e.bodyClasses)},[typeof e.content=="string"?(L(),B(It,{key:0},[rt(U(e.content),1)],2112)):(L(),Pe(gc(e.getVueComponentFromObj(e.content)),ia({key:1,"toast-id":e.id},e.hasProp(e.content,"props")?e.content.props:{},$b(e.hasProp(e.content,"listeners")?e.content.listeners:{}),{onCloseToast:e.closeToast}),null,16,["toast-id","onCloseToast"]))],10,CE),e.closeButton?(L(),Pe(n,{key:1,component:e.closeButton,"class-names":e.closeButtonClassName,"show-on-hover":e.showCloseButtonOnHover,"aria-label":e.accessibility.closeButtonLabel,onClick:os(e.closeToast,["stop"])},null,8,["component","class-names","show-on-hover","aria-label","onClick"])):bt("v-if",!0),e.timeout?(L(),Pe(i,{key:2,"is-running":e.isRunning,"hide-progress-bar":e.hideProgressBar,timeout:e.timeout,onCloseToast:e.timeoutHandler},null,8,["is-running","hide-progress-bar","timeout","onCloseToast"])):bt("v-if",!0)],38)}Cg.render=AE;var TE=Cg,Ag=zt({name:"VtTransition",props:As.TRANSITION,emits:["leave"],methods:{hasProp:rs,leave(e){e instanceof HTMLElement&&(e.style.left=e.offsetLeft+"px",e.style.top=e.offsetTop+"px",e.style.width=getComputedStyle(e).width,e.style.position="absolute")}}});function OE(e,t){return L(),Pe(Xv,{tag:"div","enter-active-class":e.transition.enter?e.transition.enter:`${e.transition}-enter-active`,"move-class":e.transition.move?e.transition.move:`${e.transition}-move`,"leave-active-class":e.transition.leave?e.transition.leave:`${e.transition}-leave-active`,onLeave:e.leave},{default:Ht(()=>[Rb(e.$slots,"default")]),_:3},8,["enter-active-class","move-class","leave-active-class","onLeave"])}Ag.render=OE;var kE=Ag,Tg=zt({name:"VueToastification",devtools:{hide:!0},components:{Toast:TE,VtTransition:kE},props:Object.assign({},As.CORE_TOAST,As.CONTAINER,As.TRANSITION),data(){return{count:0,positions:Object.values(Rr),toasts:{},defaults:{}}},computed:{toastArray(){return Object.values(this.toasts)},filteredToasts(){return this.defaults.filterToasts(this.toastArray)}},beforeMount(){const e=this.eventBus;e.on(Ee.ADD,this.addToast),e.on(Ee.CLEAR,this.clearToasts),e.on(Ee.DISMISS,this.dismissToast),e.on(Ee.UPDATE,this.updateToast),e.on(Ee.UPDATE_DEFAULTS,this.updateDefaults),this.defaults=this.$props},mounted(){this.setup(this.container)},methods:{async setup(e){ua(e)&&(e=await e()),Kw(this.$el),e.appendChild(this.$el)},setToast(e){wn(e.id)||(this.toasts[e.id]=e)},addToast(e){e.content=Yw(e.content);const t=Object.assign({},this.defaults,e.type&&this.defaults.toastDefaults&&this.defaults.toastDefaults[e.type],e),s=this.defaults.filterBeforeCreate(t,this.toastArray);s&&this.setToast(s)},dismissToast(e){const t=this.toasts[e];!wn(t)&&!wn(t.onClose)&&t.onClose(),delete this.toasts[e]},clearToasts(){Object.keys(this.toasts).forEach(e=>{this.dismissToast(e)})},getPositionToasts(e){const t=this.filteredToasts.filter(s=>s.position===e).slice(0,this.defaults.maxToasts);return this.defaults.newestOnTop?t.reverse():t},updateDefaults(e){wn(e.container)||this.setup(e.container),this.defaults=Object.assign({},this.defaults,e)},updateToast({id:e,options:t,create:s}){this.toasts[e]?(t.timeout&&t.timeout===this.toasts[e].timeout&&t.timeout++,this.setToast(Object.assign({},this.toasts[e],t))):s&&this.addToast(Object.assign({},{id:e},t))},getClasses(e){return[`${Ve}__container`,e].concat(this.defaults.containerClassName)}}});function DE(e,t){const s=be("Toast"),n=be("VtTransition");return L(),B("div",null,[(L(!0),B(It,null,We(e.positions,i=>(L(),B("div",{key:i},[dt(n,{transition:e.defaults.transition,class:Kt(e.getClasses(i))},{default:Ht(()=>[(L(!0),B(It,null,We(e.getPositionToasts(i),o=>(L(),Pe(s,ia({key:o.id},o),null,16))),128))]),_:2},1032,["transition","class"])]))),128))])}Tg.render=DE;var ME=Tg,_d=(e={},t=!0)=>{const s=e.eventBus=e.eventBus||new wc;t&&To(()=>{const o=zp(ME,dg({},e)),r=o.mount(document.createElement("div")),a=e.onMounted;if(wn(a)||a(r,o),e.shareAppContext){const l=e.shareAppContext;l===!0?console.warn(`[${Ve}] App to share context with was not provided.`):(o._context.components=l._context.components,o._context.directives=l._context.directives,o._context.mixins=l._context.mixins,o._context.provides=l._context.provides,o.config.globalProperties=l.config.globalProperties)}});const n=(o,r)=>{const a=Object.assign({},{id:Uw(),type:we.DEFAULT},r,{content:o});return s.emit(Ee.ADD,a),a.id};n.clear=()=>s.emit(Ee.CLEAR,void 0),n.updateDefaults=o=>{s.emit(Ee.UPDATE_DEFAULTS,o)},n.dismiss=o=>{s.emit(Ee.DISMISS,o)};function i(o,{content:r,options:a},l=!1){const c=Object.assign({},a,{content:r});s.emit(Ee.UPDATE,{id:o,options:c,create:l})}return n.update=i,n.success=(o,r)=>n(o,Object.assign({},r,{type:we.SUCCESS})),n.info=(o,r)=>n(o,Object.assign({},r,{type:we.INFO})),n.error=(o,r)=>n(o,Object.assign({},r,{type:we.ERROR})),n.warning=(o,r)=>n(o,Object.assign({},r,{type:we.WARNING})),n},PE=()=>{const e=()=>console.warn(`[${Ve}] This plugin does not support SSR!`);return new Proxy(e,{get(){return e}})};function Og(e){return qw()?Gw(e)?_d({eventBus:e},!1):_d(e,!0):PE()}var kg=Symbol("VueToastification"),Dg=new wc,IE=(e,t)=>{t?.shareAppContext===!0&&(t.shareAppContext=e);const s=Og(dg({eventBus:Dg},t));e.provide(kg,s)},Ec=e=>{const t=oa()?Ce(kg,void 0):void 0;return t||Og(Dg)},LE=IE;const RE={class:"container mt-4"},$E={class:"row justify-content-center"},NE={class:"col-md-8"},FE={class:"card"},BE={class:"card-body"},VE={key:0,class:"alert alert-danger"},HE={class:"mb-3"},jE=["src"],WE={key:1,class:"upload-placeholder"},zE={class:"mb-3"},UE={class:"mb-3"},KE={class:"mb-3"},YE={class:"mb-3"},qE=["min"],GE={class:"d-flex gap-2"},XE=["disabled"],QE=zt({__name:"CreateItemPage",setup(e){const t=Do(),s=on(),n=Ec(),i=ft(null),o=ft(""),r=ft({title:"",description:"",starting_price:"",picture:null,end_date:""}),a=gt(()=>{const d=new Date;return d.setMinutes(d.getMinutes()+10),d.toISOString().slice(0,16)}),l=()=>{i.value?.click()},c=d=>{const h=d.target.files?.[0];if(h){r.value.picture=h;const m=new FileReader;m.onload=p=>{o.value=p.target?.result},m.readAsDataURL(h)}},u=async()=>{if(!r.value.picture){n.warning("Please select an image");return}const d=new Date(r.value.end_date).toISOString();await t.createItem({...r.value,end_date:d})?(n.success("Item created successfully!"),s.push("/items")):n.error(t.error||"Failed to create item")};return fs(()=>{const d=new Date;d.setDate(d.getDate()+7),r.value.end_date=d.toISOString().slice(0,16)}),(d,f)=>{const h=be("router-link");return L(),B("div",RE,[g("div",$E,[g("div",NE,[g("div",FE,[g("div",BE,[f[11]||(f[11]=g("h2",{class:"card-title mb-4"},"Create Auction Listing",-1)),N(t).error?(L(),B("div",VE,U(N(t).error),1)):bt("",!0),g("form",{onSubmit:os(u,["prevent"])},[g("div",HE,[f[5]||(f[5]=g("label",{class:"form-label"},"Item Picture *",-1)),g("div",{class:"image-upload-container",onClick:l,role:"button"},[o.value?(L(),B("img",{key:0,src:o.value,alt:"Preview",class:"preview-image"},null,8,jE)):(L(),B("div",WE,[...f[4]||(f[4]=[g("span",null,"Click to upload image",-1)])]))]),g("input",{ref_key:"fileInput",ref:i,type:"file",accept:"image/jpeg,image/jpg,image/png",onChange:c,hidden:""},null,544)]),g("div",zE,[f[6]||(f[6]=g("label",{for:"title",class:"form-label"},"Title *",-1)),Ot(g("input",{"onUpdate:modelValue":f[0]||(f[0]=m=>r.value.title=m),type:"text",class:"form-control",id:"title",required:""},null,512),[[Nt,r.value.title]])]),g("div",UE,[f[7]||(f[7]=g("label",{for:"description",class:"form-label"},"Description *",-1)),Ot(g("textarea",{"onUpdate:modelValue":f[1]||(f[1]=m=>r.value.description=m),class:"form-control",id:"description",rows:"4",required:""},null,512),[[Nt,r.value.description]])]),g("div",KE,[f[8]||(f[8]=g("label",{for:"price",class:"form-label"},"Starting Price ($) *",-1)),Ot(g("input",{"onUpdate:modelValue":f[2]||(f[2]=m=>r.value.starting_price=m),type:"number",step:"0.01",min:"0.01",class:"form-control",id:"price",required:""},null,512),[[Nt,r.value.starting_price]])]),g("div",YE,[f[9]||(f[9]=g("label",{for:"endDate",class:"form-label"},"End Date & Time *",-1)),Ot(g("input",{"onUpdate:modelValue":f[3]||(f[3]=m=>r.value.end_date=m),type:"datetime-local",class:"form-control",id:"endDate",min:a.value,required:""},null,8,qE),[[Nt,r.value.end_date]])]),g("div",GE,[g("button",{type:"submit",class:"btn btn-primary",disabled:N(t).loading||!r.value.picture},U(N(t).loading?"Creating...":"Create Listing"),9,XE),dt(h,{to:"/items",class:"btn btn-secondary"},{default:Ht(()=>[...f[10]||(f[10]=[rt(" Cancel ",-1)])]),_:1})])],32)])])])])])}}}),JE=Ye(QE,[["__scopeId","data-v-a4787e58"]]),ZE={class:"container mt-4"},tS={class:"row justify-content-center"},eS={class:"col-md-8"},sS={class:"card"},nS={class:"card-body"},iS={key:0,class:"text-center py-4"},oS={key:1,class:"alert alert-danger"},rS={class:"mb-3"},aS=["src"],lS={key:1,class:"upload-placeholder"},cS={class:"mb-3"},uS={class:"mb-3"},dS={class:"mb-3"},fS=["value"],hS={class:"mb-3"},pS=["min"],gS={class:"d-flex gap-2"},mS=["disabled"],_S=zt({__name:"EditItemPage",setup(e){const t=lg(),s=on(),n=Do(),i=Ec(),o=gt(()=>Number(t.params.id)),r=ft(null),a=ft(""),l=ft(!0),c=ft(null),u=ft(null),d=ft({title:"",description:"",end_date:"",picture:void 0}),f=gt(()=>{const _=new Date;return _.setMinutes(_.getMinutes()+10),_.toISOString().slice(0,16)}),h=()=>{r.value?.click()},m=_=>{const y=_.target.files?.[0];if(y){d.value.picture=y;const v=new FileReader;v.onload=E=>{a.value=E.target?.result},v.readAsDataURL(y)}},p=async()=>{const _=new Date(d.value.end_date).toISOString();await n.updateItem(o.value,{...d.value,end_date:_})?(i.success("Item updated successfully!"),s.push(`/items/${o.value}`)):i.error(n.error||"Failed to update item")};return fs(async()=>{if(l.value=!0,await n.fetchItemDetail(o.value)&&n.currentItem){u.value=n.currentItem,d.value.title=n.currentItem.title,d.value.description=n.currentItem.description;const b=new Date(n.currentItem.end_date);d.value.end_date=b.toISOString().slice(0,16),n.currentItem.picture&&(a.value=n.currentItem.picture)}else c.value=n.error||"Failed to load item";l.value=!1}),(_,b)=>{const y=be("router-link");return L(),B("div",ZE,[g("div",tS,[g("div",eS,[g("div",sS,[g("div",nS,[b[13]||(b[13]=g("h2",{class:"card-title mb-4"},"Edit Listing",-1)),l.value?(L(),B("div",iS,[...b[3]||(b[3]=[g("div",{class:"spinner-border",role:"status"},[g("span",{class:"visually-hidden"},"Loading...")],-1)])])):c.value?(L(),B("div",oS,U(c.value),1)):(L(),B("form",{key:2,onSubmit:os(p,["prevent"])},[g("div",rS,[b[5]||(b[5]=g("label",{class:"form-label"},"Item Picture",-1)),g("div",{class:"image-upload-container",onClick:h,role:"button"},[a.value?(L(),B("img",{key:0,src:a.value,alt:"Preview",class:"preview-image"},null,8,aS)):(L(),B("div",lS,[...b[4]||(b[4]=[g("span",null,"Click to upload new image",-1)])]))]),b[6]||(b[6]=g("small",{class:"text-muted"},"Leave unchanged to keep current image",-1)),g("input",{ref_key:"fileInput",ref:r,type:"file",accept:"image/jpeg,image/jpg,image/png",onChange:m,hidden:""},null,544)]),g("div",cS,[b[7]||(b[7]=g("label",{for:"title",class:"form-label"},"Title *",-1)),Ot(g("input",{"onUpdate:modelValue":b[0]||(b[0]=v=>d.value.title=v),type:"text",class:"form-control",id:"title",required:""},null,512),[[Nt,d.value.title]])]),g("div",uS,[b[8]||(b[8]=g("label",{for:"description",class:"form-label"},"Description *",-1)),Ot(g("textarea",{"onUpdate:modelValue":b[1]||(b[1]=v=>d.value.description=v),class:"form-control",id:"description",rows:"4",required:""},null,512),[[Nt,d.value.description]])]),g("div",dS,[b[9]||(b[9]=g("label",{for:"price",class:"form-label"},"Starting Price ($)",-1)),g("input",{value:u.value?.starting_price,type:"text",class:"form-control",id:"price",disabled:""},null,8,fS),b[10]||(b[10]=g("small",{class:"text-muted"},"Starting price cannot be changed",-1))]),g("div",hS,[b[11]||(b[11]=g("label",{for:"endDate",class:"form-label"},"End Date & Time *",-1)),Ot(g("input",{"onUpdate:modelValue":b[2]||(b[2]=v=>d.value.end_date=v),type:"datetime-local",class:"form-control",id:"endDate",min:f.value,required:""},null,8,pS),[[Nt,d.value.end_date]])]),g("div",gS,[g("button",{type:"submit",class:"btn btn-primary",disabled:N(n).loading},U(N(n).loading?"Saving...":"Save Changes"),9,mS),dt(y,{to:`/items/${o.value}`,class:"btn btn-secondary"},{default:Ht(()=>[...b[12]||(b[12]=[rt(" Cancel ",-1)])]),_:1},8,["to"])])],32))])])])])])}}}),bS=Ye(_S,[["__scopeId","data-v-cae69f2b"]]);/*!
+  */const qn=typeof document<"u";function Xp(e){return typeof e=="object"||"displayName"in e||"props"in e||"__vccOpts"in e}function my(e){return e.__esModule||e[Symbol.toStringTag]==="Module"||e.default&&Xp(e.default)}const wt=Object.assign;function Ba(e,t){const s={};for(const n in t){const i=t[n];s[n]=Ke(i)?i.map(e):e(i)}return s}const Ki=()=>{},Ke=Array.isArray,Qp=/#/g,_y=/&/g,by=/\//g,vy=/=/g,yy=/\?/g,Jp=/\+/g,xy=/%5B/g,wy=/%5D/g,Zp=/%5E/g,Ey=/%60/g,tg=/%7B/g,Sy=/%7C/g,eg=/%7D/g,Cy=/%20/g;function vc(e){return encodeURI(""+e).replace(Sy,"|").replace(xy,"[").replace(wy,"]")}function Ay(e){return vc(e).replace(tg,"{").replace(eg,"}").replace(Zp,"^")}function Pl(e){return vc(e).replace(Jp,"%2B").replace(Cy,"+").replace(Qp,"%23").replace(_y,"%26").replace(Ey,"`").replace(tg,"{").replace(eg,"}").replace(Zp,"^")}function Ty(e){return Pl(e).replace(vy,"%3D")}function Oy(e){return vc(e).replace(Qp,"%23").replace(yy,"%3F")}function ky(e){return e==null?"":Oy(e).replace(by,"%2F")}function co(e){try{return decodeURIComponent(""+e)}catch{}return""+e}const Dy=/\/$/,My=e=>e.replace(Dy,"");function Va(e,t,s="/"){let n,i={},o="",r="";const a=t.indexOf("#");let l=t.indexOf("?");return a<l&&a>=0&&(l=-1),l>-1&&(n=t.slice(0,l),o=t.slice(l+1,a>-1?a:t.length),i=e(o)),a>-1&&(n=n||t.slice(0,a),r=t.slice(a,t.length)),n=Ry(n??t,s),{fullPath:n+(o&&"?")+o+r,path:n,query:i,hash:co(r)}}function Py(e,t){const s=t.query?e(t.query):"";return t.path+(s&&"?")+s+(t.hash||"")}function qu(e,t){return!t||!e.toLowerCase().startsWith(t.toLowerCase())?e:e.slice(t.length)||"/"}function Iy(e,t,s){const n=t.matched.length-1,i=s.matched.length-1;return n>-1&&n===i&&ri(t.matched[n],s.matched[i])&&sg(t.params,s.params)&&e(t.query)===e(s.query)&&t.hash===s.hash}function ri(e,t){return(e.aliasOf||e)===(t.aliasOf||t)}function sg(e,t){if(Object.keys(e).length!==Object.keys(t).length)return!1;for(const s in e)if(!Ly(e[s],t[s]))return!1;return!0}function Ly(e,t){return Ke(e)?Gu(e,t):Ke(t)?Gu(t,e):e===t}function Gu(e,t){return Ke(t)?e.length===t.length&&e.every((s,n)=>s===t[n]):e.length===1&&e[0]===t}function Ry(e,t){if(e.startsWith("/"))return e;if(!e)return t;const s=t.split("/"),n=e.split("/"),i=n[n.length-1];(i===".."||i===".")&&n.push("");let o=s.length-1,r,a;for(r=0;r<n.length;r++)if(a=n[r],a!==".")if(a==="..")o>1&&o--;else break;return s.slice(0,o).join("/")+"/"+n.slice(r).join("/")}const $s={path:"/",name:void 0,params:{},query:{},hash:"",fullPath:"/",matched:[],meta:{},redirectedFrom:void 0};var uo;(function(e){e.pop="pop",e.push="push"})(uo||(uo={}));var Yi;(function(e){e.back="back",e.forward="forward",e.unknown=""})(Yi||(Yi={}));function $y(e){if(!e)if(qn){const t=document.querySelector("base");e=t&&t.getAttribute("href")||"/",e=e.replace(/^\w+:\/\/[^\/]+/,"")}else e="/";return e[0]!=="/"&&e[0]!=="#"&&(e="/"+e),My(e)}const Ny=/^[^#]+#/;function Fy(e,t){return e.replace(Ny,"#")+t}function By(e,t){const s=document.documentElement.getBoundingClientRect(),n=e.getBoundingClientRect();return{behavior:t.behavior,left:n.left-s.left-(t.left||0),top:n.top-s.top-(t.top||0)}}const la=()=>({left:window.scrollX,top:window.scrollY});function Vy(e){let t;if("el"in e){const s=e.el,n=typeof s=="string"&&s.startsWith("#"),i=typeof s=="string"?n?document.getElementById(s.slice(1)):document.querySelector(s):s;if(!i)return;t=By(i,e)}else t=e;"scrollBehavior"in document.documentElement.style?window.scrollTo(t):window.scrollTo(t.left!=null?t.left:window.scrollX,t.top!=null?t.top:window.scrollY)}function Xu(e,t){return(history.state?history.state.position-t:-1)+e}const Il=new Map;function Hy(e,t){Il.set(e,t)}function jy(e){const t=Il.get(e);return Il.delete(e),t}let Wy=()=>location.protocol+"//"+location.host;function ng(e,t){const{pathname:s,search:n,hash:i}=t,o=e.indexOf("#");if(o>-1){let a=i.includes(e.slice(o))?e.slice(o).length:1,l=i.slice(a);return l[0]!=="/"&&(l="/"+l),qu(l,"")}return qu(s,e)+n+i}function zy(e,t,s,n){let i=[],o=[],r=null;const a=({state:f})=>{const h=ng(e,location),m=s.value,p=t.value;let _=0;if(f){if(s.value=h,t.value=f,r&&r===m){r=null;return}_=p?f.position-p.position:0}else n(h);i.forEach(b=>{b(s.value,m,{delta:_,type:uo.pop,direction:_?_>0?Yi.forward:Yi.back:Yi.unknown})})};function l(){r=s.value}function c(f){i.push(f);const h=()=>{const m=i.indexOf(f);m>-1&&i.splice(m,1)};return o.push(h),h}function u(){const{history:f}=window;f.state&&f.replaceState(wt({},f.state,{scroll:la()}),"")}function d(){for(const f of o)f();o=[],window.removeEventListener("popstate",a),window.removeEventListener("beforeunload",u)}return window.addEventListener("popstate",a),window.addEventListener("beforeunload",u,{passive:!0}),{pauseListeners:l,listen:c,destroy:d}}function Qu(e,t,s,n=!1,i=!1){return{back:e,current:t,forward:s,replaced:n,position:window.history.length,scroll:i?la():null}}function Uy(e){const{history:t,location:s}=window,n={value:ng(e,s)},i={value:t.state};i.value||o(n.value,{back:null,current:n.value,forward:null,position:t.length-1,replaced:!0,scroll:null},!0);function o(l,c,u){const d=e.indexOf("#"),f=d>-1?(s.host&&document.querySelector("base")?e:e.slice(d))+l:Wy()+e+l;try{t[u?"replaceState":"pushState"](c,"",f),i.value=c}catch(h){console.error(h),s[u?"replace":"assign"](f)}}function r(l,c){const u=wt({},t.state,Qu(i.value.back,l,i.value.forward,!0),c,{position:i.value.position});o(l,u,!0),n.value=l}function a(l,c){const u=wt({},i.value,t.state,{forward:l,scroll:la()});o(u.current,u,!0);const d=wt({},Qu(n.value,l,null),{position:u.position+1},c);o(l,d,!1),n.value=l}return{location:n,state:i,push:a,replace:r}}function Ky(e){e=$y(e);const t=Uy(e),s=zy(e,t.state,t.location,t.replace);function n(o,r=!0){r||s.pauseListeners(),history.go(o)}const i=wt({location:"",base:e,go:n,createHref:Fy.bind(null,e)},t,s);return Object.defineProperty(i,"location",{enumerable:!0,get:()=>t.location.value}),Object.defineProperty(i,"state",{enumerable:!0,get:()=>t.state.value}),i}function Yy(e){return typeof e=="string"||e&&typeof e=="object"}function ig(e){return typeof e=="string"||typeof e=="symbol"}const og=Symbol("");var Ju;(function(e){e[e.aborted=4]="aborted",e[e.cancelled=8]="cancelled",e[e.duplicated=16]="duplicated"})(Ju||(Ju={}));function ai(e,t){return wt(new Error,{type:e,[og]:!0},t)}function ps(e,t){return e instanceof Error&&og in e&&(t==null||!!(e.type&t))}const Zu="[^/]+?",qy={sensitive:!1,strict:!1,start:!0,end:!0},Gy=/[.+*?^${}()[\]/\\]/g;function Xy(e,t){const s=wt({},qy,t),n=[];let i=s.start?"^":"";const o=[];for(const c of e){const u=c.length?[]:[90];s.strict&&!c.length&&(i+="/");for(let d=0;d<c.length;d++){const f=c[d];let h=40+(s.sensitive?.25:0);if(f.type===0)d||(i+="/"),i+=f.value.replace(Gy,"\\$&"),h+=40;else if(f.type===1){const{value:m,repeatable:p,optional:_,regexp:b}=f;o.push({name:m,repeatable:p,optional:_});const y=b||Zu;if(y!==Zu){h+=10;try{new RegExp(`(${y})`)}catch(E){throw new Error(`Invalid custom RegExp for param "${m}" (${y}): `+E.message)}}let v=p?`((?:${y})(?:/(?:${y}))*)`:`(${y})`;d||(v=_&&c.length<2?`(?:/${v})`:"/"+v),_&&(v+="?"),i+=v,h+=20,_&&(h+=-8),p&&(h+=-20),y===".*"&&(h+=-50)}u.push(h)}n.push(u)}if(s.strict&&s.end){const c=n.length-1;n[c][n[c].length-1]+=.7000000000000001}s.strict||(i+="/?"),s.end?i+="$":s.strict&&!i.endsWith("/")&&(i+="(?:/|$)");const r=new RegExp(i,s.sensitive?"":"i");function a(c){const u=c.match(r),d={};if(!u)return null;for(let f=1;f<u.length;f++){const h=u[f]||"",m=o[f-1];d[m.name]=h&&m.repeatable?h.split("/"):h}return d}function l(c){let u="",d=!1;for(const f of e){(!d||!u.endsWith("/"))&&(u+="/"),d=!1;for(const h of f)if(h.type===0)u+=h.value;else if(h.type===1){const{value:m,repeatable:p,optional:_}=h,b=m in c?c[m]:"";if(Ke(b)&&!p)throw new Error(`Provided param "${m}" is an array but it is not repeatable (* or + modifiers)`);const y=Ke(b)?b.join("/"):b;if(!y)if(_)f.length<2&&(u.endsWith("/")?u=u.slice(0,-1):d=!0);else throw new Error(`Missing required param "${m}"`);u+=y}}return u||"/"}return{re:r,score:n,keys:o,parse:a,stringify:l}}function Qy(e,t){let s=0;for(;s<e.length&&s<t.length;){const n=t[s]-e[s];if(n)return n;s++}return e.length<t.length?e.length===1&&e[0]===80?-1:1:e.length>t.length?t.length===1&&t[0]===80?1:-1:0}function rg(e,t){let s=0;const n=e.score,i=t.score;for(;s<n.length&&s<i.length;){const o=Qy(n[s],i[s]);if(o)return o;s++}if(Math.abs(i.length-n.length)===1){if(td(n))return 1;if(td(i))return-1}return i.length-n.length}function td(e){const t=e[e.length-1];return e.length>0&&t[t.length-1]<0}const Jy={type:0,value:""},Zy=/[a-zA-Z0-9_]/;function t0(e){if(!e)return[[]];if(e==="/")return[[Jy]];if(!e.startsWith("/"))throw new Error(`Invalid path "${e}"`);function t(h){throw new Error(`ERR (${s})/"${c}": ${h}`)}let s=0,n=s;const i=[];let o;function r(){o&&i.push(o),o=[]}let a=0,l,c="",u="";function d(){c&&(s===0?o.push({type:0,value:c}):s===1||s===2||s===3?(o.length>1&&(l==="*"||l==="+")&&t(`A repeatable param (${c}) must be alone in its segment. eg: '/:ids+.`),o.push({type:1,value:c,regexp:u,repeatable:l==="*"||l==="+",optional:l==="*"||l==="?"})):t("Invalid state to consume buffer"),c="")}function f(){c+=l}for(;a<e.length;){if(l=e[a++],l==="\\"&&s!==2){n=s,s=4;continue}switch(s){case 0:l==="/"?(c&&d(),r()):l===":"?(d(),s=1):f();break;case 4:f(),s=n;break;case 1:l==="("?s=2:Zy.test(l)?f():(d(),s=0,l!=="*"&&l!=="?"&&l!=="+"&&a--);break;case 2:l===")"?u[u.length-1]=="\\"?u=u.slice(0,-1)+l:s=3:u+=l;break;case 3:d(),s=0,l!=="*"&&l!=="?"&&l!=="+"&&a--,u="";break;default:t("Unknown state");break}}return s===2&&t(`Unfinished custom RegExp for param "${c}"`),d(),r(),i}function e0(e,t,s){const n=Xy(t0(e.path),s),i=wt(n,{record:e,parent:t,children:[],alias:[]});return t&&!i.record.aliasOf==!t.record.aliasOf&&t.children.push(i),i}function s0(e,t){const s=[],n=new Map;t=id({strict:!1,end:!0,sensitive:!1},t);function i(d){return n.get(d)}function o(d,f,h){const m=!h,p=sd(d);p.aliasOf=h&&h.record;const _=id(t,d),b=[p];if("alias"in d){const E=typeof d.alias=="string"?[d.alias]:d.alias;for(const S of E)b.push(sd(wt({},p,{components:h?h.record.components:p.components,path:S,aliasOf:h?h.record:p})))}let y,v;for(const E of b){const{path:S}=E;if(f&&S[0]!=="/"){const O=f.record.path,C=O[O.length-1]==="/"?"":"/";E.path=f.record.path+(S&&C+S)}if(y=e0(E,f,_),h?h.alias.push(y):(v=v||y,v!==y&&v.alias.push(y),m&&d.name&&!nd(y)&&r(d.name)),ag(y)&&l(y),p.children){const O=p.children;for(let C=0;C<O.length;C++)o(O[C],y,h&&h.children[C])}h=h||y}return v?()=>{r(v)}:Ki}function r(d){if(ig(d)){const f=n.get(d);f&&(n.delete(d),s.splice(s.indexOf(f),1),f.children.forEach(r),f.alias.forEach(r))}else{const f=s.indexOf(d);f>-1&&(s.splice(f,1),d.record.name&&n.delete(d.record.name),d.children.forEach(r),d.alias.forEach(r))}}function a(){return s}function l(d){const f=o0(d,s);s.splice(f,0,d),d.record.name&&!nd(d)&&n.set(d.record.name,d)}function c(d,f){let h,m={},p,_;if("name"in d&&d.name){if(h=n.get(d.name),!h)throw ai(1,{location:d});_=h.record.name,m=wt(ed(f.params,h.keys.filter(v=>!v.optional).concat(h.parent?h.parent.keys.filter(v=>v.optional):[]).map(v=>v.name)),d.params&&ed(d.params,h.keys.map(v=>v.name))),p=h.stringify(m)}else if(d.path!=null)p=d.path,h=s.find(v=>v.re.test(p)),h&&(m=h.parse(p),_=h.record.name);else{if(h=f.name?n.get(f.name):s.find(v=>v.re.test(f.path)),!h)throw ai(1,{location:d,currentLocation:f});_=h.record.name,m=wt({},f.params,d.params),p=h.stringify(m)}const b=[];let y=h;for(;y;)b.unshift(y.record),y=y.parent;return{name:_,path:p,params:m,matched:b,meta:i0(b)}}e.forEach(d=>o(d));function u(){s.length=0,n.clear()}return{addRoute:o,resolve:c,removeRoute:r,clearRoutes:u,getRoutes:a,getRecordMatcher:i}}function ed(e,t){const s={};for(const n of t)n in e&&(s[n]=e[n]);return s}function sd(e){const t={path:e.path,redirect:e.redirect,name:e.name,meta:e.meta||{},aliasOf:e.aliasOf,beforeEnter:e.beforeEnter,props:n0(e),children:e.children||[],instances:{},leaveGuards:new Set,updateGuards:new Set,enterCallbacks:{},components:"components"in e?e.components||null:e.component&&{default:e.component}};return Object.defineProperty(t,"mods",{value:{}}),t}function n0(e){const t={},s=e.props||!1;if("component"in e)t.default=s;else for(const n in e.components)t[n]=typeof s=="object"?s[n]:s;return t}function nd(e){for(;e;){if(e.record.aliasOf)return!0;e=e.parent}return!1}function i0(e){return e.reduce((t,s)=>wt(t,s.meta),{})}function id(e,t){const s={};for(const n in e)s[n]=n in t?t[n]:e[n];return s}function o0(e,t){let s=0,n=t.length;for(;s!==n;){const o=s+n>>1;rg(e,t[o])<0?n=o:s=o+1}const i=r0(e);return i&&(n=t.lastIndexOf(i,n-1)),n}function r0(e){let t=e;for(;t=t.parent;)if(ag(t)&&rg(e,t)===0)return t}function ag({record:e}){return!!(e.name||e.components&&Object.keys(e.components).length||e.redirect)}function a0(e){const t={};if(e===""||e==="?")return t;const n=(e[0]==="?"?e.slice(1):e).split("&");for(let i=0;i<n.length;++i){const o=n[i].replace(Jp," "),r=o.indexOf("="),a=co(r<0?o:o.slice(0,r)),l=r<0?null:co(o.slice(r+1));if(a in t){let c=t[a];Ke(c)||(c=t[a]=[c]),c.push(l)}else t[a]=l}return t}function od(e){let t="";for(let s in e){const n=e[s];if(s=Ty(s),n==null){n!==void 0&&(t+=(t.length?"&":"")+s);continue}(Ke(n)?n.map(o=>o&&Pl(o)):[n&&Pl(n)]).forEach(o=>{o!==void 0&&(t+=(t.length?"&":"")+s,o!=null&&(t+="="+o))})}return t}function l0(e){const t={};for(const s in e){const n=e[s];n!==void 0&&(t[s]=Ke(n)?n.map(i=>i==null?null:""+i):n==null?n:""+n)}return t}const c0=Symbol(""),rd=Symbol(""),ca=Symbol(""),yc=Symbol(""),Ll=Symbol("");function Ai(){let e=[];function t(n){return e.push(n),()=>{const i=e.indexOf(n);i>-1&&e.splice(i,1)}}function s(){e=[]}return{add:t,list:()=>e.slice(),reset:s}}function Ws(e,t,s,n,i,o=r=>r()){const r=n&&(n.enterCallbacks[i]=n.enterCallbacks[i]||[]);return()=>new Promise((a,l)=>{const c=f=>{f===!1?l(ai(4,{from:s,to:t})):f instanceof Error?l(f):Yy(f)?l(ai(2,{from:t,to:f})):(r&&n.enterCallbacks[i]===r&&typeof f=="function"&&r.push(f),a())},u=o(()=>e.call(n&&n.instances[i],t,s,c));let d=Promise.resolve(u);e.length<3&&(d=d.then(c)),d.catch(f=>l(f))})}function Ha(e,t,s,n,i=o=>o()){const o=[];for(const r of e)for(const a in r.components){let l=r.components[a];if(!(t!=="beforeRouteEnter"&&!r.instances[a]))if(Xp(l)){const u=(l.__vccOpts||l)[t];u&&o.push(Ws(u,s,n,r,a,i))}else{let c=l();o.push(()=>c.then(u=>{if(!u)throw new Error(`Couldn't resolve component "${a}" at "${r.path}"`);const d=my(u)?u.default:u;r.mods[a]=u,r.components[a]=d;const h=(d.__vccOpts||d)[t];return h&&Ws(h,s,n,r,a,i)()}))}}return o}function ad(e){const t=Ce(ca),s=Ce(yc),n=gt(()=>{const l=N(e.to);return t.resolve(l)}),i=gt(()=>{const{matched:l}=n.value,{length:c}=l,u=l[c-1],d=s.matched;if(!u||!d.length)return-1;const f=d.findIndex(ri.bind(null,u));if(f>-1)return f;const h=ld(l[c-2]);return c>1&&ld(u)===h&&d[d.length-1].path!==h?d.findIndex(ri.bind(null,l[c-2])):f}),o=gt(()=>i.value>-1&&p0(s.params,n.value.params)),r=gt(()=>i.value>-1&&i.value===s.matched.length-1&&sg(s.params,n.value.params));function a(l={}){if(h0(l)){const c=t[N(e.replace)?"replace":"push"](N(e.to)).catch(Ki);return e.viewTransition&&typeof document<"u"&&"startViewTransition"in document&&document.startViewTransition(()=>c),c}return Promise.resolve()}return{route:n,href:gt(()=>n.value.href),isActive:o,isExactActive:r,navigate:a}}function u0(e){return e.length===1?e[0]:e}const d0=zt({name:"RouterLink",compatConfig:{MODE:3},props:{to:{type:[String,Object],required:!0},replace:Boolean,activeClass:String,exactActiveClass:String,custom:Boolean,ariaCurrentValue:{type:String,default:"page"},viewTransition:Boolean},useLink:ad,setup(e,{slots:t}){const s=Co(ad(e)),{options:n}=Ce(ca),i=gt(()=>({[cd(e.activeClass,n.linkActiveClass,"router-link-active")]:s.isActive,[cd(e.exactActiveClass,n.linkExactActiveClass,"router-link-exact-active")]:s.isExactActive}));return()=>{const o=t.default&&u0(t.default(s));return e.custom?o:$p("a",{"aria-current":s.isExactActive?e.ariaCurrentValue:null,href:s.href,onClick:s.navigate,class:i.value},o)}}}),f0=d0;function h0(e){if(!(e.metaKey||e.altKey||e.ctrlKey||e.shiftKey)&&!e.defaultPrevented&&!(e.button!==void 0&&e.button!==0)){if(e.currentTarget&&e.currentTarget.getAttribute){const t=e.currentTarget.getAttribute("target");if(/\b_blank\b/i.test(t))return}return e.preventDefault&&e.preventDefault(),!0}}function p0(e,t){for(const s in t){const n=t[s],i=e[s];if(typeof n=="string"){if(n!==i)return!1}else if(!Ke(i)||i.length!==n.length||n.some((o,r)=>o!==i[r]))return!1}return!0}function ld(e){return e?e.aliasOf?e.aliasOf.path:e.path:""}const cd=(e,t,s)=>e??t??s,g0=zt({name:"RouterView",inheritAttrs:!1,props:{name:{type:String,default:"default"},route:Object},compatConfig:{MODE:3},setup(e,{attrs:t,slots:s}){const n=Ce(Ll),i=gt(()=>e.route||n.value),o=Ce(rd,0),r=gt(()=>{let c=N(o);const{matched:u}=i.value;let d;for(;(d=u[c])&&!d.components;)c++;return c}),a=gt(()=>i.value.matched[r.value]);fr(rd,gt(()=>r.value+1)),fr(c0,a),fr(Ll,i);const l=ft();return Tn(()=>[l.value,a.value,e.name],([c,u,d],[f,h,m])=>{u&&(u.instances[d]=c,h&&h!==u&&c&&c===f&&(u.leaveGuards.size||(u.leaveGuards=h.leaveGuards),u.updateGuards.size||(u.updateGuards=h.updateGuards))),c&&u&&(!h||!ri(u,h)||!f)&&(u.enterCallbacks[d]||[]).forEach(p=>p(c))},{flush:"post"}),()=>{const c=i.value,u=e.name,d=a.value,f=d&&d.components[u];if(!f)return ud(s.default,{Component:f,route:c});const h=d.props[u],m=h?h===!0?c.params:typeof h=="function"?h(c):h:null,_=$p(f,wt({},m,t,{onVnodeUnmounted:b=>{b.component.isUnmounted&&(d.instances[u]=null)},ref:l}));return ud(s.default,{Component:_,route:c})||_}}});function ud(e,t){if(!e)return null;const s=e(t);return s.length===1?s[0]:s}const m0=g0;function _0(e){const t=s0(e.routes,e),s=e.parseQuery||a0,n=e.stringifyQuery||od,i=e.history,o=Ai(),r=Ai(),a=Ai(),l=lb($s);let c=$s;qn&&e.scrollBehavior&&"scrollRestoration"in history&&(history.scrollRestoration="manual");const u=Ba.bind(null,D=>""+D),d=Ba.bind(null,ky),f=Ba.bind(null,co);function h(D,q){let z,J;return ig(D)?(z=t.getRecordMatcher(D),J=q):J=D,t.addRoute(J,z)}function m(D){const q=t.getRecordMatcher(D);q&&t.removeRoute(q)}function p(){return t.getRoutes().map(D=>D.record)}function _(D){return!!t.getRecordMatcher(D)}function b(D,q){if(q=wt({},q||l.value),typeof D=="string"){const T=Va(s,D,q.path),I=t.resolve({path:T.path},q),R=i.createHref(T.fullPath);return wt(T,I,{params:f(I.params),hash:co(T.hash),redirectedFrom:void 0,href:R})}let z;if(D.path!=null)z=wt({},D,{path:Va(s,D.path,q.path).path});else{const T=wt({},D.params);for(const I in T)T[I]==null&&delete T[I];z=wt({},D,{params:d(T)}),q.params=d(q.params)}const J=t.resolve(z,q),xt=D.hash||"";J.params=u(f(J.params));const x=Py(n,wt({},D,{hash:Ay(xt),path:J.path})),w=i.createHref(x);return wt({fullPath:x,hash:xt,query:n===od?l0(D.query):D.query||{}},J,{redirectedFrom:void 0,href:w})}function y(D){return typeof D=="string"?Va(s,D,l.value.path):wt({},D)}function v(D,q){if(c!==D)return ai(8,{from:q,to:D})}function E(D){return C(D)}function S(D){return E(wt(y(D),{replace:!0}))}function O(D){const q=D.matched[D.matched.length-1];if(q&&q.redirect){const{redirect:z}=q;let J=typeof z=="function"?z(D):z;return typeof J=="string"&&(J=J.includes("?")||J.includes("#")?J=y(J):{path:J},J.params={}),wt({query:D.query,hash:D.hash,params:J.path!=null?{}:D.params},J)}}function C(D,q){const z=c=b(D),J=l.value,xt=D.state,x=D.force,w=D.replace===!0,T=O(z);if(T)return C(wt(y(T),{state:typeof T=="object"?wt({},xt,T.state):xt,force:x,replace:w}),q||z);const I=z;I.redirectedFrom=q;let R;return!x&&Iy(n,J,z)&&(R=ai(16,{to:I,from:J}),Yt(J,J,!0,!1)),(R?Promise.resolve(R):$(I,J)).catch(M=>ps(M)?ps(M,2)?M:Ut(M):ot(M,I,J)).then(M=>{if(M){if(ps(M,2))return C(wt({replace:w},y(M.to),{state:typeof M.to=="object"?wt({},xt,M.to.state):xt,force:x}),q||I)}else M=P(I,J,!0,w,xt);return H(I,J,M),M})}function k(D,q){const z=v(D,q);return z?Promise.reject(z):Promise.resolve()}function A(D){const q=Vt.values().next().value;return q&&typeof q.runWithContext=="function"?q.runWithContext(D):D()}function $(D,q){let z;const[J,xt,x]=b0(D,q);z=Ha(J.reverse(),"beforeRouteLeave",D,q);for(const T of J)T.leaveGuards.forEach(I=>{z.push(Ws(I,D,q))});const w=k.bind(null,D,q);return z.push(w),Dt(z).then(()=>{z=[];for(const T of o.list())z.push(Ws(T,D,q));return z.push(w),Dt(z)}).then(()=>{z=Ha(xt,"beforeRouteUpdate",D,q);for(const T of xt)T.updateGuards.forEach(I=>{z.push(Ws(I,D,q))});return z.push(w),Dt(z)}).then(()=>{z=[];for(const T of x)if(T.beforeEnter)if(Ke(T.beforeEnter))for(const I of T.beforeEnter)z.push(Ws(I,D,q));else z.push(Ws(T.beforeEnter,D,q));return z.push(w),Dt(z)}).then(()=>(D.matched.forEach(T=>T.enterCallbacks={}),z=Ha(x,"beforeRouteEnter",D,q,A),z.push(w),Dt(z))).then(()=>{z=[];for(const T of r.list())z.push(Ws(T,D,q));return z.push(w),Dt(z)}).catch(T=>ps(T,8)?T:Promise.reject(T))}function H(D,q,z){a.list().forEach(J=>A(()=>J(D,q,z)))}function P(D,q,z,J,xt){const x=v(D,q);if(x)return x;const w=q===$s,T=qn?history.state:{};z&&(J||w?i.replace(D.fullPath,wt({scroll:w&&T&&T.scroll},xt)):i.push(D.fullPath,xt)),l.value=D,Yt(D,q,z,w),Ut()}let X;function ct(){X||(X=i.listen((D,q,z)=>{if(!qt.listening)return;const J=b(D),xt=O(J);if(xt){C(wt(xt,{replace:!0,force:!0}),J).catch(Ki);return}c=J;const x=l.value;qn&&Hy(Xu(x.fullPath,z.delta),la()),$(J,x).catch(w=>ps(w,12)?w:ps(w,2)?(C(wt(y(w.to),{force:!0}),J).then(T=>{ps(T,20)&&!z.delta&&z.type===uo.pop&&i.go(-1,!1)}).catch(Ki),Promise.reject()):(z.delta&&i.go(-z.delta,!1),ot(w,J,x))).then(w=>{w=w||P(J,x,!1),w&&(z.delta&&!ps(w,8)?i.go(-z.delta,!1):z.type===uo.pop&&ps(w,20)&&i.go(-1,!1)),H(J,x,w)}).catch(Ki)}))}let nt=Ai(),Q=Ai(),K;function ot(D,q,z){Ut(D);const J=Q.list();return J.length?J.forEach(xt=>xt(D,q,z)):console.error(D),Promise.reject(D)}function mt(){return K&&l.value!==$s?Promise.resolve():new Promise((D,q)=>{nt.add([D,q])})}function Ut(D){return K||(K=!D,ct(),nt.list().forEach(([q,z])=>D?z(D):q()),nt.reset()),D}function Yt(D,q,z,J){const{scrollBehavior:xt}=e;if(!qn||!xt)return Promise.resolve();const x=!z&&jy(Xu(D.fullPath,0))||(J||!z)&&history.state&&history.state.scroll||null;return To().then(()=>xt(D,q,x)).then(w=>w&&Vy(w)).catch(w=>ot(w,D,q))}const At=D=>i.go(D);let Jt;const Vt=new Set,qt={currentRoute:l,listening:!0,addRoute:h,removeRoute:m,clearRoutes:t.clearRoutes,hasRoute:_,getRoutes:p,resolve:b,options:e,push:E,replace:S,go:At,back:()=>At(-1),forward:()=>At(1),beforeEach:o.add,beforeResolve:r.add,afterEach:a.add,onError:Q.add,isReady:mt,install(D){const q=this;D.component("RouterLink",f0),D.component("RouterView",m0),D.config.globalProperties.$router=q,Object.defineProperty(D.config.globalProperties,"$route",{enumerable:!0,get:()=>N(l)}),qn&&!Jt&&l.value===$s&&(Jt=!0,E(i.location).catch(xt=>{}));const z={};for(const xt in $s)Object.defineProperty(z,xt,{get:()=>l.value[xt],enumerable:!0});D.provide(ca,q),D.provide(yc,Gh(z)),D.provide(Ll,l);const J=D.unmount;Vt.add(D),D.unmount=function(){Vt.delete(D),Vt.size<1&&(c=$s,X&&X(),X=null,l.value=$s,Jt=!1,K=!1),J()}}};function Dt(D){return D.reduce((q,z)=>q.then(()=>A(z)),Promise.resolve())}return qt}function b0(e,t){const s=[],n=[],i=[],o=Math.max(t.matched.length,e.matched.length);for(let r=0;r<o;r++){const a=t.matched[r];a&&(e.matched.find(c=>ri(c,a))?n.push(a):s.push(a));const l=e.matched[r];l&&(t.matched.find(c=>ri(c,l))||i.push(l))}return[s,n,i]}function on(){return Ce(ca)}function lg(e){return Ce(yc)}const fo={USD:{code:"USD",name:"US Dollar",symbol:"$"},EUR:{code:"EUR",name:"Euro",symbol:"€"},GBP:{code:"GBP",name:"British Pound",symbol:"£"},JPY:{code:"JPY",name:"Japanese Yen",symbol:"¥"},AUD:{code:"AUD",name:"Australian Dollar",symbol:"A$"}},cg={USD:1,EUR:.92,GBP:.79,JPY:149.5,AUD:1.53};function Lr(e,t){const s=cg[t];return e*s}function v0(e,t){const s=cg[t];return e/s}function qi(e,t){const s=typeof e=="string"?parseFloat(e):e;if(isNaN(s))return`${fo[t].symbol}0.00`;const n=Lr(s,t),i=fo[t].symbol;return t==="JPY"?`${i}${Math.round(n).toLocaleString()}`:`${i}${n.toFixed(2)}`}function xc(e){return fo[e].symbol}function ug(){return Object.values(fo)}const y0={class:"navbar navbar-expand-lg navbar-dark bg-dark"},x0={class:"container"},w0={class:"collapse navbar-collapse",id:"navbarNav"},E0={class:"navbar-nav ms-auto align-items-lg-center"},S0={class:"nav-item"},C0={class:"nav-item"},A0={class:"nav-item"},T0={class:"nav-item dropdown"},O0={class:"nav-link dropdown-toggle",href:"#",role:"button","data-bs-toggle":"dropdown","aria-expanded":"false"},k0={class:"dropdown-menu dropdown-menu-end"},D0=["onClick"],M0={class:"nav-item"},P0={class:"nav-link text-light"},I0=zt({__name:"AppNavbar",setup(e){const t=on(),s=Ae(),n=ug(),i=gt(()=>{const a=s.user?.currency_preference||"USD";return xc(a)}),o=async a=>{await s.setCurrency(a)},r=async()=>{await s.logout(),t.push("/login")};return(a,l)=>{const c=be("router-link");return L(),B("nav",y0,[g("div",x0,[dt(c,{to:"/",class:"navbar-brand"},{default:Ht(()=>[...l[0]||(l[0]=[g("img",{src:gy,alt:"Soldit Logo",class:"navbar-logo"},null,-1)])]),_:1}),l[6]||(l[6]=g("button",{class:"navbar-toggler",type:"button","data-bs-toggle":"collapse","data-bs-target":"#navbarNav","aria-controls":"navbarNav","aria-expanded":"false","aria-label":"Toggle navigation"},[g("span",{class:"navbar-toggler-icon"})],-1)),g("div",w0,[g("ul",E0,[g("li",S0,[dt(c,{to:"/",class:"nav-link","active-class":"active"},{default:Ht(()=>[...l[1]||(l[1]=[rt(" Home ",-1)])]),_:1})]),g("li",C0,[dt(c,{to:"/items",class:"nav-link","active-class":"active"},{default:Ht(()=>[...l[2]||(l[2]=[rt(" Auctions ",-1)])]),_:1})]),g("li",A0,[dt(c,{to:"/profile",class:"nav-link","active-class":"active"},{default:Ht(()=>[...l[3]||(l[3]=[rt(" Profile ",-1)])]),_:1})]),g("li",T0,[g("a",O0,[l[4]||(l[4]=g("i",{class:"bi bi-currency-exchange me-1"},null,-1)),rt(" "+U(i.value),1)]),g("ul",k0,[(L(!0),B(It,null,We(N(n),u=>(L(),B("li",{key:u.code},[g("a",{class:Kt(["dropdown-item",{active:N(s).user?.currency_preference===u.code}]),href:"#",onClick:os(d=>o(u.code),["prevent"])},U(u.symbol)+" "+U(u.name),11,D0)]))),128))])]),g("li",M0,[g("span",P0,[l[5]||(l[5]=g("i",{class:"bi bi-person-circle"},null,-1)),rt(" "+U(N(s).user?.username),1)])]),g("li",{class:"nav-item"},[g("button",{onClick:r,class:"btn btn-outline-light btn-sm ms-lg-2"}," Logout ")])])])])])}}}),Ye=(e,t)=>{const s=e.__vccOpts||e;for(const[n,i]of t)s[n]=i;return s},L0=Ye(I0,[["__scopeId","data-v-38353bfe"]]),R0=zt({__name:"App",setup(e){const t=Ae();return fs(()=>{t.user||t.fetchCurrentUser()}),(s,n)=>{const i=be("RouterView");return L(),B("div",null,[N(t).isAuthenticated?(L(),Pe(L0,{key:0})):bt("",!0),dt(i)])}}}),Ns={async getItems(e){const t=e?`/api/items/?search=${encodeURIComponent(e)}&limit=100`:"/api/items/?limit=100",s=[];let n=null,i;do{if(i=await ce.get(n?`${t}&cursor=${encodeURIComponent(n)}`:t),!i.success||!i.data)return i;s.push(...i.data.items),n=i.data.next_cursor}while(n);return{...i,data:{...i.data,items:s,next_cursor:null}}},async getItemDetail(e){return ce.get(`/api/items/${e}/`)},async createItem(e){const t=new FormData;return t.append("title",e.title),t.append("description",e.description),t.append("starting_price",e.starting_price),t.append("picture",e.picture),t.append("end_date",e.end_date),ce.postFormData("/api/items/",t)},async placeBid(e,t){return ce.post(`/api/items/${e}/bid/`,t)},async askQuestion(e,t){return ce.post(`/api/items/${e}/questions/`,t)},async answerQuestion(e,t){return ce.post(`/api/questions/${e}/answer/`,t)},async updateItem(e,t){const s=new FormData;return s.append("title",t.title),s.append("description",t.description),s.append("end_date",t.end_date),t.picture&&s.append("picture",t.picture),ce.putFormData(`/api/items/${e}/edit/`,s)},async deleteItem(e){return ce.delete(`/api/items/${e}/delete/`)}},Do=Gp("items",{state:()=>({items:[],currentItem:null,currentItemBids:[],currentItemQuestions:[],loading:!1,error:null}),getters:{activeItems:e=>e.items.filter(t=>!t.is_ended),endedItems:e=>e.items.filter(t=>t.is_ended)},actions:{async fetchItems(e){this.loading=!0,this.error=null;try{const t=await Ns.getItems(e);t.success&&t.data?this.items=t.data.items:this.error=t.error||"Failed to load items"}catch{this.error="Network error"}finally{this.loading=!1}},async fetchItemDetail(e){this.loading=!0,this.error=null;try{const t=await Ns.getItemDetail(e);return t.success&&t.data?(this.currentItem=t.data.item,this.currentItemBids=t.data.bids,this.currentItemQuestions=t.data.questions,!0):(this.error=t.error||"Failed to load item",!1)}catch{return this.error="Network error",!1}finally{this.loading=!1}},async createItem(e){this.loading=!0,this.error=null;try{const t=await Ns.createItem(e);return t.success&&t.data?(this.items.unshift(t.data.item),!0):(this.error=t.error||"Failed to create item",!1)}catch{return this.error="Network error",!1}finally{this.loading=!1}},async placeBid(e,t){this.loading=!0,this.error=null;try{const s=await Ns.placeBid(e,{amount:t});if(s.success&&s.data){this.currentItem=s.data.item,this.currentItemBids.unshift(s.data.bid);const n=this.items.findIndex(o=>o.id===e);n!==-1&&(this.items[n]=s.data.item);const i=Ae();return i.user&&!i.user.bid_item_ids.includes(e)&&i.user.bid_item_ids.push(e),!0}else return this.error=s.error||"Failed to place bid",!1}catch{return this.error="Network error",!1}finally{this.loading=!1}},async askQuestion(e,t){this.loading=!0,this.error=null;try{const s=await Ns.askQuestion(e,{question_text:t});if(s.success&&s.data){this.currentItemQuestions.push(s.data.question);const n=Ae();return n.user&&!n.user.questioned_item_ids.includes(e)&&n.user.questioned_item_ids.push(e),!0}else return this.error=s.error||"Failed to ask question",!1}catch{return this.error="Network error",!1}finally{this.loading=!1}},async answerQuestion(e,t){this.loading=!0,this.error=null;try{const s=await Ns.answerQuestion(e,{answer_text:t});if(s.success&&s.data){const n=this.currentItemQuestions.findIndex(i=>i.id===e);return n!==-1&&(this.currentItemQuestions[n]=s.data.question),!0}else return this.error=s.error||"Failed to answer question",!1}catch{return this.error="Network error",!1}finally{this.loading=!1}},async updateItem(e,t){this.loading=!0,this.error=null;try{const s=await Ns.updateItem(e,t);if(s.success&&s.data){this.currentItem=s.data.item;const n=this.items.findIndex(i=>i.id===e);return n!==-1&&(this.items[n]=s.data.item),!0}else return this.error=s.error||"Failed to update item",!1}catch{return this.error="Network error",!1}finally{this.loading=!1}},async deleteItem(e){this.loading=!0,this.error=null;try{const t=await Ns.deleteItem(e);return t.success?(this.items=this.items.filter(s=>s.id!==e),this.currentItem?.id===e&&this.clearCurrentItem(),!0):(this.error=t.error||"Failed to delete item",!1)}catch{return this.error="Network error",!1}finally{this.loading=!1}},clearCurrentItem(){this.currentItem=null,this.currentItemBids=[],this.currentItemQuestions=[]}}});function $0(e){const t=ft(""),s=ft("normal");let n;const i=()=>{const o=new Date(e).getTime(),r=new Date().getTime(),a=o-r;if(a<=0){t.value="Ended",s.value="critical",clearInterval(n);return}const l=Math.floor(a/(1e3*60*60*24)),c=Math.floor(a%(1e3*60*60*24)/(1e3*60*60)),u=Math.floor(a%(1e3*60*60)/(1e3*60));a<36e5?(s.value="critical",t.value=`${u}m remaining`):a<864e5?(s.value="warning",t.value=`${c}h ${u}m`):(s.value="normal",t.value=`${l}d ${c}h`)};return fs(()=>{i(),n=setInterval(i,1e3)}),Oo(()=>{clearInterval(n)}),{timeRemaining:t,urgency:s}}const N0={class:"position-relative"},F0=["src"],B0={class:"position-absolute top-0 end-0 m-2"},V0={key:1,class:"badge bg-danger shadow-sm"},H0={class:"card-body d-flex flex-column"},j0={class:"card-title text-truncate"},W0={class:"card-text text-muted small flex-grow-1 text-truncate-2"},z0={class:"mt-2"},U0={class:"d-flex justify-content-between align-items-center mb-2"},K0={class:"fw-bold text-primary"},Y0={class:"text-end"},q0={class:"badge rounded-pill bg-light text-dark border"},G0={class:"pt-2 border-top"},X0={class:"text-muted d-block"},Q0=zt({__name:"ItemCard",props:{item:{}},emits:["click"],setup(e){const t=e,s=Ae(),{timeRemaining:n,urgency:i}=$0(t.item.end_date),o=r=>new Date(r).toLocaleString();return(r,a)=>(L(),B("div",{class:"card h-100 shadow-sm",onClick:a[0]||(a[0]=l=>r.$emit("click"))},[g("div",N0,[g("img",{src:r.item.picture||"",class:"card-img-top item-image",alt:"Item image"},null,8,F0),g("div",B0,[!r.item.is_ended&&r.item.is_active?(L(),B("div",{key:0,class:Kt(["countdown-badge",`countdown-${N(i)}`])},[a[1]||(a[1]=g("i",{class:"bi bi-clock me-1"},null,-1)),rt(U(N(n)),1)],2)):(L(),B("span",V0,[...a[2]||(a[2]=[g("i",{class:"bi bi-lock-fill me-1"},null,-1),rt(" Closed ",-1)])]))])]),g("div",H0,[g("h5",j0,U(r.item.title),1),g("p",W0,U(r.item.description),1),g("div",z0,[g("div",U0,[g("div",null,[a[3]||(a[3]=g("small",{class:"text-muted d-block"},"Current Bid",-1)),g("span",K0,U(N(qi)(r.item.current_price,N(s).user?.currency_preference||"USD")),1)]),g("div",Y0,[a[4]||(a[4]=g("small",{class:"text-muted d-block"},"Bids",-1)),g("span",q0,U(r.item.bid_count),1)])]),g("div",G0,[g("small",X0,[a[5]||(a[5]=g("i",{class:"bi bi-calendar3 me-1"},null,-1)),rt(" "+U(r.item.is_ended?"Ended on:":"Ends on:"),1)]),g("span",{class:Kt(["small",r.item.is_ended?"text-muted":"text-danger fw-medium"])},U(o(r.item.end_date)),3)])])])]))}}),mr=Ye(Q0,[["__scopeId","data-v-31461ca9"]]),J0={class:"container mt-4"},Z0={class:"welcome-section mb-4"},tx={class:"text-muted"},ex={class:"quick-actions mb-4"},sx={class:"card"},nx={class:"card-body"},ix={class:"d-flex flex-wrap gap-2"},ox={class:"row g-4 mb-4"},rx={class:"col-lg-3 col-md-6"},ax={class:"card stat-card border-0 h-100"},lx={class:"card-body"},cx={class:"d-flex justify-content-between align-items-center mb-2"},ux={class:"mb-0 fw-bold"},dx={class:"mt-3 pt-2 border-top"},fx={class:"text-success"},hx={class:"col-lg-3 col-md-6"},px={class:"card stat-card border-0 h-100"},gx={class:"card-body"},mx={class:"d-flex justify-content-between align-items-center mb-2"},_x={class:"mb-0 fw-bold"},bx={class:"mt-3 pt-2 border-top"},vx={class:"text-muted"},yx={class:"col-lg-3 col-md-6"},xx={class:"card stat-card border-0 h-100"},wx={class:"card-body"},Ex={class:"d-flex justify-content-between align-items-center mb-2"},Sx={class:"mb-0 fw-bold"},Cx={class:"col-lg-3 col-md-6"},Ax={class:"card stat-card border-0 h-100"},Tx={class:"card-body"},Ox={class:"d-flex justify-content-between align-items-center mb-2"},kx={class:"mb-0 fw-bold"},Dx={class:"mt-3 pt-2 border-top"},Mx={class:"text-muted"},Px={class:"activity-section"},Ix={class:"d-flex justify-content-between align-items-center mb-3"},Lx={key:0,class:"text-center py-4"},Rx={key:1},$x={key:0,class:"mb-4"},Nx={class:"text-muted mb-3"},Fx={class:"row g-3"},Bx={key:1,class:"mb-4"},Vx={class:"text-muted mb-3"},Hx={class:"row g-3"},jx={key:2,class:"mb-4"},Wx={class:"text-muted mb-3"},zx={class:"row g-3"},Ux={key:3,class:"card"},Kx={class:"card-body text-center py-5"},Yx=zt({__name:"DashboardPage",setup(e){const t=Ae(),s=Do(),n=on(),i=gt(()=>s.items.filter(f=>f.owner_id===t.user?.id)),o=gt(()=>{const f=t.user?.bid_item_ids||[];return s.items.filter(h=>f.includes(h.id))}),r=gt(()=>{const f=t.user?.questioned_item_ids||[];return s.items.filter(h=>f.includes(h.id))}),a=gt(()=>i.value.filter(f=>!f.is_ended).length),l=gt(()=>{const f=o.value.reduce((h,m)=>h+parseFloat(m.current_price),0);return qi(f,t.user?.currency_preference||"USD")}),c=gt(()=>s.items.filter(f=>f.winner_id===t.user?.id).length),u=gt(()=>{const f=o.value.filter(h=>h.is_ended).length;return f===0?0:Math.round(c.value/f*100)}),d=f=>{n.push(`/items/${f}`)};return fs(()=>{s.fetchItems()}),(f,h)=>{const m=be("router-link");return L(),B("div",J0,[g("div",Z0,[h[0]||(h[0]=g("h1",null,"Welcome to SoldIt",-1)),g("p",tx," Hello, "+U(N(t).user?.username)+"! Start bidding on items or list your own. ",1)]),g("div",ex,[g("div",sx,[g("div",nx,[h[4]||(h[4]=g("h5",{class:"card-title"},"Quick Actions",-1)),g("div",ix,[dt(m,{to:"/items/create",class:"btn btn-primary"},{default:Ht(()=>[...h[1]||(h[1]=[g("i",{class:"bi bi-plus-circle me-1"},null,-1),rt(" Create Listing ",-1)])]),_:1}),dt(m,{to:"/items",class:"btn btn-outline-primary"},{default:Ht(()=>[...h[2]||(h[2]=[g("i",{class:"bi bi-search me-1"},null,-1),rt(" Browse Auctions ",-1)])]),_:1}),dt(m,{to:"/profile",class:"btn btn-outline-secondary"},{default:Ht(()=>[...h[3]||(h[3]=[g("i",{class:"bi bi-person me-1"},null,-1),rt(" View Profile ",-1)])]),_:1})])])])]),g("div",ox,[g("div",rx,[g("div",ax,[g("div",lx,[g("div",cx,[g("div",null,[g("h3",ux,U(i.value.length),1),h[5]||(h[5]=g("small",{class:"text-muted"},"My Listings",-1))]),h[6]||(h[6]=g("div",{class:"stat-icon bg-primary"},[g("i",{class:"bi bi-box-seam"})],-1))]),g("div",dx,[g("small",fx,[h[7]||(h[7]=g("i",{class:"bi bi-arrow-up-circle me-1"},null,-1)),rt(" "+U(a.value)+" active ",1)])])])])]),g("div",hx,[g("div",px,[g("div",gx,[g("div",mx,[g("div",null,[g("h3",_x,U(l.value),1),h[8]||(h[8]=g("small",{class:"text-muted"},"Bid Value",-1))]),h[9]||(h[9]=g("div",{class:"stat-icon bg-success"},[g("i",{class:"bi bi-cash-stack"})],-1))]),g("div",bx,[g("small",vx,[h[10]||(h[10]=g("i",{class:"bi bi-tag me-1"},null,-1)),rt(" "+U(o.value.length)+" items ",1)])])])])]),g("div",yx,[g("div",xx,[g("div",wx,[g("div",Ex,[g("div",null,[g("h3",Sx,U(r.value.length),1),h[11]||(h[11]=g("small",{class:"text-muted"},"Questions",-1))]),h[12]||(h[12]=g("div",{class:"stat-icon bg-info"},[g("i",{class:"bi bi-chat-dots"})],-1))]),h[13]||(h[13]=g("div",{class:"mt-3 pt-2 border-top"},[g("small",{class:"text-muted"},[g("i",{class:"bi bi-check-circle me-1"}),rt(" Engaging with sellers ")])],-1))])])]),g("div",Cx,[g("div",Ax,[g("div",Tx,[g("div",Ox,[g("div",null,[g("h3",kx,U(u.value)+"%",1),h[14]||(h[14]=g("small",{class:"text-muted"},"Win Rate",-1))]),h[15]||(h[15]=g("div",{class:"stat-icon bg-warning"},[g("i",{class:"bi bi-trophy"})],-1))]),g("div",Dx,[g("small",Mx,[h[16]||(h[16]=g("i",{class:"bi bi-award me-1"},null,-1)),rt(" "+U(c.value)+" won ",1)])])])])])]),g("div",Px,[g("div",Ix,[h[18]||(h[18]=g("h3",{class:"mb-0"},"My Activity",-1)),dt(m,{to:"/items",class:"btn btn-sm btn-outline-primary"},{default:Ht(()=>[...h[17]||(h[17]=[rt(" Browse All Auctions ",-1)])]),_:1})]),N(s).loading?(L(),B("div",Lx,[...h[19]||(h[19]=[g("div",{class:"spinner-border",role:"status"},[g("span",{class:"visually-hidden"},"Loading...")],-1)])])):(L(),B("div",Rx,[i.value.length>0?(L(),B("div",$x,[g("h5",Nx,"My Listings ("+U(i.value.length)+")",1),g("div",Fx,[(L(!0),B(It,null,We(i.value,p=>(L(),B("div",{key:p.id,class:"col-md-4"},[dt(mr,{item:p,onClick:_=>d(p.id)},null,8,["item","onClick"])]))),128))])])):bt("",!0),o.value.length>0?(L(),B("div",Bx,[g("h5",Vx,"Items I'm Bidding On ("+U(o.value.length)+")",1),g("div",Hx,[(L(!0),B(It,null,We(o.value,p=>(L(),B("div",{key:p.id,class:"col-md-4"},[dt(mr,{item:p,onClick:_=>d(p.id)},null,8,["item","onClick"])]))),128))])])):bt("",!0),r.value.length>0?(L(),B("div",jx,[g("h5",Wx,"Items I've Asked About ("+U(r.value.length)+")",1),g("div",zx,[(L(!0),B(It,null,We(r.value,p=>(L(),B("div",{key:p.id,class:"col-md-4"},[dt(mr,{item:p,onClick:_=>d(p.id)},null,8,["item","onClick"])]))),128))])])):bt("",!0),i.value.length===0&&o.value.length===0&&r.value.length===0?(L(),B("div",Ux,[g("div",Kx,[h[21]||(h[21]=g("i",{class:"bi bi-inbox",style:{"font-size":"3rem",color:"#ccc"}},null,-1)),h[22]||(h[22]=g("h5",{class:"mt-3"},"No Activity Yet",-1)),h[23]||(h[23]=g("p",{class:"text-muted mb-3"}," You haven't created any listings, placed any bids, or asked any questions yet. ",-1)),dt(m,{to:"/items",class:"btn btn-primary"},{default:Ht(()=>[...h[20]||(h[20]=[rt(" Browse Auctions ",-1)])]),_:1})])])):bt("",!0)]))])])}}}),qx=Ye(Yx,[["__scopeId","data-v-1a6991b0"]]),Gx={class:"auth-container"},Xx={class:"auth-card"},Qx={key:0,class:"alert alert-danger",role:"alert"},Jx={class:"mb-3"},Zx={class:"mb-3"},t1=["disabled"],e1={class:"text-center mt-3 mb-0"},s1=zt({__name:"LoginPage",setup(e){const t=on(),s=Ae(),n=ft({username:"",password:""}),i=ft(null),o=async()=>{i.value=null,await s.login(n.value)?t.push("/"):i.value=s.error||"Login failed. Please check your credentials."};return(r,a)=>{const l=be("router-link");return L(),B("div",Gx,[g("div",Xx,[a[6]||(a[6]=g("h2",{class:"text-center mb-4"},"Login",-1)),i.value?(L(),B("div",Qx,U(i.value),1)):bt("",!0),g("form",{onSubmit:os(o,["prevent"])},[g("div",Jx,[a[2]||(a[2]=g("label",{for:"username",class:"form-label"},"Username",-1)),Ot(g("input",{id:"username","onUpdate:modelValue":a[0]||(a[0]=c=>n.value.username=c),type:"text",class:"form-control",placeholder:"Enter your username",required:""},null,512),[[Nt,n.value.username]])]),g("div",Zx,[a[3]||(a[3]=g("label",{for:"password",class:"form-label"},"Password",-1)),Ot(g("input",{id:"password","onUpdate:modelValue":a[1]||(a[1]=c=>n.value.password=c),type:"password",class:"form-control",placeholder:"Enter your password",required:""},null,512),[[Nt,n.value.password]])]),g("button",{type:"submit",class:"btn btn-primary w-100",disabled:N(s).loading},U(N(s).loading?"Logging in...":"Login"),9,t1)],32),g("p",e1,[a[5]||(a[5]=rt(" Don't have an account? ",-1)),dt(l,{to:"/signup",class:"text-decoration-none"},{default:Ht(()=>[...a[4]||(a[4]=[rt("Sign up",-1)])]),_:1})])])])}}}),n1=Ye(s1,[["__scopeId","data-v-dceb6c71"]]),i1={class:"auth-container"},o1={class:"auth-card"},r1={key:0,class:"alert alert-danger",role:"alert"},a1={class:"mb-3 text-center"},l1=["src"],c1={key:0,class:"text-danger small mt-1"},u1={class:"mb-3"},d1={key:0,class:"invalid-feedback"},f1={class:"mb-3"},h1={key:0,class:"invalid-feedback"},p1={class:"mb-3"},g1={key:0,class:"invalid-feedback"},m1={class:"mb-3"},_1={key:0,class:"invalid-feedback"},b1={class:"mb-3"},v1={key:0,class:"invalid-feedback"},y1=["disabled"],x1={class:"text-center mt-3 mb-0"},w1="https://upload.wikimedia.org/wikipedia/commons/7/7c/Profile_avatar_placeholder_large.png",E1=zt({__name:"SignupPage",setup(e){const t=on(),s=Ae(),n=ft({username:"",email:"",password1:"",password2:"",date_of_birth:void 0}),i=ft(null),o=ft(null),r=gt(()=>i.value?URL.createObjectURL(i.value):w1),a=c=>{const u=c.target;u.files&&u.files[0]&&(i.value=u.files[0])},l=async()=>{const c={...n.value,profile_image:i.value||void 0};await s.signup(c)&&t.push("/")};return(c,u)=>{const d=be("router-link");return L(),B("div",i1,[g("div",o1,[u[17]||(u[17]=g("h2",{class:"text-center mb-4"},"Sign Up",-1)),N(s).error?(L(),B("div",r1,U(N(s).error),1)):bt("",!0),g("form",{onSubmit:os(l,["prevent"])},[g("div",a1,[g("div",{class:"profile-preview-container",onClick:u[0]||(u[0]=f=>o.value?.click())},[g("img",{src:r.value,class:"profile-preview",alt:"Profile preview"},null,8,l1),u[6]||(u[6]=g("div",{class:"upload-overlay"},"CLICK TO UPLOAD",-1))]),g("input",{ref_key:"fileInput",ref:o,type:"file",accept:"image/jpeg,image/jpg,image/png",onChange:a,style:{display:"none"}},null,544),u[7]||(u[7]=g("small",{class:"text-muted d-block mt-1"},"Optional: Upload profile image",-1)),u[8]||(u[8]=g("small",{class:"text-muted d-block"},"(JPG, JPEG, or PNG)",-1)),N(s).errors?.profile_image?(L(),B("div",c1,U(N(s).errors.profile_image[0]),1)):bt("",!0)]),g("div",u1,[u[9]||(u[9]=g("label",{for:"username",class:"form-label"},"Username",-1)),Ot(g("input",{id:"username","onUpdate:modelValue":u[1]||(u[1]=f=>n.value.username=f),type:"text",class:Kt(["form-control",{"is-invalid":N(s).errors?.username}]),placeholder:"Choose a username",required:""},null,2),[[Nt,n.value.username]]),N(s).errors?.username?(L(),B("div",d1,U(N(s).errors.username[0]),1)):bt("",!0)]),g("div",f1,[u[10]||(u[10]=g("label",{for:"email",class:"form-label"},"Email",-1)),Ot(g("input",{id:"email","onUpdate:modelValue":u[2]||(u[2]=f=>n.value.email=f),type:"email",class:Kt(["form-control",{"is-invalid":N(s).errors?.email}]),placeholder:"name@example.com",required:""},null,2),[[Nt,n.value.email]]),N(s).errors?.email?(L(),B("div",h1,U(N(s).errors.email[0]),1)):bt("",!0)]),g("div",p1,[u[11]||(u[11]=g("label",{for:"dob",class:"form-label"},"Date of Birth (Optional)",-1)),Ot(g("input",{id:"dob","onUpdate:modelValue":u[3]||(u[3]=f=>n.value.date_of_birth=f),type:"date",class:Kt(["form-control",{"is-invalid":N(s).errors?.date_of_birth}])},null,2),[[Nt,n.value.date_of_birth]]),N(s).errors?.date_of_birth?(L(),B("div",g1,U(N(s).errors.date_of_birth[0]),1)):bt("",!0)]),g("div",m1,[u[12]||(u[12]=g("label",{for:"password1",class:"form-label"},"Password",-1)),Ot(g("input",{id:"password1","onUpdate:modelValue":u[4]||(u[4]=f=>n.value.password1=f),type:"password",class:Kt(["form-control",{"is-invalid":N(s).errors?.password1}]),placeholder:"Enter password",required:""},null,2),[[Nt,n.value.password1]]),N(s).errors?.password1?(L(),B("div",_1,U(N(s).errors.password1[0]),1)):bt("",!0),u[13]||(u[13]=g("small",{class:"text-muted"}," Password must be at least 8 characters and not entirely numeric. ",-1))]),g("div",b1,[u[14]||(u[14]=g("label",{for:"password2",class:"form-label"},"Confirm Password",-1)),Ot(g("input",{id:"password2","onUpdate:modelValue":u[5]||(u[5]=f=>n.value.password2=f),type:"password",class:Kt(["form-control",{"is-invalid":N(s).errors?.password2}]),placeholder:"Confirm password",required:""},null,2),[[Nt,n.value.password2]]),N(s).errors?.password2?(L(),B("div",v1,U(N(s).errors.password2[0]),1)):bt("",!0)]),g("button",{type:"submit",class:"btn btn-primary w-100",disabled:N(s).loading},U(N(s).loading?"Creating account...":"Sign Up"),9,y1)],32),g("p",x1,[u[16]||(u[16]=rt(" Already have an account? ",-1)),dt(d,{to:"/login",class:"text-decoration-none"},{default:Ht(()=>[...u[15]||(u[15]=[rt("Login",-1)])]),_:1})])])])}}}),S1=Ye(E1,[["__scopeId","data-v-d7e19a82"]]),C1={class:"container mt-4"},A1={class:"row justify-content-center"},T1={class:"col-md-8"},O1={class:"card shadow-sm"},k1={class:"card-body"},D1={class:"d-flex justify-content-between align-items-center mb-4"},M1={key:0,class:"alert alert-success",role:"alert"},P1={key:1},I1={class:"text-center mb-4"},L1=["src"],R1={class:"profile-info"},$1={class:"mb-3"},N1={class:"fs-5"},F1={class:"mb-3"},B1={class:"fs-5"},V1={class:"mb-3"},H1={class:"fs-5"},j1={class:"mb-3"},W1={class:"fs-5"},z1={key:2},U1={key:0,class:"alert alert-danger",role:"alert"},K1={class:"text-center mb-4"},Y1=["src"],q1={class:"mb-3"},G1={key:0,class:"invalid-feedback"},X1={class:"mb-3"},Q1={key:0,class:"invalid-feedback"},J1={class:"mb-3"},Z1=["value"],tw={class:"mb-3"},ew=["value"],sw={class:"d-flex gap-2"},nw=["disabled"],iw=["disabled"],dd="https://upload.wikimedia.org/wikipedia/commons/7/7c/Profile_avatar_placeholder_large.png",ow=zt({__name:"ProfilePage",setup(e){const t=Ae(),s=ft(!1),n=ug(),i=ft(null),o=ft({email:t.user?.email||"",date_of_birth:t.user?.date_of_birth||void 0,currency_preference:t.user?.currency_preference||"USD"}),r=m=>{const p=fo[m];return`${p.symbol} ${p.name}`},a=ft(null),l=ft(null),c=gt(()=>a.value?URL.createObjectURL(a.value):t.user?.profile_image||dd),u=()=>{s.value=!0,l.value=null,t.error=null,t.errors=null,o.value={email:t.user?.email||"",date_of_birth:t.user?.date_of_birth||void 0,currency_preference:t.user?.currency_preference||"USD"},a.value=null},d=m=>{const p=m.target;p.files&&p.files[0]&&(a.value=p.files[0])},f=async()=>{l.value=null;const m={email:o.value.email,date_of_birth:o.value.date_of_birth,currency_preference:o.value.currency_preference};a.value&&(m.profile_image=a.value),await t.updateProfile(m)&&(s.value=!1,a.value=null,l.value="Profile updated successfully!",setTimeout(()=>{l.value=null},3e3))},h=()=>{s.value=!1,a.value=null,l.value=null,t.error=null,t.errors=null};return(m,p)=>(L(),B("div",C1,[g("div",A1,[g("div",T1,[g("div",O1,[g("div",k1,[g("div",D1,[p[5]||(p[5]=g("h2",{class:"mb-0"},"My Profile",-1)),s.value?bt("",!0):(L(),B("button",{key:0,onClick:u,class:"btn btn-primary"},[...p[4]||(p[4]=[g("i",{class:"bi bi-pencil me-1"},null,-1),rt(" Edit Profile ",-1)])]))]),l.value?(L(),B("div",M1,U(l.value),1)):bt("",!0),!s.value&&N(t).user?(L(),B("div",P1,[g("div",I1,[g("img",{src:N(t).user.profile_image||dd,class:"profile-image-large",alt:"Profile"},null,8,L1)]),g("div",R1,[g("div",$1,[p[6]||(p[6]=g("label",{class:"form-label fw-bold text-muted"},"Username",-1)),g("p",N1,U(N(t).user.username),1)]),g("div",F1,[p[7]||(p[7]=g("label",{class:"form-label fw-bold text-muted"},"Email",-1)),g("p",B1,U(N(t).user.email),1)]),g("div",V1,[p[8]||(p[8]=g("label",{class:"form-label fw-bold text-muted"},"Date of Birth",-1)),g("p",H1,U(N(t).user.date_of_birth||"Not provided"),1)]),g("div",j1,[p[9]||(p[9]=g("label",{class:"form-label fw-bold text-muted"},"Currency",-1)),g("p",W1,U(r(N(t).user.currency_preference)),1)])])])):(L(),B("div",z1,[N(t).error?(L(),B("div",U1,U(N(t).error),1)):bt("",!0),g("form",{onSubmit:os(f,["prevent"])},[g("div",K1,[g("div",{class:"profile-upload-container",onClick:p[0]||(p[0]=_=>i.value?.click())},[g("img",{src:c.value,class:"profile-image-large",alt:"Profile"},null,8,Y1),p[10]||(p[10]=g("div",{class:"upload-overlay"},[g("i",{class:"bi bi-camera"}),g("br"),rt(" CHANGE ")],-1))]),g("input",{ref_key:"fileInput",ref:i,type:"file",accept:"image/jpeg,image/jpg,image/png",onChange:d,style:{display:"none"}},null,544),p[11]||(p[11]=g("br",null,null,-1)),p[12]||(p[12]=g("small",{class:"text-muted"},"Click to change profile image",-1))]),g("div",q1,[p[13]||(p[13]=g("label",{for:"email",class:"form-label"},"Email",-1)),Ot(g("input",{id:"email","onUpdate:modelValue":p[1]||(p[1]=_=>o.value.email=_),type:"email",class:Kt(["form-control",{"is-invalid":N(t).errors?.email}]),required:""},null,2),[[Nt,o.value.email]]),N(t).errors?.email?(L(),B("div",G1,U(N(t).errors.email.join(", ")),1)):bt("",!0)]),g("div",X1,[p[14]||(p[14]=g("label",{for:"dob",class:"form-label"},"Date of Birth",-1)),Ot(g("input",{id:"dob","onUpdate:modelValue":p[2]||(p[2]=_=>o.value.date_of_birth=_),type:"date",class:Kt(["form-control",{"is-invalid":N(t).errors?.date_of_birth}])},null,2),[[Nt,o.value.date_of_birth]]),N(t).errors?.date_of_birth?(L(),B("div",Q1,U(N(t).errors.date_of_birth.join(", ")),1)):bt("",!0)]),g("div",J1,[p[15]||(p[15]=g("label",{for:"currency",class:"form-label"},"Display Currency",-1)),Ot(g("select",{id:"currency","onUpdate:modelValue":p[3]||(p[3]=_=>o.value.currency_preference=_),class:"form-select"},[(L(!0),B(It,null,We(N(n),_=>(L(),B("option",{key:_.code,value:_.code},U(_.symbol)+" - "+U(_.name),9,Z1))),128))],512),[[jp,o.value.currency_preference]]),p[16]||(p[16]=g("small",{class:"text-muted"},"Prices will be displayed in this currency",-1))]),g("div",tw,[p[17]||(p[17]=g("label",{class:"form-label"},"Username",-1)),g("input",{type:"text",class:"form-control",value:N(t).user?.username,disabled:""},null,8,ew),p[18]||(p[18]=g("small",{class:"text-muted"},"Username cannot be changed",-1))]),g("div",sw,[g("button",{type:"submit",class:"btn btn-primary",disabled:N(t).loading},[p[19]||(p[19]=g("i",{class:"bi bi-check-circle me-1"},null,-1)),rt(" "+U(N(t).loading?"Saving...":"Save Changes"),1)],8,nw),g("button",{type:"button",onClick:h,class:"btn btn-secondary",disabled:N(t).loading},[...p[20]||(p[20]=[g("i",{class:"bi bi-x-circle me-1"},null,-1),rt(" Cancel ",-1)])],8,iw)])],32)]))])])])])]))}}),rw=Ye(ow,[["__scopeId","data-v-39343ee6"]]),aw={},lw={class:"card h-100"};function cw(e,t){return L(),B("div",lw,[...t[0]||(t[0]=[Ip('<div class="skeleton" style="height:200px;" data-v-d4445bd6></div><div class="card-body" data-v-d4445bd6><div class="skeleton mb-2" style="height:24px;width:70%;" data-v-d4445bd6></div><div class="skeleton mb-2" style="height:16px;width:100%;" data-v-d4445bd6></div><div class="skeleton mb-2" style="height:16px;width:80%;" data-v-d4445bd6></div><div class="mt-3" data-v-d4445bd6><div class="d-flex justify-content-between mb-2" data-v-d4445bd6><div class="skeleton" style="height:20px;width:80px;" data-v-d4445bd6></div><div class="skeleton" style="height:20px;width:50px;" data-v-d4445bd6></div></div><div class="skeleton" style="height:16px;width:120px;" data-v-d4445bd6></div></div></div>',2)])])}const uw=Ye(aw,[["render",cw],["__scopeId","data-v-d4445bd6"]]),dw={class:"container-fluid mt-4"},fw={class:"row"},hw={class:"col-lg-3 col-md-4 mb-4"},pw={class:"card filter-card sticky-top"},gw={class:"card-header d-flex justify-content-between align-items-center"},mw={class:"card-body"},_w={class:"mb-4"},bw={class:"mb-4"},vw={class:"row g-2"},yw={class:"col-6"},xw={class:"col-6"},ww={key:0,class:"text-muted"},Ew={class:"mb-4"},Sw={class:"form-check"},Cw={class:"form-check"},Aw={class:"form-check"},Tw={key:0,class:"alert alert-info py-2 mb-0"},Ow={class:"col-lg-9 col-md-8"},kw={class:"d-flex justify-content-between align-items-center mb-3"},Dw={class:"text-muted"},Mw={class:"search-section mb-4"},Pw={class:"input-group input-group-lg"},Iw={key:0,class:"row g-4"},Lw={key:1,class:"alert alert-danger"},Rw={key:2,class:"text-center py-5"},$w={key:3,class:"row g-4"},Nw=zt({__name:"ItemsListPage",setup(e){const t=Do(),s=on(),n=ft(""),i=ft("newest"),o=ft(null),r=ft(null),a=ft(!0),l=ft(!1),c=ft(!1),u=gt(()=>{let y=[...t.items];switch(y=y.filter(v=>{const E=parseFloat(v.current_price);if(o.value!==null&&E<o.value||r.value!==null&&E>r.value||!a.value&&!v.is_ended)return!1;if(l.value){const S=(new Date(v.end_date).getTime()-Date.now())/36e5;if(S>=24||S<0)return!1}return!(c.value&&v.bid_count>0)}),i.value){case"newest":y.sort((v,E)=>new Date(E.created_at).getTime()-new Date(v.created_at).getTime());break;case"ending-soon":y.sort((v,E)=>new Date(v.end_date).getTime()-new Date(E.end_date).getTime());break;case"price-low":y.sort((v,E)=>parseFloat(v.current_price)-parseFloat(E.current_price));break;case"price-high":y.sort((v,E)=>parseFloat(E.current_price)-parseFloat(v.current_price));break;case"most-bids":y.sort((v,E)=>E.bid_count-v.bid_count);break}return y}),d=gt(()=>o.value!==null||r.value!==null||!a.value||l.value||c.value||i.value!=="newest"),f=gt(()=>{let y=0;return(o.value!==null||r.value!==null)&&y++,a.value||y++,l.value&&y++,c.value&&y++,i.value!=="newest"&&y++,y}),h=()=>{o.value=null,r.value=null,a.value=!0,l.value=!1,c.value=!1,i.value="newest",n.value="",t.fetchItems()},m=()=>{n.value="",t.fetchItems()};let p;const _=()=>{clearTimeout(p),p=setTimeout(()=>{t.fetchItems(n.value)},300)},b=y=>{s.push(`/items/${y}`)};return fs(()=>{t.fetchItems()}),(y,v)=>{const E=be("router-link");return L(),B("div",dw,[g("div",fw,[g("div",hw,[g("div",pw,[g("div",gw,[v[7]||(v[7]=g("h5",{class:"mb-0"},[g("i",{class:"bi bi-funnel me-2"}),rt("Filters")],-1)),d.value?(L(),B("button",{key:0,class:"btn btn-sm btn-link text-decoration-none",onClick:h}," Reset ")):bt("",!0)]),g("div",mw,[g("div",_w,[v[9]||(v[9]=g("label",{class:"form-label fw-bold"},[g("i",{class:"bi bi-sort-down me-2"}),rt("Sort By ")],-1)),Ot(g("select",{"onUpdate:modelValue":v[0]||(v[0]=S=>i.value=S),class:"form-select form-select-sm"},[...v[8]||(v[8]=[Ip('<option value="newest" data-v-1d2f013b>Newest First</option><option value="ending-soon" data-v-1d2f013b>Ending Soon</option><option value="price-low" data-v-1d2f013b>Price: Low to High</option><option value="price-high" data-v-1d2f013b>Price: High to Low</option><option value="most-bids" data-v-1d2f013b>Most Bids</option>',5)])],512),[[jp,i.value]])]),g("div",bw,[v[10]||(v[10]=g("label",{class:"form-label fw-bold"},[g("i",{class:"bi bi-currency-dollar me-2"}),rt("Price Range ")],-1)),g("div",vw,[g("div",yw,[Ot(g("input",{"onUpdate:modelValue":v[1]||(v[1]=S=>o.value=S),type:"number",class:"form-control form-control-sm",placeholder:"Min",min:"0",step:"1"},null,512),[[Nt,o.value,void 0,{number:!0}]])]),g("div",xw,[Ot(g("input",{"onUpdate:modelValue":v[2]||(v[2]=S=>r.value=S),type:"number",class:"form-control form-control-sm",placeholder:"Max",min:"0",step:"1"},null,512),[[Nt,r.value,void 0,{number:!0}]])])]),o.value||r.value?(L(),B("small",ww,U(o.value||"0")+" - "+U(r.value||"∞"),1)):bt("",!0)]),g("div",Ew,[v[14]||(v[14]=g("label",{class:"form-label fw-bold"},[g("i",{class:"bi bi-clock-history me-2"}),rt("Status ")],-1)),g("div",Sw,[Ot(g("input",{"onUpdate:modelValue":v[3]||(v[3]=S=>a.value=S),class:"form-check-input",type:"checkbox",id:"showActive"},null,512),[[Na,a.value]]),v[11]||(v[11]=g("label",{class:"form-check-label",for:"showActive"}," Active Auctions ",-1))]),g("div",Cw,[Ot(g("input",{"onUpdate:modelValue":v[4]||(v[4]=S=>l.value=S),class:"form-check-input",type:"checkbox",id:"showEndingSoon"},null,512),[[Na,l.value]]),v[12]||(v[12]=g("label",{class:"form-check-label",for:"showEndingSoon"}," Ending Soon (<24h) ",-1))]),g("div",Aw,[Ot(g("input",{"onUpdate:modelValue":v[5]||(v[5]=S=>c.value=S),class:"form-check-input",type:"checkbox",id:"showNoBids"},null,512),[[Na,c.value]]),v[13]||(v[13]=g("label",{class:"form-check-label",for:"showNoBids"}," No Bids Yet ",-1))])]),d.value?(L(),B("div",Tw,[g("small",null,[v[15]||(v[15]=g("i",{class:"bi bi-info-circle me-1"},null,-1)),g("strong",null,U(f.value),1),v[16]||(v[16]=rt(" filter(s) active ",-1))])])):bt("",!0)])])]),g("div",Ow,[g("div",kw,[g("div",null,[v[18]||(v[18]=g("h2",{class:"mb-1"},"Auction Items",-1)),g("small",Dw,[v[17]||(v[17]=g("i",{class:"bi bi-grid-3x3-gap me-1"},null,-1)),rt(" "+U(u.value.length)+" item(s) found ",1)])]),dt(E,{to:"/items/create",class:"btn btn-primary"},{default:Ht(()=>[...v[19]||(v[19]=[g("i",{class:"bi bi-plus-circle me-2"},null,-1),rt("Create Listing ",-1)])]),_:1})]),g("div",Mw,[g("div",Pw,[v[21]||(v[21]=g("span",{class:"input-group-text bg-white"},[g("i",{class:"bi bi-search"})],-1)),Ot(g("input",{"onUpdate:modelValue":v[6]||(v[6]=S=>n.value=S),onInput:_,type:"text",class:"form-control",placeholder:"Search items by title or description..."},null,544),[[Nt,n.value]]),n.value?(L(),B("button",{key:0,class:"btn btn-outline-secondary",type:"button",onClick:m},[...v[20]||(v[20]=[g("i",{class:"bi bi-x-lg"},null,-1)])])):bt("",!0)])]),N(t).loading?(L(),B("div",Iw,[(L(),B(It,null,We(6,S=>g("div",{key:S,class:"col-lg-4 col-md-6"},[dt(uw)])),64))])):N(t).error?(L(),B("div",Lw,[v[22]||(v[22]=g("i",{class:"bi bi-exclamation-triangle me-2"},null,-1)),rt(U(N(t).error),1)])):u.value.length===0?(L(),B("div",Rw,[v[23]||(v[23]=g("i",{class:"bi bi-inbox fs-1 text-muted d-block mb-3"},null,-1)),v[24]||(v[24]=g("h4",{class:"text-muted"},"No items match your filters",-1)),v[25]||(v[25]=g("p",{class:"text-muted"},"Try adjusting your search or filters.",-1)),g("button",{class:"btn btn-outline-primary",onClick:h}," Clear All Filters ")])):(L(),B("div",$w,[(L(!0),B(It,null,We(u.value,S=>(L(),B("div",{key:S.id,class:"col-lg-4 col-md-6"},[dt(mr,{item:S,onClick:O=>b(S.id)},null,8,["item","onClick"])]))),128))]))])])])}}}),Fw=Ye(Nw,[["__scopeId","data-v-1d2f013b"]]);var Bw=Object.defineProperty,fd=Object.getOwnPropertySymbols,Vw=Object.prototype.hasOwnProperty,Hw=Object.prototype.propertyIsEnumerable,hd=(e,t,s)=>t in e?Bw(e,t,{enumerable:!0,configurable:!0,writable:!0,value:s}):e[t]=s,dg=(e,t)=>{for(var s in t||(t={}))Vw.call(t,s)&&hd(e,s,t[s]);if(fd)for(var s of fd(t))Hw.call(t,s)&&hd(e,s,t[s]);return e},ua=e=>typeof e=="function",da=e=>typeof e=="string",fg=e=>da(e)&&e.trim().length>0,jw=e=>typeof e=="number",wn=e=>typeof e>"u",ho=e=>typeof e=="object"&&e!==null,Ww=e=>rs(e,"tag")&&fg(e.tag),hg=e=>window.TouchEvent&&e instanceof TouchEvent,pg=e=>rs(e,"component")&&gg(e.component),zw=e=>ua(e)||ho(e),gg=e=>!wn(e)&&(da(e)||zw(e)||pg(e)),pd=e=>ho(e)&&["height","width","right","left","top","bottom"].every(t=>jw(e[t])),rs=(e,t)=>(ho(e)||ua(e))&&t in e,Uw=(e=>()=>e++)(0);function ja(e){return hg(e)?e.targetTouches[0].clientX:e.clientX}function gd(e){return hg(e)?e.targetTouches[0].clientY:e.clientY}var Kw=e=>{wn(e.remove)?e.parentNode&&e.parentNode.removeChild(e):e.remove()},Mo=e=>pg(e)?Mo(e.component):Ww(e)?zt({render(){return e}}):typeof e=="string"?e:_t(N(e)),Yw=e=>{if(typeof e=="string")return e;const t=rs(e,"props")&&ho(e.props)?e.props:{},s=rs(e,"listeners")&&ho(e.listeners)?e.listeners:{};return{component:Mo(e),props:t,listeners:s}},qw=()=>typeof window<"u",wc=class{constructor(){this.allHandlers={}}getHandlers(e){return this.allHandlers[e]||[]}on(e,t){const s=this.getHandlers(e);s.push(t),this.allHandlers[e]=s}off(e,t){const s=this.getHandlers(e);s.splice(s.indexOf(t)>>>0,1)}emit(e,t){this.getHandlers(e).forEach(n=>n(t))}},Gw=e=>["on","off","emit"].every(t=>rs(e,t)&&ua(e[t])),we;(function(e){e.SUCCESS="success",e.ERROR="error",e.WARNING="warning",e.INFO="info",e.DEFAULT="default"})(we||(we={}));var Rr;(function(e){e.TOP_LEFT="top-left",e.TOP_CENTER="top-center",e.TOP_RIGHT="top-right",e.BOTTOM_LEFT="bottom-left",e.BOTTOM_CENTER="bottom-center",e.BOTTOM_RIGHT="bottom-right"})(Rr||(Rr={}));var Ee;(function(e){e.ADD="add",e.DISMISS="dismiss",e.UPDATE="update",e.CLEAR="clear",e.UPDATE_DEFAULTS="update_defaults"})(Ee||(Ee={}));var Ve="Vue-Toastification",Be={type:{type:String,default:we.DEFAULT},classNames:{type:[String,Array],default:()=>[]},trueBoolean:{type:Boolean,default:!0}},mg={type:Be.type,customIcon:{type:[String,Boolean,Object,Function],default:!0}},_r={component:{type:[String,Object,Function,Boolean],default:"button"},classNames:Be.classNames,showOnHover:{type:Boolean,default:!1},ariaLabel:{type:String,default:"close"}},Rl={timeout:{type:[Number,Boolean],default:5e3},hideProgressBar:{type:Boolean,default:!1},isRunning:{type:Boolean,default:!1}},_g={transition:{type:[Object,String],default:`${Ve}__bounce`}},Xw={position:{type:String,default:Rr.TOP_RIGHT},draggable:Be.trueBoolean,draggablePercent:{type:Number,default:.6},pauseOnFocusLoss:Be.trueBoolean,pauseOnHover:Be.trueBoolean,closeOnClick:Be.trueBoolean,timeout:Rl.timeout,hideProgressBar:Rl.hideProgressBar,toastClassName:Be.classNames,bodyClassName:Be.classNames,icon:mg.customIcon,closeButton:_r.component,closeButtonClassName:_r.classNames,showCloseButtonOnHover:_r.showOnHover,accessibility:{type:Object,default:()=>({toastRole:"alert",closeButtonLabel:"close"})},rtl:{type:Boolean,default:!1},eventBus:{type:Object,required:!1,default:()=>new wc}},Qw={id:{type:[String,Number],required:!0,default:0},type:Be.type,content:{type:[String,Object,Function],required:!0,default:""},onClick:{type:Function,default:void 0},onClose:{type:Function,default:void 0}},Jw={container:{type:[Object,Function],default:()=>document.body},newestOnTop:Be.trueBoolean,maxToasts:{type:Number,default:20},transition:_g.transition,toastDefaults:Object,filterBeforeCreate:{type:Function,default:e=>e},filterToasts:{type:Function,default:e=>e},containerClassName:Be.classNames,onMounted:Function,shareAppContext:[Boolean,Object]},As={CORE_TOAST:Xw,TOAST:Qw,CONTAINER:Jw,PROGRESS_BAR:Rl,ICON:mg,TRANSITION:_g,CLOSE_BUTTON:_r},bg=zt({name:"VtProgressBar",props:As.PROGRESS_BAR,data(){return{hasClass:!0}},computed:{style(){return{animationDuration:`${this.timeout}ms`,animationPlayState:this.isRunning?"running":"paused",opacity:this.hideProgressBar?0:1}},cpClass(){return this.hasClass?`${Ve}__progress-bar`:""}},watch:{timeout(){this.hasClass=!1,this.$nextTick(()=>this.hasClass=!0)}},mounted(){this.$el.addEventListener("animationend",this.animationEnded)},beforeUnmount(){this.$el.removeEventListener("animationend",this.animationEnded)},methods:{animationEnded(){this.$emit("close-toast")}}});function Zw(e,t){return L(),B("div",{style:Eo(e.style),class:Kt(e.cpClass)},null,6)}bg.render=Zw;var tE=bg,vg=zt({name:"VtCloseButton",props:As.CLOSE_BUTTON,computed:{buttonComponent(){return this.component!==!1?Mo(this.component):"button"},classes(){const e=[`${Ve}__close-button`];return this.showOnHover&&e.push("show-on-hover"),e.concat(this.classNames)}}}),eE=rt(" × ");function sE(e,t){return L(),Pe(gc(e.buttonComponent),ia({"aria-label":e.ariaLabel,class:e.classes},e.$attrs),{default:Ht(()=>[eE]),_:1},16,["aria-label","class"])}vg.render=sE;var nE=vg,yg={},iE={"aria-hidden":"true",focusable:"false","data-prefix":"fas","data-icon":"check-circle",class:"svg-inline--fa fa-check-circle fa-w-16",role:"img",xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 512 512"},oE=g("path",{fill:"currentColor",d:"M504 256c0 136.967-111.033 248-248 248S8 392.967 8 256 119.033 8 256 8s248 111.033 248 248zM227.314 387.314l184-184c6.248-6.248 6.248-16.379 0-22.627l-22.627-22.627c-6.248-6.249-16.379-6.249-22.628 0L216 308.118l-70.059-70.059c-6.248-6.248-16.379-6.248-22.628 0l-22.627 22.627c-6.248 6.248-6.248 16.379 0 22.627l104 104c6.249 6.249 16.379 6.249 22.628.001z"},null,-1),rE=[oE];function aE(e,t){return L(),B("svg",iE,rE)}yg.render=aE;var lE=yg,xg={},cE={"aria-hidden":"true",focusable:"false","data-prefix":"fas","data-icon":"info-circle",class:"svg-inline--fa fa-info-circle fa-w-16",role:"img",xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 512 512"},uE=g("path",{fill:"currentColor",d:"M256 8C119.043 8 8 119.083 8 256c0 136.997 111.043 248 248 248s248-111.003 248-248C504 119.083 392.957 8 256 8zm0 110c23.196 0 42 18.804 42 42s-18.804 42-42 42-42-18.804-42-42 18.804-42 42-42zm56 254c0 6.627-5.373 12-12 12h-88c-6.627 0-12-5.373-12-12v-24c0-6.627 5.373-12 12-12h12v-64h-12c-6.627 0-12-5.373-12-12v-24c0-6.627 5.373-12 12-12h64c6.627 0 12 5.373 12 12v100h12c6.627 0 12 5.373 12 12v24z"},null,-1),dE=[uE];function fE(e,t){return L(),B("svg",cE,dE)}xg.render=fE;var md=xg,wg={},hE={"aria-hidden":"true",focusable:"false","data-prefix":"fas","data-icon":"exclamation-circle",class:"svg-inline--fa fa-exclamation-circle fa-w-16",role:"img",xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 512 512"},pE=g("path",{fill:"currentColor",d:"M504 256c0 136.997-111.043 248-248 248S8 392.997 8 256C8 119.083 119.043 8 256 8s248 111.083 248 248zm-248 50c-25.405 0-46 20.595-46 46s20.595 46 46 46 46-20.595 46-46-20.595-46-46-46zm-43.673-165.346l7.418 136c.347 6.364 5.609 11.346 11.982 11.346h48.546c6.373 0 11.635-4.982 11.982-11.346l7.418-136c.375-6.874-5.098-12.654-11.982-12.654h-63.383c-6.884 0-12.356 5.78-11.981 12.654z"},null,-1),gE=[pE];function mE(e,t){return L(),B("svg",hE,gE)}wg.render=mE;var _E=wg,Eg={},bE={"aria-hidden":"true",focusable:"false","data-prefix":"fas","data-icon":"exclamation-triangle",class:"svg-inline--fa fa-exclamation-triangle fa-w-18",role:"img",xmlns:"http://www.w3.org/2000/svg",viewBox:"0 0 576 512"},vE=g("path",{fill:"currentColor",d:"M569.517 440.013C587.975 472.007 564.806 512 527.94 512H48.054c-36.937 0-59.999-40.055-41.577-71.987L246.423 23.985c18.467-32.009 64.72-31.951 83.154 0l239.94 416.028zM288 354c-25.405 0-46 20.595-46 46s20.595 46 46 46 46-20.595 46-46-20.595-46-46-46zm-43.673-165.346l7.418 136c.347 6.364 5.609 11.346 11.982 11.346h48.546c6.373 0 11.635-4.982 11.982-11.346l7.418-136c.375-6.874-5.098-12.654-11.982-12.654h-63.383c-6.884 0-12.356 5.78-11.981 12.654z"},null,-1),yE=[vE];function xE(e,t){return L(),B("svg",bE,yE)}Eg.render=xE;var wE=Eg,Sg=zt({name:"VtIcon",props:As.ICON,computed:{customIconChildren(){return rs(this.customIcon,"iconChildren")?this.trimValue(this.customIcon.iconChildren):""},customIconClass(){return da(this.customIcon)?this.trimValue(this.customIcon):rs(this.customIcon,"iconClass")?this.trimValue(this.customIcon.iconClass):""},customIconTag(){return rs(this.customIcon,"iconTag")?this.trimValue(this.customIcon.iconTag,"i"):"i"},hasCustomIcon(){return this.customIconClass.length>0},component(){return this.hasCustomIcon?this.customIconTag:gg(this.customIcon)?Mo(this.customIcon):this.iconTypeComponent},iconTypeComponent(){return{[we.DEFAULT]:md,[we.INFO]:md,[we.SUCCESS]:lE,[we.ERROR]:wE,[we.WARNING]:_E}[this.type]},iconClasses(){const e=[`${Ve}__icon`];return this.hasCustomIcon?e.concat(this.customIconClass):e}},methods:{trimValue(e,t=""){return fg(e)?e.trim():t}}});function EE(e,t){return L(),Pe(gc(e.component),{class:Kt(e.iconClasses)},{default:Ht(()=>[rt(U(e.customIconChildren),1)]),_:1},8,["class"])}Sg.render=EE;var SE=Sg,Cg=zt({name:"VtToast",components:{ProgressBar:tE,CloseButton:nE,Icon:SE},inheritAttrs:!1,props:Object.assign({},As.CORE_TOAST,As.TOAST),data(){return{isRunning:!0,disableTransitions:!1,beingDragged:!1,dragStart:0,dragPos:{x:0,y:0},dragRect:{}}},computed:{classes(){const e=[`${Ve}__toast`,`${Ve}__toast--${this.type}`,`${this.position}`].concat(this.toastClassName);return this.disableTransitions&&e.push("disable-transition"),this.rtl&&e.push(`${Ve}__toast--rtl`),e},bodyClasses(){return[`${Ve}__toast-${da(this.content)?"body":"component-body"}`].concat(this.bodyClassName)},draggableStyle(){return this.dragStart===this.dragPos.x?{}:this.beingDragged?{transform:`translateX(${this.dragDelta}px)`,opacity:1-Math.abs(this.dragDelta/this.removalDistance)}:{transition:"transform 0.2s, opacity 0.2s",transform:"translateX(0)",opacity:1}},dragDelta(){return this.beingDragged?this.dragPos.x-this.dragStart:0},removalDistance(){return pd(this.dragRect)?(this.dragRect.right-this.dragRect.left)*this.draggablePercent:0}},mounted(){this.draggable&&this.draggableSetup(),this.pauseOnFocusLoss&&this.focusSetup()},beforeUnmount(){this.draggable&&this.draggableCleanup(),this.pauseOnFocusLoss&&this.focusCleanup()},methods:{hasProp:rs,getVueComponentFromObj:Mo,closeToast(){this.eventBus.emit(Ee.DISMISS,this.id)},clickHandler(){this.onClick&&this.onClick(this.closeToast),this.closeOnClick&&(!this.beingDragged||this.dragStart===this.dragPos.x)&&this.closeToast()},timeoutHandler(){this.closeToast()},hoverPause(){this.pauseOnHover&&(this.isRunning=!1)},hoverPlay(){this.pauseOnHover&&(this.isRunning=!0)},focusPause(){this.isRunning=!1},focusPlay(){this.isRunning=!0},focusSetup(){addEventListener("blur",this.focusPause),addEventListener("focus",this.focusPlay)},focusCleanup(){removeEventListener("blur",this.focusPause),removeEventListener("focus",this.focusPlay)},draggableSetup(){const e=this.$el;e.addEventListener("touchstart",this.onDragStart,{passive:!0}),e.addEventListener("mousedown",this.onDragStart),addEventListener("touchmove",this.onDragMove,{passive:!1}),addEventListener("mousemove",this.onDragMove),addEventListener("touchend",this.onDragEnd),addEventListener("mouseup",this.onDragEnd)},draggableCleanup(){const e=this.$el;e.removeEventListener("touchstart",this.onDragStart),e.removeEventListener("mousedown",this.onDragStart),removeEventListener("touchmove",this.onDragMove),removeEventListener("mousemove",this.onDragMove),removeEventListener("touchend",this.onDragEnd),removeEventListener("mouseup",this.onDragEnd)},onDragStart(e){this.beingDragged=!0,this.dragPos={x:ja(e),y:gd(e)},this.dragStart=ja(e),this.dragRect=this.$el.getBoundingClientRect()},onDragMove(e){this.beingDragged&&(e.preventDefault(),this.isRunning&&(this.isRunning=!1),this.dragPos={x:ja(e),y:gd(e)})},onDragEnd(){this.beingDragged&&(Math.abs(this.dragDelta)>=this.removalDistance?(this.disableTransitions=!0,this.$nextTick(()=>this.closeToast())):setTimeout(()=>{this.beingDragged=!1,pd(this.dragRect)&&this.pauseOnHover&&this.dragRect.bottom>=this.dragPos.y&&this.dragPos.y>=this.dragRect.top&&this.dragRect.left<=this.dragPos.x&&this.dragPos.x<=this.dragRect.right?this.isRunning=!1:this.isRunning=!0}))}}}),CE=["role"];function AE(e,t){const s=be("Icon"),n=be("CloseButton"),i=be("ProgressBar");return L(),B("div",{class:Kt(e.classes),style:Eo(e.draggableStyle),onClick:t[0]||(t[0]=(...o)=>e.clickHandler&&e.clickHandler(...o)),onMouseenter:t[1]||(t[1]=(...o)=>e.hoverPause&&e.hoverPause(...o)),onMouseleave:t[2]||(t[2]=(...o)=>e.hoverPlay&&e.hoverPlay(...o))},[e.icon?(L(),Pe(s,{key:0,"custom-icon":e.icon,type:e.type},null,8,["custom-icon","type"])):bt("v-if",!0),g("div",{role:e.accessibility.toastRole||"alert",class:Kt(e.bodyClasses)},[typeof e.content=="string"?(L(),B(It,{key:0},[rt(U(e.content),1)],2112)):(L(),Pe(gc(e.getVueComponentFromObj(e.content)),ia({key:1,"toast-id":e.id},e.hasProp(e.content,"props")?e.content.props:{},$b(e.hasProp(e.content,"listeners")?e.content.listeners:{}),{onCloseToast:e.closeToast}),null,16,["toast-id","onCloseToast"]))],10,CE),e.closeButton?(L(),Pe(n,{key:1,component:e.closeButton,"class-names":e.closeButtonClassName,"show-on-hover":e.showCloseButtonOnHover,"aria-label":e.accessibility.closeButtonLabel,onClick:os(e.closeToast,["stop"])},null,8,["component","class-names","show-on-hover","aria-label","onClick"])):bt("v-if",!0),e.timeout?(L(),Pe(i,{key:2,"is-running":e.isRunning,"hide-progress-bar":e.hideProgressBar,timeout:e.timeout,onCloseToast:e.timeoutHandler},null,8,["is-running","hide-progress-bar","timeout","onCloseToast"])):bt("v-if",!0)],38)}Cg.render=AE;var TE=Cg,Ag=zt({name:"VtTransition",props:As.TRANSITION,emits:["leave"],methods:{hasProp:rs,leave(e){e instanceof HTMLElement&&(e.style.left=e.offsetLeft+"px",e.style.top=e.offsetTop+"px",e.style.width=getComputedStyle(e).width,e.style.position="absolute")}}});function OE(e,t){return L(),Pe(Xv,{tag:"div","enter-active-class":e.transition.enter?e.transition.enter:`${e.transition}-enter-active`,"move-class":e.transition.move?e.transition.move:`${e.transition}-move`,"leave-active-class":e.transition.leave?e.transition.leave:`${e.transition}-leave-active`,onLeave:e.leave},{default:Ht(()=>[Rb(e.$slots,"default")]),_:3},8,["enter-active-class","move-class","leave-active-class","onLeave"])}Ag.render=OE;var kE=Ag,Tg=zt({name:"VueToastification",devtools:{hide:!0},components:{Toast:TE,VtTransition:kE},props:Object.assign({},As.CORE_TOAST,As.CONTAINER,As.TRANSITION),data(){return{count:0,positions:Object.values(Rr),toasts:{},defaults:{}}},computed:{toastArray(){return Object.values(this.toasts)},filteredToasts(){return this.defaults.filterToasts(this.toastArray)}},beforeMount(){const e=this.eventBus;e.on(Ee.ADD,this.addToast),e.on(Ee.CLEAR,this.clearToasts),e.on(Ee.DISMISS,this.dismissToast),e.on(Ee.UPDATE,this.updateToast),e.on(Ee.UPDATE_DEFAULTS,this.updateDefaults),this.defaults=this.$props},mounted(){this.setup(this.container)},methods:{async setup(e){ua(e)&&(e=await e()),Kw(this.$el),e.appendChild(this.$el)},setToast(e){wn(e.id)||(this.toasts[e.id]=e)},addToast(e){e.content=Yw(e.content);const t=Object.assign({},this.defaults,e.type&&this.defaults.toastDefaults&&this.defaults.toastDefaults[e.type],e),s=this.defaults.filterBeforeCreate(t,this.toastArray);s&&this.setToast(s)},dismissToast(e){const t=this.toasts[e];!wn(t)&&!wn(t.onClose)&&t.onClose(),delete this.toasts[e]},clearToasts(){Object.keys(this.toasts).forEach(e=>{this.dismissToast(e)})},getPositionToasts(e){const t=this.filteredToasts.filter(s=>s.position===e).slice(0,this.defaults.maxToasts);return this.defaults.newestOnTop?t.reverse():t},updateDefaults(e){wn(e.container)||this.setup(e.container),this.defaults=Object.assign({},this.defaults,e)},updateToast({id:e,options:t,create:s}){this.toasts[e]?(t.timeout&&t.timeout===this.toasts[e].timeout&&t.timeout++,this.setToast(Object.assign({},this.toasts[e],t))):s&&this.addToast(Object.assign({},{id:e},t))},getClasses(e){return[`${Ve}__container`,e].concat(this.defaults.containerClassName)}}});function DE(e,t){const s=be("Toast"),n=be("VtTransition");return L(),B("div",null,[(L(!0),B(It,null,We(e.positions,i=>(L(),B("div",{key:i},[dt(n,{transition:e.defaults.transition,class:Kt(e.getClasses(i))},{default:Ht(()=>[(L(!0),B(It,null,We(e.getPositionToasts(i),o=>(L(),Pe(s,ia({key:o.id},o),null,16))),128))]),_:2},1032,["transition","class"])]))),128))])}Tg.render=DE;var ME=Tg,_d=(e={},t=!0)=>{const s=e.eventBus=e.eventBus||new wc;t&&To(()=>{const o=zp(ME,dg({},e)),r=o.mount(document.createElement("div")),a=e.onMounted;if(wn(a)||a(r,o),e.shareAppContext){const l=e.shareAppContext;l===!0?console.warn(`[${Ve}] App to share context with was not provided.`):(o._context.components=l._context.components,o._context.directives=l._context.directives,o._context.mixins=l._context.mixins,o._context.provides=l._context.provides,o.config.globalProperties=l.config.globalProperties)}});const n=(o,r)=>{const a=Object.assign({},{id:Uw(),type:we.DEFAULT},r,{content:o});return s.emit(Ee.ADD,a),a.id};n.clear=()=>s.emit(Ee.CLEAR,void 0),n.updateDefaults=o=>{s.emit(Ee.UPDATE_DEFAULTS,o)},n.dismiss=o=>{s.emit(Ee.DISMISS,o)};function i(o,{content:r,options:a},l=!1){const c=Object.assign({},a,{content:r});s.emit(Ee.UPDATE,{id:o,options:c,create:l})}return n.update=i,n.success=(o,r)=>n(o,Object.assign({},r,{type:we.SUCCESS})),n.info=(o,r)=>n(o,Object.assign({},r,{type:we.INFO})),n.error=(o,r)=>n(o,Object.assign({},r,{type:we.ERROR})),n.warning=(o,r)=>n(o,Object.assign({},r,{type:we.WARNING})),n},PE=()=>{const e=()=>console.warn(`[${Ve}] This plugin does not support SSR!`);return new Proxy(e,{get(){return e}})};function Og(e){return qw()?Gw(e)?_d({eventBus:e},!1):_d(e,!0):PE()}var kg=Symbol("VueToastification"),Dg=new wc,IE=(e,t)=>{t?.shareAppContext===!0&&(t.shareAppContext=e);const s=Og(dg({eventBus:Dg},t));e.provide(kg,s)},Ec=e=>{const t=oa()?Ce(kg,void 0):void 0;return t||Og(Dg)},LE=IE;const RE={class:"container mt-4"},$E={class:"row justify-content-center"},NE={class:"col-md-8"},FE={class:"card"},BE={class:"card-body"},VE={key:0,class:"alert alert-danger"},HE={class:"mb-3"},jE=["src"],WE={key:1,class:"upload-placeholder"},zE={class:"mb-3"},UE={class:"mb-3"},KE={class:"mb-3"},YE={class:"mb-3"},qE=["min"],GE={class:"d-flex gap-2"},XE=["disabled"],QE=zt({__name:"CreateItemPage",setup(e){const t=Do(),s=on(),n=Ec(),i=ft(null),o=ft(""),r=ft({title:"",description:"",starting_price:"",picture:null,end_date:""}),a=gt(()=>{const d=new Date;return d.setMinutes(d.getMinutes()+10),d.toISOString().slice(0,16)}),l=()=>{i.value?.click()},c=d=>{const h=d.target.files?.[0];if(h){r.value.picture=h;const m=new FileReader;m.onload=p=>{o.value=p.target?.result},m.readAsDataURL(h)}},u=async()=>{if(!r.value.picture){n.warning("Please select an image");return}const d=new Date(r.value.end_date).toISOString();await t.createItem({...r.value,end_date:d})?(n.success("Item created successfully!"),s.push("/items")):n.error(t.error||"Failed to create item")};return fs(()=>{const d=new Date;d.setDate(d.getDate()+7),r.value.end_date=d.toISOString().slice(0,16)}),(d,f)=>{const h=be("router-link");return L(),B("div",RE,[g("div",$E,[g("div",NE,[g("div",FE,[g("div",BE,[f[11]||(f[11]=g("h2",{class:"card-title mb-4"},"Create Auction Listing",-1)),N(t).error?(L(),B("div",VE,U(N(t).error),1)):bt("",!0),g("form",{onSubmit:os(u,["prevent"])},[g("div",HE,[f[5]||(f[5]=g("label",{class:"form-label"},"Item Picture *",-1)),g("div",{class:"image-upload-container",onClick:l,role:"button"},[o.value?(L(),B("img",{key:0,src:o.value,alt:"Preview",class:"preview-image"},null,8,jE)):(L(),B("div",WE,[...f[4]||(f[4]=[g("span",null,"Click to upload image",-1)])]))]),g("input",{ref_key:"fileInput",ref:i,type:"file",accept:"image/jpeg,image/jpg,image/png",onChange:c,hidden:""},null,544)]),g("div",zE,[f[6]||(f[6]=g("label",{for:"title",class:"form-label"},"Title *",-1)),Ot(g("input",{"onUpdate:modelValue":f[0]||(f[0]=m=>r.value.title=m),type:"text",class:"form-control",id:"title",required:""},null,512),[[Nt,r.value.title]])]),g("div",UE,[f[7]||(f[7]=g("label",{for:"description",class:"form-label"},"Description *",-1)),Ot(g("textarea",{"onUpdate:modelValue":f[1]||(f[1]=m=>r.value.description=m),class:"form-control",id:"description",rows:"4",required:""},null,512),[[Nt,r.value.description]])]),g("div",KE,[f[8]||(f[8]=g("label",{for:"price",class:"form-label"},"Starting Price ($) *",-1)),Ot(g("input",{"onUpdate:modelValue":f[2]||(f[2]=m=>r.value.starting_price=m),type:"number",step:"0.01",min:"0.01",class:"form-control",id:"price",required:""},null,512),[[Nt,r.value.starting_price]])]),g("div",YE,[f[9]||(f[9]=g("label",{for:"endDate",class:"form-label"},"End Date & Time *",-1)),Ot(g("input",{"onUpdate:modelValue":f[3]||(f[3]=m=>r.value.end_date=m),type:"datetime-local",class:"form-control",id:"endDate",min:a.value,required:""},null,8,qE),[[Nt,r.value.end_date]])]),g("div",GE,[g("button",{type:"submit",class:"btn btn-primary",disabled:N(t).loading||!r.value.picture},U(N(t).loading?"Creating...":"Create Listing"),9,XE),dt(h,{to:"/items",class:"btn btn-secondary"},{default:Ht(()=>[...f[10]||(f[10]=[rt(" Cancel ",-1)])]),_:1})])],32)])])])])])}}}),JE=Ye(QE,[["__scopeId","data-v-a4787e58"]]),ZE={class:"container mt-4"},tS={class:"row justify-content-center"},eS={class:"col-md-8"},sS={class:"card"},nS={class:"card-body"},iS={key:0,class:"text-center py-4"},oS={key:1,class:"alert alert-danger"},rS={class:"mb-3"},aS=["src"],lS={key:1,class:"upload-placeholder"},cS={class:"mb-3"},uS={class:"mb-3"},dS={class:"mb-3"},fS=["value"],hS={class:"mb-3"},pS=["min"],gS={class:"d-flex gap-2"},mS=["disabled"],_S=zt({__name:"EditItemPage",setup(e){const t=lg(),s=on(),n=Do(),i=Ec(),o=gt(()=>Number(t.params.id)),r=ft(null),a=ft(""),l=ft(!0),c=ft(null),u=ft(null),d=ft({title:"",description:"",end_date:"",picture:void 0}),f=gt(()=>{const _=new Date;return _.setMinutes(_.getMinutes()+10),_.toISOString().slice(0,16)}),h=()=>{r.value?.click()},m=_=>{const y=_.target.files?.[0];if(y){d.value.picture=y;const v=new FileReader;v.onload=E=>{a.value=E.target?.result},v.readAsDataURL(y)}},p=async()=>{const _=new Date(d.value.end_date).toISOString();await n.updateItem(o.value,{...d.value,end_date:_})?(i.success("Item updated successfully!"),s.push(`/items/${o.value}`)):i.error(n.error||"Failed to update item")};return fs(async()=>{if(l.value=!0,await n.fetchItemDetail(o.value)&&n.currentItem){u.value=n.currentItem,d.value.title=n.currentItem.title,d.value.description=n.currentItem.description;const b=new Date(n.currentItem.end_date);d.value.end_date=b.toISOString().slice(0,16),n.currentItem.picture&&(a.value=n.currentItem.picture)}else c.value=n.error||"Failed to load item";l.value=!1}),(_,b)=>{const y=be("router-link");return L(),B("div",ZE,[g("div",tS,[g("div",eS,[g("div",sS,[g("div",nS,[b[13]||(b[13]=g("h2",{class:"card-title mb-4"},"Edit Listing",-1)),l.value?(L(),B("div",iS,[...b[3]||(b[3]=[g("div",{class:"spinner-border",role:"status"},[g("span",{class:"visually-hidden"},"Loading...")],-1)])])):c.value?(L(),B("div",oS,U(c.value),1)):(L(),B("form",{key:2,onSubmit:os(p,["prevent"])},[g("div",rS,[b[5]||(b[5]=g("label",{class:"form-label"},"Item Picture",-1)),g("div",{class:"image-upload-container",onClick:h,role:"button"},[a.value?(L(),B("img",{key:0,src:a.value,alt:"Preview",class:"preview-image"},null,8,aS)):(L(),B("div",lS,[...b[4]||(b[4]=[g("span",null,"Click to upload new image",-1)])]))]),b[6]||(b[6]=g("small",{class:"text-muted"},"Leave unchanged to keep current image",-1)),g("input",{ref_key:"fileInput",ref:r,type:"file",accept:"image/jpeg,image/jpg,image/png",onChange:m,hidden:""},null,544)]),g("div",cS,[b[7]||(b[7]=g("label",{for:"title",class:"form-label"},"Title *",-1)),Ot(g("input",{"onUpdate:modelValue":b[0]||(b[0]=v=>d.value.title=v),type:"text",class:"form-control",id:"title",required:""},null,512),[[Nt,d.value.title]])]),g("div",uS,[b[8]||(b[8]=g("label",{for:"description",class:"form-label"},"Description *",-1)),Ot(g("textarea",{"onUpdate:modelValue":b[1]||(b[1]=v=>d.value.description=v),class:"form-control",id:"description",rows:"4",required:""},null,512),[[Nt,d.value.description]])]),g("div",dS,[b[9]||(b[9]=g("label",{for:"price",class:"form-label"},"Starting Price ($)",-1)),g("input",{value:u.value?.starting_price,type:"text",class:"form-control",id:"price",disabled:""},null,8,fS),b[10]||(b[10]=g("small",{class:"text-muted"},"Starting price cannot be changed",-1))]),g("div",hS,[b[11]||(b[11]=g("label",{for:"endDate",class:"form-label"},"End Date & Time *",-1)),Ot(g("input",{"onUpdate:modelValue":b[2]||(b[2]=v=>d.value.end_date=v),type:"datetime-local",class:"form-control",id:"endDate",min:f.value,required:""},null,8,pS),[[Nt,d.value.end_date]])]),g("div",gS,[g("button",{type:"submit",class:"btn btn-primary",disabled:N(n).loading},U(N(n).loading?"Saving...":"Save Changes"),9,mS),dt(y,{to:`/items/${o.value}`,class:"btn btn-secondary"},{default:Ht(()=>[...b[12]||(b[12]=[rt(" Cancel ",-1)])]),_:1},8,["to"])])],32))])])])])])}}}),bS=Ye(_S,[["__scopeId","data-v-cae69f2b"]]);/*!
  * @kurkle/color v0.3.4
  * https://github.com/kurkle/color#readme
  * (c) 2024 Jukka Kurkela
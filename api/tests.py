@@ -1,3 +1,1551 @@
-from django.test import TestCase
+import asyncio
+import io
+import json
+import os
+import re
+import tempfile
+import time
+import unittest
+from unittest import mock
+import warnings
+from datetime import timedelta
+from decimal import Decimal
 
-# Create your tests here.
+from django.core import mail
+from django.core.cache import cache
+from django.core.mail import get_connection
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import CommandError, call_command
+from django.db import connection
+from django.db.models import F
+from django.http import HttpResponse
+from django.test import Client, RequestFactory, TestCase, TransactionTestCase, override_settings
+from django.test.client import BOUNDARY, MULTIPART_CONTENT, encode_multipart
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+from PIL import Image
+
+from . import price_cache
+from .events import PostgresBroadcaster
+from .images import ITEM_VARIANTS, generate_variants, refresh_item_variants
+from .models import User, Item, Bid, OutboundEmail, Question
+from .loadtest import Sample, summarize
+from .outbox import deliver_pending
+from .pagination import KeysetPaginator
+from .replicas import ReplicaRouter, read_from_replica
+from .auctions import close_ended
+from .bidding import ENDED, NOT_FOUND, OUTBID, OWN_ITEM, place_bid
+from .scheduler import AuctionSchedule
+from .search import BasicSearchBackend, get_search_backend
+from .serializers import bid_queryset, item_queryset, parse_item_fields, question_queryset
+from .user_cache import check_shared_cache
+
+# "SCAN api_item" without "USING ... INDEX" reads the whole table
+FULL_SCAN = re.compile(r"\bSCAN (\w+)(?! USING)(?! VIRTUAL TABLE)\b")
+
+
+def read_json(response) -> dict:
+    """Body of a plain or streamed JSON response."""
+    if response.streaming:
+        return json.loads(b"".join(response.streaming_content))
+    return response.json()
+
+
+def make_item(owner: User, **fields) -> Item:
+    """An open auction ending in a day, unless ``fields`` say otherwise."""
+    price = fields.pop("starting_price", Decimal("10.00"))
+    return Item.objects.create(
+        owner=owner,
+        title=fields.pop("title", "Vintage Bicycle"),
+        description=fields.pop("description", "Classic red bicycle"),
+        starting_price=price,
+        current_price=price,
+        picture="item_pics/bike.jpg",
+        end_date=fields.pop("end_date", timezone.now() + timedelta(days=1)),
+        **fields,
+    )
+
+
+def image_file(size: tuple[int, int], image_format: str = "PNG", name: str = "pic.png"):
+    """An in-memory image upload; random pixels, so it does not compress."""
+    buffer = io.BytesIO()
+    Image.frombytes("RGB", size, os.urandom(size[0] * size[1] * 3)).save(
+        buffer, image_format
+    )
+    buffer.seek(0)
+    buffer.name = name
+    return buffer
+
+
+@unittest.skipUnless(connection.vendor == "sqlite", "EXPLAIN output is SQLite's")
+class QueryPlanTests(TestCase):
+    """
+    Each hot query shape must be answered from an index: no full table scan
+    and no temporary B-tree for ORDER BY.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.owner = User.objects.create_user(
+            username="owner", email="owner@example.com", password="pw"
+        )
+        cls.item = Item.objects.create(
+            owner=cls.owner,
+            title="Vintage Bicycle",
+            description="Classic red bicycle",
+            starting_price=Decimal("10.00"),
+            current_price=Decimal("10.00"),
+            picture="item_pics/bike.jpg",
+            end_date=timezone.now() + timedelta(days=1),
+        )
+
+    def assertIndexed(self, queryset) -> None:
+        plan = queryset.explain()
+        self.assertIsNone(FULL_SCAN.search(plan), f"Full table scan:\n{plan}")
+        self.assertNotIn("USE TEMP B-TREE", plan, f"Sort without index:\n{plan}")
+
+    def test_item_list_first_page(self) -> None:
+        items = item_queryset(Item.objects.filter(is_active=True))
+        self.assertIndexed(items.order_by("-created_at", "-id")[:25])
+
+    def test_item_list_cursor_page(self) -> None:
+        paginator = KeysetPaginator(item_queryset(Item.objects.filter(is_active=True)))
+        after = paginator._after([timezone.now(), 100], reverse=False)
+        self.assertIndexed(
+            paginator.queryset.filter(after).order_by("-created_at", "-id")[:25]
+        )
+
+    def test_ended_auctions(self) -> None:
+        self.assertIndexed(
+            Item.objects.filter(
+                is_active=True, end_date__lte=timezone.now(), winner__isnull=True
+            )
+        )
+
+    def test_latest_bids(self) -> None:
+        self.assertIndexed(
+            bid_queryset(Bid.objects.filter(item=self.item)).order_by("-created_at")[:20]
+        )
+
+    def test_highest_bid(self) -> None:
+        self.assertIndexed(Bid.objects.filter(item=self.item).order_by("-amount")[:1])
+
+    def test_latest_questions(self) -> None:
+        self.assertIndexed(
+            question_queryset(Question.objects.filter(item=self.item)).order_by(
+                "-asked_at"
+            )
+        )
+
+    def test_items_version(self) -> None:
+        self.assertIndexed(Item.objects.order_by("-updated_at").values("updated_at")[:1])
+        self.assertIndexed(
+            Item.objects.filter(
+                is_active=True, winner__isnull=True, end_date__lte=timezone.now()
+            )
+            .order_by("-end_date")
+            .values("end_date")[:1]
+        )
+
+
+@override_settings(
+    SESSION_ENGINE="django.contrib.sessions.backends.cached_db",
+    AUTHENTICATION_BACKENDS=["api.user_cache.CachedModelBackend"],
+)
+class AuthCacheTests(TestCase):
+    """
+    A signed-in request reads its session and user from the cache; saving
+    the user drops the cached copy.
+    """
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="bidder", email="bidder@example.com", password="pw"
+        )
+        self.client.force_login(self.user)
+
+    def test_warm_request_skips_session_and_user_queries(self) -> None:
+        self.client.get("/api/auth/me/?compact=1")
+        with self.assertNumQueries(0):
+            response = self.client.get("/api/auth/me/?compact=1")
+        self.assertEqual(response.json()["data"]["user"]["id"], self.user.id)
+
+    def test_save_invalidates_cached_user(self) -> None:
+        self.client.get("/api/auth/me/?compact=1")
+        self.user.email = "new@example.com"
+        self.user.save()
+        response = self.client.get("/api/auth/me/?compact=1")
+        self.assertEqual(response.json()["data"]["user"]["email"], "new@example.com")
+
+    def test_password_change_signs_out(self) -> None:
+        self.client.get("/api/auth/me/?compact=1")
+        self.user.set_password("changed")
+        self.user.save()
+        self.assertEqual(self.client.get("/api/auth/me/?compact=1").status_code, 401)
+
+    def test_per_process_cache_is_rejected(self) -> None:
+        errors = check_shared_cache(None)
+        self.assertEqual([error.id for error in errors], ["api.E001", "api.E002"])
+        with override_settings(
+            CACHES={
+                "default": {"BACKEND": "django.core.cache.backends.redis.RedisCache"}
+            }
+        ):
+            self.assertEqual(check_shared_cache(None), [])
+
+
+@override_settings(READ_REPLICA="replica")
+class ReplicaRoutingTests(TestCase):
+    """
+    Reads in read_from_replica views go to the replica, except for users who
+    wrote within READ_YOUR_WRITES_SECONDS.
+    """
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.user = User.objects.create_user(
+            username="reader", email="reader@example.com", password="pw"
+        )
+
+    def read_alias(self, method: str = "get") -> str | None:
+        """The database an Item read would use inside a decorated view."""
+
+        @read_from_replica
+        def view(request):
+            return HttpResponse(ReplicaRouter().db_for_read(Item) or "default")
+
+        request = getattr(RequestFactory(), method)("/")
+        request.user = self.user
+        return view(request).content.decode()
+
+    def test_reads_go_to_replica(self) -> None:
+        self.assertEqual(self.read_alias(), "replica")
+        self.assertIsNone(ReplicaRouter().db_for_read(Item))
+
+    def test_writes_go_to_primary(self) -> None:
+        self.assertEqual(self.read_alias("post"), "default")
+        self.assertEqual(ReplicaRouter().db_for_write(Item), "default")
+
+    def test_reads_stick_to_primary_after_write(self) -> None:
+        self.client.force_login(self.user)
+        self.client.post(
+            "/api/profile/",
+            data={"email": "new@example.com"},
+            content_type="application/json",
+        )
+        self.assertEqual(self.read_alias(), "replica")
+
+        self.client.put(
+            "/api/profile/",
+            data={"email": "new@example.com"},
+            content_type="application/json",
+        )
+        self.assertEqual(self.read_alias(), "default")
+
+    def test_replica_reads_do_not_fill_price_cache(self) -> None:
+        item = make_item(self.user)
+        # As loaded by a view reading from the replica
+        item._state.db = "replica"
+        price_cache.remember_item(item)
+        self.assertEqual(price_cache.get_state(item.id), (None, None, None))
+
+        item._state.db = "default"
+        price_cache.remember_item(item)
+        self.assertEqual(
+            price_cache.get_state(item.id), (item.current_price, item.end_date, self.user.id)
+        )
+
+
+class LoadTestSummaryTests(TestCase):
+    def test_summarize(self) -> None:
+        samples = [Sample("bid", float(ms), 200, 3) for ms in range(1, 101)]
+        samples[0].status = 500
+        samples[1].status = 400
+        stats = summarize(samples, elapsed=10.0)
+        self.assertEqual(stats.requests, 100)
+        self.assertEqual(stats.requests_per_second, 10.0)
+        self.assertEqual((stats.p50_ms, stats.p95_ms, stats.p99_ms), (50.0, 95.0, 99.0))
+        self.assertEqual((stats.error_rate, stats.reject_rate), (0.01, 0.01))
+        self.assertEqual(stats.queries_per_request, 3.0)
+        self.assertEqual(stats.statuses, {"200": 98, "400": 1, "500": 1})
+
+
+class EventStreamTests(TestCase):
+    """Event streams are served over ASGI only; WSGI gets an immediate 501."""
+
+    def setUp(self) -> None:
+        self.user = User.objects.create_user(
+            username="watcher", email="watcher@example.com", password="pw"
+        )
+
+    def test_wsgi_request_is_refused(self) -> None:
+        self.client.force_login(self.user)
+        for path in ("/api/items/stream/", "/api/items/1/stream/"):
+            response = self.client.get(path)
+            self.assertEqual(response.status_code, 501)
+            self.assertFalse(response.streaming)
+
+    async def test_asgi_request_streams(self) -> None:
+        await self.async_client.aforce_login(self.user)
+        response = await self.async_client.get("/api/items/stream/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/event-stream")
+        chunks = aiter(response.streaming_content)
+        self.assertEqual(await anext(chunks), b": connected\n\n")
+
+
+@unittest.skipUnless(connection.vendor == "postgresql", "Uses LISTEN/NOTIFY")
+class PostgresBroadcasterTests(TransactionTestCase):
+    """Events published over NOTIFY reach subscribers through the listener."""
+
+    async def test_publish_reaches_subscriber(self) -> None:
+        broadcaster = PostgresBroadcaster()
+        subscription = broadcaster.subscribe("item:1")
+        # Let the listener thread connect before publishing
+        await asyncio.sleep(1)
+        await asyncio.to_thread(broadcaster.publish, "item:1", "event: bid\n\n")
+        await asyncio.to_thread(broadcaster.publish, "item:2", "event: bid\n\n")
+        self.assertEqual(
+            await asyncio.wait_for(subscription.get(), 5), "event: bid\n\n"
+        )
+        self.assertTrue(subscription.queue.empty())
+
+
+class BouncingEmailBackend(EmailBackend):
+    """locmem backend that refuses mail to bounce@ addresses."""
+
+    def send_messages(self, messages):
+        if any(to.startswith("bounce@") for m in messages for to in m.to):
+            raise ConnectionError("Mailbox unavailable")
+        return super().send_messages(messages)
+
+
+class BrokenReconnectBackend(BouncingEmailBackend):
+    """Cannot reconnect after a failed send."""
+
+    opened = False
+
+    def open(self):
+        if self.opened:
+            raise ConnectionError("Server unreachable")
+        self.opened = True
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class OutboxTests(TestCase):
+    """deliver_pending sends due messages and records each outcome."""
+
+    def queue(self, to_email: str, **fields) -> OutboundEmail:
+        return OutboundEmail.objects.create(
+            to_email=to_email, subject="You won", body="Congratulations", **fields
+        )
+
+    def test_sent_retried_and_failed(self) -> None:
+        sent = self.queue("winner@example.com")
+        retried = self.queue("bounce@example.com")
+        failed = self.queue("bounce@example.org", attempts=2)
+        not_due = self.queue(
+            "later@example.com", next_attempt_at=timezone.now() + timedelta(hours=1)
+        )
+
+        stats = deliver_pending(
+            batch_size=2, max_attempts=3, connection=BouncingEmailBackend()
+        )
+
+        self.assertEqual((stats.sent, stats.retrying, stats.failed), (1, 1, 1))
+        self.assertEqual([m.to for m in mail.outbox], [["winner@example.com"]])
+        for email in (sent, retried, failed, not_due):
+            email.refresh_from_db()
+        self.assertEqual((sent.status, sent.attempts), (OutboundEmail.SENT, 1))
+        self.assertIsNotNone(sent.sent_at)
+        self.assertEqual((retried.status, retried.attempts), (OutboundEmail.PENDING, 1))
+        self.assertEqual(retried.last_error, "Mailbox unavailable")
+        self.assertGreater(retried.next_attempt_at, timezone.now() + timedelta(seconds=30))
+        self.assertEqual((failed.status, failed.attempts), (OutboundEmail.FAILED, 3))
+        self.assertEqual((not_due.status, not_due.attempts), (OutboundEmail.PENDING, 0))
+
+        # Nothing is due any more
+        mail.outbox.clear()
+        self.assertEqual(deliver_pending(connection=get_connection()).sent, 0)
+        self.assertEqual(mail.outbox, [])
+
+    def test_outcomes_survive_a_failed_reconnect(self) -> None:
+        sent = self.queue("winner@example.com")
+        bounced = self.queue("bounce@example.com")
+        leased = self.queue("other@example.com")
+
+        with self.assertRaises(ConnectionError):
+            deliver_pending(connection=BrokenReconnectBackend())
+
+        for email in (sent, bounced, leased):
+            email.refresh_from_db()
+        self.assertEqual(sent.status, OutboundEmail.SENT)
+        self.assertEqual((bounced.status, bounced.attempts), (OutboundEmail.PENDING, 1))
+        self.assertEqual(bounced.last_error, "Mailbox unavailable")
+        # Not attempted; reserved until the lease runs out
+        self.assertEqual((leased.status, leased.attempts), (OutboundEmail.PENDING, 0))
+        self.assertGreater(leased.next_attempt_at, timezone.now())
+
+
+class AuctionScheduleTests(TestCase):
+    """Polls pick up new, moved and withdrawn deadlines from the database."""
+
+    def setUp(self) -> None:
+        self.owner = User.objects.create_user(
+            username="seller", email="seller@example.com", password="pw"
+        )
+        self.item = make_item(self.owner)
+        self.schedule = AuctionSchedule()
+        self.schedule.reload()
+
+    def test_edited_end_date_moves_deadline(self) -> None:
+        self.client.force_login(self.owner)
+        end_date = timezone.now() + timedelta(seconds=1)
+        response = self.client.put(
+            f"/api/items/{self.item.id}/edit/",
+            data={
+                "title": self.item.title,
+                "description": self.item.description,
+                "end_date": end_date.isoformat(),
+            },
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.schedule.poll()
+        self.assertEqual(self.schedule.next_deadline(), end_date)
+        self.assertEqual(self.schedule.pop_due(end_date), [self.item.id])
+
+    def test_new_and_withdrawn_items(self) -> None:
+        new = make_item(self.owner, end_date=timezone.now() + timedelta(hours=1))
+        self.item.is_active = False
+        self.item.save(update_fields=["is_active", "updated_at"])
+        self.schedule.poll()
+        self.assertEqual(len(self.schedule), 1)
+        self.assertEqual(self.schedule.next_deadline(), new.end_date)
+
+
+class BiddingTests(TestCase):
+    """place_bid accepts a bid only if it beats the price of an open auction."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.owner = User.objects.create_user(
+            username="seller", email="seller@example.com", password="pw"
+        )
+        cls.alice = User.objects.create_user(
+            username="alice", email="alice@example.com", password="pw"
+        )
+        cls.bob = User.objects.create_user(
+            username="bob", email="bob@example.com", password="pw"
+        )
+        cls.item = make_item(cls.owner, starting_price=Decimal("10.00"))
+
+    def setUp(self) -> None:
+        cache.clear()
+
+    def bid(self, user: User, amount: str):
+        self.client.force_login(user)
+        return self.client.post(
+            f"/api/items/{self.item.id}/bid/",
+            data={"amount": amount},
+            content_type="application/json",
+        )
+
+    def test_accepted(self) -> None:
+        response = self.bid(self.alice, "20.00")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["data"]["item"]["current_price"], "20.00")
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.current_price, Decimal("20.00"))
+        self.assertEqual(self.item.leading_bidder, self.alice)
+        self.assertEqual(self.item.bid_count, 1)
+        self.assertEqual(self.item.bids.get().amount, Decimal("20.00"))
+
+    def test_outbid(self) -> None:
+        self.assertTrue(place_bid(self.item.id, self.alice, Decimal("20.00")).accepted)
+        result = place_bid(self.item.id, self.bob, Decimal("20.00"))
+        self.assertEqual((result.accepted, result.reason), (False, OUTBID))
+        self.assertEqual(result.current_price, Decimal("20.00"))
+        # The accepted bid filled the price cache, so this needs no query
+        with self.assertNumQueries(0):
+            result = place_bid(self.item.id, self.bob, Decimal("15.00"))
+        self.assertEqual(result.reason, OUTBID)
+
+    def test_ended(self) -> None:
+        Item.objects.filter(id=self.item.id).update(
+            end_date=timezone.now() - timedelta(minutes=1)
+        )
+        result = place_bid(self.item.id, self.alice, Decimal("20.00"))
+        self.assertEqual((result.accepted, result.reason), (False, ENDED))
+
+    def test_own_item(self) -> None:
+        result = place_bid(self.item.id, self.owner, Decimal("20.00"))
+        self.assertEqual((result.accepted, result.reason), (False, OWN_ITEM))
+        self.assertEqual(self.bid(self.owner, "20.00").status_code, 400)
+
+    def test_not_found(self) -> None:
+        result = place_bid(self.item.id + 1, self.alice, Decimal("20.00"))
+        self.assertEqual((result.accepted, result.reason), (False, NOT_FOUND))
+
+    def test_sub_cent_amount_rejected(self) -> None:
+        self.assertEqual(self.bid(self.alice, "20.00").status_code, 200)
+        response = self.bid(self.bob, "20.001")
+        self.assertEqual(response.status_code, 400)
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.leading_bidder, self.alice)
+        self.assertEqual(self.item.bid_count, 1)
+        # Trailing zeros are still whole cents
+        self.assertEqual(self.bid(self.bob, "20.0100").status_code, 200)
+
+    def test_invalid_amounts_rejected(self) -> None:
+        invalid = ("1e100", "-1e100", "NaN", "Infinity", "-5", "0", "abc", "12.345", "1e-7")
+        for amount in invalid:
+            with self.subTest(amount=amount):
+                self.assertEqual(self.bid(self.alice, amount).status_code, 400)
+        self.assertEqual(self.bid(self.alice, "99999999.99").status_code, 200)
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.bid_count, 1)
+
+
+class ConditionalGetTests(TestCase):
+    """
+    Item list and detail answer a matching If-None-Match or
+    If-Modified-Since with 304, and every change to an item moves its ETag.
+    """
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.owner = User.objects.create_user(
+            username="seller", email="seller@example.com", password="pw"
+        )
+        cls.bidder = User.objects.create_user(
+            username="bidder", email="bidder@example.com", password="pw"
+        )
+        cls.item = make_item(cls.owner)
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.client.force_login(self.bidder)
+        self.paths = ["/api/items/", f"/api/items/{self.item.id}/"]
+
+    def etags(self) -> list[str]:
+        return [self.client.get(path)["ETag"] for path in self.paths]
+
+    def assertEtagsChange(self, change) -> None:
+        before = self.etags()
+        change()
+        after = self.etags()
+        for path, old, new in zip(self.paths, before, after):
+            self.assertNotEqual(old, new, path)
+
+    def post(self, user: User, path: str, data: dict) -> None:
+        self.client.force_login(user)
+        response = self.client.post(path, data=data, content_type="application/json")
+        self.assertLess(response.status_code, 300, response.content)
+        self.client.force_login(self.bidder)
+
+    def test_not_modified(self) -> None:
+        for path in self.paths:
+            response = self.client.get(path)
+            self.assertEqual(response.status_code, 200)
+            etag, last_modified = response["ETag"], response["Last-Modified"]
+            response = self.client.get(path, HTTP_IF_NONE_MATCH=etag)
+            self.assertEqual(response.status_code, 304, path)
+            response = self.client.get(path, HTTP_IF_MODIFIED_SINCE=last_modified)
+            self.assertEqual(response.status_code, 304, path)
+            response = self.client.get(path, HTTP_IF_NONE_MATCH='"stale"')
+            self.assertEqual(response.status_code, 200, path)
+
+    def test_bid_changes_etag(self) -> None:
+        self.assertEtagsChange(
+            lambda: self.post(
+                self.bidder, f"/api/items/{self.item.id}/bid/", {"amount": "20.00"}
+            )
+        )
+
+    def test_question_and_answer_change_etag(self) -> None:
+        self.assertEtagsChange(
+            lambda: self.post(
+                self.bidder,
+                f"/api/items/{self.item.id}/questions/",
+                {"question_text": "Does it ride well?"},
+            )
+        )
+        question = self.item.questions.get()
+        self.assertEtagsChange(
+            lambda: self.post(
+                self.owner,
+                f"/api/questions/{question.id}/answer/",
+                {"answer_text": "Very well."},
+            )
+        )
+
+    def test_edit_changes_etag(self) -> None:
+        def edit() -> None:
+            self.client.force_login(self.owner)
+            response = self.client.put(
+                f"/api/items/{self.item.id}/edit/",
+                data={
+                    "title": "Restored Bicycle",
+                    "description": self.item.description,
+                    "end_date": self.item.end_date.isoformat(),
+                },
+                content_type="application/json",
+            )
+            self.assertEqual(response.status_code, 200)
+            self.client.force_login(self.bidder)
+
+        self.assertEtagsChange(edit)
+
+    def test_passed_end_date_changes_etag(self) -> None:
+        # The auction ends without any write to the item
+        Item.objects.filter(id=self.item.id).update(
+            end_date=timezone.now() + timedelta(milliseconds=200)
+        )
+        self.assertEtagsChange(lambda: time.sleep(0.3))
+
+
+class QueryCountTests(TestCase):
+    """
+    The item list, item detail and bid/question pages run a fixed number of
+    queries however many rows they serialize: related users, bids and
+    questions are fetched with the page, never per row.
+    """
+
+    # Session and user lookups made by login_required
+    AUTH_QUERIES = 2
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.owner = User.objects.create_user(
+            username="seller", email="seller@example.com", password="pw"
+        )
+        cls.users = [
+            User.objects.create_user(
+                username=f"user{i}", email=f"user{i}@example.com", password="pw"
+            )
+            for i in range(3)
+        ]
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.client.force_login(self.users[0])
+
+    def populate(self, count: int) -> Item:
+        """``count`` items; the first gets ``count`` bids and questions."""
+        Item.objects.all().delete()
+        items = [make_item(self.owner, title=f"Bicycle {i}") for i in range(count)]
+        item = items[0]
+        Bid.objects.bulk_create(
+            Bid(item=item, bidder=self.users[i % 3], amount=Decimal(20 + i))
+            for i in range(count)
+        )
+        Question.objects.bulk_create(
+            Question(
+                item=item,
+                asker=self.users[i % 3],
+                question_text="Does it ride well?",
+                answer_text="Very well." if i % 2 else "",
+            )
+            for i in range(count)
+        )
+        return item
+
+    def assertQueries(self, num: int, path: str) -> None:
+        with self.assertNumQueries(self.AUTH_QUERIES + num):
+            response = self.client.get(path)
+            if response.streaming:
+                b"".join(response.streaming_content)
+        self.assertEqual(response.status_code, 200)
+
+    def test_fixed_query_count(self) -> None:
+        for count in (1, 30):
+            with self.subTest(count=count):
+                item = self.populate(count)
+                # Version lookups, then the page
+                self.assertQueries(3, "/api/items/")
+                self.assertQueries(3, "/api/items/?search=Bicycle")
+                # Version, item, first bids page, first questions page
+                self.assertQueries(4, f"/api/items/{item.id}/")
+                # Version, then the page
+                self.assertQueries(2, f"/api/items/{item.id}/bids/")
+                self.assertQueries(2, f"/api/items/{item.id}/questions/")
+
+
+class ItemPaginationTests(TestCase):
+    """GET /api/items/ pages by cursor, forwards and back, with and without search."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.owner = User.objects.create_user(
+            username="seller", email="seller@example.com", password="pw"
+        )
+        cls.bikes = [make_item(cls.owner, title=f"Bicycle {i}") for i in range(7)]
+        cls.lamps = [
+            make_item(cls.owner, title=f"Desk lamp {i}", description="Brass reading lamp")
+            for i in range(3)
+        ]
+
+    def setUp(self) -> None:
+        self.client.force_login(self.owner)
+
+    def page(self, **params) -> dict:
+        response = self.client.get("/api/items/", params)
+        self.assertEqual(response.status_code, 200)
+        return read_json(response)["data"]
+
+    def walk(self, **params) -> list[int]:
+        """Ids of every page, following next_cursor."""
+        ids, cursor = [], None
+        while True:
+            data = self.page(**params, **({"cursor": cursor} if cursor else {}))
+            ids += [item["id"] for item in data["items"]]
+            cursor = data["next_cursor"]
+            if cursor is None:
+                return ids
+
+    def test_next_pages(self) -> None:
+        newest_first = [item.id for item in reversed(self.bikes + self.lamps)]
+        self.assertEqual(self.walk(limit=3), newest_first)
+        self.assertEqual(len(self.page(limit=3)["items"]), 3)
+
+    def test_prev_page(self) -> None:
+        first = self.page(limit=3)
+        self.assertIsNone(first["prev_cursor"])
+        second = self.page(limit=3, cursor=first["next_cursor"])
+        back = self.page(limit=3, cursor=second["prev_cursor"])
+        self.assertEqual(back["items"], first["items"])
+        self.assertIsNotNone(back["next_cursor"])
+
+    def test_search_pages(self) -> None:
+        ids = self.walk(search="bicycle", limit=2)
+        self.assertEqual(sorted(ids), sorted(item.id for item in self.bikes))
+
+    def test_invalid_cursor_and_limit(self) -> None:
+        for params in (
+            {"cursor": "not-a-cursor"},
+            {"cursor": "eyJ2IjoxfQ"},
+            {"limit": "0"},
+            {"limit": "-1"},
+            {"limit": "ten"},
+        ):
+            with self.subTest(**params):
+                response = self.client.get("/api/items/", params)
+                self.assertEqual(response.status_code, 400)
+                self.assertFalse(response.json()["success"])
+        self.assertEqual(self.page(limit=1000)["limit"], 100)
+
+    def test_wsgi_body_is_synchronous(self) -> None:
+        response = self.client.get("/api/items/", {"limit": 3})
+        self.assertTrue(response.streaming)
+        self.assertFalse(response.is_async)
+        self.assertEqual(len(read_json(response)["data"]["items"]), 3)
+
+    async def test_asgi_body_is_asynchronous(self) -> None:
+        await self.async_client.aforce_login(self.owner)
+        response = await self.async_client.get("/api/items/", {"limit": 3})
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.is_async)
+        with warnings.catch_warnings():
+            # Django warns when it has to buffer a synchronous body
+            warnings.simplefilter("error")
+            body = b"".join([chunk async for chunk in response.streaming_content])
+        data = json.loads(body)["data"]
+        newest_first = [item.id for item in reversed(self.bikes + self.lamps)]
+        self.assertEqual([item["id"] for item in data["items"]], newest_first[:3])
+        self.assertIsNotNone(data["next_cursor"])
+
+
+class SyncItemAggregatesTests(TestCase):
+    """sync_item_aggregates finds and fixes stored aggregates that disagree with the rows."""
+
+    def test_check_then_fix(self) -> None:
+        owner = User.objects.create_user(
+            username="seller", email="seller@example.com", password="pw"
+        )
+        bidder = User.objects.create_user(
+            username="bidder", email="bidder@example.com", password="pw"
+        )
+        items = [make_item(owner) for _ in range(3)]
+        self.assertTrue(place_bid(items[0].id, bidder, Decimal("20.00")).accepted)
+        self.assertTrue(place_bid(items[2].id, bidder, Decimal("30.00")).accepted)
+        call_command("sync_item_aggregates", "--check", stdout=io.StringIO())
+
+        Item.objects.filter(id=items[2].id).update(bid_count=0, leading_bidder=None)
+        with self.assertRaises(CommandError):
+            call_command("sync_item_aggregates", "--check", stdout=io.StringIO())
+
+        call_command("sync_item_aggregates", "--chunk-size", "2", stdout=io.StringIO())
+        items[2].refresh_from_db()
+        self.assertEqual((items[2].bid_count, items[2].leading_bidder), (1, bidder))
+        call_command("sync_item_aggregates", "--check", stdout=io.StringIO())
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class WinnerEmailTests(TestCase):
+    """close_auctions closes, queues the winner's email and sends it."""
+
+    def setUp(self) -> None:
+        owner = User.objects.create_user(
+            username="seller", email="seller@example.com", password="pw"
+        )
+        self.winner = User.objects.create_user(
+            username="winner", email="winner@example.com", password="pw"
+        )
+        self.item = make_item(owner)
+        self.assertTrue(place_bid(self.item.id, self.winner, Decimal("25.00")).accepted)
+        Item.objects.filter(id=self.item.id).update(
+            end_date=timezone.now() - timedelta(minutes=1)
+        )
+
+    def test_close_queue_send(self) -> None:
+        call_command("close_auctions", stdout=io.StringIO())
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.winner, self.winner)
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ["winner@example.com"])
+        self.assertIn(self.item.title, mail.outbox[0].subject)
+        self.assertEqual(OutboundEmail.objects.get().status, OutboundEmail.SENT)
+
+    def test_no_send_leaves_it_to_send_outbox(self) -> None:
+        call_command("close_auctions", "--no-send", stdout=io.StringIO())
+        self.assertEqual(mail.outbox, [])
+        self.assertEqual(OutboundEmail.objects.get().status, OutboundEmail.PENDING)
+        call_command("send_outbox", stdout=io.StringIO())
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(OutboundEmail.objects.get().status, OutboundEmail.SENT)
+
+
+class UploadLimitTests(TestCase):
+    """Every picture upload goes through the bounded handler: size, format and dimensions."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.owner = User.objects.create_user(
+            username="seller", email="seller@example.com", password="pw"
+        )
+
+    def setUp(self) -> None:
+        self.item = make_item(self.owner)
+        self.client.force_login(self.owner)
+
+    def create(self, picture) -> HttpResponse:
+        return self.client.post("/api/items/", {
+            "title": "Lamp",
+            "description": "Brass reading lamp",
+            "starting_price": "5.00",
+            "end_date": (timezone.now() + timedelta(days=1)).isoformat(),
+            "picture": picture,
+        })
+
+    def put(self, path: str, fields: dict) -> HttpResponse:
+        return self.client.put(
+            path, encode_multipart(BOUNDARY, fields), content_type=MULTIPART_CONTENT
+        )
+
+    def edit(self, picture) -> HttpResponse:
+        return self.put(f"/api/items/{self.item.id}/edit/", {
+            "title": "Lamp",
+            "description": "Brass reading lamp",
+            "end_date": (timezone.now() + timedelta(days=1)).isoformat(),
+            "picture": picture,
+        })
+
+    def update_profile(self, picture) -> HttpResponse:
+        return self.put("/api/profile/", {
+            "email": "seller@example.com",
+            "profile_image": picture,
+        })
+
+    def assertRejected(self, make_file, status: int, message: str) -> None:
+        for name, send, field in (
+            ("create", self.create, "picture"),
+            ("edit", self.edit, "picture"),
+            ("profile", self.update_profile, "profile_image"),
+        ):
+            with self.subTest(name):
+                response = send(make_file())
+                self.assertEqual(response.status_code, status)
+                self.assertEqual(response.json()["errors"], {field: [message]})
+        self.assertEqual(Item.objects.count(), 1)
+        self.item.refresh_from_db()
+        self.assertEqual(self.item.title, "Vintage Bicycle")
+        self.owner.refresh_from_db()
+        self.assertFalse(self.owner.profile_image)
+
+    @override_settings(MAX_IMAGE_UPLOAD_SIZE=4096)
+    def test_file_over_byte_cap(self) -> None:
+        self.assertRejected(lambda: image_file((64, 64)), 413, "Image is too large")
+
+    def test_bad_header(self) -> None:
+        def bogus():
+            upload = io.BytesIO(b"#!/bin/sh\n" * 100)
+            upload.name = "pic.png"
+            return upload
+
+        self.assertRejected(bogus, 400, "Upload a valid JPEG or PNG image")
+        self.assertRejected(
+            lambda: image_file((8, 8), "GIF", "pic.gif"), 400,
+            "Upload a valid JPEG or PNG image",
+        )
+
+    @override_settings(MAX_IMAGE_DIMENSION=100)
+    def test_dimension_cap(self) -> None:
+        self.assertRejected(
+            lambda: image_file((101, 1)), 413, "Image dimensions are too large"
+        )
+
+    @override_settings(MAX_IMAGE_PIXELS=400)
+    def test_pixel_cap(self) -> None:
+        self.assertRejected(
+            lambda: image_file((21, 20)), 413, "Image dimensions are too large"
+        )
+
+    def test_csrf_still_enforced(self) -> None:
+        client = Client(enforce_csrf_checks=True)
+        client.force_login(self.owner)
+        client.get("/api/csrf/")
+        token = client.cookies["csrftoken"].value
+
+        # The token check runs first; with a token, the bogus file is what fails
+        for headers, status in (({}, 403), ({"X-CSRFToken": token}, 400)):
+            with self.subTest(headers=headers):
+                response = client.post(
+                    "/api/items/", {"picture": io.BytesIO(b"not an image")},
+                    headers=headers,
+                )
+                self.assertEqual(response.status_code, status)
+                fields = {
+                    "email": "seller@example.com",
+                    "profile_image": io.BytesIO(b"not an image"),
+                }
+                response = client.put(
+                    "/api/profile/", encode_multipart(BOUNDARY, fields),
+                    content_type=MULTIPART_CONTENT, headers=headers,
+                )
+                self.assertEqual(response.status_code, status)
+
+
+class SearchTests(TestCase):
+    """?search= follows creates, edits and soft deletes, and pages in rank order."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.owner = User.objects.create_user(
+            username="seller", email="seller@example.com", password="pw"
+        )
+
+    def setUp(self) -> None:
+        self.client.force_login(self.owner)
+
+    def search(self, query: str, **params) -> list[int]:
+        """Ids of every page of results, following next_cursor."""
+        ids, cursor = [], None
+        while True:
+            params["search"] = query
+            if cursor:
+                params["cursor"] = cursor
+            response = self.client.get("/api/items/", params)
+            self.assertEqual(response.status_code, 200)
+            data = read_json(response)["data"]
+            ids += [item["id"] for item in data["items"]]
+            cursor = data["next_cursor"]
+            if cursor is None:
+                return ids
+
+    def test_create_edit_delete(self) -> None:
+        with tempfile.TemporaryDirectory() as media, self.settings(MEDIA_ROOT=media):
+            response = self.client.post("/api/items/", {
+                "title": "Brass lamp",
+                "description": "Reading lamp with a green shade",
+                "starting_price": "5.00",
+                "end_date": (timezone.now() + timedelta(days=1)).isoformat(),
+                "picture": image_file((8, 8)),
+            })
+        self.assertEqual(response.status_code, 201)
+        item_id = response.json()["data"]["item"]["id"]
+        self.assertEqual(self.search("lamp"), [item_id])
+        self.assertEqual(self.search("gramophone"), [])
+
+        response = self.client.put(
+            f"/api/items/{item_id}/edit/",
+            {
+                "title": "Wind-up gramophone",
+                "description": "Plays 78s",
+                "end_date": (timezone.now() + timedelta(days=1)).isoformat(),
+            },
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.search("lamp"), [])
+        self.assertEqual(self.search("gramophone"), [item_id])
+
+        response = self.client.delete(f"/api/items/{item_id}/delete/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.search("gramophone"), [])
+
+    @unittest.skipIf(
+        isinstance(get_search_backend(), BasicSearchBackend), "Basic search is unranked"
+    )
+    def test_rank_order_across_pages(self) -> None:
+        in_title = [
+            make_item(self.owner, title=f"Lamp {i}", description="Brass")
+            for i in range(3)
+        ]
+        in_description = [
+            make_item(self.owner, title=f"Shade {i}", description="Fits any lamp")
+            for i in range(3)
+        ]
+        make_item(self.owner, title="Chair", description="Oak")
+
+        ids = self.search("lamp", limit=2)
+        # Title matches rank first; equal ranks are newest first
+        expected = [item.id for item in reversed(in_title)]
+        expected += [item.id for item in reversed(in_description)]
+        self.assertEqual(ids, expected)
+
+
+class CloseAuctionsTests(TestCase):
+    """close_ended and close_auctions: winners, unsold items, batches and reruns."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.owner = User.objects.create_user(
+            username="seller", email="seller@example.com", password="pw"
+        )
+        cls.bidder = User.objects.create_user(
+            username="bidder", email="bidder@example.com", password="pw"
+        )
+
+    def ended_item(self, bid: str | None = None) -> Item:
+        """An auction that has ended, with one bid of ``bid`` if given."""
+        item = make_item(self.owner)
+        if bid is not None:
+            self.assertTrue(place_bid(item.id, self.bidder, Decimal(bid)).accepted)
+        Item.objects.filter(id=item.id).update(
+            end_date=timezone.now() - timedelta(minutes=1)
+        )
+        return item
+
+    def test_close_ended(self) -> None:
+        won = self.ended_item("20.00")
+        unsold = self.ended_item()
+        still_open = make_item(self.owner)
+        self.assertTrue(place_bid(still_open.id, self.bidder, Decimal("20.00")).accepted)
+
+        closed = close_ended([won.id, unsold.id, still_open.id], timezone.now())
+
+        self.assertEqual([item.id for item in closed.won], [won.id])
+        self.assertEqual(closed.unsold_ids, [unsold.id])
+        won.refresh_from_db()
+        self.assertEqual(won.winner, self.bidder)
+        self.assertTrue(won.is_active)
+        unsold.refresh_from_db()
+        self.assertIsNone(unsold.winner)
+        self.assertFalse(unsold.is_active)
+        still_open.refresh_from_db()
+        self.assertIsNone(still_open.winner)
+        self.assertTrue(still_open.is_active)
+        self.assertEqual(
+            list(OutboundEmail.objects.values_list("to_email", flat=True)),
+            ["bidder@example.com"],
+        )
+
+    def test_command_batches(self) -> None:
+        won = [self.ended_item("20.00") for _ in range(3)]
+        unsold = [self.ended_item() for _ in range(2)]
+        out = io.StringIO()
+        call_command("close_auctions", "--batch-size", "2", "--no-send", stdout=out)
+
+        batches = re.findall(r"^Batch \d+: (\d+) auctions", out.getvalue(), re.M)
+        self.assertEqual(batches, ["2", "2", "1"])
+        self.assertIn("Closed 5 auctions: 3 won, 2 without bids", out.getvalue())
+        self.assertEqual(
+            Item.objects.filter(id__in=[item.id for item in won], winner=self.bidder).count(),
+            3,
+        )
+        self.assertFalse(
+            Item.objects.filter(id__in=[item.id for item in unsold], is_active=True).exists()
+        )
+        self.assertEqual(OutboundEmail.objects.count(), 3)
+
+    def test_running_twice(self) -> None:
+        won = self.ended_item("20.00")
+        unsold = self.ended_item()
+        call_command("close_auctions", "--no-send", stdout=io.StringIO())
+
+        out = io.StringIO()
+        call_command("close_auctions", "--no-send", stdout=out)
+        self.assertIn("Closed 0 auctions", out.getvalue())
+        closed = close_ended([won.id, unsold.id], timezone.now())
+        self.assertEqual((closed.won, closed.unsold_ids), ([], []))
+        # The winner is emailed once
+        self.assertEqual(OutboundEmail.objects.count(), 1)
+
+
+class UserActivityTests(TestCase):
+    """Compact /api/auth/me/ and paging /api/auth/me/items/, per user."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.owner = User.objects.create_user(
+            username="seller", email="seller@example.com", password="pw"
+        )
+        cls.alice = User.objects.create_user(
+            username="alice", email="alice@example.com", password="pw"
+        )
+        cls.bob = User.objects.create_user(
+            username="bob", email="bob@example.com", password="pw"
+        )
+        cls.items = [make_item(cls.owner) for _ in range(5)]
+        for item in cls.items:
+            place_bid(item.id, cls.alice, Decimal("20.00"))
+        place_bid(cls.items[0].id, cls.bob, Decimal("30.00"))
+        Question.objects.create(
+            item=cls.items[1], asker=cls.alice, question_text="Any rust?"
+        )
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.client.force_login(self.alice)
+
+    def test_compact_user(self) -> None:
+        full = self.client.get("/api/auth/me/").json()["data"]["user"]
+        compact = self.client.get("/api/auth/me/", {"compact": "1"}).json()["data"]["user"]
+        self.assertEqual(full["bid_item_ids"], [item.id for item in self.items])
+        self.assertEqual(full["questioned_item_ids"], [self.items[1].id])
+        self.assertNotIn("bid_item_ids", compact)
+        self.assertNotIn("questioned_item_ids", compact)
+        self.assertEqual((compact["bid_item_count"], compact["questioned_item_count"]), (5, 1))
+        del full["bid_item_ids"], full["questioned_item_ids"]
+        self.assertEqual(compact, full)
+
+    def test_item_id_pages(self) -> None:
+        ids, cursor = [], None
+        while True:
+            params = {"kind": "bid", "limit": 2, **({"cursor": cursor} if cursor else {})}
+            data = self.client.get("/api/auth/me/items/", params).json()["data"]
+            self.assertEqual(set(data), {"item_ids", "next_cursor", "limit"})
+            self.assertLessEqual(len(data["item_ids"]), 2)
+            ids += data["item_ids"]
+            cursor = data["next_cursor"]
+            if cursor is None:
+                break
+        self.assertEqual(ids, [item.id for item in reversed(self.items)])
+
+        data = self.client.get("/api/auth/me/items/", {"kind": "question"}).json()["data"]
+        self.assertEqual(data, {"item_ids": [self.items[1].id], "next_cursor": None, "limit": 24})
+
+    def test_users_see_only_their_own(self) -> None:
+        self.client.force_login(self.bob)
+        user = self.client.get("/api/auth/me/", {"compact": "1"}).json()["data"]["user"]
+        self.assertEqual((user["bid_item_count"], user["questioned_item_count"]), (1, 0))
+        bids = self.client.get("/api/auth/me/items/", {"kind": "bid"}).json()["data"]
+        self.assertEqual(bids["item_ids"], [self.items[0].id])
+        questions = self.client.get("/api/auth/me/items/", {"kind": "question"}).json()["data"]
+        self.assertEqual(questions["item_ids"], [])
+
+        # A cursor only marks a position; with alice's cursor bob still
+        # sees only his own ids
+        self.client.force_login(self.alice)
+        cursor = self.client.get(
+            "/api/auth/me/items/", {"kind": "bid", "limit": 2}
+        ).json()["data"]["next_cursor"]
+        self.client.force_login(self.bob)
+        page = self.client.get(
+            "/api/auth/me/items/", {"kind": "bid", "cursor": cursor}
+        ).json()["data"]
+        self.assertEqual(page["item_ids"], [self.items[0].id])
+
+    def test_invalid_requests(self) -> None:
+        for params in (
+            {"kind": "watch"},
+            {},
+            {"kind": "bid", "cursor": "not-a-cursor"},
+            {"kind": "bid", "limit": "0"},
+        ):
+            with self.subTest(**params):
+                response = self.client.get("/api/auth/me/items/", params)
+                self.assertEqual(response.status_code, 400)
+        self.client.logout()
+        self.assertEqual(self.client.get("/api/auth/me/", {"compact": "1"}).status_code, 401)
+
+
+class SparseFieldsTests(TestCase):
+    """?fields= on the item list and detail returns, and loads, only those fields."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.owner = User.objects.create_user(
+            username="seller", email="seller@example.com", password="pw"
+        )
+        cls.item = make_item(cls.owner)
+
+    def setUp(self) -> None:
+        cache.clear()
+        self.client.force_login(self.owner)
+
+    def item_selects(self, path: str, params: dict) -> tuple[dict, list[str]]:
+        """The response data and the column lists of the queries loading items."""
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(path, params)
+            data = read_json(response)
+        self.assertEqual(response.status_code, 200)
+        # Skips the ETag version lookups, which read a single column
+        selects = [
+            query["sql"].split(" FROM ")[0] for query in queries
+            if query["sql"].startswith('SELECT "api_item"."id"')
+        ]
+        return data["data"], selects
+
+    def test_list(self) -> None:
+        data, selects = self.item_selects("/api/items/", {"fields": "title,current_price"})
+        self.assertEqual(data["items"], [
+            {"id": self.item.id, "title": "Vintage Bicycle", "current_price": "10.00"}
+        ])
+        # Plus created_at, the pagination key
+        self.assertEqual(selects, [
+            'SELECT "api_item"."id", "api_item"."title", "api_item"."current_price", '
+            '"api_item"."created_at"'
+        ])
+
+    def test_detail(self) -> None:
+        data, selects = self.item_selects(
+            f"/api/items/{self.item.id}/", {"fields": "owner_username"}
+        )
+        self.assertEqual(data["item"], {"id": self.item.id, "owner_username": "seller"})
+        self.assertEqual(len(selects), 1)
+        self.assertIn('"api_user"."username"', selects[0])
+        self.assertNotIn('"api_item"."description"', selects[0])
+        self.assertNotIn('"api_item"."picture"', selects[0])
+
+    def test_unknown_field(self) -> None:
+        for path in ("/api/items/", f"/api/items/{self.item.id}/"):
+            with self.subTest(path):
+                response = self.client.get(path, {"fields": "title,secret"})
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(
+                    response.json()["errors"], {"fields": ["Unknown fields: secret"]}
+                )
+
+    def test_queryset_is_deferred(self) -> None:
+        fields = parse_item_fields("title, owner_username")
+        self.assertEqual(fields, ("id", "owner_username", "title"))
+        queryset = item_queryset(Item.objects.all(), fields)
+        loaded, deferred = queryset.query.deferred_loading
+        self.assertFalse(deferred)
+        self.assertEqual(set(loaded), {"id", "title", "owner", "owner__username"})
+        self.assertEqual(queryset.query.select_related, {"owner": {}})
+
+
+class ItemBatchTests(TestCase):
+    """GET /api/items/batch/?ids= keeps the requested order and reports missing ids."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.owner = User.objects.create_user(
+            username="seller", email="seller@example.com", password="pw"
+        )
+        cls.items = [make_item(cls.owner, title=f"Bicycle {i}") for i in range(3)]
+        cls.inactive = make_item(cls.owner, is_active=False)
+
+    def setUp(self) -> None:
+        self.client.force_login(self.owner)
+
+    def batch(self, ids: str, status: int = 200) -> dict:
+        response = self.client.get("/api/items/batch/", {"ids": ids, "fields": "title"})
+        self.assertEqual(response.status_code, status)
+        return response.json()
+
+    def test_order_and_missing(self) -> None:
+        first, second, third = (item.id for item in self.items)
+        gone = third + 1000
+        data = self.batch(f"{third},{gone},{first},{self.inactive.id},{third},{second}")["data"]
+        self.assertEqual(data["items"], [
+            {"id": third, "title": "Bicycle 2"},
+            {"id": first, "title": "Bicycle 0"},
+            {"id": second, "title": "Bicycle 1"},
+        ])
+        self.assertEqual(data["missing"], [gone, self.inactive.id])
+
+    def test_invalid_ids(self) -> None:
+        cases = {
+            ",".join(str(i) for i in range(1, 102)): "At most 100 ids per request",
+            "1,two": "ids must be integers",
+            "1.5": "ids must be integers",
+            "": "ids is required",
+        }
+        for ids, message in cases.items():
+            with self.subTest(ids=ids[:20]):
+                self.assertEqual(self.batch(ids, 400)["errors"], {"ids": [message]})
+        # Exactly the limit is fine
+        self.batch(",".join(str(i) for i in range(1, 101)))
+
+
+class DashboardTests(TestCase):
+    """GET /api/dashboard/ totals over a fixed set of items and bids."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.seller = User.objects.create_user(
+            username="seller", email="seller@example.com", password="pw"
+        )
+        cls.alice = User.objects.create_user(
+            username="alice", email="alice@example.com", password="pw"
+        )
+        cls.bob = User.objects.create_user(
+            username="bob", email="bob@example.com", password="pw"
+        )
+
+    def setUp(self) -> None:
+        cache.clear()
+        bids = {
+            "outbid": [(self.alice, "20.00"), (self.bob, "30.00")],
+            "leading": [(self.alice, "25.00")],
+            "won": [(self.alice, "15.00")],
+            "lost": [(self.alice, "12.00"), (self.bob, "40.00")],
+        }
+        self.items = {}
+        for name, item_bids in bids.items():
+            item = self.items[name] = make_item(self.seller, title=name)
+            for bidder, amount in item_bids:
+                self.assertTrue(place_bid(item.id, bidder, Decimal(amount)).accepted)
+        make_item(self.seller, title="no bids")
+        Item.objects.filter(id__in=[self.items["won"].id, self.items["lost"].id]).update(
+            end_date=timezone.now() - timedelta(minutes=1)
+        )
+        close_ended([self.items["won"].id, self.items["lost"].id], timezone.now())
+
+        # alice's own listings: one open with a question from bob, one ended
+        self.listing = make_item(self.alice, title="Lamp")
+        make_item(self.alice, title="Chair", end_date=timezone.now() - timedelta(days=1))
+        self.client.force_login(self.bob)
+        response = self.client.post(
+            f"/api/items/{self.listing.id}/questions/",
+            {"question_text": "Does it work?"},
+            content_type="application/json",
+        )
+        self.assertEqual(response.status_code, 201)
+        self.client.force_login(self.alice)
+
+    def test_totals(self) -> None:
+        data = self.client.get("/api/dashboard/").json()["data"]
+        totals = data["totals"]
+        self.assertEqual(totals, {
+            "listings": 2,
+            "active_listings": 1,
+            "unanswered_questions": 1,
+            "won_items": 1,
+            "bid_items": 4,
+            "winning_items": 2,
+            "ended_bid_items": 2,
+            # Current prices of outbid, leading, won and lost
+            "bid_value": "110.00",
+        })
+        # DashboardPage's win rate: won / ended auctions bid on
+        self.assertEqual(totals["won_items"] / totals["ended_bid_items"], 0.5)
+
+        self.assertEqual([item["title"] for item in data["won_items"]], ["won"])
+        self.assertEqual(
+            {entry["item"]["title"]: (entry["my_highest_bid"], entry["is_winning"])
+             for entry in data["bid_items"]},
+            {
+                "outbid": ("20.00", False),
+                "leading": ("25.00", True),
+                "won": ("15.00", True),
+                "lost": ("12.00", False),
+            },
+        )
+        self.assertEqual(
+            [q["question_text"] for q in data["unanswered_questions"]], ["Does it work?"]
+        )
+
+    def test_other_user(self) -> None:
+        self.client.force_login(self.bob)
+        totals = self.client.get("/api/dashboard/").json()["data"]["totals"]
+        self.assertEqual(
+            (totals["bid_items"], totals["won_items"], totals["ended_bid_items"]), (2, 1, 1)
+        )
+        self.assertEqual(totals["listings"], 0)
+
+
+class ImageVariantTests(TestCase):
+    """Uploaded pictures get resized variants, exposed by the serializers."""
+
+    @classmethod
+    def setUpTestData(cls) -> None:
+        cls.owner = User.objects.create_user(
+            username="seller", email="seller@example.com", password="pw"
+        )
+
+    def setUp(self) -> None:
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        settings = self.settings(MEDIA_ROOT=media.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+        self.client.force_login(self.owner)
+
+    def upload(self, size: tuple[int, int], mode: str = "RGB"):
+        """A flat-colour PNG, cheap to encode at any size."""
+        buffer = io.BytesIO()
+        Image.new(mode, size, "red").save(buffer, "PNG")
+        buffer.seek(0)
+        buffer.name = "pic.png"
+        return buffer
+
+    def assertVariants(self, field_file, variants: dict, urls: dict, expected: dict) -> None:
+        """Each variant exists at ``expected[name]`` = (size, format); URLs match."""
+        self.assertEqual(set(variants), set(expected))
+        self.assertEqual(
+            urls, {name: field_file.storage.url(path) for name, path in variants.items()}
+        )
+        for name, (size, image_format) in expected.items():
+            with self.subTest(name), field_file.storage.open(variants[name]) as stored:
+                with Image.open(stored) as image:
+                    self.assertEqual((image.size, image.format), (size, image_format))
+
+    def test_item_picture(self) -> None:
+        response = self.client.post("/api/items/", {
+            "title": "Lamp",
+            "description": "Brass reading lamp",
+            "starting_price": "5.00",
+            "end_date": (timezone.now() + timedelta(days=1)).isoformat(),
+            "picture": self.upload((1600, 1000)),
+        })
+        self.assertEqual(response.status_code, 201)
+        item = Item.objects.get(id=response.json()["data"]["item"]["id"])
+        self.assertVariants(
+            item.picture,
+            item.picture_variants,
+            response.json()["data"]["item"]["picture_variants"],
+            {
+                # Cropped to fill the 4:3 card
+                "thumb": ((400, 300), "JPEG"),
+                "thumb_webp": ((400, 300), "WEBP"),
+                # Fitted inside 1200x900, keeping the aspect ratio
+                "detail": ((1200, 750), "JPEG"),
+                "detail_webp": ((1200, 750), "WEBP"),
+            },
+        )
+        self.assertTrue(all(
+            url.startswith("/media/item_pics/variants/")
+            for url in response.json()["data"]["item"]["picture_variants"].values()
+        ))
+
+    def test_profile_image(self) -> None:
+        response = self.client.put(
+            "/api/profile/",
+            encode_multipart(BOUNDARY, {
+                "email": "seller@example.com",
+                "profile_image": self.upload((600, 500), "RGBA"),
+            }),
+            content_type=MULTIPART_CONTENT,
+        )
+        self.assertEqual(response.status_code, 200)
+        self.owner.refresh_from_db()
+        self.assertVariants(
+            self.owner.profile_image,
+            self.owner.profile_image_variants,
+            response.json()["data"]["user"]["profile_image_variants"],
+            {
+                # Transparency keeps PNG
+                "thumb": ((96, 96), "PNG"),
+                "thumb_webp": ((96, 96), "WEBP"),
+                "detail": ((400, 400), "PNG"),
+                "detail_webp": ((400, 400), "WEBP"),
+            },
+        )
+
+    def test_small_and_missing_sources(self) -> None:
+        item = make_item(self.owner)
+        item.picture.save("small.png", self.upload((200, 100)), save=True)
+        refresh_item_variants(item)
+        item.refresh_from_db()
+        # Never enlarged
+        with item.picture.storage.open(item.picture_variants["thumb"]) as stored:
+            with Image.open(stored) as image:
+                self.assertEqual(image.size, (200, 100))
+
+        item.picture.name = "item_pics/gone.png"
+        self.assertEqual(generate_variants(item.picture, ITEM_VARIANTS), {})
+
+
+class CreateTestDataTests(TestCase):
+    """A small seeded create_test_data run: counts, repeatability and aggregates."""
+
+    def setUp(self) -> None:
+        media = tempfile.TemporaryDirectory()
+        self.addCleanup(media.cleanup)
+        settings = self.settings(MEDIA_ROOT=media.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def generate(self) -> str:
+        out = io.StringIO()
+        call_command(
+            "create_test_data", "--users", "4", "--items", "30", "--bids-per-item", "2",
+            "--questions", "1", "--chunk-size", "7", "--seed", "42", stdout=out,
+        )
+        return out.getvalue()
+
+    def snapshot(self) -> list[tuple]:
+        """Everything generated that does not depend on the current time."""
+        now = timezone.now()
+        return [
+            (
+                item.title,
+                item.description,
+                item.owner.username,
+                item.starting_price,
+                item.current_price,
+                item.end_date < now,
+                [(bid.bidder.username, bid.amount) for bid in item.bids.order_by("amount")],
+                sorted(
+                    (q.asker.username, q.question_text, q.answer_text)
+                    for q in item.questions.all()
+                ),
+            )
+            for item in Item.objects.order_by("id")
+        ]
+
+    def test_counts_and_aggregates(self) -> None:
+        out = self.generate()
+        bids, questions = Bid.objects.count(), Question.objects.count()
+        self.assertEqual(User.objects.count(), 4)
+        self.assertEqual(Item.objects.count(), 30)
+        self.assertIn(f"30 items, {bids} bids, {questions} questions", out)
+        self.assertGreater(bids, 0)
+        self.assertGreater(questions, 0)
+        for item in Item.objects.all():
+            self.assertLess(item.created_at, item.end_date)
+            self.assertLess(item.created_at, timezone.now())
+        self.assertFalse(
+            Bid.objects.filter(bidder=F("item__owner")).exists(),
+            "Owners never bid on their own items",
+        )
+        call_command("sync_item_aggregates", "--check", stdout=io.StringIO())
+
+    def test_same_seed_same_data(self) -> None:
+        self.generate()
+        first = self.snapshot()
+        Item.objects.all().delete()
+        self.generate()
+        self.assertEqual(self.snapshot(), first)
+        self.assertEqual(User.objects.count(), 4)
+
+    def test_without_bulk_insert_ids(self) -> None:
+        """Databases like MySQL don't return ids from bulk_create."""
+        self.generate()
+        expected = self.snapshot()
+        Item.objects.all().delete()
+        with mock.patch.object(
+            type(connection.features),
+            "can_return_rows_from_bulk_insert",
+            new_callable=mock.PropertyMock,
+            return_value=False,
+        ):
+            self.generate()
+        self.assertEqual(self.snapshot(), expected)
+        call_command("sync_item_aggregates", "--check", stdout=io.StringIO())
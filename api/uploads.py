@@ -0,0 +1,155 @@
+"""
+Size-bounded image uploads shared by every endpoint that accepts a picture.
+
+``BoundedImageUploadHandler`` streams each uploaded file to a temporary file
+and checks it while the body is still being read:
+
+- a request whose Content-Length already exceeds the limit is refused before
+  any file data is read;
+- a file is cut off as soon as it passes ``MAX_IMAGE_UPLOAD_SIZE`` bytes;
+- the image header is identified from the first chunks, so a file that is not
+  a JPEG or PNG, or whose dimensions exceed ``MAX_IMAGE_PIXELS`` /
+  ``MAX_IMAGE_DIMENSION``, is refused without reading the rest.
+
+A refusal raises ``StopUpload(connection_reset=True)``, so Django stops
+reading the body and the worker is freed at once. The handler remembers why,
+and ``parse_upload`` turns that into ``UploadRejected`` for the view.
+"""
+
+from functools import wraps
+from io import BytesIO
+from typing import Callable
+
+from django.conf import settings
+from django.core.files.uploadhandler import StopUpload, TemporaryFileUploadHandler
+from django.http import HttpRequest, QueryDict
+from django.http.multipartparser import MultiPartParser
+from django.utils.datastructures import MultiValueDict
+from django.views.decorators.csrf import csrf_exempt, csrf_protect
+from PIL import Image
+
+ALLOWED_FORMATS = {"JPEG", "PNG"}
+# Room for the non-file form fields when checking Content-Length
+FORM_OVERHEAD_BYTES = 64 * 1024
+# Give up identifying the image after this much of the file (JPEG headers
+# can follow large EXIF blocks)
+MAX_HEADER_BYTES = 256 * 1024
+
+
+class UploadRejected(Exception):
+    """An uploaded file was refused; ``status`` is the HTTP status to answer with."""
+
+    def __init__(self, field: str, message: str, status: int) -> None:
+        super().__init__(message)
+        self.field = field
+        self.message = message
+        self.status = status
+
+
+class BoundedImageUploadHandler(TemporaryFileUploadHandler):
+    """Stream uploads to disk, refusing oversized or non-image files early."""
+
+    def __init__(self, request: HttpRequest | None = None) -> None:
+        super().__init__(request)
+        self.max_bytes: int = settings.MAX_IMAGE_UPLOAD_SIZE
+        self.max_pixels: int = settings.MAX_IMAGE_PIXELS
+        self.max_dimension: int = settings.MAX_IMAGE_DIMENSION
+        self.request_length = 0
+        self.rejection: UploadRejected | None = None
+
+    def handle_raw_input(
+        self, input_data, META, content_length, boundary, encoding=None
+    ) -> None:
+        self.request_length = content_length
+        # Let the default parser run
+        return None
+
+    def new_file(self, field_name, file_name, *args, **kwargs) -> None:
+        super().new_file(field_name, file_name, *args, **kwargs)
+        self._received = 0
+        self._header = bytearray()
+        self._identified = False
+        if self.request_length > self.max_bytes + FORM_OVERHEAD_BYTES:
+            self._reject("Image is too large", 413)
+
+    def receive_data_chunk(self, raw_data: bytes, start: int) -> None:
+        self._received += len(raw_data)
+        if self._received > self.max_bytes:
+            self._reject("Image is too large", 413)
+        if not self._identified:
+            self._header += raw_data
+            self._identify(complete=False)
+        super().receive_data_chunk(raw_data, start)
+
+    def file_complete(self, file_size: int):
+        if not self._identified:
+            self._identify(complete=True)
+        return super().file_complete(file_size)
+
+    def _identify(self, complete: bool) -> None:
+        """Read format and size from the header buffered so far."""
+        try:
+            with Image.open(BytesIO(self._header)) as image:
+                image_format, (width, height) = image.format, image.size
+        except Exception:
+            # Possibly just not enough bytes yet
+            if complete or len(self._header) >= MAX_HEADER_BYTES:
+                self._reject("Upload a valid JPEG or PNG image", 400)
+            return
+
+        self._identified = True
+        self._header = bytearray()
+        if image_format not in ALLOWED_FORMATS:
+            self._reject("Upload a valid JPEG or PNG image", 400)
+        if (
+            width * height > self.max_pixels
+            or max(width, height) > self.max_dimension
+        ):
+            self._reject("Image dimensions are too large", 413)
+
+    def _reject(self, message: str, status: int) -> None:
+        self.rejection = UploadRejected(self.field_name, message, status)
+        # The parser closes (and so deletes) the temporary file
+        raise StopUpload(connection_reset=True)
+
+
+def bounded_uploads(view: Callable) -> Callable:
+    """
+    Decorate a view that accepts image uploads.
+
+    Installs BoundedImageUploadHandler before anything reads the body. For
+    POST, CsrfViewMiddleware would parse the body first, so the CSRF check
+    is moved inside, after the handler is in place.
+    """
+    protected = csrf_protect(view)
+
+    @wraps(view)
+    def wrapper(request: HttpRequest, *args, **kwargs):
+        request.upload_handlers = [BoundedImageUploadHandler(request)]
+        return protected(request, *args, **kwargs)
+
+    return csrf_exempt(wrapper)
+
+
+def parse_upload(request: HttpRequest) -> tuple[QueryDict, MultiValueDict]:
+    """
+    Parse a multipart body (POST or PUT) through the view's upload handlers.
+
+    Returns:
+        (data, files), like request.POST and request.FILES
+
+    Raises:
+        UploadRejected: If the handler refused a file
+    """
+    if request.method == "POST":
+        data, files = request.POST, request.FILES
+    else:
+        parser = MultiPartParser(request.META, request, request.upload_handlers)
+        data, files = parser.parse()
+        # Stored where HttpRequest.close() will close (and delete) temp files
+        request._post, request._files = data, files
+    for handler in request.upload_handlers:
+        rejection = getattr(handler, "rejection", None)
+        if rejection is not None:
+            raise rejection
+    return data, files
@@ -30,15 +30,22 @@ urlpatterns = [
     path("api/auth/login/", api_views.api_login, name="api_login"),
     path("api/auth/logout/", api_views.api_logout, name="api_logout"),
     path("api/auth/me/", api_views.api_get_user, name="api_get_user"),
+    path("api/auth/me/items/", api_views.api_user_item_ids, name="api_user_item_ids"),
+    path("api/dashboard/", api_views.api_dashboard, name="api_dashboard"),
+    path("api/admin/db-pool/", api_views.api_db_pool_stats, name="api_db_pool_stats"),
     path("api/profile/", api_views.api_update_profile, name="api_update_profile"),
 
     # Item/Auction endpoints
     path("api/items/", api_views.api_items, name="api_items"),
+    path("api/items/batch/", api_views.api_items_batch, name="api_items_batch"),
+    path("api/items/stream/", api_views.api_items_stream, name="api_items_stream"),
     path("api/items/<int:item_id>/", api_views.api_item_detail, name="api_item_detail"),
+    path("api/items/<int:item_id>/stream/", api_views.api_item_stream, name="api_item_stream"),
     path("api/items/<int:item_id>/edit/", api_views.api_update_item, name="api_update_item"),
     path("api/items/<int:item_id>/delete/", api_views.api_delete_item, name="api_delete_item"),
     path("api/items/<int:item_id>/bid/", api_views.api_place_bid, name="api_place_bid"),
-    path("api/items/<int:item_id>/questions/", api_views.api_ask_question, name="api_ask_question"),
+    path("api/items/<int:item_id>/bids/", api_views.api_item_bids, name="api_item_bids"),
+    path("api/items/<int:item_id>/questions/", api_views.api_item_questions, name="api_item_questions"),
     path("api/questions/<int:question_id>/answer/", api_views.api_answer_question, name="api_answer_question"),
 ]
 
@@ -0,0 +1,83 @@
+"""
+Per-user cache of the items a user has bid on or asked about.
+
+``/api/auth/me`` returns both sets on every SPA load. Computing them is a
+``DISTINCT`` over the user's whole bid or question history. Instead, each set
+is kept in Django's default cache as a sorted list of item ids:
+
+- ``user:<id>:bid_items``
+- ``user:<id>:questioned_items``
+
+A miss loads the set from the database once. Afterwards, new bids and
+questions add their item to the cached list, so the list never has to be
+recomputed while it stays cached. Adding is a read-modify-write. If two of
+one user's requests in different processes add different items at the same
+instant, one item can be missing until the entry expires. The sets drive UI
+hints only, so the expiry is kept short rather than locking.
+
+As with :mod:`api.price_cache`, several worker processes need a shared
+cache to see each other's updates.
+"""
+
+from bisect import bisect_left
+
+from django.core.cache import cache
+
+from .models import Bid, Question
+
+ACTIVITY_CACHE_TIMEOUT = 15 * 60
+
+BIDS = "bid"
+QUESTIONS = "question"
+KINDS = (BIDS, QUESTIONS)
+
+
+def _key(user_id: int, kind: str) -> str:
+    suffix = "bid_items" if kind == BIDS else "questioned_items"
+    return f"user:{user_id}:{suffix}"
+
+
+def _load(user_id: int, kind: str) -> list[int]:
+    if kind == BIDS:
+        rows = Bid.objects.filter(bidder_id=user_id)
+    else:
+        rows = Question.objects.filter(asker_id=user_id)
+    return list(rows.order_by("item_id").values_list("item_id", flat=True).distinct())
+
+
+def item_ids(user_id: int, kind: str) -> list[int]:
+    """Sorted ids of the items a user has interacted with, from the cache if possible."""
+    key = _key(user_id, kind)
+    ids = cache.get(key)
+    if ids is None:
+        ids = _load(user_id, kind)
+        cache.add(key, ids, ACTIVITY_CACHE_TIMEOUT)
+    return ids
+
+
+def all_item_ids(user_id: int) -> dict[str, list[int]]:
+    """Both sets for a user in one cache round trip."""
+    keys = {kind: _key(user_id, kind) for kind in KINDS}
+    cached = cache.get_many(keys.values())
+    result = {}
+    for kind, key in keys.items():
+        ids = cached.get(key)
+        if ids is None:
+            ids = _load(user_id, kind)
+            cache.add(key, ids, ACTIVITY_CACHE_TIMEOUT)
+        result[kind] = ids
+    return result
+
+
+def interacted(user_id: int, item_id: int, kind: str) -> None:
+    """Record that a user bid on or asked about an item."""
+    key = _key(user_id, kind)
+    ids = cache.get(key)
+    if ids is None:
+        # Nothing cached; the next read loads the set including this item
+        return
+    position = bisect_left(ids, item_id)
+    if position < len(ids) and ids[position] == item_id:
+        return
+    ids.insert(position, item_id)
+    cache.set(key, ids, ACTIVITY_CACHE_TIMEOUT)
@@ -0,0 +1,102 @@
+"""
+Cache of authenticated users, so a signed-in request does not query the
+user table.
+
+``AuthenticationMiddleware`` resolves ``request.user`` through the
+authentication backend on every request. ``CachedModelBackend`` answers
+from Django's default cache:
+
+- ``user:<id>:auth``: the User instance
+
+A miss loads the row once and stores it. Every save or delete of a user
+(profile updates, password changes, last_login on sign-in, the admin)
+drops the entry through the signal handlers connected in ``ApiConfig``, so
+the session hash check always runs against the current password.
+``api_update_profile`` writes the saved user back, so the next request is a
+hit.
+
+Sessions are cached by the ``cached_db`` session engine (see
+``SESSION_ENGINE``), which writes through to the database. Together they
+remove both queries that ``login_required`` used to cost.
+
+Both are only enabled with a cache shared by every worker process:
+otherwise a logout or password change would only clear the cache of the
+worker that handled it. ``check_shared_cache`` rejects them on a
+per-process cache.
+"""
+
+from typing import Any
+
+from django.conf import settings
+from django.contrib.auth.backends import ModelBackend
+from django.core import checks
+from django.core.cache import cache
+
+from .models import User
+
+USER_CACHE_TIMEOUT = 15 * 60
+
+
+def _key(user_id: Any) -> str:
+    # Sessions store the id as a string
+    return f"user:{User._meta.pk.to_python(user_id)}:auth"
+
+
+def get_user(user_id: Any) -> User | None:
+    """The user with ``user_id``, from the cache if possible; None if gone."""
+    key = _key(user_id)
+    user = cache.get(key)
+    if user is None:
+        try:
+            user = User._default_manager.get(pk=user_id)
+        except (User.DoesNotExist, ValueError):
+            return None
+        cache.add(key, user, USER_CACHE_TIMEOUT)
+    return user
+
+
+def remember(user: User) -> None:
+    """Write a just-saved user through to the cache."""
+    cache.set(_key(user.pk), user, USER_CACHE_TIMEOUT)
+
+
+def forget(user_id: Any) -> None:
+    """Drop a user's entry; the next request reloads it."""
+    cache.delete(_key(user_id))
+
+
+def user_changed(sender, instance: User, **kwargs) -> None:
+    """post_save / post_delete handler for User."""
+    forget(instance.pk)
+
+
+class CachedModelBackend(ModelBackend):
+    """ModelBackend whose per-request user lookup goes through the cache."""
+
+    def get_user(self, user_id: Any) -> User | None:
+        user = get_user(user_id)
+        return user if user is not None and self.user_can_authenticate(user) else None
+
+
+def check_shared_cache(app_configs, **kwargs) -> list[checks.CheckMessage]:
+    """System check: cached sessions and users need a cache shared by all workers."""
+    if settings.CACHES["default"]["BACKEND"] not in settings.PROCESS_LOCAL_CACHES:
+        return []
+    errors = []
+    if settings.SESSION_ENGINE == "django.contrib.sessions.backends.cached_db":
+        errors.append(
+            checks.Error(
+                "SESSION_ENGINE cached_db needs a shared cache (CACHE_BACKEND)",
+                hint="Use django.contrib.sessions.backends.db with a per-process cache.",
+                id="api.E001",
+            )
+        )
+    if "api.user_cache.CachedModelBackend" in settings.AUTHENTICATION_BACKENDS:
+        errors.append(
+            checks.Error(
+                "CachedModelBackend needs a shared cache (CACHE_BACKEND)",
+                hint="Use django.contrib.auth.backends.ModelBackend with a per-process cache.",
+                id="api.E002",
+            )
+        )
+    return errors
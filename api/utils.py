@@ -1,7 +1,13 @@
-from typing import Any, TypedDict
-from django.http import JsonResponse
+import json
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator, TypedDict
+from asgiref.sync import sync_to_async
+from django.db.models import QuerySet
+from django.http import JsonResponse, StreamingHttpResponse
 from django.core.serializers.json import DjangoJSONEncoder
 
+# Rows serialized per write of a streamed response
+STREAM_CHUNK_SIZE = 100
+
 
 class ApiResponse(TypedDict, total=False):
     """Type definition for API responses"""
@@ -39,3 +45,86 @@ def json_response(
         response["errors"] = errors
 
     return JsonResponse(response, status=status, encoder=DjangoJSONEncoder)
+
+
+def _encode(value: Any) -> str:
+    return json.dumps(value, cls=DjangoJSONEncoder)
+
+
+def stream_json_response(
+    key: str,
+    rows: Iterable[Any],
+    serialize: Callable[[Any], Any],
+    data: dict[str, Any] | None = None,
+    trailer: Callable[[], dict[str, Any]] | None = None,
+    status: int = 200,
+    chunk_size: int = STREAM_CHUNK_SIZE,
+    asynchronous: bool = False,
+) -> StreamingHttpResponse:
+    """
+    Streaming variant of json_response for large lists.
+
+    Produces the same ``{"success": true, "data": {...}}`` envelope, but the
+    list under ``data[key]`` is serialized and sent ``chunk_size`` rows at a
+    time, so neither the row dicts nor the JSON text are ever held in full.
+    A QuerySet is walked with ``.iterator(chunk_size=...)``.
+
+    Under ASGI pass ``asynchronous=True``: Django would otherwise read a
+    synchronous body to the end before sending any of it. The body is then
+    an async iterator that reads each chunk in the view's thread, where the
+    database connection lives.
+
+    Args:
+        key: Key under ``data`` that holds the streamed list
+        rows: QuerySet or iterable of rows
+        serialize: Converts one row to a JSON-serializable value
+        data: Other ``data`` entries, sent before the list
+        trailer: Called after the list is sent; returns ``data`` entries that
+            depend on the rows (e.g. cursors), sent after the list
+        status: HTTP status code
+        chunk_size: Rows per chunk
+        asynchronous: Give the response an async iterator (ASGI)
+
+    Returns:
+        StreamingHttpResponse with a JSON body
+    """
+    if isinstance(rows, QuerySet):
+        rows = rows.iterator(chunk_size=chunk_size)
+
+    def body() -> Iterator[str]:
+        yield '{"success": true, "data": {'
+        for name, value in (data or {}).items():
+            yield f"{_encode(name)}: {_encode(value)}, "
+        yield f"{_encode(key)}: ["
+
+        separator = ""
+        buffer = []
+        for row in rows:
+            buffer.append(separator + _encode(serialize(row)))
+            separator = ", "
+            if len(buffer) >= chunk_size:
+                yield "".join(buffer)
+                buffer = []
+        if buffer:
+            yield "".join(buffer)
+
+        yield "]"
+        for name, value in (trailer() if trailer else {}).items():
+            yield f", {_encode(name)}: {_encode(value)}"
+        yield "}}"
+
+    content = _in_sync_thread(body()) if asynchronous else body()
+    return StreamingHttpResponse(
+        content, status=status, content_type="application/json"
+    )
+
+
+async def _in_sync_thread(chunks: Iterator[str]) -> AsyncIterator[str]:
+    """Async iterator over a synchronous one, advanced in the sync thread."""
+    next_chunk = sync_to_async(next, thread_sensitive=True)
+    try:
+        while (chunk := await next_chunk(chunks, None)) is not None:
+            yield chunk
+    finally:
+        # Ends the query if the client went away mid-stream
+        await sync_to_async(chunks.close, thread_sensitive=True)()
@@ -13,23 +13,74 @@ import type {
 
 export interface ItemsResponse {
   items: Item[];
+  next_cursor: string | null;
+  prev_cursor: string | null;
+  limit: number;
 }
 
 export interface ItemDetailResponse {
   item: Item;
   bids: Bid[];
+  bids_next_cursor: string | null;
   questions: Question[];
+  questions_next_cursor: string | null;
 }
 
+export interface BidItem {
+  item: Item;
+  my_highest_bid: string;
+  is_winning: boolean;
+}
+
+export interface DashboardResponse {
+  my_items: Item[];
+  bid_items: BidItem[];
+  won_items: Item[];
+  asked_items: Item[];
+  unanswered_questions: Question[];
+  // Over all of the user's activity; the lists hold at most limit entries
+  totals: {
+    listings: number;
+    active_listings: number;
+    unanswered_questions: number;
+    won_items: number;
+    bid_items: number;
+    winning_items: number;
+    ended_bid_items: number;
+    bid_value: string;
+  };
+  limit: number;
+}
+
+export interface BidsResponse {
+  bids: Bid[];
+  next_cursor: string | null;
+  prev_cursor: string | null;
+  limit: number;
+}
+
+export interface QuestionsResponse {
+  questions: Question[];
+  next_cursor: string | null;
+  prev_cursor: string | null;
+  limit: number;
+}
+
+// Live streams need the API served over ASGI (project.asgi); build with
+// VITE_EVENT_STREAMS=true to use them
+export const EVENT_STREAMS_ENABLED = import.meta.env.VITE_EVENT_STREAMS === 'true';
+
 export const itemsService = {
   /**
-   * Get all items with optional search
+   * Get one page of items with optional search.
+   * Pass the next_cursor of a previous page as cursor to continue.
    */
-  async getItems(search?: string): Promise<ApiResponse<ItemsResponse>> {
-    const url = search
-      ? `/api/items/?search=${encodeURIComponent(search)}`
-      : '/api/items/';
-    return apiClient.get<ItemsResponse>(url);
+  async getItems(search?: string, cursor?: string): Promise<ApiResponse<ItemsResponse>> {
+    const params = new URLSearchParams();
+    if (search) params.set('search', search);
+    if (cursor) params.set('cursor', cursor);
+    const query = params.toString();
+    return apiClient.get<ItemsResponse>(query ? `/api/items/?${query}` : '/api/items/');
   },
 
   /**
@@ -39,6 +90,36 @@ export const itemsService = {
     return apiClient.get<ItemDetailResponse>(`/api/items/${itemId}/`);
   },
 
+  /**
+   * Get the current user's listings, bids, wins and pending questions
+   */
+  async getDashboard(): Promise<ApiResponse<DashboardResponse>> {
+    return apiClient.get<DashboardResponse>('/api/dashboard/');
+  },
+
+  /**
+   * Get the next page of an item's bids (newest first)
+   */
+  async getItemBids(itemId: number, cursor: string): Promise<ApiResponse<BidsResponse>> {
+    const params = new URLSearchParams({ cursor });
+    return apiClient.get<BidsResponse>(`/api/items/${itemId}/bids/?${params}`);
+  },
+
+  /**
+   * Get the next page of an item's questions (newest first)
+   */
+  async getItemQuestions(itemId: number, cursor: string): Promise<ApiResponse<QuestionsResponse>> {
+    const params = new URLSearchParams({ cursor });
+    return apiClient.get<QuestionsResponse>(`/api/items/${itemId}/questions/?${params}`);
+  },
+
+  /**
+   * Open the Server-Sent Events stream of bids and closures for an item
+   */
+  streamItem(itemId: number): EventSource {
+    return new EventSource(`/api/items/${itemId}/stream/`, { withCredentials: true });
+  },
+
   /**
    * Create new auction item
    */
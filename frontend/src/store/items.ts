@@ -1,5 +1,5 @@
 import { defineStore } from 'pinia';
-import { itemsService } from '@/services/items';
+import { itemsService, EVENT_STREAMS_ENABLED } from '@/services/items';
 import type {
   Item,
   Bid,
@@ -11,19 +11,30 @@ import { useUserStore } from './user';
 
 interface ItemsState {
   items: Item[];
+  itemsSearch: string | undefined;
+  nextCursor: string | null;
   currentItem: Item | null;
   currentItemBids: Bid[];
+  currentItemBidsCursor: string | null;
   currentItemQuestions: Question[];
+  currentItemQuestionsCursor: string | null;
   loading: boolean;
   error: string | null;
 }
 
+// Live bid stream for the item being viewed (not reactive state)
+let itemStream: EventSource | null = null;
+
 export const useItemsStore = defineStore('items', {
   state: (): ItemsState => ({
     items: [],
+    itemsSearch: undefined,
+    nextCursor: null,
     currentItem: null,
     currentItemBids: [],
+    currentItemBidsCursor: null,
     currentItemQuestions: [],
+    currentItemQuestionsCursor: null,
     loading: false,
     error: null,
   }),
@@ -42,6 +53,8 @@ export const useItemsStore = defineStore('items', {
         const response = await itemsService.getItems(search);
         if (response.success && response.data) {
           this.items = response.data.items;
+          this.itemsSearch = search;
+          this.nextCursor = response.data.next_cursor;
         } else {
           this.error = response.error || 'Failed to load items';
         }
@@ -52,6 +65,23 @@ export const useItemsStore = defineStore('items', {
       }
     },
 
+    async fetchMoreItems(): Promise<void> {
+      if (!this.nextCursor) return;
+      this.error = null;
+
+      try {
+        const response = await itemsService.getItems(this.itemsSearch, this.nextCursor);
+        if (response.success && response.data) {
+          this.items.push(...response.data.items);
+          this.nextCursor = response.data.next_cursor;
+        } else {
+          this.error = response.error || 'Failed to load items';
+        }
+      } catch {
+        this.error = 'Network error';
+      }
+    },
+
     async fetchItemDetail(itemId: number): Promise<boolean> {
       this.loading = true;
       this.error = null;
@@ -61,7 +91,9 @@ export const useItemsStore = defineStore('items', {
         if (response.success && response.data) {
           this.currentItem = response.data.item;
           this.currentItemBids = response.data.bids;
+          this.currentItemBidsCursor = response.data.bids_next_cursor;
           this.currentItemQuestions = response.data.questions;
+          this.currentItemQuestionsCursor = response.data.questions_next_cursor;
           return true;
         } else {
           this.error = response.error || 'Failed to load item';
@@ -75,6 +107,40 @@ export const useItemsStore = defineStore('items', {
       }
     },
 
+    async fetchMoreBids(): Promise<void> {
+      if (!this.currentItem || !this.currentItemBidsCursor) return;
+      this.error = null;
+
+      try {
+        const response = await itemsService.getItemBids(this.currentItem.id, this.currentItemBidsCursor);
+        if (response.success && response.data) {
+          this.currentItemBids.push(...response.data.bids);
+          this.currentItemBidsCursor = response.data.next_cursor;
+        } else {
+          this.error = response.error || 'Failed to load bids';
+        }
+      } catch {
+        this.error = 'Network error';
+      }
+    },
+
+    async fetchMoreQuestions(): Promise<void> {
+      if (!this.currentItem || !this.currentItemQuestionsCursor) return;
+      this.error = null;
+
+      try {
+        const response = await itemsService.getItemQuestions(this.currentItem.id, this.currentItemQuestionsCursor);
+        if (response.success && response.data) {
+          this.currentItemQuestions.push(...response.data.questions);
+          this.currentItemQuestionsCursor = response.data.next_cursor;
+        } else {
+          this.error = response.error || 'Failed to load questions';
+        }
+      } catch {
+        this.error = 'Network error';
+      }
+    },
+
     async createItem(data: ItemCreateData): Promise<boolean> {
       this.loading = true;
       this.error = null;
@@ -244,10 +310,64 @@ export const useItemsStore = defineStore('items', {
       }
     },
 
+    /**
+     * Receive new bids and closures for an item as they happen.
+     * Without streams the page keeps the data fetched on load.
+     */
+    subscribeToItem(itemId: number): void {
+      this.unsubscribeFromItem();
+      if (!EVENT_STREAMS_ENABLED) return;
+      itemStream = itemsService.streamItem(itemId);
+
+      itemStream.addEventListener('error', () => {
+        // Refused by the server (e.g. 501 outside ASGI): stop and refetch once
+        if (itemStream?.readyState === EventSource.CLOSED) {
+          this.unsubscribeFromItem();
+          if (this.currentItem?.id === itemId) {
+            this.fetchItemDetail(itemId);
+          }
+        }
+      });
+
+      itemStream.addEventListener('bid', (event: MessageEvent) => {
+        const { item, bid } = JSON.parse(event.data) as { item: Item; bid: Bid };
+        if (this.currentItem?.id === item.id) {
+          this.currentItem = item;
+          if (!this.currentItemBids.some((b: Bid) => b.id === bid.id)) {
+            this.currentItemBids.unshift(bid);
+          }
+        }
+        const index = this.items.findIndex((i: Item) => i.id === item.id);
+        if (index !== -1) {
+          this.items[index] = item;
+        }
+      });
+
+      itemStream.addEventListener('closed', (event: MessageEvent) => {
+        const { item_id, winner_id, winner_username } = JSON.parse(event.data);
+        if (this.currentItem?.id === item_id) {
+          this.currentItem = {
+            ...this.currentItem,
+            is_ended: true,
+            winner_id,
+            winner_username,
+          };
+        }
+      });
+    },
+
+    unsubscribeFromItem(): void {
+      itemStream?.close();
+      itemStream = null;
+    },
+
     clearCurrentItem(): void {
+      this.unsubscribeFromItem();
       this.currentItem = null;
       this.currentItemBids = [];
+      this.currentItemBidsCursor = null;
       this.currentItemQuestions = [];
+      this.currentItemQuestionsCursor = null;
     },
   },
 });
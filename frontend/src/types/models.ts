@@ -10,7 +10,10 @@ export interface User {
   email: string;
   date_of_birth: string | null;
   profile_image: string | null;
+  profile_image_variants: Record<string, string>;
   currency_preference: CurrencyCode;
+  bid_item_count: number;
+  questioned_item_count: number;
   bid_item_ids: number[];
   questioned_item_ids: number[];
 }
@@ -45,11 +48,17 @@ export interface Item {
   starting_price: string;
   current_price: string;
   picture: string | null;
+  // thumb, detail and their *_webp renditions; empty until generated
+  picture_variants: Record<string, string>;
   end_date: string;
   created_at: string;
   is_active: boolean;
   is_ended: boolean;
   bid_count: number;
+  leading_bid: string | null;
+  leading_bidder_id: number | null;
+  last_bid_at: string | null;
+  unanswered_question_count: number;
   winner_id: number | null;
   winner_username: string | null;
 }
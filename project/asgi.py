@@ -2,6 +2,8 @@
 ASGI config for project project.
 
 It exposes the ASGI callable as a module-level variable named ``application``.
+The Server-Sent Events endpoints (api/items/stream/ and
+api/items/<id>/stream/) need to be served through it.
 
 For more information on this file, see
 https://docs.djangoproject.com/en/stable/howto/deployment/asgi/
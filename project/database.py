@@ -1,14 +1,50 @@
 import os
+from importlib.util import find_spec
 
 from django.conf import settings
 
 
 engines = {
     'sqlite': 'django.db.backends.sqlite3',
-    'postgresql': 'django.db.backends.postgresql_psycopg2',
+    'postgresql': 'django.db.backends.postgresql',
     'mysql': 'django.db.backends.mysql',
 }
 
+search_backends = {
+    engines['sqlite']: 'api.search.SQLiteSearchBackend',
+    engines['postgresql']: 'api.search.PostgresSearchBackend',
+}
+
+event_broadcasters = {
+    engines['postgresql']: 'api.events.PostgresBroadcaster',
+}
+
+
+def _env_int(name, default):
+    return int(os.getenv(name, default))
+
+
+def pool_options():
+    """
+    Options for Django's per-process PostgreSQL connection pool, or None.
+
+    Pooling needs psycopg 3 with psycopg_pool (``psycopg[pool]``) and can be
+    turned off with DATABASE_POOL=0. Sizes are per process, so a server
+    opens at most workers * DATABASE_POOL_MAX_SIZE connections.
+    """
+    if os.getenv('DATABASE_POOL', '1') == '0' or find_spec('psycopg_pool') is None:
+        return None
+    return {
+        'min_size': _env_int('DATABASE_POOL_MIN_SIZE', 2),
+        'max_size': _env_int('DATABASE_POOL_MAX_SIZE', 10),
+        # Seconds a request waits for a free connection before failing
+        'timeout': _env_int('DATABASE_POOL_TIMEOUT', 10),
+        # Seconds before idle connections above min_size are closed
+        'max_idle': _env_int('DATABASE_POOL_MAX_IDLE', 300),
+        # Seconds before a connection is replaced, spreading out reconnects
+        'max_lifetime': _env_int('DATABASE_POOL_MAX_LIFETIME', 3600),
+    }
+
 
 def config():
     service_name = os.getenv('DATABASE_SERVICE_NAME', '').upper().replace('-', '_')
@@ -19,11 +55,91 @@ def config():
     name = os.getenv('DATABASE_NAME')
     if not name and engine == engines['sqlite']:
         name = os.path.join(settings.BASE_DIR, 'db.sqlite3')
-    return {
+    database = {
         'ENGINE': engine,
         'NAME': name,
         'USER': os.getenv('DATABASE_USER'),
         'PASSWORD': os.getenv('DATABASE_PASSWORD'),
         'HOST': os.getenv('{}_SERVICE_HOST'.format(service_name)),
         'PORT': os.getenv('{}_SERVICE_PORT'.format(service_name)),
+        # Keep connections between requests instead of reconnecting each time;
+        # a connection that went away is replaced rather than failing a request
+        'CONN_MAX_AGE': _env_int('DATABASE_CONN_MAX_AGE', 60),
+        'CONN_HEALTH_CHECKS': True,
+    }
+    if engine == engines['postgresql']:
+        pool = pool_options()
+        if pool:
+            # The pool keeps connections open itself and checks them on
+            # checkout; Django refuses CONN_MAX_AGE together with a pool
+            database['OPTIONS'] = {'pool': pool}
+            database['CONN_MAX_AGE'] = 0
+    return database
+
+
+def replica_config(primary):
+    """
+    Settings for an optional read replica of ``primary``, or None.
+
+    Set DATABASE_REPLICA_HOST (and DATABASE_REPLICA_PORT) for a server
+    replica, or DATABASE_REPLICA_NAME for a different database name, e.g. a
+    second SQLite file standing in for a replica locally. Everything else
+    is the primary's. Tests mirror the primary.
+    """
+    host = os.getenv('DATABASE_REPLICA_HOST')
+    name = os.getenv('DATABASE_REPLICA_NAME')
+    if not host and not name:
+        return None
+    replica = dict(primary, OPTIONS=dict(primary.get('OPTIONS', {})))
+    if host:
+        replica['HOST'] = host
+        replica['PORT'] = os.getenv('DATABASE_REPLICA_PORT', primary['PORT'])
+    if name:
+        replica['NAME'] = name
+    replica['TEST'] = {'MIRROR': 'default'}
+    return replica
+
+
+def pool_stats(alias='default'):
+    """
+    Counters of this process's connection pool for ``alias``, or None when
+    the database is not pooled. Counters run since the pool was opened.
+
+    Returns:
+        dict with size (open connections), available (idle), max_size,
+        checkouts, waits (checkouts that had to queue), wait_ms (total time
+        queued), waiting (queued right now), timeouts (checkouts that gave
+        up after DATABASE_POOL_TIMEOUT) and connection_errors
+    """
+    from django.db import connections
+
+    pool = getattr(connections[alias], 'pool', None)
+    if pool is None:
+        return None
+    stats = pool.get_stats()
+    return {
+        'size': stats.get('pool_size', 0),
+        'available': stats.get('pool_available', 0),
+        'max_size': pool.max_size,
+        'checkouts': stats.get('requests_num', 0),
+        'waits': stats.get('requests_queued', 0),
+        'wait_ms': stats.get('requests_wait_ms', 0),
+        'waiting': stats.get('requests_waiting', 0),
+        'timeouts': stats.get('requests_errors', 0),
+        'connection_errors': stats.get('connections_errors', 0),
     }
+
+
+def search_backend(engine):
+    """Return the dotted path of the item search backend for a database engine."""
+    return search_backends.get(engine, 'api.search.BasicSearchBackend')
+
+
+def event_broadcaster(engine):
+    """
+    Return the dotted path of the event broadcaster for a database engine.
+
+    PostgreSQL carries events between processes with LISTEN/NOTIFY; other
+    engines only reach stream subscribers in the publishing process.
+    """
+    return event_broadcasters.get(engine, 'api.events.LocalBroadcaster')
@@ -58,6 +58,7 @@ MIDDLEWARE = [
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
     'django.contrib.auth.middleware.AuthenticationMiddleware',
+    'api.replicas.ReadYourWritesMiddleware',
     'django.contrib.messages.middleware.MessageMiddleware',
     'django.middleware.clickjacking.XFrameOptionsMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
@@ -92,6 +93,52 @@ DATABASES = {
     'default': database.config()
 }
 
+# Optional read replica. Views decorated with api.replicas.read_from_replica
+# read from it, except for users who wrote within READ_YOUR_WRITES_SECONDS
+# (set above the replica's usual lag).
+_replica = database.replica_config(DATABASES['default'])
+if _replica:
+    DATABASES['replica'] = _replica
+READ_REPLICA = 'replica' if _replica else None
+READ_YOUR_WRITES_SECONDS = int(os.getenv('READ_YOUR_WRITES_SECONDS', '10'))
+DATABASE_ROUTERS = ['api.replicas.ReplicaRouter']
+
+# Full-text item search, matched to the database engine
+SEARCH_BACKEND = database.search_backend(DATABASES['default']['ENGINE'])
+
+
+# Cache (bid price cache, ...). Use a shared backend such as Redis or
+# Memcached when running more than one worker process.
+CACHES = {
+    'default': {
+        'BACKEND': os.getenv(
+            'CACHE_BACKEND', 'django.core.cache.backends.locmem.LocMemCache'
+        ),
+        'LOCATION': os.getenv('CACHE_LOCATION', ''),
+    }
+}
+
+# With a cache shared by every worker, sessions and the signed-in user are
+# read from it, so login_required views do not query django_session and
+# api_user on every request (sessions still write through to the database).
+# A per-process cache would keep serving a session or password hash after
+# another worker signed the user out, so it gets the database-backed ones.
+PROCESS_LOCAL_CACHES = [
+    'django.core.cache.backends.locmem.LocMemCache',
+    'django.core.cache.backends.dummy.DummyCache',
+]
+if CACHES['default']['BACKEND'] in PROCESS_LOCAL_CACHES:
+    SESSION_ENGINE = 'django.contrib.sessions.backends.db'
+    AUTHENTICATION_BACKENDS = ['django.contrib.auth.backends.ModelBackend']
+else:
+    SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+    AUTHENTICATION_BACKENDS = ['api.user_cache.CachedModelBackend']
+
+
+# Fan-out for the Server-Sent Events streams. Only the PostgreSQL one
+# reaches other processes, e.g. closures made by close_auctions.
+EVENT_BROADCASTER = database.event_broadcaster(DATABASES['default']['ENGINE'])
+
 
 # Password validation
 # https://docs.djangoproject.com/en/stable/ref/settings/#auth-password-validators
@@ -148,6 +195,11 @@ AUTH_USER_MODEL = 'api.User'
 MEDIA_URL = '/media/'
 MEDIA_ROOT = BASE_DIR / 'media'
 
+# Image upload limits, enforced while the body is read (see api.uploads)
+MAX_IMAGE_UPLOAD_SIZE = int(os.getenv('MAX_IMAGE_UPLOAD_SIZE', 10 * 1024 * 1024))
+MAX_IMAGE_PIXELS = int(os.getenv('MAX_IMAGE_PIXELS', 40_000_000))
+MAX_IMAGE_DIMENSION = int(os.getenv('MAX_IMAGE_DIMENSION', 10_000))
+
 # CSRF Settings for development with Vite proxy
 CSRF_TRUSTED_ORIGINS = [
     'http://localhost:5173',